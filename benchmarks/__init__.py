@@ -0,0 +1 @@
+"""Reproducible performance benchmarks over synthetic workspaces (see `benchmarks.run`)."""
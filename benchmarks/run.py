@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Run the benchmark scenarios over a synthetic workspace and store the timings as JSON.
+
+    python -m benchmarks.run --issues 20000 --output bench.json
+    python -m benchmarks.run --issues 20000 --compare bench.json
+
+Scenarios run in order in one process: `first_ms` is the first (cold) run and
+`p50_ms` the median of every run, so later runs include warm caches.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from .scenarios import SCENARIOS, BenchContext, Scenario
+from .workspace import WorkspaceSpec, generate_workspace, workspace_settings, write_workspace
+
+RESULTS_SCHEMA_VERSION = 1
+
+
+def _git_revision() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=False,
+            cwd=Path(__file__).resolve().parents[1],
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return out.stdout.strip()
+
+
+@contextmanager
+def _isolated_caches(root: Path) -> Iterator[None]:
+    """Keep on-disk render caches of the run inside its workspace."""
+    name = "BUG_RESOLUTION_RADAR_PPT_DISK_CACHE_DIR"
+    previous = os.environ.get(name)
+    os.environ[name] = str(root / "render-cache")
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = previous
+
+
+def _time_scenario(scenario: Scenario, ctx: BenchContext, *, repeat: int) -> Dict[str, Any]:
+    timings: List[float] = []
+    meta: Dict[str, Any] = {}
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        started = time.perf_counter()
+        meta = scenario.run(ctx)
+        timings.append((time.perf_counter() - started) * 1000.0)
+    return {
+        "name": scenario.name,
+        "runs": len(timings),
+        "first_ms": round(timings[0], 3),
+        "p50_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "meta": meta,
+    }
+
+
+def run_benchmarks(
+    spec: WorkspaceSpec,
+    *,
+    repeat: int = 3,
+    latency_ms: float = 0.0,
+    only: Sequence[str] = (),
+    workdir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Generate the workspace, run the selected scenarios and return the results payload."""
+    selected = [s for s in SCENARIOS if not only or s.name in set(only)]
+    unknown = sorted(set(only) - {s.name for s in SCENARIOS})
+    if unknown:
+        raise ValueError(f"Escenarios desconocidos: {unknown}")
+
+    with tempfile.TemporaryDirectory(prefix="brr-bench-", dir=workdir) as tmp:
+        root = Path(tmp)
+        generate_started = time.perf_counter()
+        workspace = generate_workspace(spec)
+        settings = workspace_settings(root, workspace)
+        write_workspace(settings, workspace)
+        setup_ms = (time.perf_counter() - generate_started) * 1000.0
+        ctx = BenchContext(root=root, settings=settings, workspace=workspace, latency_ms=latency_ms)
+        with _isolated_caches(root):
+            scenarios = [_time_scenario(s, ctx, repeat=repeat) for s in selected]
+
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count() or 1,
+        "spec": asdict(spec),
+        "repeat": int(repeat),
+        "latency_ms": float(latency_ms),
+        "setup_ms": round(setup_ms, 3),
+        "scenarios": scenarios,
+    }
+
+
+def compare_results(
+    current: Dict[str, Any], baseline: Dict[str, Any], *, threshold_pct: float
+) -> List[Dict[str, Any]]:
+    """p50 delta per scenario present in both payloads; `regression` beyond `threshold_pct`."""
+    before = {row["name"]: row for row in baseline.get("scenarios", [])}
+    out: List[Dict[str, Any]] = []
+    for row in current.get("scenarios", []):
+        prev = before.get(row["name"])
+        if prev is None or not prev.get("p50_ms"):
+            continue
+        delta_pct = (float(row["p50_ms"]) / float(prev["p50_ms"]) - 1.0) * 100.0
+        out.append(
+            {
+                "name": row["name"],
+                "baseline_p50_ms": prev["p50_ms"],
+                "p50_ms": row["p50_ms"],
+                "delta_pct": round(delta_pct, 1),
+                "regression": delta_pct > threshold_pct,
+            }
+        )
+    return out
+
+
+def _print_table(report: Dict[str, Any], comparison: List[Dict[str, Any]]) -> None:
+    deltas = {row["name"]: row for row in comparison}
+    print(f"{'escenario':<30} {'first_ms':>10} {'p50_ms':>10} {'delta':>8}")
+    for row in report["scenarios"]:
+        delta = deltas.get(row["name"])
+        mark = ""
+        if delta is not None:
+            mark = f"{delta['delta_pct']:+.1f}%" + (" !" if delta["regression"] else "")
+        print(f"{row['name']:<30} {row['first_ms']:>10.1f} {row['p50_ms']:>10.1f} {mark:>8}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    defaults = WorkspaceSpec()
+    parser = argparse.ArgumentParser(description="Benchmark over a synthetic workspace.")
+    parser.add_argument("--issues", type=int, default=defaults.issues, help="Issues to generate.")
+    parser.add_argument(
+        "--countries",
+        default=",".join(defaults.countries),
+        help="Comma-separated countries; each gets its own Jira and Helix sources.",
+    )
+    parser.add_argument("--jira-sources", type=int, default=defaults.jira_sources_per_country)
+    parser.add_argument("--helix-sources", type=int, default=defaults.helix_sources_per_country)
+    parser.add_argument("--status-skew", type=float, default=defaults.status_skew)
+    parser.add_argument("--priority-skew", type=float, default=defaults.priority_skew)
+    parser.add_argument("--description-chars", type=int, default=defaults.description_chars)
+    parser.add_argument("--raw-fields", type=int, default=defaults.raw_fields)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario.")
+    parser.add_argument(
+        "--latency-ms", type=float, default=20.0, help="Latency of every stand-in response."
+    )
+    parser.add_argument("--only", default="", help="Comma-separated scenario names.")
+    parser.add_argument("--output", default="", help="Write the results JSON to this path.")
+    parser.add_argument("--compare", default="", help="Earlier results JSON to compare against.")
+    parser.add_argument(
+        "--threshold", type=float, default=15.0, help="p50 slowdown (%%) flagged as regression."
+    )
+    parser.add_argument(
+        "--fail-on-regression", action="store_true", help="Exit 1 when a regression is flagged."
+    )
+    args = parser.parse_args(argv)
+
+    spec = WorkspaceSpec(
+        issues=int(args.issues),
+        countries=tuple(c.strip() for c in str(args.countries).split(",") if c.strip()),
+        jira_sources_per_country=int(args.jira_sources),
+        helix_sources_per_country=int(args.helix_sources),
+        status_skew=float(args.status_skew),
+        priority_skew=float(args.priority_skew),
+        description_chars=int(args.description_chars),
+        raw_fields=int(args.raw_fields),
+        seed=int(args.seed),
+    )
+    only = [name.strip() for name in str(args.only).split(",") if name.strip()]
+    report = run_benchmarks(
+        spec, repeat=int(args.repeat), latency_ms=float(args.latency_ms), only=only
+    )
+    comparison: List[Dict[str, Any]] = []
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        comparison = compare_results(report, baseline, threshold_pct=float(args.threshold))
+        report["comparison"] = {
+            "baseline_git_revision": baseline.get("git_revision", ""),
+            "threshold_pct": float(args.threshold),
+            "scenarios": comparison,
+        }
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+    _print_table(report, comparison)
+    if args.fail_on_regression and any(row["regression"] for row in comparison):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
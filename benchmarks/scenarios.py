@@ -0,0 +1,171 @@
+"""Timed scenarios over a synthetic workspace, run in a fixed order by `benchmarks.run`."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from bug_resolution_radar.config import Settings
+from bug_resolution_radar.reports.executive_ppt import generate_scope_executive_ppt
+from bug_resolution_radar.reports.period_followup_ppt import generate_country_period_followup_ppt
+from bug_resolution_radar.repositories.issues_store import load_issues_df, save_issues_doc
+from bug_resolution_radar.services.dashboard_snapshot import (
+    DashboardQuery,
+    build_dashboard_snapshot,
+    build_intelligence_snapshot,
+    build_issue_rows,
+    build_report_scope_query,
+    load_scope_context,
+)
+from bug_resolution_radar.services.ingest_runner import run_helix_ingest, run_jira_ingest
+
+from .stubs import HelixArsqlStub, JiraSearchStub, StubConnectionContext, connector_env
+from .workspace import HELIX_STUB_BASE_URL, JIRA_STUB_BASE_URL, BenchSource, SyntheticWorkspace
+
+ISSUE_PAGE_SIZE = 100
+
+
+@dataclass
+class BenchContext:
+    root: Path
+    settings: Settings
+    workspace: SyntheticWorkspace
+    latency_ms: float = 0.0
+    runs: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def country(self) -> str:
+        return self.workspace.spec.countries[0]
+
+    def first_source(self, source_type: str) -> BenchSource:
+        for src in self.workspace.sources:
+            if src.country == self.country and src.source_type == source_type:
+                return src
+        raise ValueError(f"El workspace no tiene fuentes {source_type} en {self.country}.")
+
+    def country_query(self) -> DashboardQuery:
+        return build_report_scope_query(
+            country=self.country,
+            source_ids=[
+                src.source_id for src in self.workspace.sources if src.country == self.country
+            ],
+        )
+
+    def scratch(self, name: str) -> Path:
+        """Fresh directory per run, so every run starts from the same (empty) state."""
+        count = self.runs.get(name, 0) + 1
+        self.runs[name] = count
+        path = self.root / "runs" / f"{name}-{count}"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    run: Callable[[BenchContext], Dict[str, Any]]
+
+
+def _save_issues_doc(ctx: BenchContext) -> Dict[str, Any]:
+    target = ctx.scratch("save_issues_doc") / "issues.json"
+    save_issues_doc(str(target), ctx.workspace.issues_doc)
+    return {"issues": len(ctx.workspace.issues_doc.issues)}
+
+
+def _load_issues_df(ctx: BenchContext) -> Dict[str, Any]:
+    df = load_issues_df(ctx.settings.DATA_PATH)
+    return {"rows": int(len(df)), "columns": int(len(df.columns))}
+
+
+def _load_scope_context(ctx: BenchContext) -> Dict[str, Any]:
+    context = load_scope_context(ctx.settings, query=ctx.country_query(), include_kpis=True)
+    return {"rows": int(len(context.dff)), "open": int(len(context.open_df))}
+
+
+def _dashboard_snapshot(ctx: BenchContext) -> Dict[str, Any]:
+    payload = build_dashboard_snapshot(ctx.settings, query=ctx.country_query())
+    return {"keys": len(payload)}
+
+
+def _intelligence_snapshot(ctx: BenchContext) -> Dict[str, Any]:
+    payload = build_intelligence_snapshot(ctx.settings, query=ctx.country_query())
+    return {"keys": len(payload)}
+
+
+def _issue_rows_paging(ctx: BenchContext) -> Dict[str, Any]:
+    query = ctx.country_query()
+    pages = rows = 0
+    cursor = ""
+    while True:
+        page = build_issue_rows(ctx.settings, query=query, limit=ISSUE_PAGE_SIZE, after=cursor)
+        pages += 1
+        rows += len(page["rows"])
+        cursor = str(page.get("nextCursor") or "")
+        if not cursor:
+            break
+    return {"pages": pages, "rows": rows}
+
+
+def _executive_ppt(ctx: BenchContext) -> Dict[str, Any]:
+    result = generate_scope_executive_ppt(
+        ctx.settings, country=ctx.country, source_id=ctx.first_source("jira").source_id
+    )
+    return {"slides": result.slide_count, "bytes": len(result.content)}
+
+
+def _period_followup_ppt(ctx: BenchContext) -> Dict[str, Any]:
+    result = generate_country_period_followup_ppt(
+        ctx.settings,
+        country=ctx.country,
+        source_ids=[ctx.first_source("jira").source_id, ctx.first_source("helix").source_id],
+    )
+    return {"slides": result.slide_count, "bytes": len(result.content)}
+
+
+def _ingest_settings(ctx: BenchContext, name: str) -> Settings:
+    target = ctx.scratch(name)
+    return ctx.settings.model_copy(
+        update={
+            "DATA_PATH": str(target / "issues.json"),
+            "HELIX_DATA_PATH": str(target / "helix_dump.json"),
+        }
+    )
+
+
+def _jira_ingest(ctx: BenchContext) -> Dict[str, Any]:
+    settings = _ingest_settings(ctx, "jira_ingest")
+    with JiraSearchStub(ctx.workspace.jira_payloads, latency_ms=ctx.latency_ms) as stub:
+        with connector_env(settings):
+            result = run_jira_ingest(
+                settings,
+                selected_sources=ctx.workspace.sources_of("jira"),
+                connections=StubConnectionContext({JIRA_STUB_BASE_URL: stub.url}),
+            )
+    return {"state": result["state"], "requests": stub.requests}
+
+
+def _helix_ingest(ctx: BenchContext) -> Dict[str, Any]:
+    settings = _ingest_settings(ctx, "helix_ingest")
+    with HelixArsqlStub(ctx.workspace.helix_rows, latency_ms=ctx.latency_ms) as stub:
+        with connector_env(settings):
+            result = run_helix_ingest(
+                settings,
+                selected_sources=ctx.workspace.sources_of("helix"),
+                connections=StubConnectionContext({HELIX_STUB_BASE_URL: stub.url}),
+            )
+    return {"state": result["state"], "requests": stub.requests}
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("save_issues_doc", _save_issues_doc),
+    Scenario("load_issues_df", _load_issues_df),
+    Scenario("load_scope_context", _load_scope_context),
+    Scenario("build_dashboard_snapshot", _dashboard_snapshot),
+    Scenario("build_intelligence_snapshot", _intelligence_snapshot),
+    Scenario("build_issue_rows_paging", _issue_rows_paging),
+    Scenario("executive_ppt", _executive_ppt),
+    Scenario("period_followup_ppt", _period_followup_ppt),
+    Scenario("jira_ingest", _jira_ingest),
+    Scenario("helix_ingest", _helix_ingest),
+]
@@ -0,0 +1,212 @@
+"""Local HTTP stand-ins for Jira search and Helix ARSQL with injectable latency."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from bug_resolution_radar.config import Settings
+from bug_resolution_radar.ingest.connection_context import IngestConnectionContext
+
+_JIRA_PROJECT_RE = re.compile(r"project\s*=\s*([A-Za-z0-9_]+)", re.IGNORECASE)
+_SQL_PAGE_RE = re.compile(r"LIMIT\s+(\d+)\s+OFFSET\s+(\d+)", re.IGNORECASE)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_StubServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def _reply(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> Dict[str, Any]:
+        size = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(size) or b"{}")
+        except ValueError:
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def do_GET(self) -> None:
+        self.server.pause()
+        status, payload = self.server.handle_get(urlparse(self.path).path)
+        self._reply(status, payload)
+
+    def do_POST(self) -> None:
+        body = self._body()
+        self.server.pause()
+        status, payload = self.server.handle_post(urlparse(self.path).path, body)
+        self._reply(status, payload)
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *, latency_ms: float) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.latency_s = max(float(latency_ms), 0.0) / 1000.0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def pause(self) -> None:
+        with self._lock:
+            self.requests += 1
+        if self.latency_s:
+            time.sleep(self.latency_s)
+
+    def handle_get(self, path: str) -> Tuple[int, Any]:
+        return 404, {"error": path}
+
+    def handle_post(self, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        return 404, {"error": path}
+
+    def __enter__(self) -> "_StubServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+class JiraSearchStub(_StubServer):
+    """`POST .../rest/api/<v>/search` paged by `startAt`/`maxResults`; JQL picks the project."""
+
+    def __init__(
+        self, issues_by_project: Mapping[str, List[Dict[str, Any]]], *, latency_ms: float = 0.0
+    ) -> None:
+        super().__init__(latency_ms=latency_ms)
+        self.issues_by_project = {str(k).upper(): list(v) for k, v in issues_by_project.items()}
+
+    def handle_post(self, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        if not path.rstrip("/").endswith("/search"):
+            return 404, {"errorMessages": [f"Ruta no soportada: {path}"]}
+        match = _JIRA_PROJECT_RE.search(str(body.get("jql") or ""))
+        issues = self.issues_by_project.get(match.group(1).upper(), []) if match else []
+        start = max(int(body.get("startAt") or 0), 0)
+        size = max(int(body.get("maxResults") or 50), 1)
+        return 200, {
+            "startAt": start,
+            "maxResults": size,
+            "total": len(issues),
+            "issues": issues[start : start + size],
+        }
+
+
+class HelixArsqlStub(_StubServer):
+    """Dashboards preflight plus the ARSQL query endpoint; the SQL source filter picks the rows."""
+
+    def __init__(
+        self, rows_by_service: Mapping[str, List[Dict[str, Any]]], *, latency_ms: float = 0.0
+    ) -> None:
+        super().__init__(latency_ms=latency_ms)
+        self.rows_by_service = {str(k): list(v) for k, v in rows_by_service.items()}
+
+    def handle_get(self, path: str) -> Tuple[int, Any]:
+        if path.startswith("/dashboards"):
+            return 200, {"ok": True}
+        return 404, {"error": path}
+
+    def handle_post(self, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        if not path.endswith("/report/arsqlquery"):
+            return 404, {"error": path}
+        sql = str(body.get("sql") or "")
+        rows: List[Dict[str, Any]] = []
+        for service, service_rows in self.rows_by_service.items():
+            if f"'{service}'" in sql:
+                rows = service_rows
+                break
+        page = _SQL_PAGE_RE.search(sql)
+        limit, offset = (int(page.group(1)), int(page.group(2))) if page else (len(rows), 0)
+        chunk = rows[offset : offset + limit]
+        columns = sorted({name for row in chunk for name in row})
+        return 200, {
+            "total": len(rows),
+            "columns": columns,
+            "rows": [[row.get(name) for name in columns] for row in chunk],
+        }
+
+
+class _RewriteAdapter(HTTPAdapter):
+    """Sends requests for a fake https origin to a local plain-http stand-in."""
+
+    def __init__(self, origin: str, target: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._origin = origin.rstrip("/")
+        self._target = target.rstrip("/")
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        url = str(request.url or "")
+        if url.startswith(self._origin):
+            request.url = self._target + url[len(self._origin) :]
+        return super().send(request, **kwargs)
+
+
+class StubConnectionContext(IngestConnectionContext):
+    """
+    Connection context whose sessions route the configured origins to stand-ins.
+
+    The connectors keep validating (https, public host) the base URLs they are
+    configured with; only the transport underneath is redirected.
+    """
+
+    def __init__(self, routes: Mapping[str, str], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._routes = dict(routes)
+
+    def session(self, connector: str, host: str) -> requests.Session:
+        session = super().session(connector, host)
+        for origin, target in self._routes.items():
+            if not isinstance(session.get_adapter(origin + "/"), _RewriteAdapter):
+                session.mount(origin, _RewriteAdapter(origin, target))
+        return session
+
+
+@contextmanager
+def connector_env(settings: Settings) -> Iterator[None]:
+    """Expose the connector settings the ingest modules read from the environment."""
+    fields = type(settings).model_fields
+    values = {
+        name: str(getattr(settings, name))
+        for name in fields
+        if name.startswith(("JIRA_", "HELIX_")) or name == "ANALYSIS_LOOKBACK_MONTHS"
+    }
+    previous = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
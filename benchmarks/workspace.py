@@ -0,0 +1,395 @@
+"""Synthetic Jira/Helix workspaces of configurable size and shape."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from bug_resolution_radar.analytics.insights import THEME_RULES
+from bug_resolution_radar.config import Settings, build_source_id, to_env_json
+from bug_resolution_radar.ingest.helix_mapper import map_helix_values_to_item
+from bug_resolution_radar.models.schema import IssuesDocument, NormalizedIssue
+from bug_resolution_radar.models.schema_helix import HelixDocument, HelixWorkItem
+from bug_resolution_radar.repositories.helix_repo import HelixRepo
+from bug_resolution_radar.repositories.issues_store import save_issues_doc
+
+# Ordered from most to least frequent when a skew is applied.
+JIRA_STATUSES: tuple[str, ...] = (
+    "Closed",
+    "New",
+    "Analysing",
+    "En progreso",
+    "Deployed",
+    "Blocked",
+    "Test",
+    "Ready To Verify",
+    "Accepted",
+    "To Rework",
+    "Ready to Deploy",
+)
+JIRA_PRIORITIES: tuple[str, ...] = (
+    "Medium",
+    "High",
+    "Low",
+    "Highest",
+    "Supone un impedimento",
+    "Lowest",
+)
+HELIX_STATUSES: tuple[str, ...] = (
+    "Cerrado",
+    "Asignado",
+    "En curso",
+    "Resuelto",
+    "Pendiente",
+    "Nuevo",
+    "Cancelado",
+)
+HELIX_PRIORITIES: tuple[str, ...] = ("Moderate", "High", "Low", "Very High")
+_CLOSED_STATUSES = frozenset({"Closed", "Deployed", "Accepted", "Cerrado", "Resuelto", "Cancelado"})
+_THEME_WORDS: tuple[str, ...] = tuple(word for _, words in THEME_RULES for word in words) + (
+    "perfil",
+    "consulta",
+    "movimientos",
+)
+_FILLER = (
+    "el cliente reporta un error intermitente al abrir la pantalla de detalle "
+    "tras actualizar la app se reproduce en produccion con usuarios de empresa "
+    "la respuesta del servicio tarda mas de lo esperado y devuelve datos incompletos "
+    "se adjuntan trazas del backend y capturas del flujo afectado"
+).split()
+_ASSIGNEES = tuple(f"Persona {idx:02d}" for idx in range(40))
+_COMPONENTS = ("Backend", "Frontend", "Mobile", "Core", "Canales", "Integraciones")
+
+JIRA_STUB_BASE_URL = "https://jira.bench.invalid"
+HELIX_STUB_BASE_URL = "https://helix-ir1.bench.invalid"
+HELIX_STUB_DATASOURCE_UID = "bench-arsql"
+STUB_COOKIE_HEADER = "JSESSIONID=bench; XSRF-TOKEN=bench"
+
+
+@dataclass(frozen=True)
+class WorkspaceSpec:
+    """
+    Shape of a synthetic workspace.
+
+    `issues` is split evenly across every source (countries x sources per
+    connector). Skews are Zipf exponents over the status/priority lists above:
+    0 is uniform, larger values concentrate rows on the first entries.
+    """
+
+    issues: int = 5000
+    countries: tuple[str, ...] = ("México", "España")
+    jira_sources_per_country: int = 1
+    helix_sources_per_country: int = 1
+    status_skew: float = 1.0
+    priority_skew: float = 1.0
+    description_chars: int = 400
+    raw_fields: int = 40
+    history_days: int = 365
+    seed: int = 7
+
+
+@dataclass(frozen=True)
+class BenchSource:
+    source_type: str
+    country: str
+    alias: str
+    # Jira project key or Helix source service (N1) the stubs route requests by.
+    tag: str
+
+    @property
+    def source_id(self) -> str:
+        return build_source_id(self.source_type, self.country, self.alias)
+
+    def config_row(self) -> Dict[str, str]:
+        row = {"country": self.country, "alias": self.alias}
+        if self.source_type == "jira":
+            row["jql"] = f"project = {self.tag} ORDER BY updated DESC"
+        else:
+            row["service_origin_n1"] = self.tag
+            row["service_origin_buug"] = "BENCH"
+        return row
+
+
+@dataclass
+class SyntheticWorkspace:
+    spec: WorkspaceSpec
+    sources: List[BenchSource]
+    issues_doc: IssuesDocument
+    helix_doc: HelixDocument
+    # What the stand-ins serve: Jira search issues per project, ARSQL rows per service.
+    jira_payloads: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    helix_rows: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+    def sources_of(self, source_type: str) -> List[Dict[str, str]]:
+        """Selected-source rows in the shape `run_*_ingest` receives from config."""
+        return [
+            {
+                "source_type": src.source_type,
+                "source_id": src.source_id,
+                **src.config_row(),
+            }
+            for src in self.sources
+            if src.source_type == source_type
+        ]
+
+
+def _zipf_weights(size: int, skew: float) -> np.ndarray:
+    weights = 1.0 / np.power(np.arange(1, size + 1, dtype=float), max(float(skew), 0.0))
+    return np.asarray(weights / weights.sum(), dtype=float)
+
+
+def _bench_sources(spec: WorkspaceSpec) -> List[BenchSource]:
+    out: List[BenchSource] = []
+    for c_idx, country in enumerate(spec.countries):
+        for s_idx in range(max(0, spec.jira_sources_per_country)):
+            out.append(BenchSource("jira", country, f"Jira {s_idx + 1}", f"B{c_idx}J{s_idx}"))
+        for s_idx in range(max(0, spec.helix_sources_per_country)):
+            out.append(
+                BenchSource(
+                    "helix", country, f"Helix {s_idx + 1}", f"BENCH SERVICE {c_idx}-{s_idx}"
+                )
+            )
+    return out
+
+
+class _Rows:
+    """Column-wise random draws shared by both connectors."""
+
+    def __init__(self, spec: WorkspaceSpec, rng: np.random.Generator, size: int) -> None:
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        age_s = rng.integers(0, max(spec.history_days, 1) * 86400, size=size)
+        self.created = [now - timedelta(seconds=int(s)) for s in age_s]
+        self.resolve_after = rng.integers(3600, 60 * 86400, size=size)
+        self.updated_after = rng.integers(0, 30 * 86400, size=size)
+        self.now = now
+        self.theme = rng.choice(_THEME_WORDS, size=size)
+        self.assignee = rng.choice(_ASSIGNEES, size=size)
+        self.component = rng.choice(_COMPONENTS, size=size)
+        self.desc_len = np.clip(
+            rng.normal(spec.description_chars, spec.description_chars / 3.0, size=size),
+            0,
+            None,
+        ).astype(int)
+        self.filler_start = rng.integers(0, len(_FILLER), size=size)
+
+    def resolved(self, idx: int, status: str) -> Optional[datetime]:
+        if status not in _CLOSED_STATUSES:
+            return None
+        return min(self.created[idx] + timedelta(seconds=int(self.resolve_after[idx])), self.now)
+
+    def updated(self, idx: int) -> datetime:
+        return min(self.created[idx] + timedelta(seconds=int(self.updated_after[idx])), self.now)
+
+    def summary(self, idx: int, key: str) -> str:
+        return f"Error en {self.theme[idx]} al operar desde la app ({key})"
+
+    def description(self, idx: int) -> str:
+        size = int(self.desc_len[idx])
+        if size <= 0:
+            return ""
+        start = int(self.filler_start[idx])
+        words: List[str] = []
+        total = 0
+        while total < size:
+            word = _FILLER[(start + len(words)) % len(_FILLER)]
+            words.append(word)
+            total += len(word) + 1
+        return " ".join(words)[:size]
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _jira_payload(issue: NormalizedIssue) -> Dict[str, Any]:
+    return {
+        "key": issue.key,
+        "fields": {
+            "summary": issue.summary,
+            "description": issue.description,
+            "status": {"name": issue.status},
+            "issuetype": {"name": issue.type},
+            "priority": {"name": issue.priority},
+            "created": issue.created,
+            "updated": issue.updated,
+            "resolutiondate": issue.resolved,
+            "assignee": {"displayName": issue.assignee},
+            "reporter": {"displayName": issue.reporter},
+            "labels": list(issue.labels),
+            "components": [{"name": name} for name in issue.components],
+            "resolution": {"name": issue.resolution} if issue.resolution else None,
+        },
+    }
+
+
+def _epoch_ms(value: Optional[datetime]) -> Optional[int]:
+    return int(value.timestamp() * 1000) if value is not None else None
+
+
+def _helix_row(
+    rows: _Rows, idx: int, *, number: int, status: str, priority: str, src: BenchSource, width: int
+) -> Dict[str, Any]:
+    incident = f"INC{number:012d}"
+    closed = rows.resolved(idx, status)
+    row: Dict[str, Any] = {
+        "id": incident,
+        "workItemId": f"IDGAA{number:019d}",
+        "priority": priority,
+        "summary": rows.summary(idx, incident),
+        "status": status,
+        "assignee": str(rows.assignee[idx]),
+        "incidentType": "Incidencia",
+        "service": f"{rows.component[idx]} {src.country}",
+        "impactedService": str(rows.component[idx]),
+        "customerName": "BENCH",
+        "bbva_matrixservicen1": src.tag,
+        "bbva_sourceservicen1": src.tag,
+        "bbva_startdatetime": _epoch_ms(rows.created[idx]),
+        "bbva_closeddate": _epoch_ms(closed),
+        "lastModifiedDate": _epoch_ms(closed or rows.updated(idx)),
+        "targetDate": _epoch_ms(rows.created[idx]),
+        "BBVA_Environment": "Production",
+        "Detailed Decription": rows.description(idx),
+    }
+    for col in range(max(0, width)):
+        # Realistic sparsity: later raw columns are filled less often.
+        if (idx + col) % (1 + col // 8) == 0:
+            row[f"Campo {col:03d}"] = f"valor {col}-{idx % 97}"
+    return row
+
+
+def _helix_issue(item: HelixWorkItem) -> NormalizedIssue:
+    created = item.start_datetime or item.target_date
+    closed = item.closed_date
+    return NormalizedIssue(
+        key=item.id,
+        summary=item.summary,
+        status=item.status or "New",
+        type=item.incident_type or "Helix",
+        priority=item.priority,
+        created=created,
+        updated=item.last_modified or created,
+        resolved=closed,
+        assignee=item.assignee,
+        reporter=item.customer_name,
+        labels=[item.source_service_n1] if item.source_service_n1 else [],
+        components=[item.impacted_service] if item.impacted_service else [],
+        url=item.url,
+        country=item.country,
+        source_type="helix",
+        source_alias=item.source_alias,
+        source_id=item.source_id,
+    )
+
+
+def generate_workspace(spec: WorkspaceSpec) -> SyntheticWorkspace:
+    """Deterministic (per `spec.seed`) issues and Helix documents plus stand-in payloads."""
+    rng = np.random.default_rng(spec.seed)
+    sources = _bench_sources(spec)
+    total = max(0, int(spec.issues))
+    owner = rng.integers(0, max(len(sources), 1), size=total) if sources else np.empty(0, int)
+    rows = _Rows(spec, rng, total)
+    jira_status = rng.choice(
+        JIRA_STATUSES, size=total, p=_zipf_weights(len(JIRA_STATUSES), spec.status_skew)
+    )
+    jira_priority = rng.choice(
+        JIRA_PRIORITIES, size=total, p=_zipf_weights(len(JIRA_PRIORITIES), spec.priority_skew)
+    )
+    helix_status = rng.choice(
+        HELIX_STATUSES, size=total, p=_zipf_weights(len(HELIX_STATUSES), spec.status_skew)
+    )
+    helix_priority = rng.choice(
+        HELIX_PRIORITIES, size=total, p=_zipf_weights(len(HELIX_PRIORITIES), spec.priority_skew)
+    )
+
+    workspace = SyntheticWorkspace(
+        spec=spec,
+        sources=sources,
+        issues_doc=IssuesDocument.empty(),
+        helix_doc=HelixDocument.empty(),
+    )
+    workspace.issues_doc.jira_base_url = JIRA_STUB_BASE_URL
+    workspace.helix_doc.helix_base_url = HELIX_STUB_BASE_URL
+    for idx in range(total):
+        src = sources[int(owner[idx])]
+        if src.source_type == "jira":
+            key = f"{src.tag}-{idx + 1}"
+            status = str(jira_status[idx])
+            issue = NormalizedIssue(
+                key=key,
+                summary=rows.summary(idx, key),
+                description=rows.description(idx),
+                status=status,
+                type="Bug",
+                priority=str(jira_priority[idx]),
+                created=_iso(rows.created[idx]),
+                updated=_iso(rows.updated(idx)),
+                resolved=_iso(rows.resolved(idx, status)),
+                assignee=str(rows.assignee[idx]),
+                reporter="Persona QA",
+                labels=[str(rows.theme[idx])],
+                components=[str(rows.component[idx])],
+                resolution="Done" if status in _CLOSED_STATUSES else "",
+                url=f"{JIRA_STUB_BASE_URL}/browse/{key}",
+                country=src.country,
+                source_type="jira",
+                source_alias=src.alias,
+                source_id=src.source_id,
+            )
+            workspace.issues_doc.issues.append(issue)
+            workspace.jira_payloads.setdefault(src.tag, []).append(_jira_payload(issue))
+            continue
+        row = _helix_row(
+            rows,
+            idx,
+            number=idx + 1,
+            status=str(helix_status[idx]),
+            priority=str(helix_priority[idx]),
+            src=src,
+            width=spec.raw_fields,
+        )
+        workspace.helix_rows.setdefault(src.tag, []).append(row)
+        item = map_helix_values_to_item(
+            values=row,
+            base_url=f"{HELIX_STUB_BASE_URL}/smartit",
+            country=src.country,
+            source_alias=src.alias,
+            source_id=src.source_id,
+        )
+        if item is not None:
+            workspace.helix_doc.items.append(item)
+            workspace.issues_doc.issues.append(_helix_issue(item))
+    return workspace
+
+
+def workspace_settings(root: Path, workspace: SyntheticWorkspace) -> Settings:
+    """Settings pointing every data path under `root` and every source at the stand-ins."""
+    jira = [src.config_row() for src in workspace.sources if src.source_type == "jira"]
+    helix = [src.config_row() for src in workspace.sources if src.source_type == "helix"]
+    return Settings(
+        DATA_PATH=str(root / "issues.json"),
+        NOTES_PATH=str(root / "notes.json"),
+        INSIGHTS_LEARNING_PATH=str(root / "insights_learning.json"),
+        HELIX_DATA_PATH=str(root / "helix_dump.json"),
+        REPORT_PPT_DOWNLOAD_DIR=str(root / "reports"),
+        SUPPORTED_COUNTRIES=",".join(workspace.spec.countries),
+        JIRA_BASE_URL=JIRA_STUB_BASE_URL,
+        JIRA_SOURCES_JSON=to_env_json(jira),
+        JIRA_COOKIE_SOURCE="manual",
+        JIRA_COOKIE_HEADER=STUB_COOKIE_HEADER,
+        HELIX_SOURCES_JSON=to_env_json(helix),
+        HELIX_COOKIE_SOURCE="manual",
+        HELIX_COOKIE_HEADER=STUB_COOKIE_HEADER,
+        HELIX_ARSQL_BASE_URL=HELIX_STUB_BASE_URL,
+        HELIX_ARSQL_DATASOURCE_UID=HELIX_STUB_DATASOURCE_UID,
+    )
+
+
+def write_workspace(settings: Settings, workspace: SyntheticWorkspace) -> None:
+    Path(settings.DATA_PATH).parent.mkdir(parents=True, exist_ok=True)
+    save_issues_doc(settings.DATA_PATH, workspace.issues_doc)
+    HelixRepo(Path(settings.HELIX_DATA_PATH)).save(workspace.helix_doc)
@@ -0,0 +1,174 @@
+import { useEffect, useState } from "react";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
+import {
+  fetchJson,
+  type IngestProgressEvent,
+  type IngestProgressPayload,
+  type IngestTelemetry
+} from "../lib/api";
+
+type Connector = "jira" | "helix";
+
+const POLL_INTERVAL_MS = 1500;
+const STREAM_MAX_FAILURES = 3;
+const RECENT_EVENTS_LIMIT = 10;
+
+function emptyTelemetry(): IngestTelemetry {
+  return {
+    enabled: true,
+    currentPhase: "",
+    pages: 0,
+    rows: 0,
+    bytes: 0,
+    pageLatencyP50Ms: 0,
+    pageLatencyP95Ms: 0,
+    lastPage: null,
+    adaptations: {},
+    recentEvents: []
+  };
+}
+
+function text(value: unknown): string {
+  return String(value ?? "").trim();
+}
+
+function count(value: unknown): number {
+  return Math.max(0, Number(value || 0));
+}
+
+function applyIngestProgressEvent(
+  current: IngestProgressPayload | undefined,
+  event: IngestProgressEvent
+): IngestProgressPayload | undefined {
+  if (!current) {
+    return current;
+  }
+  if (event.type === "run_started") {
+    return {
+      ...current,
+      runId: event.runId,
+      state: "running",
+      active: true,
+      startedAt: text(event.startedAt),
+      finishedAt: "",
+      totalSources: count(event.totalSources),
+      completedSources: 0,
+      successCount: 0,
+      currentSourceLabel: "",
+      currentSourceIndex: 0,
+      elapsedSeconds: 0,
+      maxRunSeconds: count(event.maxRunSeconds),
+      summary: "",
+      messages: [],
+      result: null,
+      telemetry: null,
+      lastSeq: event.seq
+    };
+  }
+  if (event.runId !== current.runId) {
+    return current;
+  }
+  const next: IngestProgressPayload = { ...current, lastSeq: event.seq };
+  switch (event.type) {
+    case "source_started": {
+      next.currentSourceLabel = text(event.sourceLabel);
+      next.currentSourceIndex = count(event.sourceIndex);
+      next.totalSources = count(event.totalSources);
+      if (text(event.message)) {
+        next.messages = [...current.messages, { ok: true, message: text(event.message) }];
+      }
+      return next;
+    }
+    case "source_finished":
+      next.completedSources = count(event.completedSources);
+      next.totalSources = count(event.totalSources);
+      next.successCount = count(event.successCount);
+      next.messages = [...current.messages, { ok: Boolean(event.ok), message: text(event.message) }];
+      return next;
+    case "error":
+      next.messages = [...current.messages, { ok: false, message: text(event.message) }];
+      return next;
+    case "page": {
+      const telemetry = current.telemetry ?? emptyTelemetry();
+      const totals = (event.totals ?? {}) as Partial<IngestTelemetry>;
+      next.telemetry = {
+        ...telemetry,
+        ...totals,
+        lastPage: {
+          sourceId: text(event.sourceId),
+          page: count(event.page),
+          status: count(event.status),
+          elapsedMs: count(event.elapsedMs),
+          bytes: count(event.bytes),
+          rows: count(event.rows),
+          chunkSize: count(event.chunkSize),
+          readTimeoutSeconds: count(event.readTimeoutSeconds)
+        }
+      };
+      return next;
+    }
+    case "adaptation": {
+      const telemetry = current.telemetry ?? emptyTelemetry();
+      const kind = text(event.kind);
+      const { seq: _seq, runId: _runId, type: _type, at: _at, ...detail } = event;
+      next.telemetry = {
+        ...telemetry,
+        adaptations: {
+          ...telemetry.adaptations,
+          [kind]: count(telemetry.adaptations[kind]) + 1
+        },
+        recentEvents: [...telemetry.recentEvents, detail].slice(-RECENT_EVENTS_LIMIT)
+      };
+      return next;
+    }
+    default:
+      // `run_finished` is followed by a full snapshot carrying the result.
+      return next;
+  }
+}
+
+/**
+ * Ingest progress pushed by `/api/ingest/{connector}/events` (SSE), falling
+ * back to polling `/progress` when the stream is unavailable.
+ */
+export function useIngestProgress(connector: Connector) {
+  const queryClient = useQueryClient();
+  const [streaming, setStreaming] = useState(() => typeof EventSource !== "undefined");
+
+  useEffect(() => {
+    if (typeof EventSource === "undefined") {
+      setStreaming(false);
+      return;
+    }
+    const queryKey = ["ingest-progress", connector];
+    const source = new EventSource(`/api/ingest/${connector}/events`);
+    let failures = 0;
+    source.addEventListener("snapshot", (message) => {
+      failures = 0;
+      setStreaming(true);
+      queryClient.setQueryData(queryKey, JSON.parse((message as MessageEvent).data));
+    });
+    source.addEventListener("progress", (message) => {
+      failures = 0;
+      const event = JSON.parse((message as MessageEvent).data) as IngestProgressEvent;
+      queryClient.setQueryData<IngestProgressPayload>(queryKey, (current) =>
+        applyIngestProgressEvent(current, event)
+      );
+    });
+    source.onerror = () => {
+      failures += 1;
+      if (source.readyState === EventSource.CLOSED || failures >= STREAM_MAX_FAILURES) {
+        source.close();
+        setStreaming(false);
+      }
+    };
+    return () => source.close();
+  }, [connector, queryClient]);
+
+  return useQuery({
+    queryKey: ["ingest-progress", connector],
+    queryFn: () => fetchJson<IngestProgressPayload>(`/api/ingest/${connector}/progress`),
+    refetchInterval: streaming ? false : POLL_INTERVAL_MS,
+    staleTime: streaming ? Infinity : 0
+  });
+}
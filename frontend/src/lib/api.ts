@@ -106,6 +106,7 @@ export type DashboardPayload = {
 export type IssuesPayload = {
   total: number;
   rows: Array<Record<string, string>>;
+  nextCursor?: string | null;
 };
 
 export type IssueKeysPayload = {
@@ -359,6 +360,28 @@ export type IngestResult = {
   messages: Array<{ ok: boolean; message: string }>;
 };
 
+export type IngestTelemetry = {
+  enabled: boolean;
+  currentPhase: string;
+  pages: number;
+  rows: number;
+  bytes: number;
+  pageLatencyP50Ms: number;
+  pageLatencyP95Ms: number;
+  lastPage?: {
+    sourceId: string;
+    page: number;
+    status: number;
+    elapsedMs: number;
+    bytes: number;
+    rows: number;
+    chunkSize: number;
+    readTimeoutSeconds: number;
+  } | null;
+  adaptations: Record<string, number>;
+  recentEvents: Array<Record<string, unknown>>;
+};
+
 export type IngestProgressPayload = {
   connector: "jira" | "helix";
   runId: number;
@@ -376,7 +399,24 @@ export type IngestProgressPayload = {
   summary: string;
   messages: Array<{ ok: boolean; message: string }>;
   result?: IngestResult | null;
+  telemetry?: IngestTelemetry | null;
   started?: boolean;
+  lastSeq?: number;
+};
+
+export type IngestProgressEvent = {
+  seq: number;
+  runId: number;
+  type:
+    | "run_started"
+    | "source_started"
+    | "page"
+    | "adaptation"
+    | "source_finished"
+    | "error"
+    | "run_finished";
+  at: string;
+  [field: string]: unknown;
 };
 
 export type SavedReportPayload = {
@@ -18,6 +18,7 @@ import {
   type WorkspaceSource
 } from "../lib/api";
 import { cn } from "../lib/cn";
+import { useIngestProgress } from "../hooks/useIngestProgress";
 
 type Connector = "jira" | "helix";
 
@@ -114,6 +115,25 @@ function FeedbackPanel({ feedback }: { feedback?: ConnectorFeedback }) {
   );
 }
 
+function useElapsedSeconds(progress?: IngestProgressPayload): number {
+  const active = Boolean(progress?.active);
+  const [now, setNow] = useState(() => Date.now());
+  useEffect(() => {
+    if (!active) {
+      return;
+    }
+    const timer = window.setInterval(() => setNow(Date.now()), 1000);
+    return () => window.clearInterval(timer);
+  }, [active]);
+  const reported = Math.max(0, Number(progress?.elapsedSeconds || 0));
+  const startedMs = Date.parse(String(progress?.startedAt || ""));
+  if (!active || Number.isNaN(startedMs)) {
+    return reported;
+  }
+  // Streamed progress only changes on events; the clock keeps ticking locally.
+  return Math.max(reported, Math.floor((now - startedMs) / 1000));
+}
+
 function LiveProgressPanel({
   connector,
   progress
@@ -121,16 +141,18 @@ function LiveProgressPanel({
   connector: Connector;
   progress?: IngestProgressPayload;
 }) {
+  const elapsedSeconds = useElapsedSeconds(progress);
   if (!progress || progress.runId <= 0 || progress.state === "idle") {
     return null;
   }
   const completed = Math.max(0, Number(progress.completedSources || 0));
   const total = Math.max(0, Number(progress.totalSources || 0));
   const pct = total > 0 ? Math.min(100, Math.round((completed / total) * 100)) : 0;
-  const elapsedSeconds = Math.max(0, Number(progress.elapsedSeconds || 0));
   const maxRunSeconds = Math.max(0, Number(progress.maxRunSeconds || 0));
   const currentSourceIndex = Math.max(0, Number(progress.currentSourceIndex || 0));
   const currentSourceLabel = String(progress.currentSourceLabel || "").trim();
+  const telemetry = progress.telemetry;
+  const telemetryPages = Math.max(0, Number(telemetry?.pages || 0));
 
   return (
     <section
@@ -158,6 +180,12 @@ function LiveProgressPanel({
             ? `Tiempo ${elapsedSeconds}s / ${maxRunSeconds}s`
             : `Tiempo ${elapsedSeconds}s`}
         </span>
+        {telemetryPages > 0 ? (
+          <span>
+            Páginas {telemetryPages} · {Number(telemetry?.rows || 0)} filas · p95{" "}
+            {Math.round(Number(telemetry?.pageLatencyP95Ms || 0))} ms
+          </span>
+        ) : null}
       </div>
       <div
         className="ingest-progress-track"
@@ -291,16 +319,8 @@ export function IngestPage() {
     ...commonQueryOptions
   });
 
-  const jiraProgress = useQuery({
-    queryKey: ["ingest-progress", "jira"],
-    queryFn: () => fetchJson<IngestProgressPayload>("/api/ingest/jira/progress"),
-    refetchInterval: 1500
-  });
-  const helixProgress = useQuery({
-    queryKey: ["ingest-progress", "helix"],
-    queryFn: () => fetchJson<IngestProgressPayload>("/api/ingest/helix/progress"),
-    refetchInterval: 1500
-  });
+  const jiraProgress = useIngestProgress("jira");
+  const helixProgress = useIngestProgress("helix");
 
   useEffect(() => {
     if (!overview.data) {
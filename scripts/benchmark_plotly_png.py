@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the Pillow chart renderer over the five trend registry charts."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from bug_resolution_radar.analytics.issues import open_issues_only
+from bug_resolution_radar.analytics.kpis import compute_kpis
+from bug_resolution_radar.analytics.trend_charts import ChartContext, build_trends_registry
+from bug_resolution_radar.config import Settings
+from bug_resolution_radar.reports.plotly_png import render_plotly_figure_png
+
+_STATUSES = (
+    "New",
+    "Analysing",
+    "Blocked",
+    "En progreso",
+    "To Rework",
+    "Test",
+    "Ready To Verify",
+    "Accepted",
+    "Ready to Deploy",
+    "Deployed",
+    "Closed",
+)
+_PRIORITIES = ("Supone un impedimento", "Highest", "High", "Medium", "Low", "Lowest")
+
+
+def _synthetic_issues(rows: int, *, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    now = pd.Timestamp.now(tz="UTC").floor("D")
+    created = now - pd.to_timedelta(rng.integers(0, 240, size=rows), unit="D")
+    status = rng.choice(_STATUSES, size=rows)
+    closed_mask = np.isin(status, ("Deployed", "Closed"))
+    resolved = created + pd.to_timedelta(rng.integers(1, 60, size=rows), unit="D")
+    resolved = resolved.where(closed_mask & (resolved <= now), pd.NaT)
+    return pd.DataFrame(
+        {
+            "key": [f"BENCH-{idx}" for idx in range(rows)],
+            "summary": [f"Synthetic issue {idx}" for idx in range(rows)],
+            "status": status,
+            "priority": rng.choice(_PRIORITIES, size=rows),
+            "type": "Bug",
+            "created": created,
+            "updated": created,
+            "resolved": resolved,
+        }
+    )
+
+
+def _chart_figures(rows: int, *, seed: int) -> Dict[str, Any]:
+    dff = _synthetic_issues(rows, seed=seed)
+    open_df = open_issues_only(dff)
+    kpis = compute_kpis(dff, settings=Settings())
+    ctx = ChartContext(dff=dff, open_df=open_df, kpis=kpis)
+    figures: Dict[str, Any] = {}
+    for chart_id, spec in build_trends_registry().items():
+        fig = spec.render(ctx)
+        if fig is not None:
+            figures[chart_id] = fig
+    return figures
+
+
+def _run(args: argparse.Namespace) -> Dict[str, Any]:
+    figures = _chart_figures(int(args.rows), seed=int(args.seed))
+    results: List[Dict[str, Any]] = []
+    for chart_id, fig in figures.items():
+        timings: List[float] = []
+        size_bytes = 0
+        for _ in range(max(1, int(args.repeat))):
+            started = time.perf_counter()
+            payload = render_plotly_figure_png(
+                fig,
+                scale=float(args.scale),
+                export_width=int(args.width),
+                export_height=int(args.height),
+            )
+            timings.append((time.perf_counter() - started) * 1000.0)
+            size_bytes = len(payload)
+        results.append(
+            {
+                "chart_id": chart_id,
+                "runs": len(timings),
+                "p50_ms": round(statistics.median(timings), 3),
+                "min_ms": round(min(timings), 3),
+                "max_ms": round(max(timings), 3),
+                "png_bytes": int(size_bytes),
+            }
+        )
+    return {
+        "width": int(args.width),
+        "height": int(args.height),
+        "scale": float(args.scale),
+        "rows": int(args.rows),
+        "charts": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark report chart PNG rendering.")
+    parser.add_argument("--rows", type=int, default=5000, help="Synthetic issues to generate.")
+    parser.add_argument("--repeat", type=int, default=10, help="Renders per chart.")
+    parser.add_argument("--width", type=int, default=1280, help="Export width in px.")
+    parser.add_argument("--height", type=int, default=820, help="Export height in px.")
+    parser.add_argument("--scale", type=float, default=2.0, help="Render scale (max 2).")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the dataset.")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results.")
+    args = parser.parse_args()
+
+    report = _run(args)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+
+    print(f"Canvas: {report['width']}x{report['height']} @ {report['scale']}x")
+    print(f"Rows: {report['rows']}")
+    for row in report["charts"]:
+        print(
+            " | ".join(
+                [
+                    str(row["chart_id"]),
+                    f"p50={row['p50_ms']:.2f}ms",
+                    f"min={row['min_ms']:.2f}ms",
+                    f"max={row['max_ms']:.2f}ms",
+                    f"png={row['png_bytes']} B",
+                ]
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Print latest ingestion profile summary (p50/p95, CPU, RSS deltas) by phase."""
+"""Print latest ingestion profile summary (p50/p95, CPU, RSS deltas) by phase and tenant."""
 
 from __future__ import annotations
 
@@ -67,6 +67,44 @@ def _iter_phase_rows(record: Dict[str, Any]) -> Iterable[str]:
     return rows
 
 
+def _fmt_bytes(value: Any) -> str:
+    try:
+        return f"{float(value) / 1024.0:.1f} KiB"
+    except Exception:
+        return "0.0 KiB"
+
+
+def _iter_tenant_rows(record: Dict[str, Any]) -> Iterable[str]:
+    page_stats = record.get("page_stats")
+    if not isinstance(page_stats, dict):
+        return []
+    rows: List[str] = []
+    for source_id in sorted(page_stats.keys()):
+        stats = page_stats.get(source_id)
+        if not isinstance(stats, dict):
+            continue
+        latency = stats.get("latency_ms") if isinstance(stats.get("latency_ms"), dict) else {}
+        mapping = stats.get("map_ms") if isinstance(stats.get("map_ms"), dict) else {}
+        size = stats.get("bytes") if isinstance(stats.get("bytes"), dict) else {}
+        label = str(stats.get("source_label") or "").strip()
+        rows.append(
+            " | ".join(
+                [
+                    f"{source_id} ({label})" if label else str(source_id),
+                    f"pages={int(stats.get('pages') or 0)}",
+                    f"errors={int(stats.get('errors') or 0)}",
+                    f"rows={int(stats.get('rows_total') or 0)}",
+                    f"latency p50={_fmt_ms(latency.get('p50'))}",
+                    f"latency p95={_fmt_ms(latency.get('p95'))}",
+                    f"map p50={_fmt_ms(mapping.get('p50'))}",
+                    f"map p95={_fmt_ms(mapping.get('p95'))}",
+                    f"page p95={_fmt_bytes(size.get('p95'))}",
+                ]
+            )
+        )
+    return rows
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Show latest ingestion profile summary.")
     parser.add_argument(
@@ -114,6 +152,18 @@ def main() -> int:
     else:
         for row in rows:
             print(f"- {row}")
+    print("Tenant page metrics:")
+    tenant_rows = list(_iter_tenant_rows(latest))
+    if not tenant_rows:
+        print("- (none)")
+    else:
+        for row in tenant_rows:
+            print(f"- {row}")
+    adaptations = (
+        latest.get("adaptation_counts") if isinstance(latest.get("adaptation_counts"), dict) else {}
+    )
+    if adaptations:
+        print(f"Adaptations: {json.dumps(adaptations, ensure_ascii=False, sort_keys=True)}")
     return 0
 
 
@@ -62,6 +62,20 @@ def effective_analysis_lookback_months(
     return max(1, min(configured_months, available))
 
 
+def analysis_depth_cutoff(
+    settings: Settings,
+    *,
+    df: pd.DataFrame,
+    now: datetime | None = None,
+) -> pd.Timestamp | None:
+    """Oldest `created` kept by the analysis depth, or None when the whole backlog fits."""
+    lookback_months = effective_analysis_lookback_months(settings, df=df, now=now)
+    available_months = max_available_backlog_months(df, now=now)
+    if lookback_months >= available_months:
+        return None
+    return _utc_timestamp(now) - pd.DateOffset(months=int(lookback_months))
+
+
 def apply_analysis_depth_filter(
     df: pd.DataFrame,
     *,
@@ -77,12 +91,9 @@ def apply_analysis_depth_filter(
     if not has_created.any():
         return df.loc[has_created].copy(deep=False)
 
-    lookback_months = effective_analysis_lookback_months(settings, df=df, now=now)
-    available_months = max_available_backlog_months(df, now=now)
-    if lookback_months >= available_months:
+    cutoff = analysis_depth_cutoff(settings, df=df, now=now)
+    if cutoff is None:
         return df.loc[has_created].copy(deep=False)
 
-    current = _utc_timestamp(now)
-    cutoff = current - pd.DateOffset(months=int(lookback_months))
     mask = has_created & (created >= cutoff)
     return df.loc[mask].copy(deep=False)
@@ -0,0 +1,266 @@
+"""Daily aggregate cube (day x source x status bucket x priority x theme) for time-series queries."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .insights import classify_theme, theme_daily_trend_from_counts
+from .issues import normalize_text_col
+from .status_semantics import effective_closed_mask, effective_finalized_at
+
+CUBE_DIMENSIONS: tuple[str, ...] = (
+    "date",
+    "source_id",
+    "country",
+    "status_bucket",
+    "priority",
+    "tema",
+)
+CUBE_MEASURES: tuple[str, ...] = (
+    "created",
+    "closed",
+    "finalized",
+    "resolution_days_sum",
+    "resolution_days_count",
+)
+_COUNT_MEASURES = ("created", "closed", "finalized", "resolution_days_count")
+_FLOW_COLUMNS = ["date", "created", "closed", "open_backlog_proxy"]
+
+
+def empty_cube() -> pd.DataFrame:
+    out = pd.DataFrame(columns=list(CUBE_DIMENSIONS + CUBE_MEASURES))
+    return normalize_cube(out)
+
+
+def normalize_cube(cube: pd.DataFrame) -> pd.DataFrame:
+    """Coerce cube columns to their canonical dtypes (e.g. after a parquet round trip)."""
+    out = cube.copy(deep=False)
+    out["date"] = pd.to_datetime(out["date"], errors="coerce").astype("datetime64[ns]")
+    for column in CUBE_DIMENSIONS[1:]:
+        out[column] = out[column].fillna("").astype(str)
+    for column in _COUNT_MEASURES:
+        out[column] = pd.to_numeric(out[column], errors="coerce").fillna(0).astype("int64")
+    out["resolution_days_sum"] = (
+        pd.to_numeric(out["resolution_days_sum"], errors="coerce").fillna(0.0).astype(float)
+    )
+    return out
+
+
+def _to_dt_naive(series: pd.Series) -> pd.Series:
+    out = pd.to_datetime(series, errors="coerce", utc=True)
+    return out.dt.tz_convert(None)
+
+
+def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype="object")
+    return df[column].fillna("").astype(str).str.strip()
+
+
+def _themes(df: pd.DataFrame) -> pd.Series:
+    summaries = _text_column(df, "summary")
+    # Many issues share a summary; classify each distinct text once.
+    labels = {text: classify_theme(text) for text in summaries.unique().tolist()}
+    return summaries.map(labels)
+
+
+def build_daily_cube(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate issue rows into daily cells keyed by `CUBE_DIMENSIONS`.
+
+    `created` counts issues created that day, `closed` issues whose `resolved`
+    falls on it (the daily flow chart semantics) and `finalized` issues whose
+    effective finalization falls on it (the period summary semantics), which also
+    carries the created -> finalized resolution days as sum/count. The status
+    bucket and theme describe the issue's current state. Days are UTC.
+    """
+    safe = df if isinstance(df, pd.DataFrame) else pd.DataFrame()
+    if safe.empty or "created" not in safe.columns:
+        return empty_cube()
+
+    dims = pd.DataFrame(
+        {
+            "source_id": _text_column(safe, "source_id"),
+            "country": _text_column(safe, "country"),
+            "status_bucket": np.where(effective_closed_mask(safe), "closed", "open"),
+            "priority": normalize_text_col(
+                safe["priority"] if "priority" in safe.columns else None, "(sin priority)"
+            ).reindex(safe.index, fill_value="(sin priority)"),
+            "tema": _themes(safe),
+        },
+        index=safe.index,
+    )
+    created = _to_dt_naive(safe["created"])
+    resolved = (
+        _to_dt_naive(safe["resolved"])
+        if "resolved" in safe.columns
+        else pd.Series(pd.NaT, index=safe.index, dtype="datetime64[ns]")
+    )
+    finalized = pd.to_datetime(effective_finalized_at(safe), errors="coerce")
+    resolution_days = ((finalized - created).dt.total_seconds() / 86400.0).clip(lower=0.0)
+
+    events = []
+    for when, measures in (
+        (created, {"created": 1}),
+        (resolved, {"closed": 1}),
+        (
+            finalized,
+            {
+                "finalized": 1,
+                "resolution_days_sum": resolution_days.fillna(0.0),
+                "resolution_days_count": resolution_days.notna().astype("int64"),
+            },
+        ),
+    ):
+        mask = when.notna()
+        if not bool(mask.any()):
+            continue
+        part = dims.loc[mask].copy()
+        part["date"] = when.loc[mask].dt.floor("D")
+        for measure in CUBE_MEASURES:
+            value = measures.get(measure, 0)
+            part[measure] = value.loc[mask] if isinstance(value, pd.Series) else value
+        events.append(part)
+    if not events:
+        return empty_cube()
+
+    cube = (
+        pd.concat(events, ignore_index=True)
+        .groupby(list(CUBE_DIMENSIONS), as_index=False, sort=True)[list(CUBE_MEASURES)]
+        .sum()
+    )
+    return normalize_cube(cube)
+
+
+def apply_cube_delta(
+    cube: pd.DataFrame, *, removed: pd.DataFrame, added: pd.DataFrame
+) -> pd.DataFrame:
+    """Patch `cube` by retracting the `removed` issue rows and adding the `added` ones."""
+    parts = [normalize_cube(cube)]
+    retracted = build_daily_cube(removed)
+    if not retracted.empty:
+        negated = retracted.copy()
+        negated.loc[:, list(CUBE_MEASURES)] = -negated.loc[:, list(CUBE_MEASURES)]
+        parts.append(negated)
+    fresh = build_daily_cube(added)
+    if not fresh.empty:
+        parts.append(fresh)
+    if len(parts) == 1:
+        return parts[0]
+    merged = (
+        pd.concat(parts, ignore_index=True)
+        .groupby(list(CUBE_DIMENSIONS), as_index=False, sort=True)[list(CUBE_MEASURES)]
+        .sum()
+    )
+    merged = normalize_cube(merged)
+    alive = merged.loc[:, list(_COUNT_MEASURES)].ne(0).any(axis=1)
+    return merged.loc[alive].reset_index(drop=True)
+
+
+def slice_cube(
+    cube: pd.DataFrame,
+    *,
+    country: str = "",
+    source_ids: Sequence[str] = (),
+    priorities: Sequence[str] = (),
+    status_buckets: Sequence[str] = (),
+    themes: Sequence[str] = (),
+) -> pd.DataFrame:
+    """Cube cells for one scope; empty selectors do not filter."""
+    if cube is None or cube.empty:
+        return empty_cube()
+    mask = pd.Series(True, index=cube.index)
+    country_txt = str(country or "").strip()
+    if country_txt:
+        mask &= cube["country"].eq(country_txt)
+    for column, values in (
+        ("source_id", source_ids),
+        ("priority", priorities),
+        ("status_bucket", status_buckets),
+        ("tema", themes),
+    ):
+        tokens = [str(value or "").strip() for value in list(values or []) if str(value).strip()]
+        if tokens:
+            mask &= cube[column].isin(tokens)
+    if bool(mask.all()):
+        return cube
+    return cube.loc[mask]
+
+
+def cube_daily_totals(cube: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sum a cube slice per day.
+
+    Adds `open_at_end`: issues created minus issues finalized up to and
+    including each day, i.e. the open backlog at the end of that day.
+    """
+    if cube is None or cube.empty:
+        return pd.DataFrame(columns=["date", *CUBE_MEASURES, "open_at_end"])
+    daily = cube.groupby("date", sort=True)[list(CUBE_MEASURES)].sum().reset_index()
+    daily["open_at_end"] = (daily["created"] - daily["finalized"]).cumsum().clip(lower=0)
+    return daily
+
+
+def cube_timeseries_daily(cube: pd.DataFrame, *, lookback_days: int = 90) -> pd.DataFrame:
+    """Same payload as `kpis.build_timeseries_daily` (without deployed) from a cube slice."""
+    daily = cube_daily_totals(cube)
+    active = daily.loc[daily["created"].gt(0) | daily["closed"].gt(0)] if not daily.empty else daily
+    if active.empty:
+        return pd.DataFrame(columns=_FLOW_COLUMNS)
+
+    end_ts = pd.Timestamp(active["date"].max()).normalize()
+    lookback_span = max(int(lookback_days or 0), 1)
+    start_ts = end_ts - pd.Timedelta(days=lookback_span - 1)
+    days = pd.date_range(start=start_ts, end=end_ts, freq="D")
+    by_day = daily.set_index("date")
+
+    flow = pd.DataFrame({"date": days})
+    flow["created"] = by_day["created"].reindex(days, fill_value=0).to_numpy()
+    flow["closed"] = by_day["closed"].reindex(days, fill_value=0).to_numpy()
+    net = flow["created"] - flow["closed"]
+    flow["open_backlog_proxy"] = net.cumsum().clip(lower=0)
+    return flow
+
+
+def cube_period_counts(
+    cube: pd.DataFrame, *, start: pd.Timestamp, end: pd.Timestamp
+) -> Dict[str, Any]:
+    """Created/finalized counts and mean resolution days for days in `[start, end]`."""
+    lo = pd.Timestamp(start).normalize()
+    hi = pd.Timestamp(end).normalize()
+    if lo.tzinfo is not None:
+        lo = lo.tz_convert(None)
+    if hi.tzinfo is not None:
+        hi = hi.tz_convert(None)
+    if cube is None or cube.empty:
+        window = empty_cube()
+    else:
+        window = cube.loc[cube["date"].between(lo, hi, inclusive="both")]
+    resolution_count = int(window["resolution_days_count"].sum())
+    return {
+        "created": int(window["created"].sum()),
+        "closed": int(window["closed"].sum()),
+        "finalized": int(window["finalized"].sum()),
+        "resolution_days_mean": (
+            float(window["resolution_days_sum"].sum()) / resolution_count
+            if resolution_count
+            else None
+        ),
+    }
+
+
+def cube_theme_daily_trend(
+    cube: pd.DataFrame, *, theme_whitelist: Sequence[str] | None = None
+) -> pd.DataFrame:
+    """Same payload as `insights.build_theme_daily_trend` from a cube slice."""
+    if cube is None or cube.empty:
+        return theme_daily_trend_from_counts(pd.DataFrame(), theme_whitelist=theme_whitelist)
+    counts = (
+        cube.groupby(["date", "tema"], as_index=False)["created"]
+        .sum()
+        .rename(columns={"created": "issues"})
+    )
+    return theme_daily_trend_from_counts(counts, theme_whitelist=theme_whitelist)
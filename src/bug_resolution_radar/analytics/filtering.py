@@ -14,6 +14,7 @@ from bug_resolution_radar.analytics.quincenal_scope import (
     normalize_quincenal_scope_label,
     quincenal_scope_options,
 )
+from bug_resolution_radar.analytics.search_index import IssueSearchIndex
 from bug_resolution_radar.config import Settings
 
 
@@ -72,8 +73,14 @@ def apply_text_like_filter(
     *,
     column: str,
     query: str,
+    search_index: IssueSearchIndex | None = None,
 ) -> pd.DataFrame:
-    """Apply a lightweight literal-like filter over a single column."""
+    """
+    Apply a lightweight literal-like filter over a single column.
+
+    With a `search_index` built over the frame `df` was filtered from, indexed
+    text columns are answered from the index instead of scanning every row.
+    """
     if df is None or df.empty:
         return pd.DataFrame() if df is None else df
     col_name = str(column or "").strip()
@@ -81,6 +88,12 @@ def apply_text_like_filter(
     if not col_name or not q or col_name not in df.columns:
         return df
 
+    if search_index is not None and search_index.supports_like(col_name):
+        index_mask = df.index.isin(search_index.match_labels(col_name, q))
+        if bool(index_mask.all()):
+            return df
+        return df.loc[index_mask].copy(deep=False)
+
     series = df[col_name]
     try:
         if pd.api.types.is_datetime64_any_dtype(series) or isinstance(
@@ -111,6 +124,7 @@ def apply_dashboard_issue_scope(
     issue_keys: Sequence[str] | None = None,
     sort_col: str = "",
     like_query: str = "",
+    search_index: IssueSearchIndex | None = None,
 ) -> pd.DataFrame:
     """Apply quincenal scope + explicit issue subset + like filter."""
     scoped = df
@@ -137,7 +151,9 @@ def apply_dashboard_issue_scope(
     ):
         scoped = apply_issue_key_scope(scoped, keys=issue_keys)
 
-    return apply_text_like_filter(scoped, column=sort_col, query=like_query)
+    return apply_text_like_filter(
+        scoped, column=sort_col, query=like_query, search_index=search_index
+    )
 
 
 def open_only(df: pd.DataFrame) -> pd.DataFrame:
@@ -606,6 +606,31 @@ def build_theme_daily_trend(
     work["tema"] = [
         classify_theme(summary, theme_rules=theme_rules) for summary in work["summary"].tolist()
     ]
+    counts = (
+        work.groupby(["date", "tema"], as_index=False).size().rename(columns={"size": "issues"})
+    )
+    return theme_daily_trend_from_counts(counts, theme_whitelist=theme_whitelist)
+
+
+def theme_daily_trend_from_counts(
+    counts: pd.DataFrame,
+    *,
+    theme_whitelist: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Daily theme trend from pre-aggregated `date` / `tema` / `issues` counts.
+
+    Shared by `build_theme_daily_trend` and the daily aggregate cube, so both
+    produce the same axis, theme order and columns.
+    """
+    safe = _safe_df(counts)
+    if safe.empty or not {"date", "tema", "issues"}.issubset(safe.columns):
+        return pd.DataFrame(columns=list(_EMPTY_THEME_DAILY_COLUMNS))
+    work = safe.loc[pd.to_numeric(safe["issues"], errors="coerce").fillna(0) > 0]
+    work = work.loc[:, ["date", "tema", "issues"]].copy(deep=False)
+    if work.empty:
+        return pd.DataFrame(columns=list(_EMPTY_THEME_DAILY_COLUMNS))
+    day_axis = _daily_axis(pd.Series(pd.to_datetime(work["date"]).to_numpy(copy=False)))
 
     theme_order: list[str]
     if theme_whitelist is not None:
@@ -616,7 +641,7 @@ def build_theme_daily_trend(
             return pd.DataFrame(columns=list(_EMPTY_THEME_DAILY_COLUMNS))
         work = work.loc[work["tema"].isin(theme_order)].copy(deep=False)
     else:
-        totals = work["tema"].value_counts()
+        totals = work.groupby("tema", sort=False)["issues"].sum()
         theme_order = order_theme_labels_by_volume(
             totals.index.tolist(),
             counts_by_label=totals,
@@ -625,10 +650,7 @@ def build_theme_daily_trend(
         if not theme_order:
             return pd.DataFrame(columns=list(_EMPTY_THEME_DAILY_COLUMNS))
 
-    grouped = (
-        work.groupby(["date", "tema"], as_index=False).size().rename(columns={"size": "issues"})
-    )
-    day_axis = _daily_axis(created)
+    grouped = work.groupby(["date", "tema"], as_index=False)["issues"].sum()
     if day_axis.empty:
         return pd.DataFrame(columns=list(_EMPTY_THEME_DAILY_COLUMNS))
 
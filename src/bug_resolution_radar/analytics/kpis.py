@@ -78,6 +78,17 @@ def _empty_timeseries_chart() -> Any:
     return px.line(empty_ts, x="date", y=["created", "closed", "open_backlog_proxy"])
 
 
+def build_timeseries_chart(timeseries_daily: pd.DataFrame) -> Any:
+    """KPI time series line chart over a `build_timeseries_daily` payload."""
+    if timeseries_daily.empty:
+        return _empty_timeseries_chart()
+    return px.line(
+        timeseries_daily,
+        x="date",
+        y=["created", "closed", "open_backlog_proxy"],
+    )
+
+
 def _normalize_status_token(value: object) -> str:
     txt = str(value or "").strip().lower()
     if not txt:
@@ -337,7 +348,12 @@ def compute_kpis(
         if not has_priority:
             return {}
         counts = priority.loc[mask].value_counts()
-        return {str(priority_name): int(count) for priority_name, count in counts.items()}
+        # Ties by name, so the order does not depend on row order (and matches SQL).
+        ranked = sorted(
+            ((str(priority_name), int(count)) for priority_name, count in counts.items()),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return dict(ranked)
 
     closed_all_mask = created_notna & resolved_notna
 
@@ -376,14 +392,7 @@ def compute_kpis(
             lookback_days=90,
             include_deployed=False,
         )
-        if timeseries_daily.empty:
-            timeseries_chart = _empty_timeseries_chart()
-        else:
-            timeseries_chart = px.line(
-                timeseries_daily,
-                x="date",
-                y=["created", "closed", "open_backlog_proxy"],
-            )
+        timeseries_chart = build_timeseries_chart(timeseries_daily)
 
     if open_now_total > 0 and has_summary:
         top_open = (
@@ -421,8 +421,12 @@ def build_period_functionality_followup_summary(
         if not open_filtered.empty
         else pd.Series(dtype="float64", name="avg_open_days")
     )
+    # Empty placeholders carry no index name, so name the axis after the concat.
     theme_stats = (
-        pd.concat([theme_new, theme_total, theme_avg_open_days], axis=1).fillna(0).reset_index()
+        pd.concat([theme_new, theme_total, theme_avg_open_days], axis=1)
+        .rename_axis("functionality")
+        .fillna(0)
+        .reset_index()
     )
     theme_rows = _rank_theme_rows(theme_stats)
 
@@ -0,0 +1,16 @@
+"""Quincenal scope labels, importable without pandas (API route defaults use them)."""
+
+from __future__ import annotations
+
+QUINCENAL_SCOPE_ALL = "Todas"
+QUINCENAL_SCOPE_CREATED_CURRENT = "Creadas en la quincena actual"
+QUINCENAL_SCOPE_CREATED_PREVIOUS = "Creadas en la quincena previa"
+QUINCENAL_SCOPE_CREATED_MONTH = "Creadas en el mes actual"
+QUINCENAL_SCOPE_CLOSED_CURRENT = "Cerradas en la quincena"
+QUINCENAL_SCOPE_RESOLUTION_CLOSED_CURRENT = (
+    "Días de resolución incidencias cerradas en la quincena actual"
+)
+QUINCENAL_SCOPE_OPEN_TOTAL = "Abiertas totales"
+QUINCENAL_SCOPE_MAESTRAS_OPEN = "Maestras abiertas"
+QUINCENAL_SCOPE_CRITICAL_HIGH_OPEN = "Incidencias con criticidad alta"
+QUINCENAL_SCOPE_OTHERS_OPEN = "Otras incidencias"
@@ -11,20 +11,21 @@ from bug_resolution_radar.analytics.period_summary import (
     open_issue_grouping,
     source_label_map,
 )
-from bug_resolution_radar.config import Settings
-
-QUINCENAL_SCOPE_ALL = "Todas"
-QUINCENAL_SCOPE_CREATED_CURRENT = "Creadas en la quincena actual"
-QUINCENAL_SCOPE_CREATED_PREVIOUS = "Creadas en la quincena previa"
-QUINCENAL_SCOPE_CREATED_MONTH = "Creadas en el mes actual"
-QUINCENAL_SCOPE_CLOSED_CURRENT = "Cerradas en la quincena"
-QUINCENAL_SCOPE_RESOLUTION_CLOSED_CURRENT = (
-    "Días de resolución incidencias cerradas en la quincena actual"
+from bug_resolution_radar.analytics.quincenal_labels import (
+    QUINCENAL_SCOPE_ALL,
+    QUINCENAL_SCOPE_CLOSED_CURRENT,
+    QUINCENAL_SCOPE_CREATED_CURRENT,
+    QUINCENAL_SCOPE_CREATED_MONTH,
+    QUINCENAL_SCOPE_CREATED_PREVIOUS,
+    QUINCENAL_SCOPE_CRITICAL_HIGH_OPEN,
+    QUINCENAL_SCOPE_OPEN_TOTAL,
+    QUINCENAL_SCOPE_OTHERS_OPEN,
+    QUINCENAL_SCOPE_RESOLUTION_CLOSED_CURRENT,
 )
-QUINCENAL_SCOPE_OPEN_TOTAL = "Abiertas totales"
-QUINCENAL_SCOPE_MAESTRAS_OPEN = "Maestras abiertas"
-QUINCENAL_SCOPE_CRITICAL_HIGH_OPEN = "Incidencias con criticidad alta"
-QUINCENAL_SCOPE_OTHERS_OPEN = "Otras incidencias"
+from bug_resolution_radar.analytics.quincenal_labels import (
+    QUINCENAL_SCOPE_MAESTRAS_OPEN as QUINCENAL_SCOPE_MAESTRAS_OPEN,
+)
+from bug_resolution_radar.config import Settings
 
 _LEGACY_LABEL_TO_CANONICAL: Dict[str, str] = {
     "Nuevas (quincena actual)": QUINCENAL_SCOPE_CREATED_CURRENT,
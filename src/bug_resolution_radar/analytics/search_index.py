@@ -0,0 +1,267 @@
+"""In-memory inverted index (words + trigrams) for issue text search."""
+
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Field -> ranking weight. A hit at the start of a word counts twice.
+SEARCH_FIELDS: Dict[str, float] = {
+    "key": 8.0,
+    "summary": 5.0,
+    "labels": 3.0,
+    "assignee": 2.0,
+    "description": 1.0,
+}
+# Scalar text columns whose index answers `apply_text_like_filter` exactly.
+_LIKE_COLUMNS = frozenset({"key", "summary", "description", "assignee"})
+_EXACT_KEY_BONUS = 100.0
+_WORD_RE = re.compile(r"\w+")
+_GRAM = 3
+
+
+def _cell_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return " ".join(str(item) for item in value if item is not None)
+    try:
+        if pd.isna(value):
+            return ""
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+
+def _csr(groups: np.ndarray, members: np.ndarray, size: int) -> tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(groups, kind="stable")
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(groups, minlength=size), out=offsets[1:])
+    return members[order], offsets
+
+
+def _gather(flat: np.ndarray, offsets: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Concatenate the CSR slices `flat[offsets[i]:offsets[i + 1]]` for `ids`, vectorised."""
+    if ids.size == 0:
+        return np.empty(0, dtype=flat.dtype)
+    starts = offsets[ids]
+    lengths = offsets[ids + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=flat.dtype)
+    shifts = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return flat[shifts + np.arange(total, dtype=np.int64)]
+
+
+class _FieldIndex:
+    """Words, word trigrams and postings for one text column."""
+
+    def __init__(self, texts: Sequence[str]) -> None:
+        codes, uniques = pd.factorize(pd.Series(list(texts), dtype="object").str.lower())
+        self.values: List[str] = [str(value) for value in uniques]
+        self._value_series = pd.Series(self.values, dtype="object")
+        self.codes = codes.astype(np.int64)
+        self.rows, self.row_offsets = _csr(
+            self.codes, np.arange(len(self.codes), dtype=np.int64), len(self.values)
+        )
+
+        words = self._value_series.str.findall(_WORD_RE.pattern).explode().dropna()
+        pairs = pd.DataFrame({"value": words.index.to_numpy(), "word": words.to_numpy()})
+        pairs = pairs.drop_duplicates()
+        # Sorted vocabulary so prefix lookups are a bisect range.
+        word_codes, vocab = pd.factorize(pairs["word"], sort=True)
+        self.vocab: List[str] = [str(word) for word in vocab]
+        self.word_values, self.word_offsets = _csr(
+            word_codes.astype(np.int64),
+            pairs["value"].to_numpy(dtype=np.int64),
+            len(self.vocab),
+        )
+
+        grams: Dict[str, List[int]] = {}
+        for word_id, word in enumerate(self.vocab):
+            for gram in {word[i : i + _GRAM] for i in range(len(word) - _GRAM + 1)}:
+                grams.setdefault(gram, []).append(word_id)
+        self.grams = {gram: np.array(ids, dtype=np.int64) for gram, ids in grams.items()}
+
+    def _words_containing(self, term: str) -> np.ndarray:
+        if len(term) < _GRAM:
+            return np.array([i for i, word in enumerate(self.vocab) if term in word], np.int64)
+        candidates: Optional[np.ndarray] = None
+        for gram in {term[i : i + _GRAM] for i in range(len(term) - _GRAM + 1)}:
+            posting = self.grams.get(gram)
+            if posting is None:
+                return np.empty(0, dtype=np.int64)
+            candidates = (
+                posting
+                if candidates is None
+                else np.intersect1d(candidates, posting, assume_unique=True)
+            )
+        assert candidates is not None
+        return np.array([i for i in candidates.tolist() if term in self.vocab[i]], np.int64)
+
+    def _words_with_prefix(self, term: str) -> np.ndarray:
+        lo = bisect.bisect_left(self.vocab, term)
+        hi = bisect.bisect_left(self.vocab, term + "\U0010ffff")
+        return np.arange(lo, hi, dtype=np.int64)
+
+    def _values_for_words(self, word_ids: np.ndarray) -> np.ndarray:
+        return np.unique(_gather(self.word_values, self.word_offsets, word_ids))
+
+    def value_ids_containing(self, query: str) -> np.ndarray:
+        """Value ids whose text contains `query` (already lower-cased) as a substring."""
+        terms = _WORD_RE.findall(query)
+        if not terms:
+            candidates = np.arange(len(self.values), dtype=np.int64)
+        else:
+            # Every word run of the query lies inside one word of a matching value.
+            candidates = None
+            for term in sorted(set(terms), key=len, reverse=True):
+                found = self._values_for_words(self._words_containing(term))
+                candidates = (
+                    found
+                    if candidates is None
+                    else np.intersect1d(candidates, found, assume_unique=True)
+                )
+                if candidates.size == 0:
+                    return candidates
+        assert candidates is not None
+        if candidates.size == 0:
+            return candidates
+        texts = self._value_series.iloc[candidates]
+        verified: np.ndarray = candidates[texts.str.contains(query, regex=False).to_numpy(bool)]
+        return verified
+
+    def value_ids_with_word_prefix(self, term: str) -> np.ndarray:
+        return self._values_for_words(self._words_with_prefix(term))
+
+    def value_ids_containing_word_part(self, term: str) -> np.ndarray:
+        return self._values_for_words(self._words_containing(term))
+
+    def positions(self, value_ids: np.ndarray) -> np.ndarray:
+        return _gather(self.rows, self.row_offsets, value_ids)
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    label: Any
+    score: float
+    fields: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SearchResults:
+    total: int
+    hits: List[SearchHit]
+
+
+class IssueSearchIndex:
+    """
+    Inverted index over the text columns of one issues frame.
+
+    Each column keeps its distinct values, the words in them (sorted, for
+    prefix lookups), a trigram index over those words (for substring lookups)
+    and word -> value -> row postings. Columns are indexed lazily on first use,
+    so a frame only pays for the columns that are actually searched. Lookups
+    return labels of the source frame index, ready to intersect with other
+    filter masks.
+    """
+
+    def __init__(self, df: pd.DataFrame, *, columns: Sequence[str] = tuple(SEARCH_FIELDS)):
+        safe = df if isinstance(df, pd.DataFrame) else pd.DataFrame()
+        self.index = safe.index
+        self._frame = safe
+        self._columns = tuple(col for col in columns if col in safe.columns)
+        self._fields: Dict[str, _FieldIndex] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def covers_rows(self, df: pd.DataFrame) -> bool:
+        """True when every row of `df` is a row of the indexed frame (same label, same key)."""
+        if not isinstance(df, pd.DataFrame) or "key" not in df.columns:
+            return False
+        if "key" not in self._frame.columns or not self.index.is_unique:
+            return False
+        if not bool(df.index.isin(self.index).all()):
+            return False
+        return bool(self._frame["key"].reindex(df.index).equals(df["key"]))
+
+    def supports_like(self, column: str) -> bool:
+        token = str(column or "").strip()
+        return token in self._columns and token in _LIKE_COLUMNS
+
+    def _field(self, column: str) -> _FieldIndex:
+        with self._lock:
+            field = self._fields.get(column)
+            if field is None:
+                texts = [_cell_text(value) for value in self._frame[column].tolist()]
+                field = _FieldIndex(texts)
+                self._fields[column] = field
+            return field
+
+    def match_labels(self, column: str, query: str) -> pd.Index:
+        """Labels of rows whose `column` contains `query` (case-insensitive substring)."""
+        field = self._field(str(column).strip())
+        positions = field.positions(field.value_ids_containing(str(query or "").lower()))
+        return self.index[np.sort(positions)]
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 50,
+        within: Optional[pd.Index] = None,
+    ) -> SearchResults:
+        """
+        Ranked search: every word of `query` must appear (as part of a word) in
+        some indexed column. Scores add the column weight per matching term,
+        doubled when the term starts a word, plus a bonus for an exact key.
+        `total` counts every match; `hits` holds the best `limit` of them.
+        """
+        text = str(query or "").strip().lower()
+        terms = list(dict.fromkeys(_WORD_RE.findall(text)))
+        if not terms or len(self) == 0:
+            return SearchResults(total=0, hits=[])
+        n_rows = len(self)
+        scores = np.zeros(n_rows, dtype=float)
+        matched = np.ones(n_rows, dtype=bool)
+        field_hits: Dict[str, np.ndarray] = {}
+        for term in terms:
+            term_hit = np.zeros(n_rows, dtype=bool)
+            for column in self._columns:
+                weight = SEARCH_FIELDS.get(column, 1.0)
+                field = self._field(column)
+                contains = field.positions(field.value_ids_containing_word_part(term))
+                if contains.size == 0:
+                    continue
+                prefix = field.positions(field.value_ids_with_word_prefix(term))
+                scores[contains] += weight
+                scores[prefix] += weight
+                term_hit[contains] = True
+                column_hits = field_hits.setdefault(column, np.zeros(n_rows, dtype=bool))
+                column_hits[contains] = True
+            matched &= term_hit
+        if "key" in self._columns:
+            key_field = self._field("key")
+            exact = [i for i, value in enumerate(key_field.values) if value == text]
+            scores[key_field.positions(np.array(exact, dtype=np.int64))] += _EXACT_KEY_BONUS
+        if within is not None:
+            matched &= self.index.isin(within)
+        candidates = np.flatnonzero(matched)
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")][: max(int(limit), 0)]
+        hits = [
+            SearchHit(
+                label=self.index[pos],
+                score=round(float(scores[pos]), 3),
+                fields=tuple(col for col, seen in field_hits.items() if seen[pos]),
+            )
+            for pos in ranked.tolist()
+        ]
+        return SearchResults(total=int(candidates.size), hits=hits)
@@ -272,8 +272,11 @@ def _insights_age_buckets(ctx: ChartContext) -> List[str]:
 
 
 def _render_resolution_hist(ctx: ChartContext) -> Optional[go.Figure]:
-    payload = build_open_age_priority_payload(ctx.dff)
-    grouped = payload.get("grouped") if isinstance(payload, dict) else None
+    # The SQL engine pre-aggregates the age × priority counts into the KPIs.
+    grouped = (ctx.kpis or {}).get("open_age_priority")
+    if not isinstance(grouped, pd.DataFrame):
+        payload = build_open_age_priority_payload(ctx.dff)
+        grouped = payload.get("grouped") if isinstance(payload, dict) else None
     if not isinstance(grouped, pd.DataFrame) or grouped.empty:
         return None
 
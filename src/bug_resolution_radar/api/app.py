@@ -2,30 +2,39 @@
 
 from __future__ import annotations
 
+import copy
+from collections import OrderedDict
 from contextlib import contextmanager
 from functools import lru_cache
 import json
 import os
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Iterator, MutableMapping, Sequence
+from threading import Lock
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-import pandas as pd
 from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import FileResponse, JSONResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from bug_resolution_radar.analytics.analysis_window import apply_analysis_depth_filter
-from bug_resolution_radar.analytics.filtering import FilterState, normalize_filter_tokens
-from bug_resolution_radar.analytics.issues import normalize_text_col
-from bug_resolution_radar.analytics.quincenal_scope import (
-    QUINCENAL_SCOPE_ALL,
-    quincenal_scope_options,
-)
+from bug_resolution_radar.analytics.quincenal_labels import QUINCENAL_SCOPE_ALL
 from bug_resolution_radar.config import (
     Settings,
     all_configured_sources,
@@ -34,79 +43,97 @@ from bug_resolution_radar.config import (
     jira_sources,
     load_settings,
     restore_env_from_example,
+    settings_cache_token,
     supported_countries,
 )
 from bug_resolution_radar.ingest.browser_runtime import open_url_in_configured_browser
-from bug_resolution_radar.ingest.helix_ingest import ingest_helix as execute_helix_ingest
-from bug_resolution_radar.ingest.jira_ingest import ingest_jira as execute_jira_ingest
 from bug_resolution_radar.models.schema_helix import HelixDocument
-from bug_resolution_radar.repositories.helix_repo import HelixRepo
-from bug_resolution_radar.reports.service import (
-    build_report_filters,
-    generate_executive_report_artifact,
-    generate_period_followup_report_artifact,
-    save_report_content,
-)
-from bug_resolution_radar.repositories.issues_store import (
-    load_issues_df,
-    load_issues_workspace_index,
-)
-from bug_resolution_radar.services.dashboard_snapshot import (
-    DashboardQuery,
-    build_dashboard_defaults,
-    build_dashboard_snapshot,
-    build_default_filters,
-    build_intelligence_snapshot,
-    build_issue_keys,
-    build_issue_rows,
-    build_kanban_columns,
-    build_trend_detail,
-    load_scope_context,
-)
+from bug_resolution_radar.services.compute_pool import API_COMPUTE_POOL
 from bug_resolution_radar.services.downloads import (
+    reserve_download_path,
     resolve_download_target,
     save_download_content,
 )
-from bug_resolution_radar.services.helix_raw_export import build_helix_raw_export_frame
-from bug_resolution_radar.services.ingest_contracts import (
-    ingest_overview_payload,
-    persist_ingest_selection,
-)
-from bug_resolution_radar.services.ingest_async import (
-    get_ingest_progress,
-    start_ingest_job,
-)
-from bug_resolution_radar.services.ingest_runner import run_helix_ingest, run_jira_ingest
 from bug_resolution_radar.services.notes import NotesStore
-from bug_resolution_radar.services.settings_contracts import (
-    load_settings_payload,
-    save_settings_payload,
-)
-from bug_resolution_radar.services.source_maintenance import (
-    cache_inventory,
-    purge_source_cache,
-    reset_cache_store,
-    source_cache_impact,
-)
-from bug_resolution_radar.services.sources_excel import (
-    build_sources_export_excel_bytes,
-    import_sources_from_excel_bytes,
-)
-from bug_resolution_radar.services.tabular_export import (
-    dataframes_to_xlsx_bytes,
-    dataframe_to_csv_bytes,
-    dataframe_to_xlsx_bytes,
-    download_filename,
-)
-from bug_resolution_radar.services.workspace import (
-    WorkspaceSelection,
-    apply_workspace_source_scope,
-    available_sources_by_country,
-    merge_sources_by_country,
-)
+from bug_resolution_radar.services.warmup import schedule_warmup
 from bug_resolution_radar.theme.design_tokens import frontend_theme_tokens
 from bug_resolution_radar.theme.semantic_colors import semantic_color_contract
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from bug_resolution_radar.models.schema import IssuesDocument
+    from bug_resolution_radar.reports.service import (
+        ExecutiveReportResult,
+        PeriodFollowupReportResult,
+    )
+    from bug_resolution_radar.services.dashboard_snapshot import DashboardQuery
+    from bug_resolution_radar.services.helix_raw_export import HelixRawExport
+    from bug_resolution_radar.services.workspace import WorkspaceSelection
+
+_WORKSPACE_PAYLOAD_CACHE_MAX_ENTRIES = 32
+_WORKSPACE_PAYLOAD_CACHE_TTL_SECONDS = 12.0
+_workspace_payload_cache: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = OrderedDict()
+_workspace_payload_cache_lock = Lock()
+_INGEST_STREAM_KEEPALIVE_SECONDS = 15.0
+_INGEST_STREAM_RETRY_MS = 3000
+
+
+# pandas, the ingest connectors and report rendering (python-pptx, plotly) are
+# imported on first use, so `/api/health` and the SPA are served right after boot;
+# `services.warmup` loads them in the background once the health check answers.
+# The wrappers below keep the module-level names routes and tests patch.
+
+
+def execute_jira_ingest(*args: Any, **kwargs: Any) -> Tuple[bool, str, Optional[IssuesDocument]]:
+    from bug_resolution_radar.ingest.jira_ingest import ingest_jira
+
+    return ingest_jira(*args, **kwargs)
+
+
+def execute_helix_ingest(*args: Any, **kwargs: Any) -> Tuple[bool, str, Optional[HelixDocument]]:
+    from bug_resolution_radar.ingest.helix_ingest import ingest_helix
+
+    return ingest_helix(*args, **kwargs)
+
+
+def generate_executive_report_artifact(settings: Settings, **kwargs: Any) -> ExecutiveReportResult:
+    from bug_resolution_radar.reports.service import generate_executive_report_artifact
+
+    return generate_executive_report_artifact(settings, **kwargs)
+
+
+def generate_period_followup_report_artifact(
+    settings: Settings, **kwargs: Any
+) -> PeriodFollowupReportResult:
+    from bug_resolution_radar.reports.service import generate_period_followup_report_artifact
+
+    return generate_period_followup_report_artifact(settings, **kwargs)
+
+
+def persist_ingest_selection(
+    settings: Settings, *, connector: str, selected_source_ids: list[str]
+) -> Settings:
+    from bug_resolution_radar.services.ingest_contracts import persist_ingest_selection
+
+    return persist_ingest_selection(
+        settings, connector=connector, selected_source_ids=selected_source_ids
+    )
+
+
+def start_ingest_job(
+    connector: str, *, settings: Settings, selected_sources: list[Dict[str, str]]
+) -> Dict[str, Any]:
+    from bug_resolution_radar.services.ingest_async import start_ingest_job
+
+    return start_ingest_job(connector, settings=settings, selected_sources=selected_sources)
+
+
+def get_ingest_progress(connector: str) -> Dict[str, Any]:
+    from bug_resolution_radar.services.ingest_async import get_ingest_progress
+
+    return get_ingest_progress(connector)
+
 
 class SPAStaticFiles(StaticFiles):
     """Serve bundled frontend assets with SPA fallback for client-side routes."""
@@ -221,12 +248,65 @@ def _sync_settings_to_process_env(settings: Settings) -> Iterator[None]:
                 os.environ.pop(env_key, None)
 
 
+def _request_flight_key(request: Request) -> tuple[Any, ...]:
+    """Identify identical GET requests so concurrent duplicates share one computation."""
+    return (request.url.path, tuple(sorted(request.query_params.multi_items())))
+
+
+def _sse_frame(event: str, payload: dict[str, Any], *, event_id: int) -> str:
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {int(event_id)}\nevent: {event}\ndata: {data}\n\n"
+
+
+def _resume_seq(request: Request, after: int | None) -> int | None:
+    """`Last-Event-ID` (browser reconnects) wins over the explicit `after` parameter."""
+    header = str(request.headers.get("last-event-id") or "").strip()
+    if header:
+        try:
+            return int(header)
+        except ValueError:
+            return None
+    return after
+
+
+async def _ingest_event_stream(
+    request: Request, connector: str, *, after_seq: int | None
+) -> AsyncIterator[str]:
+    """
+    Server-sent ingest progress: a `snapshot` when the client cannot resume,
+    then one `progress` frame per event, plus a fresh `snapshot` after each
+    `run_finished` so the final result travels without an extra request.
+    """
+    from bug_resolution_radar.services.ingest_async import IngestEventWaiter, ingest_events_since
+
+    yield f"retry: {_INGEST_STREAM_RETRY_MS}\n\n"
+    cursor = after_seq
+    with IngestEventWaiter(connector) as waiter:
+        while not await request.is_disconnected():
+            batch = ingest_events_since(connector, cursor)
+            snapshot = batch["snapshot"]
+            if snapshot is not None:
+                cursor = int(batch["lastSeq"])
+                yield _sse_frame("snapshot", snapshot, event_id=cursor)
+            for event in batch["events"]:
+                cursor = int(event["seq"])
+                yield _sse_frame("progress", event, event_id=cursor)
+            if any(event.get("type") == "run_finished" for event in batch["events"]):
+                final = ingest_events_since(connector, None)
+                cursor = int(final["lastSeq"])
+                yield _sse_frame("snapshot", final["snapshot"], event_id=cursor)
+            if not await waiter.wait(_INGEST_STREAM_KEEPALIVE_SECONDS):
+                yield ": keepalive\n\n"
+
+
 def _workspace_query(
     *,
     country: str = "",
     source_id: str = "",
     scope_mode: str = "source",
 ) -> WorkspaceSelection:
+    from bug_resolution_radar.services.workspace import WorkspaceSelection
+
     return WorkspaceSelection(
         country=str(country or "").strip(),
         source_id=str(source_id or "").strip(),
@@ -249,6 +329,9 @@ def _dashboard_query(
     chart_ids: str = "",
     dark_mode: bool = False,
 ) -> DashboardQuery:
+    from bug_resolution_radar.analytics.filtering import FilterState, normalize_filter_tokens
+    from bug_resolution_radar.services.dashboard_snapshot import DashboardQuery
+
     return DashboardQuery(
         workspace=_workspace_query(
             country=country,
@@ -312,6 +395,12 @@ def _scoped_dataframe_for_options(
     *,
     workspace: WorkspaceSelection,
 ) -> pd.DataFrame:
+    import pandas as pd
+
+    from bug_resolution_radar.analytics.analysis_window import apply_analysis_depth_filter
+    from bug_resolution_radar.repositories.issues_store import load_issues_df
+    from bug_resolution_radar.services.workspace import apply_workspace_source_scope
+
     try:
         df_all = load_issues_df(settings.DATA_PATH)
     except Exception:
@@ -326,6 +415,8 @@ def _filter_options(df: pd.DataFrame) -> dict[str, list[str]]:
     if df is None or df.empty:
         return _empty_filter_options()
 
+    from bug_resolution_radar.analytics.issues import normalize_text_col
+
     out: dict[str, list[str]] = {
         "status": [],
         "priority": [],
@@ -401,6 +492,15 @@ def _sources_by_country_from_index(
     return out
 
 
+def _data_file_revision(path: str) -> tuple[str, int, int]:
+    resolved = Path(str(path or "")).expanduser()
+    try:
+        stat = resolved.stat()
+    except OSError:
+        return (str(resolved), -1, -1)
+    return (str(resolved), int(stat.st_mtime_ns), int(stat.st_size))
+
+
 def _workspace_payload(
     settings: Settings,
     *,
@@ -409,6 +509,56 @@ def _workspace_payload(
     scope_mode: str = "source",
     include_filter_options: bool = True,
 ) -> dict[str, Any]:
+    cache_key = (
+        settings_cache_token(settings),
+        _data_file_revision(settings.DATA_PATH),
+        str(country or "").strip(),
+        str(source_id or "").strip(),
+        str(scope_mode or "").strip().lower(),
+        bool(include_filter_options),
+    )
+    now = monotonic()
+    with _workspace_payload_cache_lock:
+        cached = _workspace_payload_cache.get(cache_key)
+        if cached is not None and (now - cached[0]) <= _WORKSPACE_PAYLOAD_CACHE_TTL_SECONDS:
+            _workspace_payload_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached[1])
+
+    payload = _build_workspace_payload(
+        settings,
+        country=country,
+        source_id=source_id,
+        scope_mode=scope_mode,
+        include_filter_options=include_filter_options,
+    )
+    with _workspace_payload_cache_lock:
+        _workspace_payload_cache[cache_key] = (now, copy.deepcopy(payload))
+        _workspace_payload_cache.move_to_end(cache_key)
+        while len(_workspace_payload_cache) > _WORKSPACE_PAYLOAD_CACHE_MAX_ENTRIES:
+            _workspace_payload_cache.popitem(last=False)
+    return payload
+
+
+def _build_workspace_payload(
+    settings: Settings,
+    *,
+    country: str,
+    source_id: str,
+    scope_mode: str,
+    include_filter_options: bool,
+) -> dict[str, Any]:
+    import pandas as pd
+
+    from bug_resolution_radar.analytics.quincenal_scope import quincenal_scope_options
+    from bug_resolution_radar.repositories.issues_store import (
+        load_issues_df,
+        load_issues_workspace_index,
+    )
+    from bug_resolution_radar.services.workspace import (
+        available_sources_by_country,
+        merge_sources_by_country,
+    )
+
     df_all = pd.DataFrame()
     has_data = False
     try:
@@ -533,6 +683,10 @@ def _download_headers(filename: str) -> dict[str, str]:
 
 
 def _export_dataframe(settings: Settings, *, query: DashboardQuery) -> pd.DataFrame:
+    import pandas as pd
+
+    from bug_resolution_radar.services.dashboard_snapshot import build_issue_rows
+
     result = build_issue_rows(
         settings,
         query=query,
@@ -546,6 +700,8 @@ def _export_dataframe(settings: Settings, *, query: DashboardQuery) -> pd.DataFr
 
 
 def _helix_export_dataframe(settings: Settings, *, query: DashboardQuery) -> pd.DataFrame:
+    from bug_resolution_radar.services.dashboard_snapshot import load_scope_context
+
     context = load_scope_context(settings, query=query)
     dff = context.dff.copy(deep=False)
     if dff.empty:
@@ -574,7 +730,7 @@ def _helix_data_path_and_mtime(settings: Settings) -> tuple[str, int]:
         return str(resolved), -1
 
 
-def _helix_raw_export_bytes(settings: Settings, *, query: DashboardQuery) -> bytes:
+def _helix_raw_export(settings: Settings, *, query: DashboardQuery) -> HelixRawExport:
     export_df = _helix_export_dataframe(settings, query=query)
     if export_df.empty:
         raise HTTPException(status_code=400, detail="No hay incidencias para exportar.")
@@ -599,41 +755,28 @@ def _helix_raw_export_bytes(settings: Settings, *, query: DashboardQuery) -> byt
             detail="No se ha encontrado el volcado Helix requerido para la exportación raw.",
         )
 
+    from bug_resolution_radar.services.helix_raw_export import open_helix_raw_export
+
     try:
-        helix_doc = HelixRepo(Path(helix_path)).load() or HelixDocument.empty()
+        raw_export = open_helix_raw_export(helix_df, helix_path=helix_path)
     except Exception:
-        helix_doc = HelixDocument.empty()
-    helix_items_by_merge_key = {}
-    for item in helix_doc.items:
-        source_id = str(item.source_id or "").strip().lower()
-        issue_key = str(item.id or "").strip().upper()
-        if not issue_key:
-            continue
-        merge_key = f"{source_id}::{issue_key}" if source_id else issue_key
-        helix_items_by_merge_key[merge_key] = item
-
-    if not helix_items_by_merge_key:
         raise HTTPException(
             status_code=400,
             detail="No se ha podido cargar el dataset raw de Helix para la exportación.",
-        )
-    raw_df = build_helix_raw_export_frame(
-        helix_df,
-        helix_items_by_merge_key=helix_items_by_merge_key,
-    )
-    if raw_df is None or raw_df.empty:
+        ) from None
+    if raw_export is None or len(raw_export) == 0:
         raise HTTPException(
             status_code=400,
             detail="No se han encontrado filas raw de Helix para las incidencias filtradas.",
         )
+    return raw_export
 
-    return dataframes_to_xlsx_bytes(
-        [("Helix Raw", raw_df)],
-        include_index=False,
-        hyperlink_columns_by_sheet={
-            "Helix Raw": [("ID de la Incidencia", "__item_url__")],
-        },
-    )
+
+def _write_helix_raw_export(raw_export: HelixRawExport, target: Path, *, fmt: str) -> None:
+    if fmt == "csv":
+        raw_export.write_csv(target)
+    else:
+        raw_export.write_xlsx(target)
 
 
 class SourceSelectionRequest(BaseModel):
@@ -772,18 +915,34 @@ def create_app() -> FastAPI:
 
     @app.get("/api/health")
     def health() -> dict[str, Any]:
+        # The desktop shell waits for this answer: heavy modules load right after it.
+        schedule_warmup(load_settings)
         return {
             "ok": True,
             "frontendDist": str(_frontend_dist_dir() or ""),
             "frontendDevUrl": _frontend_dev_url(),
         }
 
+    @app.get("/api/metrics")
+    def metrics() -> dict[str, Any]:
+        from bug_resolution_radar.reports.render_cache import render_cache_stats
+
+        return {
+            "compute": API_COMPUTE_POOL.stats(),
+            "renderCache": render_cache_stats(),
+        }
+
     @app.get("/api/bootstrap")
     def bootstrap(
         country: str = "",
         sourceId: str = "",
         scopeMode: str = "source",
     ) -> dict[str, Any]:
+        from bug_resolution_radar.services.dashboard_snapshot import (
+            build_dashboard_defaults,
+            build_default_filters,
+        )
+
         settings = load_settings()
         return {
             "appTitle": str(settings.APP_TITLE or "Bug Resolution Radar"),
@@ -819,21 +978,26 @@ def create_app() -> FastAPI:
         }
 
     @app.get("/api/workspace")
-    def workspace_options(
+    async def workspace_options(
+        request: Request,
         country: str = "",
         sourceId: str = "",
         scopeMode: str = "source",
     ) -> dict[str, Any]:
-        settings = load_settings()
-        return _workspace_payload(
-            settings,
-            country=country,
-            source_id=sourceId,
-            scope_mode=scopeMode,
-        )
+        def _compute() -> dict[str, Any]:
+            settings = load_settings()
+            return _workspace_payload(
+                settings,
+                country=country,
+                source_id=sourceId,
+                scope_mode=scopeMode,
+            )
+
+        return await API_COMPUTE_POOL.run(_compute, key=_request_flight_key(request))
 
     @app.get("/api/dashboard")
-    def dashboard(
+    async def dashboard(
+        request: Request,
         country: str = "",
         sourceId: str = "",
         scopeMode: str = "source",
@@ -847,33 +1011,46 @@ def create_app() -> FastAPI:
         chartIds: str = "",
         darkMode: bool = False,
     ) -> dict[str, Any]:
-        settings = load_settings()
-        query = _dashboard_query(
-            country=country,
-            source_id=sourceId,
-            scope_mode=scopeMode,
-            status=status,
-            priority=priority,
-            assignee=assignee,
-            quincenal_scope=quincenalScope,
-            issue_keys=issueKeys,
-            issue_sort_col=issueSortCol,
-            issue_like_query=issueLikeQuery,
-            chart_ids=chartIds,
-            dark_mode=darkMode,
-        )
-        payload = build_dashboard_snapshot(settings, query=query)
-        payload["workspace"] = _workspace_payload(
-            settings,
-            country=query.workspace.country,
-            source_id=query.workspace.source_id,
-            scope_mode=query.workspace.scope_mode,
-            include_filter_options=False,
-        )
-        return payload
+        def _compute() -> dict[str, Any]:
+            from bug_resolution_radar.services.dashboard_snapshot import build_dashboard_snapshot
+            from bug_resolution_radar.services.scope_prewarm import (
+                prewarmed_dashboard_snapshot,
+                record_scope_usage,
+            )
+
+            settings = load_settings()
+            query = _dashboard_query(
+                country=country,
+                source_id=sourceId,
+                scope_mode=scopeMode,
+                status=status,
+                priority=priority,
+                assignee=assignee,
+                quincenal_scope=quincenalScope,
+                issue_keys=issueKeys,
+                issue_sort_col=issueSortCol,
+                issue_like_query=issueLikeQuery,
+                chart_ids=chartIds,
+                dark_mode=darkMode,
+            )
+            record_scope_usage(settings, query)
+            payload = prewarmed_dashboard_snapshot(settings, query)
+            if payload is None:
+                payload = build_dashboard_snapshot(settings, query=query)
+            payload["workspace"] = _workspace_payload(
+                settings,
+                country=query.workspace.country,
+                source_id=query.workspace.source_id,
+                scope_mode=query.workspace.scope_mode,
+                include_filter_options=False,
+            )
+            return payload
+
+        return await API_COMPUTE_POOL.run(_compute, key=_request_flight_key(request))
 
     @app.get("/api/intelligence")
-    def intelligence(
+    async def intelligence(
+        request: Request,
         country: str = "",
         sourceId: str = "",
         scopeMode: str = "source",
@@ -891,32 +1068,38 @@ def create_app() -> FastAPI:
         insightsStatusManual: bool = False,
         darkMode: bool = False,
     ) -> dict[str, Any]:
-        settings = load_settings()
-        query = _dashboard_query(
-            country=country,
-            source_id=sourceId,
-            scope_mode=scopeMode,
-            status=status,
-            priority=priority,
-            assignee=assignee,
-            quincenal_scope=quincenalScope,
-            issue_keys=issueKeys,
-            issue_sort_col=issueSortCol,
-            issue_like_query=issueLikeQuery,
-            dark_mode=darkMode,
-        )
-        return build_intelligence_snapshot(
-            settings,
-            query=query,
-            insights_view_mode=insightsViewMode,
-            insights_status_filters=_split_csv_param(insightsStatus),
-            insights_priority_filters=_split_csv_param(insightsPriority),
-            insights_functionality_filters=_split_csv_param(insightsFunctionality),
-            insights_status_manual=bool(insightsStatusManual),
-        )
+        def _compute() -> dict[str, Any]:
+            from bug_resolution_radar.services.dashboard_snapshot import build_intelligence_snapshot
+
+            settings = load_settings()
+            query = _dashboard_query(
+                country=country,
+                source_id=sourceId,
+                scope_mode=scopeMode,
+                status=status,
+                priority=priority,
+                assignee=assignee,
+                quincenal_scope=quincenalScope,
+                issue_keys=issueKeys,
+                issue_sort_col=issueSortCol,
+                issue_like_query=issueLikeQuery,
+                dark_mode=darkMode,
+            )
+            return build_intelligence_snapshot(
+                settings,
+                query=query,
+                insights_view_mode=insightsViewMode,
+                insights_status_filters=_split_csv_param(insightsStatus),
+                insights_priority_filters=_split_csv_param(insightsPriority),
+                insights_functionality_filters=_split_csv_param(insightsFunctionality),
+                insights_status_manual=bool(insightsStatusManual),
+            )
+
+        return await API_COMPUTE_POOL.run(_compute, key=_request_flight_key(request))
 
     @app.get("/api/trends/detail")
-    def trend_detail(
+    async def trend_detail(
+        request: Request,
         chartId: str,
         country: str = "",
         sourceId: str = "",
@@ -930,24 +1113,55 @@ def create_app() -> FastAPI:
         issueLikeQuery: str = "",
         darkMode: bool = False,
     ) -> dict[str, Any]:
-        settings = load_settings()
-        query = _dashboard_query(
-            country=country,
-            source_id=sourceId,
-            scope_mode=scopeMode,
-            status=status,
-            priority=priority,
-            assignee=assignee,
-            quincenal_scope=quincenalScope,
-            issue_keys=issueKeys,
-            issue_sort_col=issueSortCol,
-            issue_like_query=issueLikeQuery,
-            dark_mode=darkMode,
-        )
-        return build_trend_detail(settings, query=query, chart_id=chartId)
+        def _compute() -> dict[str, Any]:
+            from bug_resolution_radar.services.dashboard_snapshot import build_trend_detail
+
+            settings = load_settings()
+            query = _dashboard_query(
+                country=country,
+                source_id=sourceId,
+                scope_mode=scopeMode,
+                status=status,
+                priority=priority,
+                assignee=assignee,
+                quincenal_scope=quincenalScope,
+                issue_keys=issueKeys,
+                issue_sort_col=issueSortCol,
+                issue_like_query=issueLikeQuery,
+                dark_mode=darkMode,
+            )
+            return build_trend_detail(settings, query=query, chart_id=chartId)
+
+        return await API_COMPUTE_POOL.run(_compute, key=_request_flight_key(request))
+
+    @app.get("/api/trends/daily-flow")
+    async def trends_daily_flow(
+        request: Request,
+        country: str = "",
+        sourceIds: str = "",
+        priority: str = "",
+        statusBucket: str = "",
+        theme: str = "",
+        lookbackDays: int = Query(90, ge=1, le=3660),
+    ) -> dict[str, Any]:
+        def _compute() -> dict[str, Any]:
+            from bug_resolution_radar.services.dashboard_snapshot import build_daily_flow
+
+            return build_daily_flow(
+                load_settings(),
+                country=country,
+                source_ids=_split_csv_param(sourceIds),
+                priorities=_split_csv_param(priority),
+                status_buckets=_split_csv_param(statusBucket),
+                themes=_split_csv_param(theme),
+                lookback_days=lookbackDays,
+            )
+
+        return await API_COMPUTE_POOL.run(_compute, key=_request_flight_key(request))
 
     @app.get("/api/issues")
-    def issues(
+    async def issues(
+        request: Request,
         country: str = "",
         sourceId: str = "",
         scopeMode: str = "source",
@@ -962,31 +1176,80 @@ def create_app() -> FastAPI:
         limit: int = Query(100, ge=1, le=50000),
         sortBy: str = "updated",
         sortDir: str = "desc",
+        after: str = "",
+        fields: str = "",
     ) -> dict[str, Any]:
-        settings = load_settings()
-        query = _dashboard_query(
-            country=country,
-            source_id=sourceId,
-            scope_mode=scopeMode,
-            status=status,
-            priority=priority,
-            assignee=assignee,
-            quincenal_scope=quincenalScope,
-            issue_keys=issueKeys,
-            issue_sort_col=issueSortCol,
-            issue_like_query=issueLikeQuery,
-        )
-        return build_issue_rows(
-            settings,
-            query=query,
-            offset=offset,
-            limit=limit,
-            sort_by=sortBy,
-            sort_dir=sortDir,
-        )
+        def _compute() -> dict[str, Any]:
+            from bug_resolution_radar.services.dashboard_snapshot import build_issue_rows
+
+            settings = load_settings()
+            query = _dashboard_query(
+                country=country,
+                source_id=sourceId,
+                scope_mode=scopeMode,
+                status=status,
+                priority=priority,
+                assignee=assignee,
+                quincenal_scope=quincenalScope,
+                issue_keys=issueKeys,
+                issue_sort_col=issueSortCol,
+                issue_like_query=issueLikeQuery,
+            )
+            try:
+                return build_issue_rows(
+                    settings,
+                    query=query,
+                    offset=offset,
+                    limit=limit,
+                    sort_by=sortBy,
+                    sort_dir=sortDir,
+                    after=after,
+                    columns=_split_csv_param(fields),
+                )
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+        return await API_COMPUTE_POOL.run(_compute, key=_request_flight_key(request))
+
+    @app.get("/api/issues/search")
+    async def issue_search(
+        request: Request,
+        q: str = "",
+        country: str = "",
+        sourceId: str = "",
+        scopeMode: str = "source",
+        status: str = "",
+        priority: str = "",
+        assignee: str = "",
+        quincenalScope: str = QUINCENAL_SCOPE_ALL,
+        issueKeys: str = "",
+        issueSortCol: str = "",
+        issueLikeQuery: str = "",
+        limit: int = Query(50, ge=1, le=500),
+    ) -> dict[str, Any]:
+        def _compute() -> dict[str, Any]:
+            from bug_resolution_radar.services.dashboard_snapshot import build_issue_search
+
+            settings = load_settings()
+            query = _dashboard_query(
+                country=country,
+                source_id=sourceId,
+                scope_mode=scopeMode,
+                status=status,
+                priority=priority,
+                assignee=assignee,
+                quincenal_scope=quincenalScope,
+                issue_keys=issueKeys,
+                issue_sort_col=issueSortCol,
+                issue_like_query=issueLikeQuery,
+            )
+            return build_issue_search(settings, query=query, text=q, limit=limit)
+
+        return await API_COMPUTE_POOL.run(_compute, key=_request_flight_key(request))
 
     @app.get("/api/issues/keys")
-    def issue_keys(
+    async def issue_keys(
+        request: Request,
         country: str = "",
         sourceId: str = "",
         scopeMode: str = "source",
@@ -998,23 +1261,28 @@ def create_app() -> FastAPI:
         issueSortCol: str = "",
         issueLikeQuery: str = "",
     ) -> dict[str, Any]:
-        settings = load_settings()
-        query = _dashboard_query(
-            country=country,
-            source_id=sourceId,
-            scope_mode=scopeMode,
-            status=status,
-            priority=priority,
-            assignee=assignee,
-            quincenal_scope=quincenalScope,
-            issue_keys=issueKeys,
-            issue_sort_col=issueSortCol,
-            issue_like_query=issueLikeQuery,
-        )
-        return build_issue_keys(settings, query=query)
+        def _compute() -> dict[str, Any]:
+            from bug_resolution_radar.services.dashboard_snapshot import build_issue_keys
+
+            settings = load_settings()
+            query = _dashboard_query(
+                country=country,
+                source_id=sourceId,
+                scope_mode=scopeMode,
+                status=status,
+                priority=priority,
+                assignee=assignee,
+                quincenal_scope=quincenalScope,
+                issue_keys=issueKeys,
+                issue_sort_col=issueSortCol,
+                issue_like_query=issueLikeQuery,
+            )
+            return build_issue_keys(settings, query=query)
+
+        return await API_COMPUTE_POOL.run(_compute, key=_request_flight_key(request))
 
     @app.get("/api/issues/export")
-    def issues_export(
+    async def issues_export(
         format: str = Query("xlsx", pattern="^(xlsx|csv)$"),
         country: str = "",
         sourceId: str = "",
@@ -1027,32 +1295,49 @@ def create_app() -> FastAPI:
         issueSortCol: str = "",
         issueLikeQuery: str = "",
     ) -> Response:
-        settings = load_settings()
-        query = _dashboard_query(
-            country=country,
-            source_id=sourceId,
-            scope_mode=scopeMode,
-            status=status,
-            priority=priority,
-            assignee=assignee,
-            quincenal_scope=quincenalScope,
-            issue_keys=issueKeys,
-            issue_sort_col=issueSortCol,
-            issue_like_query=issueLikeQuery,
-        )
-        df = _export_dataframe(settings, query=query)
-        if str(format).lower() == "csv":
-            content = dataframe_to_csv_bytes(df, include_index=False)
-            media_type = "text/csv; charset=utf-8"
-            filename = download_filename("issues", ext="csv")
-        else:
-            content = dataframe_to_xlsx_bytes(df, sheet_name="Issues", include_index=False)
-            media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            filename = download_filename("issues", ext="xlsx")
-        return Response(content=content, media_type=media_type, headers=_download_headers(filename))
+        def _compute() -> Response:
+            from bug_resolution_radar.services.tabular_export import (
+                dataframe_to_csv_bytes,
+                dataframe_to_xlsx_bytes,
+                download_filename,
+            )
+
+            settings = load_settings()
+            query = _dashboard_query(
+                country=country,
+                source_id=sourceId,
+                scope_mode=scopeMode,
+                status=status,
+                priority=priority,
+                assignee=assignee,
+                quincenal_scope=quincenalScope,
+                issue_keys=issueKeys,
+                issue_sort_col=issueSortCol,
+                issue_like_query=issueLikeQuery,
+            )
+            df = _export_dataframe(settings, query=query)
+            if str(format).lower() == "csv":
+                content = dataframe_to_csv_bytes(df, include_index=False)
+                media_type = "text/csv; charset=utf-8"
+                filename = download_filename("issues", ext="csv")
+            else:
+                content = dataframe_to_xlsx_bytes(df, sheet_name="Issues", include_index=False)
+                media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                filename = download_filename("issues", ext="xlsx")
+            return Response(
+                content=content, media_type=media_type, headers=_download_headers(filename)
+            )
+
+        return await API_COMPUTE_POOL.run(_compute)
 
     @app.post("/api/issues/export/save")
     def issues_export_save(payload: DashboardExportSaveRequest) -> dict[str, Any]:
+        from bug_resolution_radar.services.tabular_export import (
+            dataframe_to_csv_bytes,
+            dataframe_to_xlsx_bytes,
+            download_filename,
+        )
+
         export_format = str(payload.format or "xlsx").strip().lower() or "xlsx"
         if export_format not in {"xlsx", "csv"}:
             raise HTTPException(status_code=400, detail="Formato de exportación no soportado.")
@@ -1080,7 +1365,8 @@ def create_app() -> FastAPI:
         return _saved_file_payload(export_path, file_name=filename)
 
     @app.get("/api/issues/export/helix-raw")
-    def issues_export_helix_raw(
+    async def issues_export_helix_raw(
+        format: str = Query("xlsx", pattern="^(xlsx|csv)$"),
         country: str = "",
         sourceId: str = "",
         scopeMode: str = "source",
@@ -1092,29 +1378,53 @@ def create_app() -> FastAPI:
         issueSortCol: str = "",
         issueLikeQuery: str = "",
     ) -> Response:
-        settings = load_settings()
-        query = _dashboard_query(
-            country=country,
-            source_id=sourceId,
-            scope_mode=scopeMode,
-            status=status,
-            priority=priority,
-            assignee=assignee,
-            quincenal_scope=quincenalScope,
-            issue_keys=issueKeys,
-            issue_sort_col=issueSortCol,
-            issue_like_query=issueLikeQuery,
-        )
-        content = _helix_raw_export_bytes(settings, query=query)
-        filename = download_filename("helix_raw_issues", ext="xlsx")
-        return Response(
-            content=content,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers=_download_headers(filename),
-        )
+        def _compute() -> Response:
+            from bug_resolution_radar.services.tabular_export import download_filename
+
+            settings = load_settings()
+            query = _dashboard_query(
+                country=country,
+                source_id=sourceId,
+                scope_mode=scopeMode,
+                status=status,
+                priority=priority,
+                assignee=assignee,
+                quincenal_scope=quincenalScope,
+                issue_keys=issueKeys,
+                issue_sort_col=issueSortCol,
+                issue_like_query=issueLikeQuery,
+            )
+            raw_export = _helix_raw_export(settings, query=query)
+            export_format = str(format).lower()
+            filename = download_filename("helix_raw_issues", ext=export_format)
+            # Written to a temporary file batch by batch and streamed from disk.
+            handle, tmp_name = tempfile.mkstemp(suffix=f".{export_format}")
+            os.close(handle)
+            try:
+                _write_helix_raw_export(raw_export, Path(tmp_name), fmt=export_format)
+            except Exception:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            return FileResponse(
+                tmp_name,
+                media_type=(
+                    "text/csv; charset=utf-8"
+                    if export_format == "csv"
+                    else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                ),
+                headers=_download_headers(filename),
+                background=BackgroundTask(Path(tmp_name).unlink, missing_ok=True),
+            )
+
+        return await API_COMPUTE_POOL.run(_compute)
 
     @app.post("/api/issues/export/helix-raw/save")
     def issues_export_helix_raw_save(payload: DashboardExportSaveRequest) -> dict[str, Any]:
+        from bug_resolution_radar.services.tabular_export import download_filename
+
+        export_format = str(payload.format or "xlsx").strip().lower() or "xlsx"
+        if export_format not in {"xlsx", "csv"}:
+            raise HTTPException(status_code=400, detail="Formato de exportación no soportado.")
         settings = load_settings()
         query = _dashboard_query(
             country=payload.country,
@@ -1128,13 +1438,19 @@ def create_app() -> FastAPI:
             issue_sort_col=payload.issueSortCol,
             issue_like_query=payload.issueLikeQuery,
         )
-        content = _helix_raw_export_bytes(settings, query=query)
-        filename = download_filename("helix_raw_issues", ext="xlsx")
-        export_path = save_download_content(settings, file_name=filename, content=content)
+        raw_export = _helix_raw_export(settings, query=query)
+        filename = download_filename("helix_raw_issues", ext=export_format)
+        export_path = reserve_download_path(settings, file_name=filename)
+        try:
+            _write_helix_raw_export(raw_export, export_path, fmt=export_format)
+        except Exception:
+            export_path.unlink(missing_ok=True)
+            raise
         return _saved_file_payload(export_path, file_name=filename)
 
     @app.get("/api/kanban")
-    def kanban(
+    async def kanban(
+        request: Request,
         country: str = "",
         sourceId: str = "",
         scopeMode: str = "source",
@@ -1146,20 +1462,30 @@ def create_app() -> FastAPI:
         issueSortCol: str = "",
         issueLikeQuery: str = "",
     ) -> list[dict[str, Any]]:
+        def _compute() -> list[dict[str, Any]]:
+            from bug_resolution_radar.services.dashboard_snapshot import build_kanban_columns
+
+            settings = load_settings()
+            query = _dashboard_query(
+                country=country,
+                source_id=sourceId,
+                scope_mode=scopeMode,
+                status=status,
+                priority=priority,
+                assignee=assignee,
+                quincenal_scope=quincenalScope,
+                issue_keys=issueKeys,
+                issue_sort_col=issueSortCol,
+                issue_like_query=issueLikeQuery,
+            )
+            return build_kanban_columns(settings, query=query)
+
+        return await API_COMPUTE_POOL.run(_compute, key=_request_flight_key(request))
+
+    @app.get("/api/notes")
+    def get_notes(keys: str = "") -> dict[str, Any]:
         settings = load_settings()
-        query = _dashboard_query(
-            country=country,
-            source_id=sourceId,
-            scope_mode=scopeMode,
-            status=status,
-            priority=priority,
-            assignee=assignee,
-            quincenal_scope=quincenalScope,
-            issue_keys=issueKeys,
-            issue_sort_col=issueSortCol,
-            issue_like_query=issueLikeQuery,
-        )
-        return build_kanban_columns(settings, query=query)
+        return {"notes": _notes_store(settings).get_many(_split_csv_param(keys))}
 
     @app.get("/api/notes/{issue_key}")
     def get_note(issue_key: str) -> dict[str, Any]:
@@ -1169,17 +1495,19 @@ def create_app() -> FastAPI:
     @app.put("/api/notes/{issue_key}")
     def put_note(issue_key: str, payload: NoteRequest) -> dict[str, Any]:
         settings = load_settings()
-        store = _notes_store(settings)
-        store.set(str(issue_key or "").strip(), str(payload.note or ""))
-        store.save()
+        _notes_store(settings).set(str(issue_key or "").strip(), str(payload.note or ""))
         return _notes_payload(settings, issue_key=issue_key)
 
     @app.get("/api/settings")
     def get_settings() -> dict[str, Any]:
+        from bug_resolution_radar.services.settings_contracts import load_settings_payload
+
         return load_settings_payload()
 
     @app.put("/api/settings")
     def put_settings(payload: dict[str, Any]) -> dict[str, Any]:
+        from bug_resolution_radar.services.settings_contracts import save_settings_payload
+
         try:
             return save_settings_payload(payload)
         except Exception as exc:
@@ -1189,6 +1517,9 @@ def create_app() -> FastAPI:
     def get_settings_sources_export(
         sourceType: str = Query("helix", pattern="^(jira|helix)$"),
     ) -> Response:
+        from bug_resolution_radar.services.sources_excel import build_sources_export_excel_bytes
+        from bug_resolution_radar.services.tabular_export import download_filename
+
         settings = load_settings()
         source_type = str(sourceType or "helix").strip().lower()
         try:
@@ -1204,6 +1535,9 @@ def create_app() -> FastAPI:
 
     @app.post("/api/settings/sources/export/save")
     def post_settings_sources_export_save(payload: SourceExportSaveRequest) -> dict[str, Any]:
+        from bug_resolution_radar.services.sources_excel import build_sources_export_excel_bytes
+        from bug_resolution_radar.services.tabular_export import download_filename
+
         settings = load_settings()
         source_type = str(payload.sourceType or "helix").strip().lower()
         if source_type not in {"jira", "helix"}:
@@ -1221,6 +1555,8 @@ def create_app() -> FastAPI:
         request: Request,
         sourceType: str = Query("helix", pattern="^(jira|helix)$"),
     ) -> dict[str, Any]:
+        from bug_resolution_radar.services.sources_excel import import_sources_from_excel_bytes
+
         settings = load_settings()
         source_type = str(sourceType or "helix").strip().lower()
         try:
@@ -1253,6 +1589,8 @@ def create_app() -> FastAPI:
 
     @app.post("/api/settings/restore-from-example")
     def restore_settings() -> dict[str, Any]:
+        from bug_resolution_radar.services.settings_contracts import load_settings_payload
+
         try:
             restored_from = restore_env_from_example()
         except FileNotFoundError as exc:
@@ -1264,16 +1602,22 @@ def create_app() -> FastAPI:
 
     @app.get("/api/cache/inventory")
     def get_cache_inventory() -> list[dict[str, Any]]:
+        from bug_resolution_radar.services.source_maintenance import cache_inventory
+
         settings = load_settings()
         return cache_inventory(settings)
 
     @app.get("/api/cache/impact")
     def get_cache_impact(sourceId: str) -> dict[str, Any]:
+        from bug_resolution_radar.services.source_maintenance import source_cache_impact
+
         settings = load_settings()
         return source_cache_impact(settings, sourceId)
 
     @app.post("/api/cache/reset")
     def post_cache_reset(payload: CacheResetRequest) -> dict[str, Any]:
+        from bug_resolution_radar.services.source_maintenance import reset_cache_store
+
         settings = load_settings()
         try:
             return reset_cache_store(settings, payload.cacheId)
@@ -1282,6 +1626,8 @@ def create_app() -> FastAPI:
 
     @app.post("/api/cache/purge-source")
     def post_cache_purge(payload: CachePurgeRequest) -> dict[str, Any]:
+        from bug_resolution_radar.services.source_maintenance import purge_source_cache
+
         settings = load_settings()
         return purge_source_cache(settings, payload.sourceId)
 
@@ -1328,11 +1674,15 @@ def create_app() -> FastAPI:
 
     @app.get("/api/ingest/overview")
     def ingest_overview() -> dict[str, Any]:
+        from bug_resolution_radar.services.ingest_contracts import ingest_overview_payload
+
         settings = load_settings()
         return ingest_overview_payload(settings)
 
     @app.put("/api/ingest/jira/selection")
     def put_jira_ingest_selection(payload: SourceSelectionRequest) -> dict[str, Any]:
+        from bug_resolution_radar.services.ingest_contracts import ingest_overview_payload
+
         settings = load_settings()
         try:
             updated = persist_ingest_selection(
@@ -1346,6 +1696,8 @@ def create_app() -> FastAPI:
 
     @app.put("/api/ingest/helix/selection")
     def put_helix_ingest_selection(payload: SourceSelectionRequest) -> dict[str, Any]:
+        from bug_resolution_radar.services.ingest_contracts import ingest_overview_payload
+
         settings = load_settings()
         try:
             updated = persist_ingest_selection(
@@ -1410,6 +1762,8 @@ def create_app() -> FastAPI:
 
     @app.post("/api/ingest/jira")
     def post_ingest_jira(payload: SourceSelectionRequest) -> dict[str, Any]:
+        from bug_resolution_radar.services.ingest_runner import run_jira_ingest
+
         settings = load_settings()
         sources = _select_sources(
             list(jira_sources(settings)),
@@ -1443,6 +1797,8 @@ def create_app() -> FastAPI:
 
     @app.post("/api/ingest/helix")
     def post_ingest_helix(payload: SourceSelectionRequest) -> dict[str, Any]:
+        from bug_resolution_radar.services.ingest_runner import run_helix_ingest
+
         settings = load_settings()
         sources = _select_sources(
             list(helix_sources(settings)),
@@ -1474,39 +1830,61 @@ def create_app() -> FastAPI:
     def get_ingest_helix_progress() -> dict[str, Any]:
         return get_ingest_progress("helix")
 
+    @app.get("/api/ingest/{connector}/events")
+    async def get_ingest_events(
+        request: Request,
+        connector: str,
+        after: Optional[int] = Query(None, ge=0),
+    ) -> StreamingResponse:
+        if connector not in {"jira", "helix"}:
+            raise HTTPException(status_code=404, detail="Conector de ingesta no soportado.")
+        return StreamingResponse(
+            _ingest_event_stream(request, connector, after_seq=_resume_seq(request, after)),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     @app.post("/api/reports/executive")
-    def executive_report(payload: ReportRequest) -> Response:
-        settings = load_settings()
-        country = str(payload.country or "").strip()
-        source_id = str(payload.sourceId or "").strip()
-        if not country or not source_id:
-            raise HTTPException(
-                status_code=400,
-                detail="Selecciona país y fuente para el informe ejecutivo.",
-            )
-        try:
-            artifact = generate_executive_report_artifact(
-                settings,
-                country=country,
-                source_id=source_id,
-                filters=build_report_filters(
-                    status_filters=payload.status,
-                    priority_filters=payload.priority,
-                    assignee_filters=payload.assignee,
-                    quincenal_scope=payload.quincenalScope,
-                ),
+    async def executive_report(payload: ReportRequest) -> Response:
+        def _compute() -> Response:
+            from bug_resolution_radar.reports.service import build_report_filters
+            from bug_resolution_radar.services.tabular_export import download_filename
+
+            settings = load_settings()
+            country = str(payload.country or "").strip()
+            source_id = str(payload.sourceId or "").strip()
+            if not country or not source_id:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Selecciona país y fuente para el informe ejecutivo.",
+                )
+            try:
+                artifact = generate_executive_report_artifact(
+                    settings,
+                    country=country,
+                    source_id=source_id,
+                    filters=build_report_filters(
+                        status_filters=payload.status,
+                        priority_filters=payload.priority,
+                        assignee_filters=payload.assignee,
+                        quincenal_scope=payload.quincenalScope,
+                    ),
+                )
+            except Exception as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            filename = download_filename("informe_ejecutivo", ext="pptx")
+            return Response(
+                content=bytes(getattr(artifact, "content", b"") or b""),
+                media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                headers=_download_headers(filename),
             )
-        except Exception as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        filename = download_filename("informe_ejecutivo", ext="pptx")
-        return Response(
-            content=bytes(getattr(artifact, "content", b"") or b""),
-            media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            headers=_download_headers(filename),
-        )
+
+        return await API_COMPUTE_POOL.run(_compute)
 
     @app.post("/api/reports/executive/save")
     def executive_report_save(payload: ReportRequest) -> dict[str, Any]:
+        from bug_resolution_radar.reports.service import build_report_filters, save_report_content
+
         settings = load_settings()
         country = str(payload.country or "").strip()
         source_id = str(payload.sourceId or "").strip()
@@ -1544,44 +1922,52 @@ def create_app() -> FastAPI:
         )
 
     @app.post("/api/reports/period")
-    def period_report(payload: ReportRequest) -> Response:
-        settings = load_settings()
-        country = str(payload.country or "").strip()
-        source_ids = [
-            str(item).strip() for item in list(payload.sourceIds or []) if str(item).strip()
-        ]
-        if not country or not source_ids:
-            raise HTTPException(
-                status_code=400,
-                detail="Selecciona país y al menos una fuente para el seguimiento.",
-            )
-        try:
-            artifact = generate_period_followup_report_artifact(
-                settings,
-                country=country,
-                source_ids=source_ids,
-                filters=build_report_filters(
-                    status_filters=payload.status,
-                    priority_filters=payload.priority,
-                    assignee_filters=payload.assignee,
-                    quincenal_scope=payload.quincenalScope,
-                ),
-                applied_filter_summary=str(payload.appliedFilterSummary or "").strip(),
-                functionality_status_filters=payload.functionalityStatusFilters,
-                functionality_priority_filters=payload.functionalityPriorityFilters,
-                functionality_filters=payload.functionalityFilters,
+    async def period_report(payload: ReportRequest) -> Response:
+        def _compute() -> Response:
+            from bug_resolution_radar.reports.service import build_report_filters
+            from bug_resolution_radar.services.tabular_export import download_filename
+
+            settings = load_settings()
+            country = str(payload.country or "").strip()
+            source_ids = [
+                str(item).strip() for item in list(payload.sourceIds or []) if str(item).strip()
+            ]
+            if not country or not source_ids:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Selecciona país y al menos una fuente para el seguimiento.",
+                )
+            try:
+                artifact = generate_period_followup_report_artifact(
+                    settings,
+                    country=country,
+                    source_ids=source_ids,
+                    filters=build_report_filters(
+                        status_filters=payload.status,
+                        priority_filters=payload.priority,
+                        assignee_filters=payload.assignee,
+                        quincenal_scope=payload.quincenalScope,
+                    ),
+                    applied_filter_summary=str(payload.appliedFilterSummary or "").strip(),
+                    functionality_status_filters=payload.functionalityStatusFilters,
+                    functionality_priority_filters=payload.functionalityPriorityFilters,
+                    functionality_filters=payload.functionalityFilters,
+                )
+            except Exception as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            filename = download_filename("seguimiento_periodo", ext="pptx")
+            return Response(
+                content=bytes(getattr(artifact, "content", b"") or b""),
+                media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                headers=_download_headers(filename),
             )
-        except Exception as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        filename = download_filename("seguimiento_periodo", ext="pptx")
-        return Response(
-            content=bytes(getattr(artifact, "content", b"") or b""),
-            media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            headers=_download_headers(filename),
-        )
+
+        return await API_COMPUTE_POOL.run(_compute)
 
     @app.post("/api/reports/period/save")
     def period_report_save(payload: ReportRequest) -> dict[str, Any]:
+        from bug_resolution_radar.reports.service import build_report_filters, save_report_content
+
         settings = load_settings()
         country = str(payload.country or "").strip()
         source_ids = [
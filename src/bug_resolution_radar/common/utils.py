@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
 from typing import List, Tuple
 
@@ -10,6 +11,29 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def int_env(name: str, default: int) -> int:
+    """Integer environment override; unset or malformed values fall back to `default`."""
+    raw = str(os.getenv(name, "") or "").strip()
+    if not raw:
+        return int(default)
+    try:
+        return int(raw)
+    except Exception:
+        return int(default)
+
+
+def bool_env(name: str, default: bool) -> bool:
+    """Boolean environment override (`1/true/yes/on`, `0/false/no/off`); else `default`."""
+    raw = str(os.getenv(name, "") or "").strip().lower()
+    if not raw:
+        return bool(default)
+    if raw in {"1", "true", "yes", "on"}:
+        return True
+    if raw in {"0", "false", "no", "off"}:
+        return False
+    return bool(default)
+
+
 def parse_int_list(s: str) -> List[int]:
     return [int(x.strip()) for x in s.split(",") if x.strip()]
 
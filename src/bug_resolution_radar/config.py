@@ -2,21 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
 import sys
+import threading
 import unicodedata
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
 from dotenv import dotenv_values
-from pydantic import BaseModel
-
-from bug_resolution_radar.repositories.issues_store import (
-    load_issues_df,
-    load_issues_workspace_index,
-)
+from pydantic import BaseModel, ConfigDict
 
 
 def _default_user_config_home() -> Path:
@@ -371,6 +369,9 @@ class Settings(BaseModel):
     HELIX_MIN_CHUNK_SIZE: int = 10
     HELIX_MAX_PAGES: int = 200
     HELIX_MAX_INGEST_SECONDS: int = 900
+    HELIX_WATERMARK_ENABLED: str = "true"
+    HELIX_WATERMARK_SKEW_MINUTES: int = 15
+    HELIX_FULL_RECONCILE_HOURS: int = 168
     HELIX_ARSQL_BASE_URL: str = ""
     HELIX_ARSQL_DATASOURCE_UID: str = ""
     HELIX_ARSQL_SOURCE_SERVICE_N1: str = "ENTERPRISE WEB"
@@ -400,14 +401,66 @@ class Settings(BaseModel):
     COUNTRY_ROLLUP_SOURCES_JSON: str = "[]"
 
 
+class SettingsSnapshot(Settings):
+    """Immutable `Settings` instance served by `load_settings()`; use `model_copy(update=...)`."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+@dataclass
+class _SettingsCacheEntry:
+    signature: tuple[str, int, int]
+    snapshot: SettingsSnapshot
+    token: str = ""
+
+
+_settings_cache_lock = threading.Lock()
+_settings_cache: _SettingsCacheEntry | None = None
+
+
+def _env_file_signature() -> tuple[str, int, int]:
+    path = Path(ENV_PATH).expanduser()
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path), -1, -1)
+    return (str(path), int(stat.st_mtime_ns), int(stat.st_size))
+
+
+def _invalidate_settings_cache() -> None:
+    global _settings_cache
+    with _settings_cache_lock:
+        _settings_cache = None
+
+
+def settings_cache_token(settings: Settings) -> str:
+    """
+    Stable digest of `settings` for downstream cache keys.
+
+    For the snapshot currently served by `load_settings()` the digest is computed once per
+    snapshot, so a reload or save changes it; any other instance (copies, ad-hoc test settings) is hashed on demand.
+    """
+    with _settings_cache_lock:
+        entry = _settings_cache
+        if entry is not None and entry.snapshot is settings and entry.token:
+            return entry.token
+    encoded = settings.model_dump_json().encode("utf-8", errors="replace")
+    token = hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    if entry is not None and entry.snapshot is settings:
+        with _settings_cache_lock:
+            entry.token = token
+    return token
+
+
 def ensure_env() -> None:
     ENV_PATH.parent.mkdir(parents=True, exist_ok=True)
     if not ENV_PATH.exists():
         example_path = next((p for p in _candidate_env_example_paths() if p.exists()), None)
         if example_path is not None:
             ENV_PATH.write_text(example_path.read_text(encoding="utf-8"), encoding="utf-8")
-            return
-        ENV_PATH.write_text("", encoding="utf-8")
+        else:
+            ENV_PATH.write_text("", encoding="utf-8")
+        _invalidate_settings_cache()
 
 
 def restore_env_from_example() -> Path:
@@ -417,17 +470,38 @@ def restore_env_from_example() -> Path:
     if example_path is None:
         raise FileNotFoundError("No se encontró la plantilla de configuración para restaurar.")
     ENV_PATH.write_text(example_path.read_text(encoding="utf-8"), encoding="utf-8")
+    _invalidate_settings_cache()
     return example_path
 
 
-def load_settings() -> Settings:
+def _read_settings_snapshot() -> SettingsSnapshot:
     vals = {k: v for k, v in dotenv_values(ENV_PATH).items() if v is not None}
     settings = Settings.model_validate(vals)
 
     payload = settings.model_dump()
     for key in _PATH_SETTING_KEYS:
         payload[key] = _resolve_runtime_path(str(payload.get(key) or ""))
-    return Settings.model_validate(payload)
+    return SettingsSnapshot.model_validate(payload)
+
+
+def load_settings() -> Settings:
+    """
+    Return the active configuration as an immutable snapshot.
+
+    The parsed `.env` is reused while its path, mtime and size stay the same, so hot
+    paths (API handlers, Streamlit reruns) do not re-parse and re-validate it.
+    """
+    global _settings_cache
+    signature = _env_file_signature()
+    with _settings_cache_lock:
+        entry = _settings_cache
+        if entry is not None and entry.signature == signature:
+            return entry.snapshot
+
+    snapshot = _read_settings_snapshot()
+    with _settings_cache_lock:
+        _settings_cache = _SettingsCacheEntry(signature=signature, snapshot=snapshot)
+    return snapshot
 
 
 def save_settings(settings: Settings, *, drop_keys: Set[str] | List[str] | None = None) -> None:
@@ -465,6 +539,8 @@ def save_settings(settings: Settings, *, drop_keys: Set[str] | List[str] | None
         lines.append(f"{key}={_encode_env_multiline(str(raw_existing))}")
 
     ENV_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # Same-size rewrites can land within one mtime tick; never trust the old snapshot.
+    _invalidate_settings_cache()
 
 
 def supported_countries(settings: Settings) -> List[str]:
@@ -584,6 +660,9 @@ def country_rollup_sources(settings: Settings) -> Dict[str, List[str]]:
             continue
         configured_by_country.setdefault(country, set()).add(sid)
 
+    # Local import: settings are loaded on every request, the issues store pulls in pandas.
+    from bug_resolution_radar.repositories.issues_store import load_issues_workspace_index
+
     available_by_country: Dict[str, set[str]] = {}
     try:
         index_payload = load_issues_workspace_index(str(getattr(settings, "DATA_PATH", "") or ""))
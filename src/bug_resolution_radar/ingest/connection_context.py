@@ -0,0 +1,150 @@
+"""Per-run connection reuse (sessions, cookies, discovered endpoints) across sources."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from bug_resolution_radar.common.utils import int_env
+
+
+def pooled_session(*, pool_maxsize: Optional[int] = None) -> requests.Session:
+    """Build a `requests.Session` whose adapters keep enough pooled connections per host."""
+    size = max(1, int(pool_maxsize or int_env("INGEST_HTTP_POOL_MAXSIZE", 16)))
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@dataclass
+class _CachedCookie:
+    header: str
+    expires_at: float
+
+
+class IngestConnectionContext:
+    """
+    Connection state shared by every source of one ingest run, keyed by host.
+
+    Sources on the same tenant reuse one pooled session (one TLS handshake), the
+    decrypted browser cookie header for a short TTL, the Jira API base detected by
+    the first source and the ARSQL datasource UID/root discovered for Helix.
+    Connectors fall back to per-source state when no context is passed.
+    """
+
+    def __init__(
+        self,
+        *,
+        cookie_ttl_seconds: Optional[float] = None,
+        pool_maxsize: Optional[int] = None,
+    ) -> None:
+        self.cookie_ttl_seconds = float(
+            cookie_ttl_seconds
+            if cookie_ttl_seconds is not None
+            else max(0, int_env("INGEST_COOKIE_TTL_SECONDS", 300))
+        )
+        self._pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        self._sessions: Dict[Tuple[str, str], requests.Session] = {}
+        self._cookies: Dict[str, _CachedCookie] = {}
+        self._jira_api_bases: Dict[str, str] = {}
+        self._arsql_datasources: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, int] = {
+            "sessions_created": 0,
+            "sessions_reused": 0,
+            "cookie_hits": 0,
+            "cookie_misses": 0,
+            "api_base_reused": 0,
+            "datasource_reused": 0,
+        }
+
+    @staticmethod
+    def _host_key(host: str) -> str:
+        return str(host or "").strip().lower()
+
+    def session(self, connector: str, host: str) -> requests.Session:
+        key = (str(connector or "").strip().lower(), self._host_key(host))
+        with self._lock:
+            existing = self._sessions.get(key)
+            if existing is not None:
+                self._counters["sessions_reused"] += 1
+                return existing
+            created = pooled_session(pool_maxsize=self._pool_maxsize)
+            self._sessions[key] = created
+            self._counters["sessions_created"] += 1
+            return created
+
+    def cached_cookie(self, host: str) -> Optional[str]:
+        key = self._host_key(host)
+        if not key:
+            return None
+        with self._lock:
+            entry = self._cookies.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                self._cookies.pop(key, None)
+                self._counters["cookie_misses"] += 1
+                return None
+            self._counters["cookie_hits"] += 1
+            return entry.header
+
+    def remember_cookie(self, host: str, cookie_header: str) -> None:
+        key = self._host_key(host)
+        header = str(cookie_header or "").strip()
+        if not key or not header or self.cookie_ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._cookies[key] = _CachedCookie(
+                header=header, expires_at=time.monotonic() + self.cookie_ttl_seconds
+            )
+
+    def forget_cookie(self, host: str) -> None:
+        with self._lock:
+            self._cookies.pop(self._host_key(host), None)
+
+    def jira_api_base(self, host: str) -> str:
+        with self._lock:
+            value = self._jira_api_bases.get(self._host_key(host), "")
+            if value:
+                self._counters["api_base_reused"] += 1
+            return value
+
+    def remember_jira_api_base(self, host: str, api_base: str) -> None:
+        key = self._host_key(host)
+        if key and str(api_base or "").strip():
+            with self._lock:
+                self._jira_api_bases[key] = str(api_base).strip()
+
+    def arsql_datasource(self, host: str) -> Optional[Tuple[str, str]]:
+        with self._lock:
+            value = self._arsql_datasources.get(self._host_key(host))
+            if value is not None:
+                self._counters["datasource_reused"] += 1
+            return value
+
+    def remember_arsql_datasource(self, host: str, *, uid: str, root: str) -> None:
+        key = self._host_key(host)
+        if key and str(uid or "").strip() and str(root or "").strip():
+            with self._lock:
+                self._arsql_datasources[key] = (str(uid).strip(), str(root).strip())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._counters)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._cookies.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
@@ -5,8 +5,10 @@ from __future__ import annotations
 import calendar
 import os
 import re
+import threading
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from urllib.parse import urlparse
@@ -26,7 +28,8 @@ from ..analytics.status_semantics import is_finalist_status
 from ..common.security import sanitize_cookie_header, validate_service_base_url
 from ..common.utils import now_iso
 from ..config import build_source_id
-from ..models.schema_helix import HelixDocument, HelixWorkItem
+from ..models.schema_helix import HelixDocument, HelixSourceWatermark, HelixWorkItem
+from ..services.ingest_profiler import IngestRunProfiler, response_bytes
 from .browser_runtime import (
     is_target_page_open_in_configured_browser as _is_target_page_open_in_browser,
 )
@@ -36,6 +39,7 @@ from .browser_runtime import (
 from .browser_runtime import (
     open_urls_in_configured_browser as _open_urls_in_browser,
 )
+from .connection_context import IngestConnectionContext
 from .helix_mapper import (
     is_allowed_helix_business_incident_type,
     map_helix_values_to_item,
@@ -63,6 +67,8 @@ _ARSQL_OFFICIAL_BUSINESS_INCIDENT_TYPES: tuple[str, ...] = (
 _ARSQL_OFFICIAL_ENVIRONMENTS: tuple[str, ...] = ("Production",)
 _ARSQL_OFFICIAL_TIME_FIELDS: tuple[str, ...] = ("Submit Date",)
 _INSECURE_TLS_WARNING_SUPPRESSED = False
+_HOST_REFRESH_SEMAPHORES: Dict[Tuple[str, int], threading.BoundedSemaphore] = {}
+_HOST_REFRESH_LOCK = threading.Lock()
 _RE_SPACES = re.compile(r"\s+")
 
 
@@ -356,6 +362,72 @@ def _cache_pending_refresh_ids(
     return out
 
 
+def _pending_id_batches(
+    incident_ids: List[str],
+    *,
+    max_ids: Any = 150,
+    max_chars: Any = 12000,
+) -> List[List[str]]:
+    """Split IDs into `IN (...)` batches bounded by count and quoted SQL length."""
+    max_ids_int = max(1, _coerce_int(max_ids, 150))
+    max_chars_int = max(64, _coerce_int(max_chars, 12000))
+    batches: List[List[str]] = []
+    current: List[str] = []
+    current_chars = 0
+    for incident_id in incident_ids:
+        token_chars = len(_sql_quote(incident_id)) + 2
+        if current and (len(current) >= max_ids_int or current_chars + token_chars > max_chars_int):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(incident_id)
+        current_chars += token_chars
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _host_refresh_semaphore(host: str, limit: int) -> threading.BoundedSemaphore:
+    # Shared per host so concurrent sources hitting the same tenant respect one cap.
+    key = (str(host or "").strip().lower(), max(1, int(limit)))
+    with _HOST_REFRESH_LOCK:
+        semaphore = _HOST_REFRESH_SEMAPHORES.get(key)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(key[1])
+            _HOST_REFRESH_SEMAPHORES[key] = semaphore
+        return semaphore
+
+
+def _plan_watermark_sync(
+    watermark: Optional[HelixSourceWatermark],
+    *,
+    has_cached_items: bool,
+    window_start_ms: int,
+    now_ms: int,
+    skew_minutes: Any = 15,
+    full_reconcile_hours: Any = 168,
+    enabled: bool = True,
+) -> Tuple[Optional[int], str]:
+    """
+    Decide between a modified-since refresh and a full-window reconciliation.
+
+    Returns the `Last Modified Date` lower bound (epoch ms) for incremental runs,
+    or `None` when the full window must be scanned, plus a short rule for `doc.query`.
+    """
+    if not enabled:
+        return None, "sync=full (watermark disabled)"
+    if watermark is None or int(watermark.last_modified_ms or 0) <= 0 or not has_cached_items:
+        return None, "sync=full (no watermark)"
+    if int(window_start_ms) < int(watermark.full_window_start_ms or 0):
+        return None, "sync=full (window widened)"
+    last_full_ms = _iso_to_epoch_ms(watermark.last_full_sync_at)
+    reconcile_ms = max(0, _coerce_int(full_reconcile_hours, 168)) * 60 * 60 * 1000
+    if last_full_ms is None or int(now_ms) - last_full_ms >= reconcile_ms:
+        return None, "sync=full (scheduled reconciliation)"
+    skew_ms = max(0, _coerce_int(skew_minutes, 15)) * 60 * 1000
+    since_ms = max(0, int(watermark.last_modified_ms) - skew_ms)
+    return since_ms, f"sync=incremental; modified_since={_iso_from_epoch_ms(since_ms)}"
+
+
 def _iso_from_epoch_ms(ms: int) -> str:
     return datetime.fromtimestamp(ms / 1000.0, tz=timezone.utc).isoformat()
 
@@ -626,6 +698,8 @@ def _build_arsql_sql(
     companies: Optional[List[str]] = None,
     environments: Optional[List[str]] = None,
     time_fields: Optional[List[str]] = None,
+    modified_since_ms: Optional[int] = None,
+    time_window: bool = True,
 ) -> str:
     disabled = {str(x or "").strip() for x in (disabled_fields or set()) if str(x or "").strip()}
 
@@ -719,6 +793,14 @@ def _build_arsql_sql(
             f"OR {field_sql} BETWEEN {start_ms} AND {end_ms})"
         )
 
+    def _modified_since(field_sql: str, since_ms: int) -> str:
+        lower_ms = int(max(0, since_ms))
+        upper_ms = int(max(lower_ms, end_ms))
+        return (
+            f"({field_sql} BETWEEN {lower_ms // 1000} AND {upper_ms // 1000} "
+            f"OR {field_sql} BETWEEN {lower_ms} AND {upper_ms})"
+        )
+
     where_parts: List[str] = []
     if not _is_disabled("BBVA_MarcaSmartIT"):
         where_parts.append(f"{_field_ref('BBVA_MarcaSmartIT')} = 'SmartIT'")
@@ -736,7 +818,7 @@ def _build_arsql_sql(
     time_clauses = [
         _time_window(_field_ref(field_name))
         for field_name in time_field_candidates
-        if not _is_disabled(field_name)
+        if time_window and not _is_disabled(field_name)
     ]
     incident_ids_filter = _sql_in_filter(_field_ref("Incident Number"), incident_ids)
     if time_clauses and incident_ids_filter:
@@ -745,6 +827,10 @@ def _build_arsql_sql(
         where_parts.append("(" + " OR ".join(time_clauses) + ")")
     elif incident_ids_filter:
         where_parts.append(incident_ids_filter)
+    if modified_since_ms is not None and not _is_disabled("Last Modified Date"):
+        where_parts.append(
+            _modified_since(_field_ref("Last Modified Date"), int(modified_since_ms))
+        )
 
     source_filter_field = _first_available_field(["BBVA_SourceServiceN1", "BBVA_MatrixServiceN1"])
     source_filter = (
@@ -1331,6 +1417,8 @@ def ingest_helix(
     dry_run: bool = False,
     existing_doc: Optional[HelixDocument] = None,
     cache_doc: Optional[HelixDocument] = None,
+    profiler: Optional[IngestRunProfiler] = None,
+    connections: Optional[IngestConnectionContext] = None,
 ) -> Tuple[bool, str, Optional[HelixDocument]]:
     country_value = str(country or "").strip()
     alias_value = str(source_alias or "").strip() or "Helix principal"
@@ -1338,6 +1426,7 @@ def ingest_helix(
     if not source_id_value:
         source_id_value = build_source_id("helix", country_value or "default", alias_value)
     source_label = f"{country_value} · {alias_value}" if country_value else f"Helix · {alias_value}"
+    prof = profiler if profiler is not None else IngestRunProfiler.disabled("helix")
 
     dashboard_url_cfg = str(os.getenv("HELIX_DASHBOARD_URL", "")).strip()
     base = _smartit_base_from_dashboard_url(dashboard_url_cfg)
@@ -1418,7 +1507,13 @@ def ingest_helix(
     )
     login_bootstrap_url = str(login_bootstrap_url or "").strip()
 
-    session = requests.Session()
+    # Sources of the same run share the session, cookie and datasource of this ARSQL host.
+    connection_host = str(host)
+    session = (
+        connections.session("helix", connection_host)
+        if connections is not None
+        else requests.Session()
+    )
 
     helix_proxy = (proxy or os.getenv("HELIX_PROXY", "")).strip()
     has_proxy = bool(helix_proxy)
@@ -1540,7 +1635,14 @@ def ingest_helix(
         bootstrap_page_checked = True
         return bootstrap_page_ready
 
-    def _read_auth_cookie_from_browser() -> Tuple[Optional[str], str, str]:
+    def _read_auth_cookie_from_browser(
+        *, use_cached: bool = False
+    ) -> Tuple[Optional[str], str, str]:
+        if use_cached and connections is not None:
+            for cookie_host in auth_cookie_hosts:
+                cached = connections.cached_cookie(cookie_host)
+                if cached:
+                    return cached, cookie_host, ""
         last_error = ""
         for cookie_host in auth_cookie_hosts:
             try:
@@ -1550,6 +1652,8 @@ def ingest_helix(
                 continue
             candidate = sanitize_cookie_header(candidate)
             if candidate and _has_auth_cookie(_cookie_names_from_header(candidate)):
+                if connections is not None:
+                    connections.remember_cookie(cookie_host, candidate)
                 return candidate, cookie_host, ""
         return None, "", last_error
 
@@ -1591,14 +1695,17 @@ def ingest_helix(
             time.sleep(login_poll_seconds)
         return None, ""
 
-    cookie, cookie_source_host, cookie_error = _read_auth_cookie_from_browser()
-    cookie_names_from_header = _cookie_names_from_header(cookie or "")
-    if (not cookie or not _has_auth_cookie(cookie_names_from_header)) and not manual_cookie_mode:
-        bootstrapped_cookie, bootstrapped_host = _bootstrap_cookie_from_browser()
-        if bootstrapped_cookie:
-            cookie = bootstrapped_cookie
-            cookie_source_host = bootstrapped_host or cookie_source_host
-            cookie_names_from_header = _cookie_names_from_header(cookie)
+    with prof.phase(phase="auth_bootstrap", source_id=source_id_value, source_label=source_label):
+        cookie, cookie_source_host, cookie_error = _read_auth_cookie_from_browser(use_cached=True)
+        cookie_names_from_header = _cookie_names_from_header(cookie or "")
+        if (
+            not cookie or not _has_auth_cookie(cookie_names_from_header)
+        ) and not manual_cookie_mode:
+            bootstrapped_cookie, bootstrapped_host = _bootstrap_cookie_from_browser()
+            if bootstrapped_cookie:
+                cookie = bootstrapped_cookie
+                cookie_source_host = bootstrapped_host or cookie_source_host
+                cookie_names_from_header = _cookie_names_from_header(cookie)
 
     if not cookie:
         details = f" Detalle: {cookie_error}" if cookie_error else ""
@@ -1730,16 +1837,19 @@ def ingest_helix(
         return True, ""
 
     preflight: Optional[requests.Response] = None
-    if not dry_run:
-        try:
-            preflight = session.get(preflight_url, timeout=(5, 15))
-        except requests.RequestException:
-            preflight = None
+    refreshed_ok, refreshed_msg = True, ""
+    with prof.phase(phase="auth_preflight", source_id=source_id_value, source_label=source_label):
+        if not dry_run:
+            try:
+                preflight = session.get(preflight_url, timeout=(5, 15))
+            except requests.RequestException:
+                preflight = None
 
-    _apply_xsrf_headers(session)
+        _apply_xsrf_headers(session)
 
-    if not dry_run and preflight is not None and _looks_like_sso_redirect(preflight):
-        refreshed_ok, refreshed_msg = _refresh_auth_session("preflight_sso_redirect")
+        if not dry_run and preflight is not None and _looks_like_sso_redirect(preflight):
+            prof.record_event("session_refresh", source_id=source_id_value, trigger="preflight")
+            refreshed_ok, refreshed_msg = _refresh_auth_session("preflight_sso_redirect")
         if not refreshed_ok:
             return (
                 False,
@@ -1771,18 +1881,39 @@ def ingest_helix(
         )
         create_window_rule = f"{create_window_rule}; first_ingest=true"
 
-    optimized_start_ms, cache_window_rule = _optimize_create_start_from_cache(
-        source_cached_items,
-        base_start_ms=create_start_ms,
-        base_end_ms=create_end_ms,
+    window_start_ms = int(create_start_ms)
+    previous_watermark = (
+        cache_reference_doc.source_watermarks.get(source_id_value)
+        if cache_reference_doc is not None
+        else None
+    )
+    modified_since_ms, sync_rule = _plan_watermark_sync(
+        previous_watermark,
+        has_cached_items=bool(source_cached_items),
+        window_start_ms=window_start_ms,
+        now_ms=int(time.time() * 1000),
+        skew_minutes=os.getenv("HELIX_WATERMARK_SKEW_MINUTES", "15"),
+        full_reconcile_hours=os.getenv("HELIX_FULL_RECONCILE_HOURS", "168"),
+        enabled=_parse_bool(os.getenv("HELIX_WATERMARK_ENABLED", "true"), default=True),
     )
-    create_start_ms = int(max(0, min(optimized_start_ms, create_end_ms)))
-    pending_ids_max = _coerce_int(os.getenv("HELIX_ARSQL_PENDING_IDS_MAX", "200"), 200)
+    if modified_since_ms is None:
+        optimized_start_ms, cache_window_rule = _optimize_create_start_from_cache(
+            source_cached_items,
+            base_start_ms=create_start_ms,
+            base_end_ms=create_end_ms,
+        )
+        create_start_ms = int(max(0, min(optimized_start_ms, create_end_ms)))
+    else:
+        # The modified-since bound already limits the scan; keep the full business window.
+        cache_window_rule = "cache_window=watermark"
+    cache_window_rule = f"{cache_window_rule}; {sync_rule}"
+    # Non-final cached incidents outside the scanned window are revalidated by ID in a
+    # dedicated batched stage after the main page loop (no cap on how many).
     arsql_pending_incident_ids = _cache_pending_refresh_ids(
         source_cached_items,
         base_start_ms=create_start_ms,
         base_end_ms=create_end_ms,
-        max_ids=pending_ids_max,
+        max_ids=max(1, len(source_cached_items)),
         include_outside_window=True,
     )
     create_window_rule = (
@@ -1830,7 +1961,12 @@ def ingest_helix(
     arsql_wide_fallback_used = False
     arsql_disabled_fields: set[str] = set()
 
-    def make_body(start_index: int, page_chunk_size: Optional[int] = None) -> Dict[str, Any]:
+    def make_body(
+        start_index: int,
+        page_chunk_size: Optional[int] = None,
+        *,
+        refresh_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         size = int(page_chunk_size if page_chunk_size is not None else chunk_size)
         sql = _build_arsql_sql(
             create_start_ms=create_start_ms,
@@ -1842,10 +1978,12 @@ def ingest_helix(
             source_service_n1=arsql_source_service_n1,
             source_service_n2=arsql_source_service_n2,
             incident_types=incident_types_filter,
-            incident_ids=arsql_pending_incident_ids,
+            incident_ids=refresh_ids,
             companies=arsql_companies,
             environments=arsql_environments_filter,
             time_fields=arsql_time_fields,
+            modified_since_ms=modified_since_ms if refresh_ids is None else None,
+            time_window=refresh_ids is None,
         )
         return {
             "date_format": "DD/MM/YYYY",
@@ -1900,46 +2038,70 @@ def ingest_helix(
                 return uid, f"{candidate_scheme}://{candidate_host}"
         return "", arsql_base_root
 
+    reused_datasource = (
+        connections.arsql_datasource(connection_host)
+        if connections is not None and not arsql_uid
+        else None
+    )
+    if reused_datasource is not None:
+        arsql_uid, arsql_base_root = reused_datasource
+        reused_parsed = urlparse(arsql_base_root)
+        host = reused_parsed.hostname or host
+        scheme = reused_parsed.scheme or scheme
+        preflight_url = f"{arsql_base_root}/dashboards/"
+        preflight_name = "/dashboards/"
+        _sync_arsql_origin_headers()
+        endpoint = _build_arsql_endpoint(arsql_base_root, arsql_uid)
+
     if not arsql_uid:
-        arsql_uid, discovered_root = _discover_uid_across_candidates()
-        if arsql_uid:
-            arsql_base_root = discovered_root or arsql_base_root
-            discovered_parsed = urlparse(arsql_base_root)
-            host = discovered_parsed.hostname or host
-            scheme = discovered_parsed.scheme or scheme
-            preflight_url = f"{arsql_base_root}/dashboards/"
-            preflight_name = "/dashboards/"
-            _sync_arsql_origin_headers()
-        if not arsql_uid:
-            if not manual_cookie_mode:
-                bootstrapped_cookie, bootstrapped_host = _bootstrap_cookie_from_browser()
-                if bootstrapped_cookie:
-                    try:
-                        session.cookies.clear()
-                    except Exception:
-                        pass
-                    _cookies_to_jar(session, bootstrapped_cookie, host=(bootstrapped_host or host))
-                    _apply_xsrf_headers(session)
-                    arsql_uid, discovered_root = _discover_uid_across_candidates()
-                    if arsql_uid:
-                        arsql_base_root = discovered_root or arsql_base_root
-                        discovered_parsed = urlparse(arsql_base_root)
-                        host = discovered_parsed.hostname or host
-                        scheme = discovered_parsed.scheme or scheme
-                        preflight_url = f"{arsql_base_root}/dashboards/"
-                        preflight_name = "/dashboards/"
-                        _sync_arsql_origin_headers()
-        if not arsql_uid:
-            return (
-                False,
-                f"{source_label}: no se pudo autodetectar HELIX_ARSQL_DATASOURCE_UID. "
-                "Configura HELIX_ARSQL_DATASOURCE_UID o abre antes un dashboard Helix y reintenta.",
-                None,
+        with prof.phase(
+            phase="uid_discovery", source_id=source_id_value, source_label=source_label
+        ):
+            arsql_uid, discovered_root = _discover_uid_across_candidates()
+            if arsql_uid:
+                arsql_base_root = discovered_root or arsql_base_root
+                discovered_parsed = urlparse(arsql_base_root)
+                host = discovered_parsed.hostname or host
+                scheme = discovered_parsed.scheme or scheme
+                preflight_url = f"{arsql_base_root}/dashboards/"
+                preflight_name = "/dashboards/"
+                _sync_arsql_origin_headers()
+            if not arsql_uid:
+                if not manual_cookie_mode:
+                    bootstrapped_cookie, bootstrapped_host = _bootstrap_cookie_from_browser()
+                    if bootstrapped_cookie:
+                        try:
+                            session.cookies.clear()
+                        except Exception:
+                            pass
+                        _cookies_to_jar(
+                            session, bootstrapped_cookie, host=(bootstrapped_host or host)
+                        )
+                        _apply_xsrf_headers(session)
+                        arsql_uid, discovered_root = _discover_uid_across_candidates()
+                        if arsql_uid:
+                            arsql_base_root = discovered_root or arsql_base_root
+                            discovered_parsed = urlparse(arsql_base_root)
+                            host = discovered_parsed.hostname or host
+                            scheme = discovered_parsed.scheme or scheme
+                            preflight_url = f"{arsql_base_root}/dashboards/"
+                            preflight_name = "/dashboards/"
+                            _sync_arsql_origin_headers()
+            if not arsql_uid:
+                return (
+                    False,
+                    f"{source_label}: no se pudo autodetectar HELIX_ARSQL_DATASOURCE_UID. "
+                    "Configura HELIX_ARSQL_DATASOURCE_UID o abre antes un dashboard Helix y reintenta.",
+                    None,
+                )
+            endpoint = _build_arsql_endpoint(
+                arsql_base_root or f"{scheme}://{host}",
+                arsql_uid,
             )
-        endpoint = _build_arsql_endpoint(
-            arsql_base_root or f"{scheme}://{host}",
-            arsql_uid,
-        )
+            if connections is not None:
+                connections.remember_arsql_datasource(
+                    connection_host, uid=arsql_uid, root=arsql_base_root or f"{scheme}://{host}"
+                )
 
     # -----------------------------
     # Dry-run
@@ -2066,6 +2228,7 @@ def ingest_helix(
         _coerce_int(os.getenv("HELIX_MAX_SESSION_REFRESHES", "1"), 1),
     )
     session_refreshes = 0
+    max_seen_modified_ms = 0
 
     def _build_result_doc(
         collected_items: List[HelixWorkItem],
@@ -2118,6 +2281,43 @@ def ingest_helix(
             return None
         return _build_result_doc(items, outcome_note=outcome_note)
 
+    def _accept_row(values: Dict[str, Any]) -> Optional[HelixWorkItem]:
+        nonlocal max_seen_modified_ms
+        nonlocal filtered_out_by_business_incident_type, filtered_out_by_environment
+        mapped_item = map_helix_values_to_item(
+            values=values,
+            base_url=base,
+            country=country_value,
+            source_alias=alias_value,
+            source_id=source_id_value,
+            ticket_console_url=ticket_console_url,
+        )
+        if mapped_item is None:
+            return None
+        modified_ms = _iso_to_epoch_ms(mapped_item.last_modified)
+        if modified_ms is not None and modified_ms > max_seen_modified_ms:
+            max_seen_modified_ms = modified_ms
+        if allowed_business_incident_types and not is_allowed_helix_business_incident_type(
+            mapped_item.incident_type
+        ):
+            filtered_out_by_business_incident_type += 1
+            return None
+        if arsql_environments_filter:
+            env_raw = ""
+            raw_fields = mapped_item.raw_fields or {}
+            for env_key in _ARSQL_ENVIRONMENT_FIELD_CANDIDATES:
+                env_candidate = str(raw_fields.get(env_key) or "").strip()
+                if env_candidate:
+                    env_raw = env_candidate
+                    break
+            env_token = _normalize_space_token(env_raw)
+            if env_token in {"producción", "produccion"}:
+                env_token = "production"
+            if allowed_env_tokens and env_token and env_token not in allowed_env_tokens:
+                filtered_out_by_environment += 1
+                return None
+        return mapped_item
+
     while True:
         elapsed = time.monotonic() - started_at
         if elapsed > max_elapsed_seconds:
@@ -2141,6 +2341,7 @@ def ingest_helix(
                 _partial_doc("limit:max_pages"),
             )
 
+        request_started = time.perf_counter()
         try:
             r = _request(
                 session,
@@ -2153,12 +2354,28 @@ def ingest_helix(
             cause = _retry_root_cause(e)
             if _is_timeout_text(cause):
                 if current_chunk_size > min_chunk_limit:
+                    previous_chunk_size = current_chunk_size
                     current_chunk_size = max(min_chunk_limit, current_chunk_size // 2)
+                    prof.record_event(
+                        "chunk_size_reduced",
+                        source_id=source_id_value,
+                        page=page + 1,
+                        previous=previous_chunk_size,
+                        current=current_chunk_size,
+                    )
                     continue
                 if current_read_to < max_read_to:
+                    previous_read_to = current_read_to
                     current_read_to = min(
                         max_read_to, max(current_read_to + 5.0, current_read_to * 1.5)
                     )
+                    prof.record_event(
+                        "read_timeout_raised",
+                        source_id=source_id_value,
+                        page=page + 1,
+                        previous=previous_read_to,
+                        current=current_read_to,
+                    )
                     continue
             if "rate limited" in cause.lower():
                 return (
@@ -2179,12 +2396,28 @@ def ingest_helix(
             )
         except requests.exceptions.Timeout as e:
             if current_chunk_size > min_chunk_limit:
+                previous_chunk_size = current_chunk_size
                 current_chunk_size = max(min_chunk_limit, current_chunk_size // 2)
+                prof.record_event(
+                    "chunk_size_reduced",
+                    source_id=source_id_value,
+                    page=page + 1,
+                    previous=previous_chunk_size,
+                    current=current_chunk_size,
+                )
                 continue
             if current_read_to < max_read_to:
+                previous_read_to = current_read_to
                 current_read_to = min(
                     max_read_to, max(current_read_to + 5.0, current_read_to * 1.5)
                 )
+                prof.record_event(
+                    "read_timeout_raised",
+                    source_id=source_id_value,
+                    page=page + 1,
+                    previous=previous_read_to,
+                    current=current_read_to,
+                )
                 continue
             return (
                 False,
@@ -2209,10 +2442,22 @@ def ingest_helix(
                 _partial_doc("error:network"),
             )
 
+        request_ms = (time.perf_counter() - request_started) * 1000.0
         if r.status_code != 200:
+            prof.record_page(
+                source_id=source_id_value,
+                source_label=source_label,
+                page=page + 1,
+                status=r.status_code,
+                elapsed_ms=request_ms,
+                bytes_received=response_bytes(r),
+                chunk_size=current_chunk_size,
+                read_timeout_s=current_read_to,
+            )
             missing_field = _arsql_missing_field_name_from_response(r)
             if missing_field and missing_field not in arsql_disabled_fields:
                 arsql_disabled_fields.add(missing_field)
+                prof.record_event("field_disabled", source_id=source_id_value, field=missing_field)
                 continue
             if (
                 arsql_include_all_fields
@@ -2222,6 +2467,7 @@ def ingest_helix(
             ):
                 arsql_include_all_fields = False
                 arsql_wide_fallback_used = True
+                prof.record_event("narrow_select_fallback", source_id=source_id_value)
                 continue
             if _is_session_expired_response(r):
                 if session_refreshes >= max_session_refreshes:
@@ -2241,6 +2487,9 @@ def ingest_helix(
                         _partial_doc("error:session_refresh"),
                     )
                 session_refreshes += 1
+                prof.record_event(
+                    "session_refresh", source_id=source_id_value, trigger="session_expired"
+                )
                 continue
             return (
                 False,
@@ -2254,42 +2503,26 @@ def ingest_helix(
         data = r.json()
         batch = _extract_arsql_rows(data)
         if not batch:
+            prof.record_page(
+                source_id=source_id_value,
+                source_label=source_label,
+                page=page,
+                status=r.status_code,
+                elapsed_ms=request_ms,
+                bytes_received=response_bytes(r),
+                chunk_size=current_chunk_size,
+                read_timeout_s=current_read_to,
+            )
             break
 
         total = _extract_total(data)
 
+        map_started = time.perf_counter()
         new_in_page = 0
         for it in batch:
-            values = cast(Dict[str, Any], it if isinstance(it, dict) else {})
-            mapped_item = map_helix_values_to_item(
-                values=values,
-                base_url=base,
-                country=country_value,
-                source_alias=alias_value,
-                source_id=source_id_value,
-                ticket_console_url=ticket_console_url,
-            )
+            mapped_item = _accept_row(cast(Dict[str, Any], it if isinstance(it, dict) else {}))
             if mapped_item is None:
                 continue
-            if allowed_business_incident_types and not is_allowed_helix_business_incident_type(
-                mapped_item.incident_type
-            ):
-                filtered_out_by_business_incident_type += 1
-                continue
-            if arsql_environments_filter:
-                env_raw = ""
-                raw_fields = mapped_item.raw_fields or {}
-                for env_key in _ARSQL_ENVIRONMENT_FIELD_CANDIDATES:
-                    env_candidate = str(raw_fields.get(env_key) or "").strip()
-                    if env_candidate:
-                        env_raw = env_candidate
-                        break
-                env_token = _normalize_space_token(env_raw)
-                if env_token in {"producción", "produccion"}:
-                    env_token = "production"
-                if allowed_env_tokens and env_token and env_token not in allowed_env_tokens:
-                    filtered_out_by_environment += 1
-                    continue
             wid = str(mapped_item.id or "").strip()
             if wid in seen_ids:
                 continue
@@ -2299,6 +2532,18 @@ def ingest_helix(
             items.append(mapped_item)
 
         batch_size = len(batch)
+        prof.record_page(
+            source_id=source_id_value,
+            source_label=source_label,
+            page=page,
+            status=r.status_code,
+            elapsed_ms=request_ms,
+            bytes_received=response_bytes(r),
+            rows=batch_size,
+            map_ms=(time.perf_counter() - map_started) * 1000.0,
+            chunk_size=current_chunk_size,
+            read_timeout_s=current_read_to,
+        )
         if batch_size <= 0:
             break
         # Advance using the effective batch size returned by Helix. Some tenants ignore
@@ -2310,9 +2555,137 @@ def ingest_helix(
         if total is None and batch_size < current_chunk_size:
             # Some tenants enforce a fixed page size (e.g. 25 rows) regardless of requested LIMIT.
             # In that case, keep paging using the effective page size until the API returns empty.
+            prof.record_event(
+                "chunk_size_clamped",
+                source_id=source_id_value,
+                page=page,
+                previous=current_chunk_size,
+                current=int(batch_size),
+            )
             current_chunk_size = int(batch_size)
 
-    doc = _build_result_doc(items)
+    pending_targets = [iid for iid in arsql_pending_incident_ids if iid not in seen_ids]
+    pending_counts = {"refreshed": 0, "unchanged": 0, "closed": 0, "missing": 0, "failed": 0}
+    if pending_targets:
+        cached_by_id = {str(i.id or "").strip(): i for i in source_cached_items}
+        id_batches = _pending_id_batches(
+            pending_targets,
+            max_ids=os.getenv("HELIX_ARSQL_ID_BATCH_SIZE", "150"),
+            max_chars=os.getenv("HELIX_ARSQL_ID_BATCH_MAX_CHARS", "12000"),
+        )
+        refresh_concurrency = max(1, _coerce_int(os.getenv("HELIX_ID_REFRESH_CONCURRENCY", "4"), 4))
+        host_semaphore = _host_refresh_semaphore(
+            str(urlparse(endpoint).hostname or host or ""), refresh_concurrency
+        )
+
+        def _fetch_id_batch(batch_index: int, batch_ids: List[str]) -> Optional[List[Any]]:
+            # Page each IN (...) batch like the main loop: tenants that clamp the page size
+            # would otherwise leave every ID past the first page reported as missing.
+            rows: List[Any] = []
+            previous_page: Optional[List[Any]] = None
+            while True:
+                with host_semaphore:
+                    started_batch = time.perf_counter()
+                    try:
+                        resp = _request(
+                            session,
+                            "POST",
+                            endpoint,
+                            json=make_body(len(rows), len(batch_ids), refresh_ids=batch_ids),
+                            timeout=(connect_to, current_read_to),
+                        )
+                    except (RetryError, requests.exceptions.RequestException) as e:
+                        prof.record_event(
+                            "pending_batch_failed",
+                            source_id=source_id_value,
+                            batch=batch_index,
+                            error=type(e).__name__,
+                        )
+                        return None
+                page_rows: Optional[List[Any]] = None
+                if resp.status_code == 200:
+                    try:
+                        page_rows = list(_extract_arsql_rows(resp.json()))
+                    except Exception:
+                        page_rows = None
+                prof.record_page(
+                    source_id=source_id_value,
+                    source_label=source_label,
+                    page=batch_index,
+                    status=resp.status_code,
+                    elapsed_ms=(time.perf_counter() - started_batch) * 1000.0,
+                    bytes_received=response_bytes(resp),
+                    rows=len(page_rows or []),
+                    chunk_size=len(batch_ids),
+                    read_timeout_s=current_read_to,
+                )
+                if page_rows is None:
+                    return None
+                # A repeated page means the tenant ignores OFFSET: nothing more to read.
+                if not page_rows or page_rows == previous_page:
+                    return rows
+                rows.extend(page_rows)
+                if len(rows) >= len(batch_ids):
+                    return rows
+                previous_page = page_rows
+
+        with prof.phase(
+            phase="pending_refresh", source_id=source_id_value, source_label=source_label
+        ):
+            with ThreadPoolExecutor(
+                max_workers=min(refresh_concurrency, len(id_batches)),
+                thread_name_prefix="helix-id-refresh",
+            ) as pool:
+                batch_results = list(
+                    pool.map(_fetch_id_batch, range(1, len(id_batches) + 1), id_batches)
+                )
+            # Map in the calling thread: counters and `items` are not shared with workers.
+            for batch_ids, rows in zip(id_batches, batch_results):
+                if rows is None:
+                    pending_counts["failed"] += len(batch_ids)
+                    continue
+                returned: set[str] = set()
+                for row in rows:
+                    refreshed_item = _accept_row(
+                        cast(Dict[str, Any], row if isinstance(row, dict) else {})
+                    )
+                    if refreshed_item is None:
+                        continue
+                    wid = str(refreshed_item.id or "").strip()
+                    if wid in seen_ids:
+                        continue
+                    seen_ids.add(wid)
+                    returned.add(wid)
+                    items.append(refreshed_item)
+                    cached_item = cached_by_id.get(wid)
+                    if _is_helix_finalist_status(
+                        refreshed_item.status or refreshed_item.status_raw
+                    ):
+                        pending_counts["closed"] += 1
+                    elif cached_item is not None and (
+                        cached_item.model_dump() == refreshed_item.model_dump()
+                    ):
+                        pending_counts["unchanged"] += 1
+                    else:
+                        pending_counts["refreshed"] += 1
+                pending_counts["missing"] += sum(1 for iid in batch_ids if iid not in returned)
+
+    with prof.phase(phase="source_merge", source_id=source_id_value, source_label=source_label):
+        doc = _build_result_doc(items)
+    # Only a completed run may advance the watermark; partial docs keep the previous one.
+    now_ms = int(time.time() * 1000)
+    next_watermark = (
+        previous_watermark.model_copy()
+        if previous_watermark is not None
+        else HelixSourceWatermark()
+    )
+    next_watermark.last_modified_ms = min(
+        now_ms, max(int(next_watermark.last_modified_ms or 0), int(max_seen_modified_ms))
+    )
+    if modified_since_ms is None:
+        next_watermark.last_full_sync_at = _iso_from_epoch_ms(now_ms)
+        next_watermark.full_window_start_ms = int(window_start_ms)
+    doc.source_watermarks[source_id_value] = next_watermark
     source_total_after_merge = len(
         {_item_merge_key(i) for i in source_cached_items} | {_item_merge_key(i) for i in items}
     )
@@ -2322,7 +2695,18 @@ def ingest_helix(
         (
             f"{source_label}: ingesta Helix OK ({len(items)} items, cache fuente tras merge {source_total_after_merge}). "
             f"Filtrados por tipo (negocio): {filtered_out_by_business_incident_type}. "
-            f"Filtrados por entorno: {filtered_out_by_environment}."
+            f"Filtrados por entorno: {filtered_out_by_environment}. "
+            f"Modo: {'incremental' if modified_since_ms is not None else 'completo'}."
+            + (
+                f" Pendientes revalidadas por ID: {len(pending_targets)} "
+                f"(actualizadas {pending_counts['refreshed']}, "
+                f"sin cambios {pending_counts['unchanged']}, "
+                f"cerradas {pending_counts['closed']}, "
+                f"sin respuesta {pending_counts['missing']}, "
+                f"fallidas {pending_counts['failed']})."
+                if pending_targets
+                else ""
+            )
         ),
         doc,
     )
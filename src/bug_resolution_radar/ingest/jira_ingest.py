@@ -16,12 +16,15 @@ from ..common.security import sanitize_cookie_header, validate_service_base_url
 from ..common.utils import now_iso
 from ..config import Settings, build_source_id, jira_sources, supported_countries
 from ..models.schema import IssuesDocument, NormalizedIssue
+from ..services.ingest_merge import MergeIndex, issue_merge_key
+from ..services.ingest_profiler import IngestRunProfiler, response_bytes
 from .browser_runtime import (
     is_target_page_open_in_configured_browser as _is_target_page_open_in_browser,
 )
 from .browser_runtime import (
     open_url_in_configured_browser as _open_url_in_browser,
 )
+from .connection_context import IngestConnectionContext
 from .jira_session import get_jira_session_cookie
 
 _ADF_BLOCK_TYPES_WITH_BREAK: set[str] = {
@@ -413,22 +416,18 @@ def _resolve_source_scope(
     return fallback_country, alias, source_id, ""
 
 
-def _merge_key(issue: NormalizedIssue) -> str:
-    sid = str(issue.source_id or "").strip().lower()
-    key = str(issue.key or "").strip().upper()
-    if sid:
-        return f"{sid}::{key}"
-    return key
-
-
 def ingest_jira(
     settings: Settings,
     dry_run: bool = False,
     existing_doc: Optional[IssuesDocument] = None,
     source: Optional[Dict[str, str]] = None,
+    profiler: Optional[IngestRunProfiler] = None,
+    connections: Optional[IngestConnectionContext] = None,
+    merge_index: Optional[MergeIndex[NormalizedIssue]] = None,
 ) -> Tuple[bool, str, Optional[IssuesDocument]]:
     country, alias, source_id, jql = _resolve_source_scope(settings, source)
     source_label = f"{country} · {alias}"
+    prof = profiler if profiler is not None else IngestRunProfiler.disabled("jira")
 
     if not jql:
         return False, f"{source_label}: configura JQL obligatorio para la fuente Jira.", None
@@ -440,7 +439,8 @@ def ingest_jira(
 
     # Jira accepts whitespace, but sending a single-line JQL avoids issues with env/UI formatting.
     jql = jql.replace("\r", " ").replace("\n", " ")
-    session = requests.Session()
+    host = urlparse(base).hostname or ""
+    session = connections.session("jira", host) if connections is not None else requests.Session()
     session.headers.update({"Accept": "application/json"})
 
     base_candidates = _build_jira_base_candidates(base)
@@ -452,26 +452,28 @@ def ingest_jira(
     poll_seconds = max(0.5, float(os.getenv("JIRA_BROWSER_LOGIN_POLL_SECONDS", "2")))
     cookie_source_mode = str(os.getenv("JIRA_COOKIE_SOURCE", "browser") or "").strip().lower()
     manual_cookie_mode = cookie_source_mode == "manual"
-    try:
-        host = urlparse(base).hostname or ""
-        cookie = get_jira_session_cookie(browser=settings.JIRA_BROWSER, host=host)
+    with prof.phase(phase="auth_bootstrap", source_id=source_id, source_label=source_label):
+        cookie = connections.cached_cookie(host) if connections is not None else None
         cookie_error = ""
-    except Exception as e:
-        cookie = None
-        cookie_error = str(e)
-    cookie = sanitize_cookie_header(cookie)
-    cookie_names = _cookie_names_from_header(cookie or "")
-    if (not cookie or not _has_jira_auth_cookie(cookie_names)) and not manual_cookie_mode:
-        bootstrapped_cookie = _bootstrap_jira_cookie_from_browser(
-            browser=settings.JIRA_BROWSER,
-            host=host,
-            login_url=login_url,
-            wait_seconds=wait_seconds,
-            poll_seconds=poll_seconds,
-            page_already_ensured=False,
-        )
-        if bootstrapped_cookie:
-            cookie = bootstrapped_cookie
+        if not cookie:
+            try:
+                cookie = get_jira_session_cookie(browser=settings.JIRA_BROWSER, host=host)
+            except Exception as e:
+                cookie = None
+                cookie_error = str(e)
+        cookie = sanitize_cookie_header(cookie)
+        cookie_names = _cookie_names_from_header(cookie or "")
+        if (not cookie or not _has_jira_auth_cookie(cookie_names)) and not manual_cookie_mode:
+            bootstrapped_cookie = _bootstrap_jira_cookie_from_browser(
+                browser=settings.JIRA_BROWSER,
+                host=host,
+                login_url=login_url,
+                wait_seconds=wait_seconds,
+                poll_seconds=poll_seconds,
+                page_already_ensured=False,
+            )
+            if bootstrapped_cookie:
+                cookie = bootstrapped_cookie
 
     if not cookie:
         details = f" Detalle: {cookie_error}" if cookie_error else ""
@@ -488,6 +490,8 @@ def ingest_jira(
         )
 
     session.headers.update({"Cookie": cookie})
+    if connections is not None and _has_jira_auth_cookie(_cookie_names_from_header(cookie)):
+        connections.remember_cookie(host, cookie)
 
     if dry_run:
         attempts: List[str] = []
@@ -532,13 +536,18 @@ def ingest_jira(
     }
 
     api_base: Optional[str] = None
+    known_api_base = connections.jira_api_base(host) if connections is not None else ""
     while True:
         if api_base is None:
-            # Autodetect the working API base on first request.
-            api_base = api_candidates[0] if api_candidates else f"{base}/rest/api/3"
+            # Autodetect the working API base on first request (or reuse the run's detection).
+            if known_api_base in api_candidates:
+                api_base = known_api_base
+            else:
+                api_base = api_candidates[0] if api_candidates else f"{base}/rest/api/3"
 
         payload = dict(payload_base)
         payload["startAt"] = start_at
+        request_started = time.perf_counter()
         r = _jira_search_request(session, api_base, payload)
         if r.status_code == 404:
             # Try alternate API versions and/or /jira context path.
@@ -578,7 +587,20 @@ def ingest_jira(
                         break
                     if search_parse_error is None and parsed_trial_error is not None:
                         search_parse_error = parsed_trial_error
+        request_ms = (time.perf_counter() - request_started) * 1000.0
         if r.status_code != 200:
+            prof.record_page(
+                source_id=source_id,
+                source_label=source_label,
+                page=start_at // max_results + 1,
+                status=r.status_code,
+                elapsed_ms=request_ms,
+                bytes_received=response_bytes(r),
+                chunk_size=max_results,
+            )
+            if connections is not None and r.status_code in (401, 403):
+                # Don't hand a rejected cookie to the remaining sources of the run.
+                connections.forget_cookie(host)
             hint = ""
             if r.status_code == 404 and _looks_like_html(r.text):
                 hint = " Revisa JIRA_BASE_URL: usa la URL base de Jira (sin rutas como /browse/INC-123)."
@@ -595,7 +617,8 @@ def ingest_jira(
                 None,
             )
 
-        issues.extend(
+        map_started = time.perf_counter()
+        page_issues = [
             _jira_issue_to_normalized(
                 cast(Dict[str, Any], it if isinstance(it, dict) else {}),
                 base_url=base,
@@ -605,22 +628,38 @@ def ingest_jira(
             )
             for it in data.get("issues", [])
             if isinstance(it, dict)
+        ]
+        issues.extend(page_issues)
+        prof.record_page(
+            source_id=source_id,
+            source_label=source_label,
+            page=start_at // max_results + 1,
+            status=r.status_code,
+            elapsed_ms=request_ms,
+            bytes_received=response_bytes(r),
+            rows=len(page_issues),
+            map_ms=(time.perf_counter() - map_started) * 1000.0,
+            chunk_size=max_results,
         )
 
         start_at += max_results
         if start_at >= int(data.get("total", 0)):
             break
 
+    if connections is not None and api_base:
+        connections.remember_jira_api_base(host, api_base)
+
     doc = existing_doc or IssuesDocument.empty()
     doc.schema_version = "1.0"
     doc.ingested_at = now_iso()
     doc.jira_base_url = base
     doc.query = jql
 
-    merged = {_merge_key(i): i for i in doc.issues}
-    for i in issues:
-        merged[_merge_key(i)] = i
-    doc.issues = list(merged.values())
+    with prof.phase(phase="source_merge", source_id=source_id, source_label=source_label):
+        # Runners pass a run-wide index over `existing_doc.issues`; standalone calls build one.
+        index = merge_index if merge_index is not None else MergeIndex(doc.issues, issue_merge_key)
+        index.upsert(issues)
+        doc.issues = index.rows
 
     return (
         True,
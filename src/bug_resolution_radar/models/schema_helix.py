@@ -35,6 +35,16 @@ class HelixWorkItem(BaseModel):
     raw_fields: Dict[str, Any] = Field(default_factory=dict)
 
 
+class HelixSourceWatermark(BaseModel):
+    """Incremental sync checkpoint for one Helix source."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    last_modified_ms: int = 0
+    last_full_sync_at: str = ""
+    full_window_start_ms: int = 0
+
+
 class HelixDocument(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
@@ -43,6 +53,7 @@ class HelixDocument(BaseModel):
     helix_base_url: str = ""
     query: str = ""
     items: List[HelixWorkItem] = Field(default_factory=list)
+    source_watermarks: Dict[str, HelixSourceWatermark] = Field(default_factory=dict)
 
     @staticmethod
     def empty() -> "HelixDocument":
@@ -15,7 +15,7 @@ import time
 import warnings
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, replace
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
@@ -37,22 +37,37 @@ from bug_resolution_radar.analytics.analysis_window import (
 )
 from bug_resolution_radar.analytics.duplicate_insights import prepare_duplicates_payload
 from bug_resolution_radar.analytics.duplicates import exact_title_duplicate_stats
+from bug_resolution_radar.analytics.filtering import FilterState, normalize_filter_tokens
 from bug_resolution_radar.analytics.issues import normalize_text_col
 from bug_resolution_radar.analytics.kpis import compute_kpis
 from bug_resolution_radar.analytics.status_semantics import (
     effective_closed_mask,
     is_finalist_status,
 )
-from bug_resolution_radar.analytics.trend_charts import ChartContext, build_trends_registry
+from bug_resolution_radar.analytics.trend_charts import build_trends_registry
 from bug_resolution_radar.analytics.trend_insights import (
     ActionInsight,
     InsightMetric,
     TrendInsightPack,
-    build_trend_insight_pack,
 )
-from bug_resolution_radar.config import Settings, all_configured_sources
+from bug_resolution_radar.common.utils import bool_env, int_env
+from bug_resolution_radar.config import Settings, all_configured_sources, settings_cache_token
 from bug_resolution_radar.reports.plotly_png import render_plotly_figure_png
+from bug_resolution_radar.reports.render_cache import (
+    CHART_PNG_CACHE,
+    REPORT_RESULT_CACHE,
+    pack_report_blob,
+    unpack_report_blob,
+)
 from bug_resolution_radar.repositories.issues_store import load_issues_df
+from bug_resolution_radar.services.dashboard_snapshot import (
+    DashboardScopeContext,
+    build_report_scope_query,
+    load_scope_context,
+    scope_chart_figure,
+    scope_trend_insight_pack,
+)
+from bug_resolution_radar.services.workspace import WorkspaceSelection, apply_workspace_source_scope
 from bug_resolution_radar.theme.design_tokens import (
     BBVA_FONT_HEADLINE_PPT,
     BBVA_FONT_SANS_BOOK_PPT,
@@ -366,42 +381,6 @@ def _resolve_source_label(settings: Settings, source_id: str) -> str:
     return sid
 
 
-def _scope_df(df: pd.DataFrame, *, country: str, source_id: str) -> pd.DataFrame:
-    if df is None or df.empty:
-        return pd.DataFrame()
-
-    mask = pd.Series(True, index=df.index)
-    country_txt = str(country or "").strip()
-    source_txt = str(source_id or "").strip()
-
-    if country_txt and "country" in df.columns:
-        mask &= df["country"].fillna("").astype(str).eq(country_txt)
-    if source_txt and "source_id" in df.columns:
-        mask &= df["source_id"].fillna("").astype(str).eq(source_txt)
-    return df.loc[mask].copy(deep=False)
-
-
-def _apply_report_filters(df: pd.DataFrame, filters: _FilterSnapshot) -> pd.DataFrame:
-    if df is None or df.empty:
-        return pd.DataFrame()
-
-    mask = pd.Series(True, index=df.index)
-
-    if filters.status and "status" in df.columns:
-        status_norm = normalize_text_col(df["status"], "(sin estado)")
-        mask &= status_norm.isin(list(filters.status))
-
-    if filters.priority and "priority" in df.columns:
-        prio_norm = normalize_text_col(df["priority"], "(sin priority)")
-        mask &= prio_norm.isin(list(filters.priority))
-
-    if filters.assignee and "assignee" in df.columns:
-        assignee_norm = normalize_text_col(df["assignee"], "(sin asignar)")
-        mask &= assignee_norm.isin(list(filters.assignee))
-
-    return df.loc[mask].copy(deep=False)
-
-
 def _open_closed(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
     if df.empty:
         return pd.DataFrame(), pd.DataFrame()
@@ -646,19 +625,33 @@ def _add_mini_kpi_ribbons(
 
 
 def _build_sections(
-    settings: Settings, *, dff: pd.DataFrame, open_df: pd.DataFrame
+    settings: Settings,
+    *,
+    dff: pd.DataFrame,
+    open_df: pd.DataFrame,
+    scope: DashboardScopeContext | None = None,
 ) -> List[_ChartSection]:
+    if scope is None:
+        scope = DashboardScopeContext(
+            scoped_df=dff, dff=dff, open_df=open_df, source_ids=(), kpis={}
+        )
+    if not scope.kpis:
+        scope = replace(
+            scope,
+            kpis=dict(compute_kpis(dff, settings=settings) or {}),
+            artifacts=scope.artifacts,
+        )
     registry = build_trends_registry()
-    kpis = compute_kpis(dff, settings=settings)
-    chart_ctx = ChartContext(dff=dff, open_df=open_df, kpis=kpis)
 
     sections: List[_ChartSection] = []
     for chart_id in CHART_ORDER:
         spec = registry.get(chart_id)
         if spec is None:
             continue
-        insight_pack = build_trend_insight_pack(chart_id, dff=dff, open_df=open_df)
-        figure = spec.render(chart_ctx)
+        # Figures and packs are memoized on the shared scope context, so a deck built
+        # right after the dashboard/trend views only pays for PNG + slide rendering.
+        insight_pack = scope_trend_insight_pack(scope, chart_id)
+        figure = scope_chart_figure(scope, chart_id)
         if figure is None:
             # Skip chart section when scope/filter has insufficient data.
             continue
@@ -895,12 +888,12 @@ def _build_quality_insights_section(*, open_df: pd.DataFrame) -> Optional[_Chart
 def _prerender_section_images(sections: Sequence[_ChartSection]) -> List[_ChartSection]:
     if not sections:
         return []
-    if not _bool_env("BUG_RESOLUTION_RADAR_PPT_PRERENDER_CHARTS", True):
+    if not bool_env("BUG_RESOLUTION_RADAR_PPT_PRERENDER_CHARTS", True):
         return list(sections)
 
     workers = max(
         1,
-        _int_env(
+        int_env(
             "BUG_RESOLUTION_RADAR_PPT_RENDER_WORKERS",
             _default_ppt_render_workers(),
         ),
@@ -949,45 +942,46 @@ def _prerender_section_images(sections: Sequence[_ChartSection]) -> List[_ChartS
         return out
 
 
+def _override_scope_context(
+    settings: Settings,
+    *,
+    dff_override: pd.DataFrame,
+    open_df_override: pd.DataFrame | None,
+    scoped_source_df: pd.DataFrame | None,
+) -> DashboardScopeContext:
+    dff = apply_analysis_depth_filter(dff_override.copy(deep=False), settings=settings)
+    if open_df_override is None:
+        open_df, _ = _open_closed(dff)
+    else:
+        open_df = apply_analysis_depth_filter(open_df_override.copy(deep=False), settings=settings)
+    return DashboardScopeContext(
+        scoped_df=scoped_source_df if scoped_source_df is not None else dff,
+        dff=dff,
+        open_df=open_df,
+        source_ids=(),
+        kpis={},
+    )
+
+
 def _build_context(
     settings: Settings,
     *,
     country: str,
     source_id: str,
     filters: _FilterSnapshot,
-    dff_override: pd.DataFrame | None,
-    open_df_override: pd.DataFrame | None,
-    scoped_source_df: pd.DataFrame | None,
+    scope: DashboardScopeContext,
 ) -> _ScopeContext:
-    if dff_override is None:
-        if scoped_source_df is None:
-            base_df = _scope_df(
-                load_issues_df(settings.DATA_PATH), country=country, source_id=source_id
-            )
-        else:
-            base_df = scoped_source_df.copy(deep=False)
-        base_df = apply_analysis_depth_filter(base_df, settings=settings)
-        dff = _apply_report_filters(base_df, filters)
-        open_df, closed_df = _open_closed(dff)
-    else:
-        dff = apply_analysis_depth_filter(dff_override.copy(deep=False), settings=settings)
-        if open_df_override is None:
-            open_df, closed_df = _open_closed(dff)
-        else:
-            open_df = apply_analysis_depth_filter(
-                open_df_override.copy(deep=False), settings=settings
-            )
-            if not dff.empty and not open_df.empty:
-                closed_df = dff.loc[~dff.index.isin(open_df.index)].copy(deep=False)
-            else:
-                closed_df = pd.DataFrame()
-
+    dff = scope.dff
+    open_df = scope.open_df
     if dff.empty:
         raise ValueError(
             "No hay incidencias para el país/origen y filtros seleccionados. Ajusta scope o filtros."
         )
+    closed_df = dff.loc[~dff.index.isin(open_df.index)].copy(deep=False)
 
-    sections = _prerender_section_images(_build_sections(settings, dff=dff, open_df=open_df))
+    sections = _prerender_section_images(
+        _build_sections(settings, dff=dff, open_df=open_df, scope=scope)
+    )
     return _ScopeContext(
         country=str(country or "").strip(),
         source_id=str(source_id or "").strip(),
@@ -1001,31 +995,10 @@ def _build_context(
     )
 
 
-def _int_env(name: str, default: int) -> int:
-    raw = str(os.getenv(name, "") or "").strip()
-    if not raw:
-        return int(default)
-    try:
-        return int(raw)
-    except Exception:
-        return int(default)
-
-
-def _bool_env(name: str, default: bool) -> bool:
-    raw = str(os.getenv(name, "") or "").strip().lower()
-    if not raw:
-        return bool(default)
-    if raw in {"1", "true", "yes", "on"}:
-        return True
-    if raw in {"0", "false", "no", "off"}:
-        return False
-    return bool(default)
-
-
 def _ppt_png_cache_max_entries() -> int:
     return max(
         1,
-        _int_env(
+        int_env(
             "BUG_RESOLUTION_RADAR_PPT_IMAGE_CACHE_MAX_ENTRIES",
             _PPT_PNG_CACHE_DEFAULT_MAX_ENTRIES,
         ),
@@ -1033,13 +1006,13 @@ def _ppt_png_cache_max_entries() -> int:
 
 
 def _ppt_result_cache_enabled() -> bool:
-    return _bool_env("BUG_RESOLUTION_RADAR_PPT_RESULT_CACHE", True)
+    return bool_env("BUG_RESOLUTION_RADAR_PPT_RESULT_CACHE", True)
 
 
 def _ppt_result_cache_max_entries() -> int:
     return max(
         1,
-        _int_env(
+        int_env(
             "BUG_RESOLUTION_RADAR_PPT_RESULT_CACHE_MAX_ENTRIES",
             _PPT_RESULT_CACHE_DEFAULT_MAX_ENTRIES,
         ),
@@ -1102,12 +1075,15 @@ def _report_request_cache_key(
 
     payload = {
         "cache_version": _PPT_RESULT_CACHE_VERSION,
+        # The deck stamps `generated_at` and its aging charts are relative to today.
+        "report_day": datetime.now(timezone.utc).date().isoformat(),
         "country": str(country or "").strip(),
         "source_id": str(source_id or "").strip(),
         "status_filters": _normalize_filter_values(status_filters),
         "priority_filters": _normalize_filter_values(priority_filters),
         "assignee_filters": _normalize_filter_values(assignee_filters),
-        "analysis_lookback_months": int(getattr(settings, "ANALYSIS_LOOKBACK_MONTHS", 0) or 0),
+        # Lookback, source labels and rollups all come from settings.
+        "settings_token": settings_cache_token(settings),
         "data_path": str(data_path),
         "data_rev": data_rev,
         # If callers provide prefiltered frames without backing file changes, keep a
@@ -1123,31 +1099,55 @@ def _report_request_cache_key(
     return hashlib.blake2b(encoded, digest_size=20).hexdigest()
 
 
+def _ppt_result_cache_remember(cache_key: str, result: ExecutiveReportResult) -> None:
+    max_entries = _ppt_result_cache_max_entries()
+    with _PPT_RESULT_CACHE_LOCK:
+        _PPT_RESULT_CACHE[cache_key] = result
+        _PPT_RESULT_CACHE.move_to_end(cache_key)
+        while len(_PPT_RESULT_CACHE) > max_entries:
+            _PPT_RESULT_CACHE.popitem(last=False)
+
+
+def _ppt_result_from_disk(cache_key: str) -> Optional[ExecutiveReportResult]:
+    blob = REPORT_RESULT_CACHE.get(f"executive{cache_key}")
+    unpacked = unpack_report_blob(blob) if blob is not None else None
+    if unpacked is None:
+        return None
+    metadata, content = unpacked
+    try:
+        return ExecutiveReportResult(content=content, **metadata)
+    except TypeError:
+        return None
+
+
 def _ppt_result_cache_get(cache_key: str) -> Optional[ExecutiveReportResult]:
     if not _ppt_result_cache_enabled():
         return None
     with _PPT_RESULT_CACHE_LOCK:
         item = _PPT_RESULT_CACHE.get(cache_key)
-        if item is None:
-            return None
-        _PPT_RESULT_CACHE.move_to_end(cache_key)
-        return item
+        if item is not None:
+            _PPT_RESULT_CACHE.move_to_end(cache_key)
+            return item
+    # Survive restarts: a persisted deck for the same data revision is reused as-is.
+    persisted = _ppt_result_from_disk(cache_key)
+    if persisted is not None:
+        _ppt_result_cache_remember(cache_key, persisted)
+    return persisted
 
 
 def _ppt_result_cache_put(cache_key: str, result: ExecutiveReportResult) -> None:
     if not _ppt_result_cache_enabled():
         return
-    max_entries = _ppt_result_cache_max_entries()
-    with _PPT_RESULT_CACHE_LOCK:
-        _PPT_RESULT_CACHE[cache_key] = result
-        _PPT_RESULT_CACHE.move_to_end(cache_key)
-        while len(_PPT_RESULT_CACHE) > max_entries:
-            _PPT_RESULT_CACHE.popitem(last=False)
+    _ppt_result_cache_remember(cache_key, result)
+    metadata = asdict(result)
+    content = bytes(metadata.pop("content", b"") or b"")
+    REPORT_RESULT_CACHE.put(f"executive{cache_key}", pack_report_blob(metadata, content))
 
 
 def _clear_ppt_result_cache() -> None:
     with _PPT_RESULT_CACHE_LOCK:
         _PPT_RESULT_CACHE.clear()
+    REPORT_RESULT_CACHE.clear()
 
 
 def _ppt_png_cache_key(
@@ -1174,29 +1174,38 @@ def _ppt_png_cache_key(
     return h.hexdigest()
 
 
+def _ppt_png_cache_remember(cache_key: str, payload: bytes) -> None:
+    max_entries = _ppt_png_cache_max_entries()
+    with _PPT_PNG_CACHE_LOCK:
+        _PPT_PNG_CACHE[cache_key] = payload
+        _PPT_PNG_CACHE.move_to_end(cache_key)
+        while len(_PPT_PNG_CACHE) > max_entries:
+            _PPT_PNG_CACHE.popitem(last=False)
+
+
 def _ppt_png_cache_get(cache_key: str) -> Optional[bytes]:
     with _PPT_PNG_CACHE_LOCK:
         item = _PPT_PNG_CACHE.get(cache_key)
-        if item is None:
-            return None
-        _PPT_PNG_CACHE.move_to_end(cache_key)
-        return item
+        if item is not None:
+            _PPT_PNG_CACHE.move_to_end(cache_key)
+            return item
+    persisted = CHART_PNG_CACHE.get(cache_key)
+    if persisted is not None:
+        _ppt_png_cache_remember(cache_key, persisted)
+    return persisted
 
 
 def _ppt_png_cache_put(cache_key: str, payload: bytes) -> None:
     if not payload:
         return
-    max_entries = _ppt_png_cache_max_entries()
-    with _PPT_PNG_CACHE_LOCK:
-        _PPT_PNG_CACHE[cache_key] = payload
-        _PPT_PNG_CACHE.move_to_end(cache_key)
-        while len(_PPT_PNG_CACHE) > max_entries:
-            _PPT_PNG_CACHE.popitem(last=False)
+    _ppt_png_cache_remember(cache_key, payload)
+    CHART_PNG_CACHE.put(cache_key, payload)
 
 
 def _clear_ppt_png_cache() -> None:
     with _PPT_PNG_CACHE_LOCK:
         _PPT_PNG_CACHE.clear()
+    CHART_PNG_CACHE.clear()
 
 
 def _default_ppt_render_workers() -> int:
@@ -2937,11 +2946,18 @@ def generate_scope_executive_ppt(
     dff_override: pd.DataFrame | None = None,
     open_df_override: pd.DataFrame | None = None,
     scoped_source_df_override: pd.DataFrame | None = None,
+    scope_context: DashboardScopeContext | None = None,
 ) -> ExecutiveReportResult:
-    """Generate an executive PPT for selected scope using dashboard-equivalent visuals."""
+    """
+    Generate an executive PPT for selected scope using dashboard-equivalent visuals.
+
+    `scope_context` lets callers hand over the cached dashboard scope (see
+    `load_scope_context`); otherwise the scope is resolved through the same pipeline.
+    """
     source_txt = str(source_id or "").strip()
     if not source_txt:
         raise ValueError("No se ha seleccionado un origen válido para generar el informe.")
+    country_txt = str(country or "").strip()
 
     cache_key = _report_request_cache_key(
         settings,
@@ -2950,21 +2966,46 @@ def generate_scope_executive_ppt(
         status_filters=status_filters,
         priority_filters=priority_filters,
         assignee_filters=assignee_filters,
-        dff_override=dff_override,
+        dff_override=scope_context.dff if scope_context is not None else dff_override,
     )
     cached_result = _ppt_result_cache_get(cache_key)
     if cached_result is not None:
         return cached_result
 
+    if scope_context is None and dff_override is not None:
+        scope_context = _override_scope_context(
+            settings,
+            dff_override=dff_override,
+            open_df_override=open_df_override,
+            scoped_source_df=scoped_source_df_override,
+        )
+    elif scope_context is None:
+        scope_context = load_scope_context(
+            settings,
+            query=build_report_scope_query(
+                country=country_txt,
+                source_ids=[source_txt],
+                filters=FilterState(
+                    status=normalize_filter_tokens(status_filters),
+                    priority=normalize_filter_tokens(priority_filters),
+                    assignee=normalize_filter_tokens(assignee_filters),
+                ),
+            ),
+            include_kpis=True,
+            include_timeseries_chart=True,
+        )
+
+    # The analysis-window label describes the full source history, before the
+    # lookback cut applied to the report rows.
     if scoped_source_df_override is not None:
         scoped_source_df = scoped_source_df_override
     elif dff_override is not None:
         scoped_source_df = dff_override
     else:
-        scoped_source_df = _scope_df(
+        scoped_source_df = apply_workspace_source_scope(
             load_issues_df(settings.DATA_PATH),
-            country=str(country or "").strip(),
-            source_id=source_txt,
+            settings=settings,
+            selection=WorkspaceSelection(country=country_txt, source_id=source_txt),
         )
     available_months = max_available_backlog_months(scoped_source_df)
     lookback_months = effective_analysis_lookback_months(settings, df=scoped_source_df)
@@ -2979,12 +3020,10 @@ def generate_scope_executive_ppt(
 
     context = _build_context(
         settings,
-        country=str(country or "").strip(),
+        country=country_txt,
         source_id=source_txt,
         filters=filters,
-        dff_override=dff_override,
-        open_df_override=open_df_override,
-        scoped_source_df=scoped_source_df if dff_override is None else None,
+        scope=scope_context,
     )
     prs = _compose_presentation(context)
 
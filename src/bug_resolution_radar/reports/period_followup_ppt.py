@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 import unicodedata
+import warnings
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Any, List, Mapping, Optional, Sequence, cast
 
 import pandas as pd
 import plotly.graph_objects as go
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_SHAPE_TYPE
@@ -22,7 +26,6 @@ from pptx.oxml.ns import qn
 from pptx.oxml.xmlchemy import OxmlElement
 from pptx.util import Pt
 
-from bug_resolution_radar.analytics.analysis_window import apply_analysis_depth_filter
 from bug_resolution_radar.analytics.insights import (
     build_theme_color_map,
     build_theme_fortnight_trend,
@@ -44,15 +47,40 @@ from bug_resolution_radar.analytics.period_summary import (
     QuincenalScopeResult,
     build_country_quincenal_result,
     format_window_label,
-    scope_country_sources,
     source_label_map,
 )
 from bug_resolution_radar.analytics.status_semantics import effective_closed_mask
 from bug_resolution_radar.analytics.trend_charts import ChartContext, build_trends_registry
 from bug_resolution_radar.analytics.trend_insights import build_trend_insight_pack
-from bug_resolution_radar.config import Settings, resolve_period_ppt_template_path
-from bug_resolution_radar.reports.executive_ppt import _fig_to_png, _kaleido_png_bytes
-from bug_resolution_radar.repositories.issues_store import load_issues_df
+from bug_resolution_radar.common.utils import int_env
+from bug_resolution_radar.config import (
+    Settings,
+    resolve_period_ppt_template_path,
+    settings_cache_token,
+)
+from bug_resolution_radar.reports.executive_ppt import (
+    _compact_df_signature,
+    _default_ppt_render_workers,
+    _fig_to_png,
+    _kaleido_png_bytes,
+    _ppt_result_cache_enabled,
+)
+from bug_resolution_radar.reports.render_cache import (
+    REPORT_RESULT_CACHE,
+    pack_report_blob,
+    unpack_report_blob,
+)
+from bug_resolution_radar.reports.section_plan import SectionTask, run_section_plan
+from bug_resolution_radar.reports.text_layout import (
+    fit_lines,
+    line_height,
+    load_font,
+    text_width,
+)
+from bug_resolution_radar.services.dashboard_snapshot import (
+    build_report_scope_query,
+    load_scope_context,
+)
 from bug_resolution_radar.theme.design_tokens import (
     BBVA_FONT_HEADLINE_PPT,
     BBVA_FONT_SANS_BOOK_PPT,
@@ -65,6 +93,8 @@ from bug_resolution_radar.theme.design_tokens import (
 _REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
 _EMU_PER_INCH = 914400.0
 _FUNCTIONALITY_TEMPLATE_FILENAME = "Seguimiento de incidencias por funcionalidad.pptx"
+# Functionality deck slides used as prototypes: header, trend/dashboard and zoom.
+_FUNCTIONALITY_PROTOTYPE_SLIDES = 3
 _TABLE_RENDER_DPI = 180
 _TABLE_HEADER_BG_RGB = hex_to_rgb(BBVA_LIGHT.core_blue)
 _TABLE_HEADER_FG_RGB = hex_to_rgb(BBVA_LIGHT.white)
@@ -296,6 +326,41 @@ def _resolve_functionality_template_path() -> Path:
     )
 
 
+def _prepare_functionality_template(prs: Any) -> None:
+    if len(prs.slides) < 5:
+        raise ValueError(
+            "La plantilla de funcionalidad debe contener 5 slides (cabecera + dashboard + 3 zoom)."
+        )
+    while len(prs.slides) > _FUNCTIONALITY_PROTOTYPE_SLIDES:
+        _remove_slide(prs, _FUNCTIONALITY_PROTOTYPE_SLIDES)
+
+
+@lru_cache(maxsize=8)
+def _prepared_template_bytes(path: str, revision: str, kind: str) -> bytes:
+    del revision  # cache invalidation key only
+    prs = Presentation(path)
+    if kind == "period":
+        _normalize_period_template(prs)
+    else:
+        _prepare_functionality_template(prs)
+    buff = BytesIO()
+    prs.save(buff)
+    return buff.getvalue()
+
+
+def _load_prepared_template(path: Path, *, kind: str) -> Any:
+    """
+    Fresh in-memory copy of a template after its one-off preparation.
+
+    The normalised period deck and the functionality prototypes are parsed and
+    prepared once per file revision and kept serialised; every report re-opens
+    that payload, so batches do not re-run slide scans and XML copies per deck.
+    """
+    resolved = Path(path).resolve()
+    payload = _prepared_template_bytes(str(resolved), _file_revision(resolved), kind)
+    return Presentation(BytesIO(payload))
+
+
 def _remove_slide(prs: Any, index: int) -> None:
     sld_id = prs.slides._sldIdLst[index]
     prs.part.drop_rel(sld_id.rId)
@@ -696,82 +761,7 @@ def _emu_to_px(value: int | float, *, dpi: int = _TABLE_RENDER_DPI) -> int:
 def _load_report_font(*, size_px: int, bold: bool) -> Any:
     preferred = [_REPORT_FONT_BOLD_PATH] if bold else [_REPORT_FONT_BOOK_PATH]
     fallback = [_REPORT_FONT_BOOK_PATH] if bold else [_REPORT_FONT_BOLD_PATH]
-    for candidate in preferred + fallback:
-        try:
-            if candidate.exists():
-                return ImageFont.truetype(str(candidate), max(int(size_px), 1))
-        except Exception:
-            continue
-    return ImageFont.load_default()
-
-
-def _measure_text(draw: Any, text: str, font: Any) -> tuple[int, int]:
-    if not str(text or ""):
-        return 0, 0
-    left, top, right, bottom = draw.textbbox((0, 0), str(text), font=font)
-    return max(int(right - left), 0), max(int(bottom - top), 0)
-
-
-def _shorten_to_width(draw: Any, text: str, font: Any, *, max_width: int) -> str:
-    raw = str(text or "").strip()
-    if not raw:
-        return ""
-    if _measure_text(draw, raw, font)[0] <= max_width:
-        return raw
-
-    probe = raw
-    while probe:
-        probe = probe[:-1].rstrip()
-        candidate = f"{probe}..."
-        if _measure_text(draw, candidate, font)[0] <= max_width:
-            return candidate
-    return "..."
-
-
-def _wrap_text_to_width(draw: Any, text: str, font: Any, *, max_width: int) -> list[str]:
-    raw = str(text or "").strip()
-    if not raw:
-        return [""]
-
-    lines: list[str] = []
-    for block in raw.splitlines() or [""]:
-        words = block.split()
-        if not words:
-            lines.append("")
-            continue
-        current = words[0]
-        for word in words[1:]:
-            candidate = f"{current} {word}"
-            if _measure_text(draw, candidate, font)[0] <= max_width:
-                current = candidate
-                continue
-            lines.append(current)
-            current = word
-        lines.append(current)
-
-    return lines or [""]
-
-
-def _fit_lines_in_cell(
-    draw: Any,
-    text: str,
-    font: Any,
-    *,
-    max_width: int,
-    max_height: int,
-) -> list[str]:
-    lines = _wrap_text_to_width(draw, text, font, max_width=max_width)
-    line_h = max(_measure_text(draw, "Ag", font)[1], 1)
-    capacity = max(
-        int((max_height + _TABLE_LINE_SPACING_PX) / (line_h + _TABLE_LINE_SPACING_PX)),
-        1,
-    )
-    if len(lines) <= capacity:
-        return lines
-    if capacity == 1:
-        return [_shorten_to_width(draw, " ".join(lines), font, max_width=max_width)]
-    tail = " ".join(lines[capacity - 1 :])
-    return lines[: capacity - 1] + [_shorten_to_width(draw, tail, font, max_width=max_width)]
+    return load_font(preferred + fallback, size_px)
 
 
 def _draw_table_cell_text(
@@ -786,13 +776,19 @@ def _draw_table_cell_text(
     x0, y0, x1, y1 = box
     inner_w = max((x1 - x0) - (_TABLE_PADDING_X_PX * 2), 1)
     inner_h = max((y1 - y0) - (_TABLE_PADDING_Y_PX * 2), 1)
-    lines = _fit_lines_in_cell(draw, text, font, max_width=inner_w, max_height=inner_h)
-    line_h = max(_measure_text(draw, "Ag", font)[1], 1)
+    lines = fit_lines(
+        font,
+        text,
+        max_width=inner_w,
+        max_height=inner_h,
+        line_spacing=_TABLE_LINE_SPACING_PX,
+    )
+    line_h = line_height(font)
     total_h = (line_h * len(lines)) + (_TABLE_LINE_SPACING_PX * max(len(lines) - 1, 0))
     start_y = y0 + max(int(((y1 - y0) - total_h) / 2), _TABLE_PADDING_Y_PX)
 
     for idx, line in enumerate(lines):
-        line_w, _ = _measure_text(draw, line, font)
+        line_w = text_width(font, line)
         if align == "center":
             tx = x0 + max(int(((x1 - x0) - line_w) / 2), _TABLE_PADDING_X_PX)
         else:
@@ -2320,6 +2316,7 @@ def _populate_open_aging_executive_slide(
     scope_result: QuincenalScopeResult,
     slide_width: int,
     slide_height: int,
+    chart_png: bytes | None = None,
 ) -> None:
     _clear_slide_shapes(slide)
 
@@ -2396,11 +2393,12 @@ def _populate_open_aging_executive_slide(
     chart_frame.line.color.rgb = RGBColor(*_EXEC_ACCENT_BORDER_RGB)
     chart_frame.line.width = Pt(1.2)
 
-    chart_png = _resolution_chart_png_executive(
-        settings,
-        dff=scope_result.dff,
-        open_df=scope_result.open_df,
-    )
+    if chart_png is None:
+        chart_png = _resolution_chart_png_executive(
+            settings,
+            dff=scope_result.dff,
+            open_df=scope_result.open_df,
+        )
     if chart_png:
         _overlay_picture_contain(
             slide,
@@ -2599,6 +2597,7 @@ def _populate_open_priority_executive_slide(
     scope_result: QuincenalScopeResult,
     slide_width: int,
     slide_height: int,
+    chart_png: bytes | None = None,
 ) -> None:
     _clear_slide_shapes(slide)
     try:
@@ -2641,11 +2640,12 @@ def _populate_open_priority_executive_slide(
     chart_frame.line.color.rgb = RGBColor(*_EXEC_ACCENT_BORDER_RGB)
     chart_frame.line.width = Pt(1.2)
 
-    chart_png = _priority_chart_png_executive(
-        settings,
-        dff=scope_result.dff,
-        open_df=scope_result.open_df,
-    )
+    if chart_png is None:
+        chart_png = _priority_chart_png_executive(
+            settings,
+            dff=scope_result.dff,
+            open_df=scope_result.open_df,
+        )
     if chart_png:
         _overlay_picture_contain(
             slide,
@@ -3264,9 +3264,11 @@ def _populate_functionality_zoom_slide(
     _set_shape_text(
         slide,
         4,
-        "Zoom de incidencias críticas del periodo:"
-        if critical_wording
-        else "Zoom de incidencias del periodo:",
+        (
+            "Zoom de incidencias críticas del periodo:"
+            if critical_wording
+            else "Zoom de incidencias del periodo:"
+        ),
     )
     _set_shape_font_name(slide, shape_index=4, font_name=_PPT_FONT_BODY_MEDIUM)
 
@@ -3481,6 +3483,7 @@ def _populate_functionality_trend_aggregate_slide(
     open_df: pd.DataFrame,
     slide_width: int,
     slide_height: int,
+    chart_png: bytes | None = None,
 ) -> None:
     _clear_slide_shapes(slide)
 
@@ -3525,7 +3528,8 @@ def _populate_functionality_trend_aggregate_slide(
     frame.line.color.rgb = RGBColor(214, 220, 232)
     frame.line.width = Pt(1.0)
 
-    chart_png = _functionality_fortnight_trend_png(open_df=open_df)
+    if chart_png is None:
+        chart_png = _functionality_fortnight_trend_png(open_df=open_df)
     if chart_png:
         _overlay_picture_contain(
             slide,
@@ -3558,13 +3562,13 @@ def _append_functionality_followup_slides(
     open_df: pd.DataFrame,
     slide_width: int,
     slide_height: int,
+    template_prs: Any | None = None,
+    trend_png: bytes | None = None,
 ) -> None:
     critical_wording = bool(getattr(summary, "is_critical_focus", False))
-    template_path = _resolve_functionality_template_path()
-    template_prs = Presentation(str(template_path))
-    if len(template_prs.slides) < 5:
-        raise ValueError(
-            "La plantilla de funcionalidad debe contener 5 slides (cabecera + dashboard + 3 zoom)."
+    if template_prs is None:
+        template_prs = _load_prepared_template(
+            _resolve_functionality_template_path(), kind="functionality"
         )
 
     header_slide = _append_slide_clone_from_source(prs, source_slide=template_prs.slides[0])
@@ -3590,6 +3594,7 @@ def _append_functionality_followup_slides(
         open_df=open_df,
         slide_width=slide_width,
         slide_height=slide_height,
+        chart_png=trend_png,
     )
 
     # Slide 3 (dashboard funcionalidad)
@@ -3645,6 +3650,103 @@ def _append_functionality_followup_slides(
         )
 
 
+def _period_section_plan(
+    settings: Settings,
+    *,
+    dff: pd.DataFrame,
+    country: str,
+    source_ids: Sequence[str],
+    labels: Mapping[str, str],
+    template: Path,
+    functionality_status_filters: Sequence[str] | None,
+    functionality_priority_filters: Sequence[str] | None,
+    functionality_filters: Sequence[str] | None,
+) -> List[SectionTask]:
+    """Data and PNG production of the deck, as tasks keyed by what they depend on."""
+    source_a_id, source_b_id = source_ids[0], source_ids[1]
+
+    def _quincenal(_deps: Mapping[str, Any]) -> Any:
+        return build_country_quincenal_result(
+            df=dff,
+            settings=settings,
+            country=country,
+            source_ids=list(source_ids),
+            source_label_by_id=dict(labels),
+        )
+
+    def _scope(deps: Mapping[str, Any], source_id: str = "") -> QuincenalScopeResult:
+        quincenal = deps["quincenal"]
+        scope: QuincenalScopeResult = (
+            quincenal.by_source[source_id] if source_id else quincenal.aggregate
+        )
+        return scope
+
+    def _timeseries(source_id: str = "") -> Any:
+        def _build(deps: Mapping[str, Any]) -> bytes:
+            scope = _scope(deps, source_id)
+            return _chart_png(settings, dff=scope.dff, open_df=scope.open_df, chart_id="timeseries")
+
+        return _build
+
+    def _aging_png(deps: Mapping[str, Any]) -> bytes:
+        scope = _scope(deps)
+        return _resolution_chart_png_executive(settings, dff=scope.dff, open_df=scope.open_df)
+
+    def _priority_png(deps: Mapping[str, Any]) -> bytes:
+        scope = _scope(deps)
+        return _priority_chart_png_executive(settings, dff=scope.dff, open_df=scope.open_df)
+
+    def _functionality(deps: Mapping[str, Any]) -> PeriodFunctionalityFollowupSummary:
+        return build_period_functionality_followup_summary(
+            scope_result=_scope(deps),
+            jira_base_url=str(getattr(settings, "JIRA_BASE_URL", "") or "").strip(),
+            status_filters=list(functionality_status_filters or []),
+            priority_filters=list(functionality_priority_filters or []),
+            functionality_filters=list(functionality_filters or []),
+            apply_default_status_when_empty=True,
+            top_n=3,
+            top_root_causes=3,
+        )
+
+    def _functionality_trend_png(deps: Mapping[str, Any]) -> bytes:
+        return _functionality_fortnight_trend_png(open_df=_scope(deps).open_df)
+
+    after_quincenal = ("quincenal",)
+    return [
+        SectionTask("quincenal", _quincenal),
+        SectionTask("template", lambda _deps: _load_prepared_template(template, kind="period")),
+        SectionTask(
+            "functionality_template",
+            lambda _deps: _load_prepared_template(
+                _resolve_functionality_template_path(), kind="functionality"
+            ),
+        ),
+        SectionTask("timeseries_aggregate", _timeseries(), after_quincenal),
+        SectionTask("timeseries_a", _timeseries(source_a_id), after_quincenal),
+        SectionTask("timeseries_b", _timeseries(source_b_id), after_quincenal),
+        SectionTask("aging_png", _aging_png, after_quincenal),
+        SectionTask("priority_png", _priority_png, after_quincenal),
+        SectionTask("functionality", _functionality, after_quincenal),
+        SectionTask("functionality_trend_png", _functionality_trend_png, after_quincenal),
+    ]
+
+
+def _run_period_sections(tasks: Sequence[SectionTask]) -> dict[str, Any]:
+    workers = max(
+        1,
+        int_env("BUG_RESOLUTION_RADAR_PPT_RENDER_WORKERS", _default_ppt_render_workers()),
+    )
+    # Same Plotly template deprecation noise as the executive prerender in worker threads.
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore",
+            message=r"\*scattermapbox\* is deprecated! Use \*scattermap\* instead\..*",
+            category=DeprecationWarning,
+            module=r"_plotly_utils\.basevalidators",
+        )
+        return run_section_plan(tasks, max_workers=workers)
+
+
 def _load_or_scope_data(
     settings: Settings,
     *,
@@ -3653,13 +3755,17 @@ def _load_or_scope_data(
     dff_override: pd.DataFrame | None,
     open_df_override: pd.DataFrame | None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    if dff_override is not None:
-        dff = dff_override.copy(deep=False)
-    else:
-        base_df = load_issues_df(settings.DATA_PATH)
-        scoped = scope_country_sources(base_df, country=country, source_ids=source_ids)
-        dff = apply_analysis_depth_filter(scoped, settings=settings)
+    if dff_override is None:
+        # Same cached scope pipeline the dashboard and executive report use.
+        scope = load_scope_context(
+            settings,
+            query=build_report_scope_query(country=country, source_ids=source_ids),
+        )
+        if open_df_override is None:
+            return scope.dff, scope.open_df
+        return scope.dff, open_df_override.copy(deep=False)
 
+    dff = dff_override.copy(deep=False)
     if open_df_override is not None:
         open_df = open_df_override.copy(deep=False)
     else:
@@ -3668,6 +3774,80 @@ def _load_or_scope_data(
     return dff, open_df
 
 
+def _file_revision(path: Path | str) -> str:
+    resolved = Path(str(path or "")).expanduser()
+    try:
+        stat = resolved.stat()
+    except OSError:
+        return "missing"
+    return f"{int(stat.st_mtime_ns)}:{int(stat.st_size)}"
+
+
+def _period_report_cache_key(
+    settings: Settings,
+    *,
+    country: str,
+    source_ids: Sequence[str],
+    template: Path,
+    dff_override: pd.DataFrame | None,
+    open_df_override: pd.DataFrame | None,
+    applied_filter_summary: str,
+    functionality_status_filters: Sequence[str] | None,
+    functionality_priority_filters: Sequence[str] | None,
+    functionality_filters: Sequence[str] | None,
+) -> str:
+    payload = {
+        "cache_version": "v1",
+        # Fortnight windows and open-age figures move with the calendar day.
+        "report_day": datetime.now(timezone.utc).date().isoformat(),
+        "country": str(country or "").strip(),
+        "source_ids": list(source_ids),
+        "template": str(template),
+        "template_rev": _file_revision(template),
+        "data_rev": (_file_revision(settings.DATA_PATH) if dff_override is None else "override"),
+        "dff_override_sig": _compact_df_signature(dff_override),
+        "open_df_override_sig": _compact_df_signature(open_df_override),
+        "applied_filter_summary": str(applied_filter_summary or "").strip(),
+        "functionality_status_filters": [str(v) for v in list(functionality_status_filters or [])],
+        "functionality_priority_filters": [
+            str(v) for v in list(functionality_priority_filters or [])
+        ],
+        "functionality_filters": [str(v) for v in list(functionality_filters or [])],
+        "settings_token": settings_cache_token(settings),
+    }
+    encoded = json.dumps(
+        payload,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8", errors="replace")
+    return "period" + hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+def _period_result_cache_get(cache_key: str) -> PeriodFollowupReportResult | None:
+    if not _ppt_result_cache_enabled():
+        return None
+    blob = REPORT_RESULT_CACHE.get(cache_key)
+    unpacked = unpack_report_blob(blob) if blob is not None else None
+    if unpacked is None:
+        return None
+    metadata, content = unpacked
+    metadata["source_ids"] = tuple(metadata.get("source_ids") or ())
+    try:
+        return PeriodFollowupReportResult(content=content, **metadata)
+    except TypeError:
+        return None
+
+
+def _period_result_cache_put(cache_key: str, result: PeriodFollowupReportResult) -> None:
+    if not _ppt_result_cache_enabled():
+        return
+    metadata = asdict(result)
+    content = bytes(metadata.pop("content", b"") or b"")
+    REPORT_RESULT_CACHE.put(cache_key, pack_report_blob(metadata, content))
+
+
 def generate_country_period_followup_ppt(
     settings: Settings,
     *,
@@ -3689,6 +3869,23 @@ def generate_country_period_followup_ppt(
     clean_source_ids = clean_source_ids[:2]
 
     country_txt = str(country or "").strip()
+    template = _resolve_template_path(settings, explicit_path=template_path)
+    cache_key = _period_report_cache_key(
+        settings,
+        country=country_txt,
+        source_ids=clean_source_ids,
+        template=template,
+        dff_override=dff_override,
+        open_df_override=open_df_override,
+        applied_filter_summary=applied_filter_summary,
+        functionality_status_filters=functionality_status_filters,
+        functionality_priority_filters=functionality_priority_filters,
+        functionality_filters=functionality_filters,
+    )
+    cached_result = _period_result_cache_get(cache_key)
+    if cached_result is not None:
+        return cached_result
+
     dff, open_df = _load_or_scope_data(
         settings,
         country=country_txt,
@@ -3700,21 +3897,26 @@ def generate_country_period_followup_ppt(
         raise ValueError("No hay incidencias para generar el informe de seguimiento.")
 
     labels = source_label_map(settings, country=country_txt, source_ids=clean_source_ids)
-    quincenal = build_country_quincenal_result(
-        df=dff,
-        settings=settings,
-        country=country_txt,
-        source_ids=clean_source_ids,
-        source_label_by_id=labels,
+    # Sections are produced concurrently; only the python-pptx mutation below is sequential.
+    sections = _run_period_sections(
+        _period_section_plan(
+            settings,
+            dff=dff,
+            country=country_txt,
+            source_ids=clean_source_ids,
+            labels=labels,
+            template=template,
+            functionality_status_filters=functionality_status_filters,
+            functionality_priority_filters=functionality_priority_filters,
+            functionality_filters=functionality_filters,
+        )
     )
-    template = _resolve_template_path(settings, explicit_path=template_path)
-    prs = Presentation(str(template))
+    quincenal = sections["quincenal"]
+    # User template normalised into the canonical 8-slide structure (cached per revision).
+    prs = sections["template"]
     slide_width_emu = _safe_emu(getattr(prs, "slide_width", None), default=9_144_000)
     slide_height_emu = _safe_emu(getattr(prs, "slide_height", None), default=5_143_500)
 
-    # Normalize user template into canonical 8-slide structure.
-    _normalize_period_template(prs)
-
     aggregate = quincenal.aggregate
     source_a_id, source_b_id = clean_source_ids[0], clean_source_ids[1]
     source_a = quincenal.by_source[source_a_id]
@@ -3742,25 +3944,19 @@ def generate_country_period_followup_ppt(
     _overlay_picture(
         prs.slides[2],
         anchor_shape=_resolve_summary_chart_anchor(prs.slides[2]),
-        payload=_chart_png(
-            settings, dff=aggregate.dff, open_df=aggregate.open_df, chart_id="timeseries"
-        ),
+        payload=sections["timeseries_aggregate"],
         replace_anchor=True,
     )
     _overlay_picture(
         prs.slides[3],
         anchor_shape=_resolve_summary_chart_anchor(prs.slides[3]),
-        payload=_chart_png(
-            settings, dff=source_a.dff, open_df=source_a.open_df, chart_id="timeseries"
-        ),
+        payload=sections["timeseries_a"],
         replace_anchor=True,
     )
     _overlay_picture(
         prs.slides[4],
         anchor_shape=_resolve_summary_chart_anchor(prs.slides[4]),
-        payload=_chart_png(
-            settings, dff=source_b.dff, open_df=source_b.open_df, chart_id="timeseries"
-        ),
+        payload=sections["timeseries_b"],
         replace_anchor=True,
     )
 
@@ -3770,6 +3966,7 @@ def generate_country_period_followup_ppt(
         scope_result=aggregate,
         slide_width=slide_width_emu,
         slide_height=slide_height_emu,
+        chart_png=sections["aging_png"],
     )
     _populate_open_priority_executive_slide(
         prs.slides[7],
@@ -3777,18 +3974,10 @@ def generate_country_period_followup_ppt(
         scope_result=aggregate,
         slide_width=slide_width_emu,
         slide_height=slide_height_emu,
+        chart_png=sections["priority_png"],
     )
 
-    functionality_followup = build_period_functionality_followup_summary(
-        scope_result=aggregate,
-        jira_base_url=str(getattr(settings, "JIRA_BASE_URL", "") or "").strip(),
-        status_filters=list(functionality_status_filters or []),
-        priority_filters=list(functionality_priority_filters or []),
-        functionality_filters=list(functionality_filters or []),
-        apply_default_status_when_empty=True,
-        top_n=3,
-        top_root_causes=3,
-    )
+    functionality_followup = sections["functionality"]
     _append_functionality_followup_slides(
         prs,
         summary=functionality_followup,
@@ -3796,6 +3985,8 @@ def generate_country_period_followup_ppt(
         open_df=aggregate.open_df,
         slide_width=slide_width_emu,
         slide_height=slide_height_emu,
+        template_prs=sections["functionality_template"],
+        trend_png=sections["functionality_trend_png"],
     )
 
     buff = BytesIO()
@@ -3808,7 +3999,7 @@ def generate_country_period_followup_ppt(
     total_issues = int(len(aggregate.dff))
     open_issues = int(len(aggregate.open_df))
     closed_issues = max(total_issues - open_issues, 0)
-    return PeriodFollowupReportResult(
+    result = PeriodFollowupReportResult(
         file_name=file_name,
         content=content,
         slide_count=len(prs.slides),
@@ -3819,3 +4010,5 @@ def generate_country_period_followup_ppt(
         source_ids=tuple(clean_source_ids),
         applied_filter_summary=str(applied_filter_summary or "").strip(),
     )
+    _period_result_cache_put(cache_key, result)
+    return result
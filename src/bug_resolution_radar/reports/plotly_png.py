@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import math
+import os
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Sequence, cast
+from typing import Any, Callable, Sequence, cast
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from PIL import Image, ImageColor, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw
 
+from bug_resolution_radar.reports.text_layout import load_font, truncate_to_width
 from bug_resolution_radar.theme.design_tokens import BBVA_LIGHT, BBVA_REPORT_LINE, BBVA_REPORT_MIST
 
 _REPORT_FONT_DIR = (
@@ -20,6 +25,20 @@ _REPORT_FONT_DIR = (
 ).resolve()
 _REPORT_FONT_BOOK_PATH = _REPORT_FONT_DIR / "BentonSansBBVA-Book.ttf"
 _REPORT_FONT_BOLD_PATH = _REPORT_FONT_DIR / "BentonSansBBVA-Bold.ttf"
+_DEFAULT_PNG_COMPRESS_LEVEL = 6
+_TEXT_SIZE_CACHE_MAX_ENTRIES = 4096
+_TEXT_SIZE_CACHE: "OrderedDict[tuple[Any, str, str], tuple[int, int]]" = OrderedDict()
+_TEXT_SIZE_CACHE_LOCK = threading.Lock()
+_DATETIME_ARRAY_KINDS = {
+    "datetime64",
+    "datetime",
+    "date",
+    "string",
+    "integer",
+    "floating",
+    "mixed-integer-float",
+}
+_NUMERIC_ARRAY_KINDS = {"integer", "floating", "mixed-integer-float", "boolean", "empty"}
 
 
 @dataclass(frozen=True)
@@ -38,15 +57,9 @@ class _AxisSpec:
 
 
 def _load_font(size_px: int, *, bold: bool = False) -> Any:
+    # One shared face per (path, size): see `text_layout.load_font`.
     path = _REPORT_FONT_BOLD_PATH if bold else _REPORT_FONT_BOOK_PATH
-    try:
-        return ImageFont.truetype(str(path), size=max(8, int(size_px)))
-    except Exception:
-        try:
-            fallback = _REPORT_FONT_BOOK_PATH if path != _REPORT_FONT_BOOK_PATH else path
-            return ImageFont.truetype(str(fallback), size=max(8, int(size_px)))
-        except Exception:
-            return ImageFont.load_default()
+    return load_font([path, _REPORT_FONT_BOOK_PATH], max(8, int(size_px)))
 
 
 def _parse_color(value: object, *, default: str = "#004481") -> tuple[int, int, int, int]:
@@ -123,6 +136,61 @@ def _to_datetime_float(value: object) -> float | None:
     return float(ts.value)
 
 
+def _coerce_each(values: Sequence[object], parser: Callable[[object], float | None]) -> np.ndarray:
+    parsed = [parser(value) for value in values]
+    return np.array([np.nan if value is None else value for value in parsed], dtype=float)
+
+
+def _to_float_array(values: Sequence[object]) -> np.ndarray:
+    """Vectorized `_to_float`: NaN marks values that cannot be plotted."""
+    if not len(values):
+        return np.empty(0, dtype=float)
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    try:
+        if kind in _NUMERIC_ARRAY_KINDS:
+            return np.asarray(values, dtype=float)
+        if kind == "string":
+            stripped = pd.Series(values, dtype=object).str.strip()
+            return np.asarray(pd.to_numeric(stripped, errors="coerce"), dtype=float)
+    except (TypeError, ValueError):
+        pass
+    return _coerce_each(values, _to_float)
+
+
+def _to_datetime_array(values: Sequence[object]) -> np.ndarray:
+    """Vectorized `_to_datetime_float` returning epoch nanoseconds (NaN when invalid)."""
+    if not len(values):
+        return np.empty(0, dtype=float)
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind not in _DATETIME_ARRAY_KINDS:
+        return _coerce_each(values, _to_datetime_float)
+    try:
+        if kind == "string":
+            try:
+                parsed = pd.to_datetime(
+                    pd.Series(values, dtype=object), errors="coerce", utc=True, format="mixed"
+                )
+            except TypeError:
+                parsed = pd.to_datetime(pd.Series(values, dtype=object), errors="coerce", utc=True)
+        else:
+            parsed = pd.to_datetime(values, errors="coerce", utc=True)
+        index = pd.DatetimeIndex(parsed).as_unit("ns")
+    except Exception:
+        return _coerce_each(values, _to_datetime_float)
+    out = np.asarray(index.asi8, dtype=float)
+    out[np.asarray(index.isna())] = np.nan
+    return out
+
+
+def _png_compress_level() -> int:
+    raw = str(os.getenv("BUG_RESOLUTION_RADAR_PPT_PNG_COMPRESS_LEVEL", "") or "").strip()
+    try:
+        level = int(raw) if raw else _DEFAULT_PNG_COMPRESS_LEVEL
+    except ValueError:
+        level = _DEFAULT_PNG_COMPRESS_LEVEL
+    return max(0, min(9, level))
+
+
 def _stringify_tick(value: object) -> str:
     txt = str(value or "").strip()
     return txt or "—"
@@ -131,8 +199,19 @@ def _stringify_tick(value: object) -> str:
 def _text_bbox(draw: ImageDraw.ImageDraw, text: str, font: Any) -> tuple[int, int]:
     if not text:
         return (0, 0)
+    cache_key = (font, str(getattr(draw, "mode", "") or ""), text)
+    with _TEXT_SIZE_CACHE_LOCK:
+        cached = _TEXT_SIZE_CACHE.get(cache_key)
+        if cached is not None:
+            _TEXT_SIZE_CACHE.move_to_end(cache_key)
+            return cached
     box = draw.textbbox((0, 0), text, font=font)
-    return (max(0, int(box[2] - box[0])), max(0, int(box[3] - box[1])))
+    size = (max(0, int(box[2] - box[0])), max(0, int(box[3] - box[1])))
+    with _TEXT_SIZE_CACHE_LOCK:
+        _TEXT_SIZE_CACHE[cache_key] = size
+        while len(_TEXT_SIZE_CACHE) > _TEXT_SIZE_CACHE_MAX_ENTRIES:
+            _TEXT_SIZE_CACHE.popitem(last=False)
+    return size
 
 
 def _normalize_text_payload(raw: object) -> list[str]:
@@ -281,11 +360,7 @@ def _fit_text_to_width(
         return ""
     if _text_bbox(draw, clean, font)[0] <= max_width:
         return clean
-    ellipsis = "…"
-    token = clean
-    while token and _text_bbox(draw, f"{token}{ellipsis}", font)[0] > max_width:
-        token = token[:-1]
-    return f"{token}{ellipsis}" if token else ellipsis
+    return truncate_to_width(font, clean, max_width=max_width, ellipsis="…")
 
 
 def _draw_legend_vertical(
@@ -426,14 +501,14 @@ def _infer_x_axis(fig: go.Figure, traces: Sequence[object]) -> _AxisSpec:
                 categories=[],
             )
 
-    dt_values = [_to_datetime_float(value) for value in all_x_values]
-    valid_dt = [value for value in dt_values if value is not None]
-    if valid_dt and len(valid_dt) >= max(2, len(all_x_values) // 2):
-        minimum = min(valid_dt)
-        maximum = max(valid_dt)
+    dt_values = _to_datetime_array(all_x_values)
+    valid_dt = dt_values[~np.isnan(dt_values)]
+    if valid_dt.size and valid_dt.size >= max(2, len(all_x_values) // 2):
+        minimum = float(valid_dt.min())
+        maximum = float(valid_dt.max())
         if maximum <= minimum:
             maximum = minimum + 86_400_000_000_000.0
-        tick_count = 5 if len(valid_dt) >= 5 else max(2, len(valid_dt))
+        tick_count = 5 if valid_dt.size >= 5 else max(2, int(valid_dt.size))
         step = (maximum - minimum) / float(max(1, tick_count - 1))
         ticks: list[tuple[float, str]] = []
         for idx in range(tick_count):
@@ -448,11 +523,11 @@ def _infer_x_axis(fig: go.Figure, traces: Sequence[object]) -> _AxisSpec:
             categories=[],
         )
 
-    numeric_values = [_to_float(value) for value in all_x_values]
-    valid_numeric = [value for value in numeric_values if value is not None]
-    if valid_numeric and len(valid_numeric) >= max(2, len(all_x_values) // 2):
-        minimum = min(valid_numeric)
-        maximum = max(valid_numeric)
+    numeric_values = _to_float_array(all_x_values)
+    valid_numeric = numeric_values[~np.isnan(numeric_values)]
+    if valid_numeric.size and valid_numeric.size >= max(2, len(all_x_values) // 2):
+        minimum = float(valid_numeric.min())
+        maximum = float(valid_numeric.max())
         if maximum <= minimum:
             maximum = minimum + 1.0
         ticks = []
@@ -463,7 +538,7 @@ def _infer_x_axis(fig: go.Figure, traces: Sequence[object]) -> _AxisSpec:
                     continue
                 ticks.append((parsed, ticktext[idx]))
         else:
-            tick_count = 5 if len(valid_numeric) >= 5 else max(2, len(valid_numeric))
+            tick_count = 5 if valid_numeric.size >= 5 else max(2, int(valid_numeric.size))
             step = (maximum - minimum) / float(max(1, tick_count - 1))
             for idx in range(tick_count):
                 raw = minimum + (step * idx)
@@ -551,25 +626,17 @@ def _infer_y_axis(fig: go.Figure, traces: Sequence[object], *, stacked_bars: boo
             if str(getattr(trace, "type", "") or "").strip().lower() != "bar":
                 continue
             xs = _trace_values(trace, "x")
-            ys = _trace_values(trace, "y")
-            for idx, raw_y in enumerate(ys):
-                y_value = _to_float(raw_y)
-                if y_value is None:
-                    continue
+            ys = _to_float_array(_trace_values(trace, "y"))
+            for idx in np.flatnonzero(~np.isnan(ys)).tolist():
                 x_key = str(xs[idx] if idx < len(xs) else idx)
-                totals[x_key] = float(totals.get(x_key, 0.0)) + max(0.0, y_value)
+                totals[x_key] = float(totals.get(x_key, 0.0)) + max(0.0, float(ys[idx]))
         values.extend(float(total) for total in totals.values())
 
     for trace in traces:
         if str(getattr(trace, "type", "") or "").strip().lower() == "pie":
             continue
-        values.extend(
-            [
-                cast(float, value)
-                for value in [_to_float(item) for item in _trace_values(trace, "y")]
-                if value is not None
-            ]
-        )
+        ys = _to_float_array(_trace_values(trace, "y"))
+        values.extend(ys[~np.isnan(ys)].tolist())
 
     if not values:
         values = [0.0, 1.0]
@@ -622,6 +689,37 @@ def _map_y(value: object, axis: _AxisSpec, top: int, height: int) -> float | Non
     return top + height - (normalized * height)
 
 
+def _map_x_array(values: Sequence[object], axis: _AxisSpec, left: int, width: int) -> np.ndarray:
+    """Map a whole trace to pixel columns in one pass; NaN marks unplottable values."""
+    if axis.kind == "category":
+        positions: dict[str, int] = {}
+        for idx, category in enumerate(axis.categories):
+            positions.setdefault(category, idx)
+        step = width / float(max(1, len(axis.categories)))
+        slots = np.array(
+            [positions.get(str(value or "").strip(), -1) for value in values], dtype=float
+        )
+        slots[slots < 0] = np.nan
+        return left + (step * (slots + 0.5))
+
+    if axis.kind == "datetime":
+        parsed = _to_datetime_array(values)
+    else:
+        parsed = _to_float_array(values)
+    span = max(1e-9, axis.maximum - axis.minimum)
+    return left + ((parsed - axis.minimum) / span) * width
+
+
+def _map_y_array(values: Sequence[object], axis: _AxisSpec, top: int, height: int) -> np.ndarray:
+    return _map_y_values(_to_float_array(values), axis, top, height)
+
+
+def _map_y_values(parsed: np.ndarray, axis: _AxisSpec, top: int, height: int) -> np.ndarray:
+    span = max(1e-9, axis.maximum - axis.minimum)
+    normalized = (parsed - axis.minimum) / span
+    return top + height - (normalized * height)
+
+
 def _draw_rotated_text(
     image: Image.Image,
     text: str,
@@ -759,48 +857,55 @@ def _draw_bar_traces(
         text_values = _normalize_text_payload(getattr(trace, "text", None))
         marker = getattr(trace, "marker", None)
         bar_color = _parse_color(getattr(marker, "color", None))
-        for idx, raw_y in enumerate(ys):
-            y_value = _to_float(raw_y)
-            if y_value is None or y_value <= 0:
-                continue
-            x_raw = xs[idx] if idx < len(xs) else str(idx)
-            x_token = str(x_raw or "").strip()
-            x_center = _map_x(x_raw, x_axis, left, width)
-            if x_center is None:
-                continue
-            y0_value = stacks.get(x_token, 0.0) if stacked else 0.0
-            y1_value = y0_value + y_value
-            y0 = _map_y(y0_value, y_axis, top, height)
-            y1 = _map_y(y1_value, y_axis, top, height)
-            if y0 is None or y1 is None:
+        if not ys:
+            continue
+        x_values = list(xs[: len(ys)]) + [str(idx) for idx in range(len(xs), len(ys))]
+        y_values = _to_float_array(ys)
+        x_centers = _map_x_array(x_values, x_axis, left, width)
+        drawable = np.flatnonzero((y_values > 0) & ~np.isnan(x_centers))
+        if not drawable.size:
+            continue
+
+        # Stacking depends on the order bars are laid down, so offsets are
+        # accumulated sequentially; pixel mapping then runs once per trace.
+        base_values = np.zeros(drawable.size, dtype=float)
+        for pos, idx in enumerate(drawable.tolist()):
+            if not stacked:
                 continue
-            rect = [
-                x_center - (bar_width / 2),
-                min(y0, y1),
-                x_center + (bar_width / 2),
-                max(y0, y1),
+            x_token = str(x_values[idx] or "").strip()
+            base_values[pos] = stacks.get(x_token, 0.0)
+            stacks[x_token] = float(base_values[pos] + y_values[idx])
+        y0 = _map_y_values(base_values, y_axis, top, height)
+        y1 = _map_y_values(base_values + y_values[drawable], y_axis, top, height)
+        rects = np.column_stack(
+            [
+                x_centers[drawable] - (bar_width / 2),
+                np.minimum(y0, y1),
+                x_centers[drawable] + (bar_width / 2),
+                np.maximum(y0, y1),
             ]
-            draw.rounded_rectangle(
-                rect,
-                radius=max(2, int(4 * scale)),
-                fill=bar_color,
-            )
-            if stacked:
-                stacks[x_token] = y1_value
+        ).tolist()
+        radius = max(2, int(4 * scale))
+        for rect in rects:
+            draw.rounded_rectangle(rect, radius=radius, fill=bar_color)
+
+        label_color = _contrast_text(bar_color)
+        for rect, idx in zip(rects, drawable.tolist()):
             label = _plain_text(text_values[idx] if idx < len(text_values) else "")
-            if label:
-                label_w, label_h = _text_bbox(draw, label, label_font)
-                rect_height = max(0, rect[3] - rect[1])
-                if rect_height >= label_h + (8 * scale):
-                    draw.text(
-                        (
-                            rect[0] + ((bar_width - label_w) / 2),
-                            rect[1] + ((rect_height - label_h) / 2),
-                        ),
-                        label,
-                        font=label_font,
-                        fill=_contrast_text(bar_color),
-                    )
+            if not label:
+                continue
+            label_w, label_h = _text_bbox(draw, label, label_font)
+            rect_height = max(0, rect[3] - rect[1])
+            if rect_height >= label_h + (8 * scale):
+                draw.text(
+                    (
+                        rect[0] + ((bar_width - label_w) / 2),
+                        rect[1] + ((rect_height - label_h) / 2),
+                    ),
+                    label,
+                    font=label_font,
+                    fill=label_color,
+                )
 
 
 def _draw_scatter_traces(
@@ -837,15 +942,13 @@ def _draw_scatter_traces(
         marker_size = _to_float(getattr(marker, "size", 6)) or 6.0
         text_values = _normalize_text_payload(getattr(trace, "text", None))
 
-        points: list[tuple[float, float]] = []
-        for idx, raw_x in enumerate(xs):
-            if idx >= len(ys):
-                continue
-            x_pos = _map_x(raw_x, x_axis, left, width)
-            y_pos = _map_y(ys[idx], y_axis, top, height)
-            if x_pos is None or y_pos is None:
-                continue
-            points.append((x_pos, y_pos))
+        count = min(len(xs), len(ys))
+        x_pos = _map_x_array(xs[:count], x_axis, left, width)
+        y_pos = _map_y_array(ys[:count], y_axis, top, height)
+        valid = ~(np.isnan(x_pos) | np.isnan(y_pos))
+        x_pos = x_pos[valid]
+        y_pos = y_pos[valid]
+        points = list(zip(x_pos.tolist(), y_pos.tolist()))
 
         if "lines" in mode_tokens and len(points) >= 2:
             base_width = float(getattr(line, "width", 2) or 2)
@@ -859,13 +962,12 @@ def _draw_scatter_traces(
         if "markers" in mode_tokens:
             radius = max(2, int((marker_size / 2.0) * scale * safe_marker_multiplier))
             outline = _parse_color(BBVA_LIGHT.white)
-            for x_pos, y_pos in points:
-                draw.ellipse(
-                    [x_pos - radius, y_pos - radius, x_pos + radius, y_pos + radius],
-                    fill=marker_color,
-                    outline=outline,
-                    width=max(1, int(scale)),
-                )
+            outline_width = max(1, int(scale))
+            boxes = np.column_stack(
+                [x_pos - radius, y_pos - radius, x_pos + radius, y_pos + radius]
+            ).tolist()
+            for box in boxes:
+                draw.ellipse(box, fill=marker_color, outline=outline, width=outline_width)
 
         if "text" in mode_tokens:
             for idx, point in enumerate(points):
@@ -1114,8 +1216,14 @@ def render_plotly_figure_png(
     scale: float,
     export_width: int,
     export_height: int,
+    compress_level: int | None = None,
 ) -> bytes:
-    """Render supported Plotly report figures to PNG without any browser runtime."""
+    """
+    Render supported Plotly report figures to PNG without any browser runtime.
+
+    `compress_level` (0-9) trades PNG size for encode time; when omitted it comes
+    from `BUG_RESOLUTION_RADAR_PPT_PNG_COMPRESS_LEVEL` (default 6).
+    """
 
     render_scale = max(1.0, min(float(scale or 1.0), 2.0))
     width = max(320, int(export_width * render_scale))
@@ -1186,5 +1294,6 @@ def render_plotly_figure_png(
         )
 
     payload = BytesIO()
-    image.save(payload, format="PNG", optimize=True)
+    level = _png_compress_level() if compress_level is None else max(0, min(9, compress_level))
+    image.save(payload, format="PNG", compress_level=int(level))
     return payload.getvalue()
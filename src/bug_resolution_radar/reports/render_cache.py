@@ -0,0 +1,213 @@
+"""Persistent content-addressed cache for rendered report artifacts."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from bug_resolution_radar.common.utils import bool_env, int_env
+from bug_resolution_radar.config import config_home
+
+_DEFAULT_MAX_MB = 256
+_ENTRY_SUFFIX = ".bin"
+
+
+def render_cache_enabled() -> bool:
+    return bool_env("BUG_RESOLUTION_RADAR_PPT_DISK_CACHE", True)
+
+
+def render_cache_root() -> Path:
+    override = str(os.getenv("BUG_RESOLUTION_RADAR_PPT_DISK_CACHE_DIR", "") or "").strip()
+    if override:
+        return Path(override).expanduser()
+    return config_home() / "data" / "cache" / "report_render"
+
+
+def render_cache_max_bytes() -> int:
+    max_mb = max(1, int_env("BUG_RESOLUTION_RADAR_PPT_DISK_CACHE_MAX_MB", _DEFAULT_MAX_MB))
+    return int(max_mb) * 1024 * 1024
+
+
+def _safe_key(cache_key: str) -> str:
+    token = "".join(ch for ch in str(cache_key or "").strip().lower() if ch.isalnum())
+    return token[:96]
+
+
+class PersistentBlobCache:
+    """
+    Size-bounded LRU blob store keyed by content hashes.
+
+    Entries live as one file per key under `<root>/<namespace>/<xx>/<key>.bin`.
+    Writes go through a temporary file plus `os.replace`, so concurrent readers
+    never observe partial payloads. Recency is tracked through file mtimes, which
+    lets the LRU order survive restarts without a separate manifest.
+    """
+
+    def __init__(self, namespace: str) -> None:
+        self.namespace = str(namespace or "").strip() or "default"
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._index_root: Optional[Path] = None
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._errors = 0
+
+    def _dir(self) -> Path:
+        return render_cache_root() / self.namespace
+
+    def _entry_path(self, root: Path, key: str) -> Path:
+        return root / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def _ensure_index(self, root: Path) -> None:
+        if self._index_root == root:
+            return
+        entries: list[tuple[int, str, int]] = []
+        if root.exists():
+            for path in root.glob(f"*/*{_ENTRY_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((int(stat.st_mtime_ns), path.stem, int(stat.st_size)))
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._total_bytes = sum(size for _, _, size in entries)
+        self._index_root = root
+
+    def _evict_locked(self, root: Path, *, max_bytes: int) -> None:
+        while self._index and self._total_bytes > max_bytes:
+            old_key, old_size = self._index.popitem(last=False)
+            self._total_bytes -= int(old_size)
+            self._evictions += 1
+            try:
+                self._entry_path(root, old_key).unlink(missing_ok=True)
+            except OSError:
+                self._errors += 1
+
+    def get(self, cache_key: str) -> Optional[bytes]:
+        key = _safe_key(cache_key)
+        if not key or not render_cache_enabled():
+            return None
+        root = self._dir()
+        with self._lock:
+            self._ensure_index(root)
+            if key not in self._index:
+                self._misses += 1
+                return None
+            path = self._entry_path(root, key)
+            try:
+                payload = path.read_bytes()
+            except OSError:
+                self._total_bytes -= int(self._index.pop(key, 0))
+                self._misses += 1
+                return None
+            self._index.move_to_end(key)
+            self._hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return payload
+
+    def put(self, cache_key: str, payload: bytes) -> None:
+        key = _safe_key(cache_key)
+        if not key or not payload or not render_cache_enabled():
+            return
+        max_bytes = render_cache_max_bytes()
+        if len(payload) > max_bytes:
+            return
+        root = self._dir()
+        target = self._entry_path(root, key)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as handle:
+                handle.write(payload)
+            os.replace(tmp, target)
+        except OSError:
+            with self._lock:
+                self._errors += 1
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self._ensure_index(root)
+            self._total_bytes -= int(self._index.pop(key, 0))
+            self._index[key] = len(payload)
+            self._total_bytes += len(payload)
+            self._writes += 1
+            self._evict_locked(root, max_bytes=max_bytes)
+
+    def clear(self) -> None:
+        root = self._dir()
+        with self._lock:
+            self._ensure_index(root)
+            for key in list(self._index.keys()):
+                try:
+                    self._entry_path(root, key).unlink(missing_ok=True)
+                except OSError:
+                    self._errors += 1
+            self._index.clear()
+            self._total_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._writes = 0
+            self._evictions = 0
+            self._errors = 0
+            self._index_root = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "namespace": self.namespace,
+                "enabled": render_cache_enabled(),
+                "entries": len(self._index),
+                "bytes": int(self._total_bytes),
+                "max_bytes": render_cache_max_bytes(),
+                "hits": int(self._hits),
+                "misses": int(self._misses),
+                "writes": int(self._writes),
+                "evictions": int(self._evictions),
+                "errors": int(self._errors),
+                "hit_rate": (float(self._hits) / float(lookups)) if lookups else 0.0,
+            }
+
+
+CHART_PNG_CACHE = PersistentBlobCache("chart_png")
+REPORT_RESULT_CACHE = PersistentBlobCache("report_result")
+
+
+def render_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return hit-rate and size metrics for every persistent render cache."""
+    return {cache.namespace: cache.stats() for cache in (CHART_PNG_CACHE, REPORT_RESULT_CACHE)}
+
+
+def pack_report_blob(metadata: Dict[str, Any], content: bytes) -> bytes:
+    """Serialize report metadata plus binary content into one cache entry."""
+    header = json.dumps(metadata, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return header.encode("utf-8") + b"\0" + bytes(content or b"")
+
+
+def unpack_report_blob(blob: bytes) -> Optional[tuple[Dict[str, Any], bytes]]:
+    """Inverse of `pack_report_blob`; returns `None` for corrupt entries."""
+    header, sep, content = bytes(blob or b"").partition(b"\0")
+    if not sep or not content:
+        return None
+    try:
+        metadata = json.loads(header.decode("utf-8"))
+    except Exception:
+        return None
+    if not isinstance(metadata, dict):
+        return None
+    return metadata, content
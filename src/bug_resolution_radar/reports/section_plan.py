@@ -0,0 +1,70 @@
+"""Dependency-ordered execution of report sections on a bounded worker pool."""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Sequence
+
+
+@dataclass(frozen=True)
+class SectionTask:
+    """One unit of report data/PNG production; `build` receives its resolved `deps`."""
+
+    name: str
+    build: Callable[[Mapping[str, Any]], Any]
+    deps: tuple[str, ...] = ()
+
+
+def _validate(tasks: Sequence[SectionTask]) -> None:
+    names = [task.name for task in tasks]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Secciones duplicadas en el plan del informe: {names}")
+    known = set(names)
+    for task in tasks:
+        missing = [dep for dep in task.deps if dep not in known]
+        if missing:
+            raise ValueError(f"La sección {task.name} depende de secciones desconocidas: {missing}")
+
+
+def _ready(pending: Dict[str, SectionTask], results: Mapping[str, Any]) -> List[SectionTask]:
+    return [task for task in pending.values() if all(dep in results for dep in task.deps)]
+
+
+def run_section_plan(tasks: Sequence[SectionTask], *, max_workers: int) -> Dict[str, Any]:
+    """
+    Run `tasks` as soon as their dependencies finish and return results by name.
+
+    With `max_workers <= 1` tasks run inline in plan order. The first failing
+    task's exception is raised once the tasks already running have finished.
+    """
+    _validate(tasks)
+    pending = {task.name: task for task in tasks}
+    results: Dict[str, Any] = {}
+
+    if max_workers <= 1 or len(tasks) <= 1:
+        while pending:
+            ready = _ready(pending, results)
+            if not ready:
+                raise ValueError(f"Dependencias circulares en el plan: {sorted(pending)}")
+            task = ready[0]
+            del pending[task.name]
+            results[task.name] = task.build({dep: results[dep] for dep in task.deps})
+        return results
+
+    running: Dict[Future[Any], str] = {}
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(tasks)), thread_name_prefix="ppt-section"
+    ) as pool:
+        while pending or running:
+            for task in _ready(pending, results):
+                del pending[task.name]
+                deps = {dep: results[dep] for dep in task.deps}
+                running[pool.submit(task.build, deps)] = task.name
+            if not running:
+                raise ValueError(f"Dependencias circulares en el plan: {sorted(pending)}")
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+    return results
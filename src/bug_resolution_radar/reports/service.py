@@ -7,17 +7,12 @@ from typing import Sequence
 
 import pandas as pd
 
-from bug_resolution_radar.analytics.analysis_window import apply_analysis_depth_filter
-from bug_resolution_radar.analytics.issues import normalize_text_col
+from bug_resolution_radar.analytics.filtering import FilterState
 from bug_resolution_radar.analytics.quincenal_scope import (
     QUINCENAL_SCOPE_ALL,
-    apply_issue_key_scope,
     normalize_quincenal_scope_label,
-    quincenal_scope_options,
 )
-from bug_resolution_radar.analytics.status_semantics import effective_closed_mask
 from bug_resolution_radar.config import Settings
-from bug_resolution_radar.repositories.issues_store import load_issues_df
 from bug_resolution_radar.reports.executive_ppt import (
     ExecutiveReportResult,
     generate_scope_executive_ppt,
@@ -26,6 +21,11 @@ from bug_resolution_radar.reports.period_followup_ppt import (
     PeriodFollowupReportResult,
     generate_country_period_followup_ppt,
 )
+from bug_resolution_radar.services.dashboard_snapshot import (
+    DashboardScopeContext,
+    build_report_scope_query,
+    load_scope_context,
+)
 from bug_resolution_radar.services.downloads import (
     default_download_dir as default_report_export_dir,
     ensure_download_dir as ensure_report_export_dir,
@@ -42,11 +42,7 @@ class ReportFilters:
     quincenal_scope: str = QUINCENAL_SCOPE_ALL
 
 
-@dataclass(frozen=True)
-class PreparedReportContext:
-    scoped_df: pd.DataFrame
-    dff: pd.DataFrame
-    open_df: pd.DataFrame
+PreparedReportContext = DashboardScopeContext
 
 
 def _normalize_tokens(values: Sequence[str] | None) -> tuple[str, ...]:
@@ -76,93 +72,6 @@ def build_report_filters(
     )
 
 
-def _scope_source_df(df: pd.DataFrame, *, country: str, source_id: str) -> pd.DataFrame:
-    if df is None or df.empty:
-        return pd.DataFrame()
-
-    mask = pd.Series(True, index=df.index)
-    country_txt = str(country or "").strip()
-    source_txt = str(source_id or "").strip()
-    if country_txt and "country" in df.columns:
-        mask &= df["country"].fillna("").astype(str).eq(country_txt)
-    if source_txt and "source_id" in df.columns:
-        mask &= df["source_id"].fillna("").astype(str).eq(source_txt)
-    return df.loc[mask].copy(deep=False)
-
-
-def _scope_country_sources(
-    df: pd.DataFrame,
-    *,
-    country: str,
-    source_ids: Sequence[str],
-) -> pd.DataFrame:
-    if df is None or df.empty:
-        return pd.DataFrame()
-
-    country_txt = str(country or "").strip()
-    source_tokens = [str(source_id or "").strip() for source_id in list(source_ids or [])]
-    source_tokens = [token for token in source_tokens if token]
-    mask = pd.Series(True, index=df.index)
-    if country_txt and "country" in df.columns:
-        mask &= df["country"].fillna("").astype(str).eq(country_txt)
-    if source_tokens and "source_id" in df.columns:
-        mask &= df["source_id"].fillna("").astype(str).isin(source_tokens)
-    return df.loc[mask].copy(deep=False)
-
-
-def _apply_explicit_filters(df: pd.DataFrame, filters: ReportFilters) -> pd.DataFrame:
-    if df is None or df.empty:
-        return pd.DataFrame()
-
-    mask = pd.Series(True, index=df.index)
-    status_norm: pd.Series | None = None
-    if "status" in df.columns:
-        status_norm = normalize_text_col(df["status"], "(sin estado)")
-        if filters.status:
-            mask &= status_norm.isin(list(filters.status))
-
-    priority_norm: pd.Series | None = None
-    if "priority" in df.columns:
-        priority_norm = normalize_text_col(df["priority"], "(sin priority)")
-        if filters.priority:
-            mask &= priority_norm.isin(list(filters.priority))
-
-    if filters.assignee and "assignee" in df.columns:
-        assignee_norm = normalize_text_col(df["assignee"], "(sin asignar)")
-        mask &= assignee_norm.isin(list(filters.assignee))
-
-    dff = df.loc[mask].copy(deep=False)
-    if status_norm is not None:
-        dff["status"] = status_norm.loc[mask].to_numpy()
-    if priority_norm is not None:
-        dff["priority"] = priority_norm.loc[mask].to_numpy()
-    return dff
-
-
-def _apply_quincenal_scope(
-    df: pd.DataFrame,
-    *,
-    settings: Settings,
-    country: str,
-    source_ids: Sequence[str],
-    selected_scope: str,
-) -> pd.DataFrame:
-    scope_label = normalize_quincenal_scope_label(selected_scope)
-    if scope_label == QUINCENAL_SCOPE_ALL or df is None or df.empty:
-        return df.copy(deep=False)
-
-    options = quincenal_scope_options(
-        df,
-        settings=settings,
-        country=str(country or "").strip(),
-        source_ids=source_ids,
-    )
-    selected_keys = options.get(scope_label)
-    if selected_keys is None:
-        return df.copy(deep=False)
-    return apply_issue_key_scope(df, keys=selected_keys)
-
-
 def _build_context_for_scope(
     settings: Settings,
     *,
@@ -171,27 +80,25 @@ def _build_context_for_scope(
     filters: ReportFilters,
     df_all: pd.DataFrame | None = None,
 ) -> PreparedReportContext:
-    base_df = df_all if isinstance(df_all, pd.DataFrame) else load_issues_df(settings.DATA_PATH)
-    clean_source_ids = [str(source_id or "").strip() for source_id in list(source_ids or [])]
-    clean_source_ids = [token for token in clean_source_ids if token]
-
-    if len(clean_source_ids) == 1:
-        scoped_df = _scope_source_df(base_df, country=country, source_id=clean_source_ids[0])
-    else:
-        scoped_df = _scope_country_sources(base_df, country=country, source_ids=clean_source_ids)
-
-    scoped_df = apply_analysis_depth_filter(scoped_df, settings=settings)
-    dff = _apply_explicit_filters(scoped_df, filters)
-    dff = _apply_quincenal_scope(
-        dff,
-        settings=settings,
+    query = build_report_scope_query(
         country=country,
-        source_ids=clean_source_ids,
-        selected_scope=filters.quincenal_scope,
+        source_ids=source_ids,
+        filters=FilterState(
+            status=list(filters.status),
+            priority=list(filters.priority),
+            assignee=list(filters.assignee),
+        ),
+        quincenal_scope=filters.quincenal_scope,
+    )
+    # Same pipeline (and cache) as `/api/dashboard`: a report generated right after
+    # viewing the dashboard reuses its scope, KPIs, figures and insight packs.
+    return load_scope_context(
+        settings,
+        query=query,
+        include_kpis=True,
+        include_timeseries_chart=True,
+        df_all=df_all,
     )
-    closed_mask = effective_closed_mask(dff) if not dff.empty else pd.Series(dtype=bool)
-    open_df = dff.loc[~closed_mask].copy(deep=False) if not dff.empty else pd.DataFrame()
-    return PreparedReportContext(scoped_df=scoped_df, dff=dff, open_df=open_df)
 
 
 def generate_executive_report_artifact(
@@ -221,9 +128,7 @@ def generate_executive_report_artifact(
         status_filters=list(filters.status),
         priority_filters=list(filters.priority),
         assignee_filters=list(filters.assignee),
-        dff_override=context.dff,
-        open_df_override=context.open_df,
-        scoped_source_df_override=context.scoped_df,
+        scope_context=context,
     )
 
 
@@ -0,0 +1,147 @@
+"""Shared text measurement and fitting for text rasterised into report images."""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import math
+import threading
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Sequence
+
+from PIL import ImageFont
+
+_METRICS: "weakref.WeakKeyDictionary[Any, FontMetrics]" = weakref.WeakKeyDictionary()
+_METRICS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=128)
+def _truetype(path: str, size_px: int) -> Any:
+    try:
+        return ImageFont.truetype(path, size_px)
+    except Exception:
+        return None
+
+
+def load_font(paths: Sequence[str | Path], size_px: int) -> Any:
+    """
+    First loadable FreeType face among `paths` at `size_px`, shared per (path, size).
+
+    Faces are immutable once loaded, so every render reuses the same instance
+    (and its glyph metrics). Falls back to Pillow's default bitmap font.
+    """
+    size = max(int(size_px), 1)
+    for path in paths:
+        font = _truetype(str(path), size)
+        if font is not None:
+            return font
+    return _default_font()
+
+
+@lru_cache(maxsize=1)
+def _default_font() -> Any:
+    return ImageFont.load_default()
+
+
+class FontMetrics:
+    """Glyph advances of one font, measured once per character."""
+
+    def __init__(self, font: Any) -> None:
+        self.font = font
+        self._advances: dict[str, float] = {}
+        bbox = font.getbbox("Ag")
+        self.line_height = max(int(bbox[3] - bbox[1]), 1)
+
+    def advance(self, char: str) -> float:
+        width = self._advances.get(char)
+        if width is None:
+            width = float(self.font.getlength(char))
+            self._advances[char] = width
+        return width
+
+    def width(self, text: str) -> int:
+        return int(math.ceil(sum(self.advance(char) for char in str(text or ""))))
+
+    def prefix_widths(self, text: str) -> list[float]:
+        """`out[k]` is the advance width of `text[:k]`."""
+        return [0.0, *itertools.accumulate(self.advance(char) for char in text)]
+
+
+def font_metrics(font: Any) -> FontMetrics:
+    with _METRICS_LOCK:
+        metrics = _METRICS.get(font)
+        if metrics is None:
+            metrics = FontMetrics(font)
+            _METRICS[font] = metrics
+        return metrics
+
+
+def text_width(font: Any, text: str) -> int:
+    return font_metrics(font).width(text)
+
+
+def line_height(font: Any) -> int:
+    return font_metrics(font).line_height
+
+
+def truncate_to_width(font: Any, text: str, *, max_width: int, ellipsis: str = "...") -> str:
+    """Longest prefix of `text` that fits `max_width` with `ellipsis` appended (binary search)."""
+    raw = str(text or "").strip()
+    if not raw:
+        return ""
+    metrics = font_metrics(font)
+    prefix = metrics.prefix_widths(raw)
+    if prefix[-1] <= max_width:
+        return raw
+    budget = float(max_width) - sum(metrics.advance(char) for char in ellipsis)
+    cut = bisect.bisect_right(prefix, budget) - 1
+    probe = raw[: max(min(cut, len(raw) - 1), 0)].rstrip()
+    return f"{probe}{ellipsis}" if probe else ellipsis
+
+
+def wrap_to_width(font: Any, text: str, *, max_width: int) -> list[str]:
+    """Greedy word wrap; a word wider than `max_width` keeps a line of its own."""
+    raw = str(text or "").strip()
+    if not raw:
+        return [""]
+    metrics = font_metrics(font)
+    space = metrics.advance(" ")
+    lines: list[str] = []
+    for block in raw.splitlines() or [""]:
+        words = block.split()
+        if not words:
+            lines.append("")
+            continue
+        widths = [metrics.prefix_widths(word)[-1] for word in words]
+        start, current = 0, widths[0]
+        for idx in range(1, len(words)):
+            candidate = current + space + widths[idx]
+            if candidate <= max_width:
+                current = candidate
+                continue
+            lines.append(" ".join(words[start:idx]))
+            start, current = idx, widths[idx]
+        lines.append(" ".join(words[start:]))
+    return lines or [""]
+
+
+def fit_lines(
+    font: Any,
+    text: str,
+    *,
+    max_width: int,
+    max_height: int,
+    line_spacing: int = 0,
+    ellipsis: str = "...",
+) -> list[str]:
+    """Wrap `text` into the box; the last line that fits takes the rest, truncated."""
+    lines = wrap_to_width(font, text, max_width=max_width)
+    step = line_height(font) + line_spacing
+    capacity = max(int((max_height + line_spacing) / step), 1)
+    if len(lines) <= capacity:
+        return lines
+    tail = " ".join(lines[capacity - 1 :])
+    last = truncate_to_width(font, tail, max_width=max_width, ellipsis=ellipsis)
+    return lines[: capacity - 1] + [last]
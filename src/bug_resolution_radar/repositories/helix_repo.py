@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Collection, Optional
 
 from bug_resolution_radar.models.schema_helix import HelixDocument
 
@@ -18,7 +18,7 @@ class HelixRepo:
             return None
         return HelixDocument.model_validate_json(self._path.read_text(encoding="utf-8"))
 
-    def save(self, doc: HelixDocument) -> None:
+    def save(self, doc: HelixDocument, *, changed_keys: Optional[Collection[str]] = None) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
         tmp = self._path.with_suffix(self._path.suffix + ".tmp")
@@ -31,6 +31,6 @@ class HelixRepo:
         try:
             from bug_resolution_radar.repositories.helix_store import sync_helix_sidecars
 
-            sync_helix_sidecars(self._path, doc)
+            sync_helix_sidecars(self._path, doc, changed_keys=changed_keys)
         except Exception:
             pass
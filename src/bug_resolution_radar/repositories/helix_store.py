@@ -8,11 +8,14 @@ import os
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Collection, Iterable, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
-from bug_resolution_radar.models.schema_helix import HelixDocument
+from bug_resolution_radar.models.schema_helix import HelixDocument, HelixWorkItem
 from bug_resolution_radar.repositories.helix_repo import HelixRepo
 
 
@@ -37,7 +40,8 @@ def _atomic_write_text(path: Path, content: str) -> None:
 def _atomic_write_parquet(path: Path, df: pd.DataFrame) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    df.to_parquet(tmp, index=False)
+    # Small row groups let the raw export read only the groups holding its rows.
+    df.to_parquet(tmp, index=False, row_group_size=_EXPORT_ROW_GROUP_ROWS)
     tmp.replace(path)
 
 
@@ -76,19 +80,84 @@ def _coerce_export_scalar(value: Any) -> Any:
     return _jsonable_text(value)
 
 
-def _build_export_df(doc: HelixDocument) -> pd.DataFrame:
+_EXPORT_FRONT_COLUMNS = ("merge_key", "source_id", "ID de la Incidencia", "__item_url__")
+_EXPORT_ROW_GROUP_ROWS = 4096
+# Item-level values the raw export falls back to when the issue row has none,
+# stored as `__item_<field>__` columns next to the raw fields.
+HELIX_ITEM_FRONT_FIELDS: tuple[str, ...] = (
+    "id",
+    "priority",
+    "summary",
+    "status",
+    "assignee",
+    "incidentType",
+    "service",
+    "customerName",
+    "bbva_matrixservicen1",
+    "bbva_sourceservicen1",
+    "bbva_startdatetime",
+    "bbva_closeddate",
+    "lastModifiedDate",
+    "targetDate",
+    "workItemId",
+)
+
+
+def item_front_column(field: str) -> str:
+    return f"__item_{field}__"
+
+
+def _item_front_values(item: HelixWorkItem) -> dict[str, Any]:
+    raw = item.raw_fields if isinstance(item.raw_fields, dict) else {}
+    work_item_id = (
+        raw.get("workItemId")
+        or raw.get("workItemID")
+        or raw.get("InstanceId")
+        or raw.get("instanceId")
+        or ""
+    )
+    values = {
+        "id": item.id,
+        "priority": item.priority,
+        "summary": item.summary,
+        "status": item.status,
+        "assignee": item.assignee,
+        "incidentType": item.incident_type or raw.get("incidentType") or "",
+        "service": item.service,
+        "customerName": item.customer_name or raw.get("customerName") or "",
+        "bbva_matrixservicen1": item.matrix_service_n1 or raw.get("bbva_matrixservicen1") or "",
+        "bbva_sourceservicen1": item.source_service_n1 or raw.get("bbva_sourceservicen1") or "",
+        "bbva_startdatetime": item.start_datetime or raw.get("bbva_startdatetime") or "",
+        "bbva_closeddate": item.closed_date or raw.get("bbva_closeddate") or "",
+        "lastModifiedDate": item.last_modified or raw.get("lastModifiedDate") or "",
+        "targetDate": item.target_date or raw.get("targetDate") or "",
+        "workItemId": work_item_id,
+    }
+    return {item_front_column(field): _coerce_export_scalar(values[field]) for field in values}
+
+
+def _export_merge_key(item: HelixWorkItem) -> str:
+    source_id = str(item.source_id or "").strip().lower()
+    item_id = str(item.id or "").strip().upper()
+    if not item_id:
+        return ""
+    return f"{source_id}::{item_id}" if source_id else item_id
+
+
+def _export_frame(items: Iterable[HelixWorkItem]) -> pd.DataFrame:
     rows: list[dict[str, Any]] = []
-    for item in list(doc.items or []):
+    for item in items:
+        merge_key = _export_merge_key(item)
+        if not merge_key:
+            continue
         source_id = str(item.source_id or "").strip().lower()
         item_id = str(item.id or "").strip().upper()
-        if not item_id:
-            continue
-        merge_key = f"{source_id}::{item_id}" if source_id else item_id
         row: dict[str, Any] = {
             "merge_key": merge_key,
             "source_id": source_id,
             "ID de la Incidencia": item_id,
             "__item_url__": str(item.url or "").strip(),
+            **_item_front_values(item),
         }
         raw_fields = item.raw_fields or {}
         for key, value in raw_fields.items():
@@ -96,20 +165,76 @@ def _build_export_df(doc: HelixDocument) -> pd.DataFrame:
         rows.append(row)
 
     if not rows:
-        return pd.DataFrame(
-            columns=["merge_key", "source_id", "ID de la Incidencia", "__item_url__"]
-        )
+        return pd.DataFrame(columns=list(_EXPORT_COLUMNS))
+    return _arrow_safe(_front_columns_first(pd.DataFrame(rows)))
+
+
+def helix_export_frame(items: Iterable[HelixWorkItem]) -> pd.DataFrame:
+    """Rows of the raw export sidecar for `items` (one per merge key, last one wins)."""
+    frame = _export_frame(items)
+    return frame.drop_duplicates("merge_key", keep="last").reset_index(drop=True)
+
+
+def _arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """Render values of mixed-type raw columns as text so the frame fits one Arrow type."""
+    out = df
+    for column in df.columns:
+        series = df[column]
+        if not pd.api.types.is_object_dtype(series.dtype):
+            continue
+        if not pd.api.types.infer_dtype(series, skipna=True).startswith("mixed"):
+            continue
+        if out is df:
+            out = df.copy()
+        out[column] = series.map(lambda value: value if value is None else str(value))
+    return out
 
-    df = pd.DataFrame(rows)
-    front = [
-        col
-        for col in ("merge_key", "source_id", "ID de la Incidencia", "__item_url__")
-        if col in df.columns
-    ]
+
+_EXPORT_COLUMNS = (*_EXPORT_FRONT_COLUMNS, *map(item_front_column, HELIX_ITEM_FRONT_FIELDS))
+
+
+def _front_columns_first(df: pd.DataFrame) -> pd.DataFrame:
+    front = [col for col in _EXPORT_COLUMNS if col in df.columns]
     rest = [col for col in df.columns if col not in front]
     return df[front + rest].copy()
 
 
+def _build_export_df(doc: HelixDocument) -> pd.DataFrame:
+    return _export_frame(list(doc.items or []))
+
+
+def _apply_export_delta(path: Path, doc: HelixDocument, changed_keys: Collection[str]) -> bool:
+    """Patch the raw export Parquet for changed items only; `False` asks for a rebuild."""
+    target = _export_parquet_path(path)
+    if not target.exists():
+        return False
+    if not changed_keys:
+        os.utime(target)
+        return True
+    items = list(doc.items or [])
+    doc_keys = [key for key in (_export_merge_key(item) for item in items) if key]
+    if len(set(doc_keys)) != len(doc_keys):
+        return False
+    changed = set(changed_keys)
+    current = pd.read_parquet(target)
+    if any(column not in current.columns for column in _EXPORT_COLUMNS):
+        return False
+    kept = current.loc[~current["merge_key"].isin(changed)]
+    fresh = _export_frame(item for item in items if _export_merge_key(item) in changed)
+    combined = pd.concat([kept, fresh], ignore_index=True) if not fresh.empty else kept
+    if len(combined) != len(doc_keys):
+        return False
+    positions = pd.Series(range(len(doc_keys)), index=doc_keys)
+    order = positions.reindex(combined["merge_key"].to_numpy())
+    if order.isna().any():
+        return False
+    combined = combined.iloc[order.to_numpy().argsort(kind="stable")].reset_index(drop=True)
+    if combined.empty:
+        return False
+    _atomic_write_parquet(target, _front_columns_first(combined))
+    return True
+
+
 def _build_meta(doc: HelixDocument) -> dict[str, Any]:
     helix_source_ids = {
         str(item.source_id or "").strip()
@@ -126,8 +251,15 @@ def _build_meta(doc: HelixDocument) -> dict[str, Any]:
     }
 
 
-def sync_helix_sidecars(path: Path, doc: HelixDocument) -> None:
-    export_df = _build_export_df(doc)
+def sync_helix_sidecars(
+    path: Path, doc: HelixDocument, *, changed_keys: Optional[Collection[str]] = None
+) -> None:
+    """
+    Refresh the meta JSON and raw export Parquet next to the Helix dump.
+
+    With `changed_keys` (merge keys from the ingest change set) only those rows
+    of the export are rebuilt; an empty collection keeps the export as is.
+    """
     meta = _build_meta(doc)
     try:
         _atomic_write_text(
@@ -137,6 +269,15 @@ def sync_helix_sidecars(path: Path, doc: HelixDocument) -> None:
     except Exception:
         pass
 
+    if changed_keys is not None:
+        try:
+            if _apply_export_delta(path, doc, changed_keys):
+                return
+        except Exception:
+            pass
+
+    export_df = _build_export_df(doc)
+
     if export_df.empty:
         try:
             _export_parquet_path(path).unlink(missing_ok=True)
@@ -159,7 +300,8 @@ def _load_export_df_cached(path: str, json_mtime_ns: int, parquet_mtime_ns: int)
     parquet_path = _export_parquet_path(resolved)
     if parquet_mtime_ns >= json_mtime_ns and parquet_path.exists():
         try:
-            return pd.read_parquet(parquet_path)
+            if _has_export_schema(parquet_path):
+                return pd.read_parquet(parquet_path)
         except Exception:
             pass
 
@@ -184,6 +326,81 @@ def load_helix_export_df(path: str) -> pd.DataFrame:
     ).copy(deep=False)
 
 
+def _has_export_schema(parquet_path: Path) -> bool:
+    names = set(pq.read_schema(parquet_path).names)
+    return all(column in names for column in _EXPORT_COLUMNS)
+
+
+def _fresh_export_parquet(path: Path) -> Optional[Path]:
+    """The raw export sidecar if it is current (rebuilding it once when stale)."""
+    parquet_path = _export_parquet_path(path)
+    for attempt in range(2):
+        json_mtime_ns = path.stat().st_mtime_ns if path.exists() else -1
+        if parquet_path.exists():
+            try:
+                if parquet_path.stat().st_mtime_ns >= json_mtime_ns and _has_export_schema(
+                    parquet_path
+                ):
+                    return parquet_path
+            except Exception:
+                pass
+        if attempt == 0 and path.exists():
+            try:
+                sync_helix_sidecars(path, HelixRepo(path).load() or HelixDocument.empty())
+            except Exception:
+                return None
+    return None
+
+
+def load_helix_export_table(path: str, *, merge_keys: Collection[str]) -> pa.Table:
+    """
+    Raw export rows whose merge key is in `merge_keys`, read from the sidecar as Arrow.
+
+    Only the `merge_key` column is read in full; the remaining columns are read
+    for the row groups that hold a requested key, skipping raw columns those
+    groups have no values for. Falls back to the in-memory export frame when the
+    sidecar cannot be written.
+    """
+    resolved = Path(path).expanduser()
+    wanted = pa.array(sorted({str(key) for key in merge_keys}), type=pa.string())
+    parquet_path = _fresh_export_parquet(resolved)
+    if parquet_path is None:
+        frame = load_helix_export_df(path)
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        return table.filter(pc.is_in(table["merge_key"], value_set=wanted))
+
+    parquet = pq.ParquetFile(parquet_path)
+    keys = parquet.read(columns=["merge_key"])["merge_key"]
+    hits = pc.is_in(keys, value_set=wanted).to_numpy(zero_copy_only=False)
+    metadata = parquet.metadata
+    groups: list[int] = []
+    start = 0
+    for group in range(metadata.num_row_groups):
+        rows = metadata.row_group(group).num_rows
+        if hits[start : start + rows].any():
+            groups.append(group)
+        start += rows
+    if not groups:
+        return parquet.schema_arrow.empty_table()
+
+    always = set(_EXPORT_COLUMNS)
+    columns: list[str] = []
+    for index, name in enumerate(parquet.schema_arrow.names):
+        if name in always or any(
+            _column_has_values(metadata.row_group(group), index) for group in groups
+        ):
+            columns.append(name)
+    table = parquet.read_row_groups(groups, columns=columns)
+    return table.filter(pc.is_in(table["merge_key"], value_set=wanted))
+
+
+def _column_has_values(row_group: Any, index: int) -> bool:
+    stats = row_group.column(index).statistics
+    if stats is None or stats.null_count is None:
+        return True
+    return bool(stats.null_count < row_group.num_rows)
+
+
 @lru_cache(maxsize=8)
 def _load_meta_cached(path: str, json_mtime_ns: int, meta_mtime_ns: int) -> dict[str, Any]:
     resolved = Path(path)
@@ -0,0 +1,242 @@
+"""Columnar issue-level change log with point-in-time state reconstruction."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from bug_resolution_radar.common.utils import bool_env
+from bug_resolution_radar.models.schema import NormalizedIssue
+
+TRACKED_FIELDS: Tuple[str, ...] = (
+    "status",
+    "priority",
+    "assignee",
+    "type",
+    "summary",
+    "created",
+    "resolved",
+    "source_id",
+    "country",
+)
+_COLUMNS = ("merge_key", "field", "old", "new", "observed_at")
+_SEGMENT_SUFFIX = ".parquet"
+_COMPACTED_NAME = "compacted.parquet"
+_COMPACT_AFTER_SEGMENTS = 32
+_WRITE_LOCK = threading.Lock()
+
+
+def changelog_enabled() -> bool:
+    return bool_env("BUG_RESOLUTION_RADAR_ISSUE_CHANGELOG", True)
+
+
+def changelog_dir(data_path: str | Path) -> Path:
+    """Change-log segments live next to the issues JSON (`issues.changelog/`)."""
+    return Path(data_path).with_suffix(".changelog")
+
+
+def _issue_key(issue: NormalizedIssue) -> str:
+    sid = str(issue.source_id or "").strip().lower()
+    key = str(issue.key or "").strip().upper()
+    return f"{sid}::{key}" if sid else key
+
+
+def _field_text(issue: Optional[NormalizedIssue], field: str) -> Optional[str]:
+    if issue is None:
+        return None
+    value = getattr(issue, field, None)
+    if value is None:
+        return None
+    return str(value)
+
+
+def _diff_rows(
+    key: str,
+    old: Optional[NormalizedIssue],
+    new: NormalizedIssue,
+    observed_at: pd.Timestamp,
+) -> List[Tuple[str, str, Optional[str], Optional[str], pd.Timestamp]]:
+    rows = []
+    for field in TRACKED_FIELDS:
+        before = _field_text(old, field)
+        after = _field_text(new, field)
+        if old is not None and before == after:
+            continue
+        rows.append((key, field, before, after, observed_at))
+    return rows
+
+
+def _segments(root: Path) -> List[Path]:
+    if not root.exists():
+        return []
+    return sorted(root.glob(f"*{_SEGMENT_SUFFIX}"))
+
+
+def _write_segment(root: Path, name: str, df: pd.DataFrame) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    target = root / name
+    tmp = target.with_name(f"{target.name}.tmp")
+    df.to_parquet(tmp, index=False)
+    tmp.replace(target)
+
+
+def _frame(rows: Sequence[Tuple[Any, ...]]) -> pd.DataFrame:
+    df = pd.DataFrame(list(rows), columns=list(_COLUMNS))
+    for column in ("merge_key", "field", "old", "new"):
+        df[column] = df[column].astype("string")
+    df["observed_at"] = pd.to_datetime(df["observed_at"], utc=True)
+    return df
+
+
+def _compact(root: Path) -> None:
+    segments = _segments(root)
+    if len(segments) <= _COMPACT_AFTER_SEGMENTS:
+        return
+    merged = pd.concat([pd.read_parquet(path) for path in segments], ignore_index=True)
+    merged = merged.sort_values("observed_at", kind="stable").reset_index(drop=True)
+    _write_segment(root, _COMPACTED_NAME, merged)
+    for path in segments:
+        if path.name != _COMPACTED_NAME:
+            path.unlink(missing_ok=True)
+
+
+def append_issue_changes(
+    data_path: str | Path,
+    changes: Mapping[str, Optional[NormalizedIssue]],
+    lookup: Callable[[str], Optional[NormalizedIssue]],
+    *,
+    all_rows: Iterable[NormalizedIssue] = (),
+    observed_at: Optional[datetime] = None,
+) -> int:
+    """
+    Append one segment with the tracked-field transitions of a merge.
+
+    `changes` maps each changed merge key to its row before the change (`None`
+    for inserts) and `lookup` returns the row after it. `all_rows` is only read
+    when the log is still empty: the pre-change state of every stored issue is
+    then written first as the baseline. Returns the number of rows written.
+    """
+    if not changelog_enabled() or not changes:
+        return 0
+    stamp = pd.Timestamp(observed_at or datetime.now(timezone.utc))
+    stamp = stamp.tz_convert("UTC") if stamp.tzinfo else stamp.tz_localize("UTC")
+    root = changelog_dir(data_path)
+    with _WRITE_LOCK:
+        rows: List[Tuple[Any, ...]] = []
+        if not _segments(root):
+            baseline_at = stamp - pd.Timedelta(microseconds=1)
+            for issue in all_rows:
+                key = _issue_key(issue)
+                before = changes[key] if key in changes else issue
+                if before is not None:
+                    rows.extend(_diff_rows(key, None, before, baseline_at))
+        for key, previous in changes.items():
+            after = lookup(key)
+            if after is not None:
+                rows.extend(_diff_rows(key, previous, after, stamp))
+        if not rows:
+            return 0
+        name = f"{stamp.strftime('%Y%m%dT%H%M%S%f')}-{os.getpid()}{_SEGMENT_SUFFIX}"
+        _write_segment(root, name, _frame(rows))
+        _compact(root)
+        return len(rows)
+
+
+def drop_source_changes(data_path: str | Path, source_id: str) -> int:
+    """Rewrite the log without the rows of `source_id` (source purge); returns rows removed."""
+    sid = str(source_id or "").strip().lower()
+    if not sid:
+        return 0
+    prefix = f"{sid}::"
+    removed = 0
+    with _WRITE_LOCK:
+        for path in _segments(changelog_dir(data_path)):
+            df = pd.read_parquet(path)
+            mask = df["merge_key"].astype("string").str.startswith(prefix).fillna(False)
+            hits = int(mask.sum())
+            if not hits:
+                continue
+            removed += hits
+            kept = df.loc[~mask].reset_index(drop=True)
+            if kept.empty:
+                path.unlink(missing_ok=True)
+            else:
+                _write_segment(path.parent, path.name, kept)
+    return removed
+
+
+def clear_issue_changes(data_path: str | Path) -> int:
+    """Delete the whole log (issues cache reset); returns the number of segments removed."""
+    root = changelog_dir(data_path)
+    with _WRITE_LOCK:
+        segments = len(_segments(root))
+        shutil.rmtree(root, ignore_errors=True)
+    return segments
+
+
+def load_issue_changes(
+    data_path: str | Path,
+    *,
+    until: Optional[datetime] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """Read change-log rows (optionally up to `until` and for some fields) in time order."""
+    segments = _segments(changelog_dir(data_path))
+    if not segments:
+        return _frame([])
+    filters: List[Tuple[str, str, Any]] = []
+    if until is not None:
+        bound = pd.Timestamp(until)
+        bound = bound.tz_convert("UTC") if bound.tzinfo else bound.tz_localize("UTC")
+        filters.append(("observed_at", "<=", bound))
+    if fields:
+        filters.append(("field", "in", list(fields)))
+    parts = [
+        pd.read_parquet(path, filters=filters or None)  # type: ignore[arg-type]
+        for path in segments
+    ]
+    df = pd.concat(parts, ignore_index=True) if parts else _frame([])
+    return df.sort_values("observed_at", kind="stable").reset_index(drop=True)
+
+
+def issue_state_at(
+    data_path: str | Path,
+    at: datetime,
+    *,
+    fields: Sequence[str] = TRACKED_FIELDS,
+) -> pd.DataFrame:
+    """
+    Reconstruct tracked fields for every issue known at `at`.
+
+    Returns one row per merge key (index) with one column per field, holding the
+    last value observed at or before `at`.
+    """
+    changes = load_issue_changes(data_path, until=at, fields=fields)
+    if changes.empty:
+        return pd.DataFrame(columns=list(fields)).rename_axis("merge_key")
+    latest = changes.drop_duplicates(subset=["merge_key", "field"], keep="last")
+    state = latest.pivot(index="merge_key", columns="field", values="new")
+    state.columns.name = None
+    return state.reindex(columns=list(fields))
+
+
+def field_transitions(
+    data_path: str | Path,
+    *,
+    field: str = "status",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Transitions (`merge_key`, `old`, `new`, `observed_at`) of one field in a time range."""
+    changes = load_issue_changes(data_path, until=until, fields=[field])
+    if since is not None and not changes.empty:
+        bound = pd.Timestamp(since)
+        bound = bound.tz_convert("UTC") if bound.tzinfo else bound.tz_localize("UTC")
+        changes = changes.loc[changes["observed_at"] >= bound]
+    return changes.loc[:, ["merge_key", "old", "new", "observed_at"]].reset_index(drop=True)
@@ -0,0 +1,369 @@
+"""Optional DuckDB query engine over the issues Parquet read model.
+
+Scope predicates and column projections are pushed down to the Parquet scan,
+so the memory a scope query needs follows the size of its result instead of
+the whole backlog. Aggregates mirror their pandas counterparts exactly and
+`services.dashboard_snapshot` answers from them when the engine is active:
+
+- `status_counts`        -> `apply_filters(...)["status"].value_counts()` (KPI totals)
+- `open_priority_counts` -> `compute_kpis(...)["open_now_by_priority"]`
+- `timeseries_daily`     -> `build_timeseries_daily(...)` (KPI time series chart)
+- `open_age_priority`    -> `build_open_age_priority_payload(...)["grouped"]` (age chart)
+- `top_open_assignees`   -> assignee ranking of the people cards
+
+DuckDB is an optional dependency (`pip install .[sql]`); the engine is only
+used when `BUG_RESOLUTION_RADAR_QUERY_ENGINE=duckdb` and it is importable.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from bug_resolution_radar.analytics.kpis import OPEN_AGE_BUCKET_BINS, OPEN_AGE_BUCKET_LABELS
+from bug_resolution_radar.analytics.status_semantics import is_finalist_status
+from bug_resolution_radar.repositories.issues_store import issues_parquet_path
+
+QUERY_ENGINE_ENV = "BUG_RESOLUTION_RADAR_QUERY_ENGINE"
+
+_REQUIRED_COLUMNS = (
+    "key",
+    "country",
+    "source_id",
+    "status",
+    "priority",
+    "assignee",
+    "created",
+    "resolved",
+)
+_DATETIME_COLUMNS = ("created", "updated", "resolved")
+_US_PER_DAY = 86_400_000_000
+
+_STATUS_SQL = "CASE WHEN status IS NULL OR status = '' THEN '(sin estado)' ELSE status END"
+_PRIORITY_SQL = (
+    "CASE WHEN priority IS NULL OR priority = '' THEN '(sin priority)' ELSE priority END"
+)
+_ASSIGNEE_SQL = "CASE WHEN assignee IS NULL OR assignee = '' THEN '(sin asignar)' ELSE assignee END"
+
+
+def _duckdb() -> ModuleType | None:
+    try:
+        return importlib.import_module("duckdb")
+    except ImportError:
+        return None
+
+
+def query_engine_name() -> str:
+    """Configured scope query engine: `duckdb` or the default `pandas`."""
+    raw = str(os.getenv(QUERY_ENGINE_ENV, "") or "").strip().lower()
+    return "duckdb" if raw == "duckdb" else "pandas"
+
+
+def sql_engine_available() -> bool:
+    return _duckdb() is not None
+
+
+@dataclass(frozen=True)
+class IssuesSqlScope:
+    """
+    Row selection pushed down to the Parquet scan.
+
+    Filters use the dashboard semantics: empty tuples do not filter and the
+    status/priority/assignee values compare against the `(sin ...)` labels
+    `apply_filters` gives to missing values.
+    """
+
+    country: str = ""
+    source_ids: Tuple[str, ...] = ()
+    created_since: Optional[pd.Timestamp] = None
+    require_created: bool = False
+    status: Tuple[str, ...] = ()
+    priority: Tuple[str, ...] = ()
+    assignee: Tuple[str, ...] = ()
+    # Issue keys compared trimmed and upper-cased, like `apply_issue_key_scope`.
+    keys: Tuple[str, ...] = ()
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _utc_param(value: Any) -> datetime:
+    # Bound as a naive UTC TIMESTAMP: the session time zone is UTC, and tz-aware
+    # parameters would need pytz on the Python side.
+    ts = pd.Timestamp(value)
+    ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+    naive: datetime = ts.tz_localize(None).to_pydatetime()
+    return naive
+
+
+def _where(scope: IssuesSqlScope) -> Tuple[str, List[Any]]:
+    clauses: List[str] = []
+    params: List[Any] = []
+    country = str(scope.country or "").strip()
+    if country:
+        clauses.append("country = ?")
+        params.append(country)
+    source_ids = [sid for sid in (str(s or "").strip() for s in scope.source_ids) if sid]
+    if source_ids:
+        clauses.append(f"source_id IN ({_placeholders(source_ids)})")
+        params.extend(source_ids)
+    if scope.require_created or scope.created_since is not None:
+        clauses.append("created IS NOT NULL")
+    if scope.created_since is not None:
+        clauses.append("created >= CAST(? AS TIMESTAMPTZ)")
+        params.append(_utc_param(scope.created_since))
+    for expr, values in (
+        (_STATUS_SQL, scope.status),
+        (_PRIORITY_SQL, scope.priority),
+        (_ASSIGNEE_SQL, scope.assignee),
+    ):
+        if values:
+            clauses.append(f"({expr}) IN ({_placeholders(values)})")
+            params.extend(str(value) for value in values)
+    keys = sorted({str(k or "").strip().upper() for k in scope.keys} - {""})
+    if keys:
+        clauses.append(f"upper(trim(coalesce(\"key\", ''))) IN ({_placeholders(keys)})")
+        params.extend(keys)
+    return (" AND ".join(clauses) or "TRUE"), params
+
+
+def _age_bucket_sql(days_expr: str) -> str:
+    # pd.cut(right=True, include_lowest=True): every bucket includes its upper bound.
+    whens = [
+        f"WHEN {days_expr} <= {upper!r} THEN {idx}"
+        for idx, upper in enumerate(OPEN_AGE_BUCKET_BINS[1:-1])
+    ]
+    return f"CASE {' '.join(whens)} ELSE {len(OPEN_AGE_BUCKET_LABELS) - 1} END"
+
+
+class IssuesSqlEngine:
+    """Scope queries and aggregates over one revision of the issues Parquet read model."""
+
+    def __init__(self, parquet_path: Path) -> None:
+        duckdb = _duckdb()
+        if duckdb is None:
+            raise RuntimeError("duckdb no está instalado")
+        self.parquet_path = parquet_path
+        self._con = duckdb.connect(":memory:")
+        literal = str(parquet_path).replace("'", "''")
+        self._con.execute(
+            f"CREATE VIEW issues AS SELECT * FROM read_parquet('{literal}', file_row_number = true)"
+        )
+        self.columns: Tuple[str, ...] = tuple(
+            str(row[0])
+            for row in self._con.execute("DESCRIBE issues").fetchall()
+            if str(row[0]) != "file_row_number"
+        )
+        self._lock = threading.Lock()
+        self._finalists: Optional[Tuple[str, ...]] = None
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> Any:
+        # Cursors are independent connections to the same database: one per query
+        # keeps concurrent API requests off each other's result sets.
+        with self._lock:
+            cursor = self._con.cursor()
+        cursor.execute("SET TimeZone = 'UTC'")
+        return cursor.execute(sql, list(params))
+
+    def supports_scope_queries(self) -> bool:
+        return all(column in self.columns for column in _REQUIRED_COLUMNS)
+
+    def _finalist_statuses(self) -> Tuple[str, ...]:
+        # Closure semantics live in Python; they are resolved once over the
+        # (small) status dictionary so SQL and pandas can never disagree.
+        if self._finalists is None:
+            rows = self._query(
+                "SELECT DISTINCT status FROM issues WHERE status IS NOT NULL"
+            ).fetchall()
+            self._finalists = tuple(
+                sorted(str(row[0]) for row in rows if is_finalist_status(row[0]))
+            )
+        return self._finalists
+
+    def _open_where(self, scope: IssuesSqlScope) -> Tuple[str, List[Any]]:
+        where, params = _where(scope)
+        finalists = self._finalist_statuses()
+        where += " AND resolved IS NULL"
+        if finalists:
+            where += f" AND coalesce(status, '') NOT IN ({_placeholders(finalists)})"
+            params = [*params, *finalists]
+        return where, params
+
+    def source_ids(self, *, country: str = "") -> List[str]:
+        """Distinct non-empty source ids, optionally within a country."""
+        where, params = _where(IssuesSqlScope(country=country))
+        rows = self._query(
+            f"SELECT DISTINCT source_id FROM issues WHERE {where} AND source_id <> ''",
+            params,
+        ).fetchall()
+        return sorted(str(row[0]) for row in rows if row[0] is not None)
+
+    def oldest_created(self, scope: IssuesSqlScope) -> pd.Timestamp | None:
+        where, params = _where(scope)
+        value = self._query(
+            f"SELECT epoch_us(min(created)) FROM issues WHERE {where}", params
+        ).fetchone()
+        if value is None or value[0] is None:
+            return None
+        return pd.Timestamp(int(value[0]), unit="us", tz="UTC")
+
+    def scope_frame(
+        self, scope: IssuesSqlScope, *, columns: Sequence[str] | None = None
+    ) -> pd.DataFrame:
+        """
+        Rows of the scope, labelled like `load_issues_df` labels the same rows.
+
+        Only the requested `columns` are read from the Parquet file.
+        """
+        selected = [c for c in (columns or self.columns) if c in self.columns]
+        projection = ", ".join(f'"{c}"' for c in selected) or "NULL AS __none"
+        where, params = _where(scope)
+        out = self._query(
+            f"SELECT file_row_number, {projection} FROM issues WHERE {where} "
+            "ORDER BY file_row_number",
+            params,
+        ).df()
+        out = out.set_index("file_row_number")
+        out.index.name = None
+        if not selected:
+            return out.drop(columns=["__none"])
+        for column in _DATETIME_COLUMNS:
+            if column in out.columns and isinstance(out[column].dtype, pd.DatetimeTZDtype):
+                out[column] = out[column].dt.tz_convert("UTC")
+        return out
+
+    def status_counts(self, scope: IssuesSqlScope) -> Dict[str, int]:
+        where, params = _where(scope)
+        rows = self._query(
+            f"SELECT {_STATUS_SQL} AS status, count(*) FROM issues WHERE {where} GROUP BY 1",
+            params,
+        ).fetchall()
+        return {str(status): int(n) for status, n in rows}
+
+    def open_priority_counts(self, scope: IssuesSqlScope) -> Dict[str, int]:
+        where, params = self._open_where(scope)
+        rows = self._query(
+            f"SELECT {_PRIORITY_SQL} AS priority, count(*) AS n FROM issues WHERE {where} "
+            "GROUP BY 1 ORDER BY n DESC, priority ASC",
+            params,
+        ).fetchall()
+        return {str(priority): int(n) for priority, n in rows}
+
+    def timeseries_daily(self, scope: IssuesSqlScope, *, lookback_days: int = 90) -> pd.DataFrame:
+        """Daily created/closed flow over the last `lookback_days` with events."""
+        where, params = _where(scope)
+        day = f"epoch_us({{col}}) // {_US_PER_DAY}"
+        rows = self._query(
+            f"WITH scoped AS (SELECT created, resolved FROM issues WHERE {where}) "
+            f"SELECT 'created', {day.format(col='created')} AS day, count(*) FROM scoped "
+            "WHERE created IS NOT NULL GROUP BY 2 "
+            "UNION ALL "
+            f"SELECT 'closed', {day.format(col='resolved')} AS day, count(*) FROM scoped "
+            "WHERE resolved IS NOT NULL GROUP BY 2",
+            params,
+        ).fetchall()
+        cols = ["date", "created", "closed", "open_backlog_proxy"]
+        if not rows:
+            return pd.DataFrame(columns=cols)
+
+        end_day = max(int(r[1]) for r in rows)
+        start_day = end_day - max(int(lookback_days or 0), 1) + 1
+        counts: Dict[str, Dict[int, int]] = {"created": {}, "closed": {}}
+        for kind, day_number, n in rows:
+            if int(day_number) >= start_day:
+                counts[str(kind)][int(day_number)] = int(n)
+
+        start_ts = pd.Timestamp(start_day * _US_PER_DAY, unit="us", tz="UTC")
+        end_ts = pd.Timestamp(end_day * _US_PER_DAY, unit="us", tz="UTC")
+        days = pd.date_range(start=start_ts, end=end_ts, freq="D")
+        day_numbers = range(start_day, end_day + 1)
+        daily = pd.DataFrame({"date": pd.DatetimeIndex(days).tz_localize(None)})
+        daily["created"] = [counts["created"].get(d, 0) for d in day_numbers]
+        daily["closed"] = [counts["closed"].get(d, 0) for d in day_numbers]
+        net = daily["created"] - daily["closed"]
+        daily["open_backlog_proxy"] = net.cumsum().clip(lower=0)
+        return daily
+
+    def open_age_priority(
+        self, scope: IssuesSqlScope, *, reference_now: pd.Timestamp | None = None
+    ) -> pd.DataFrame:
+        """Open issues by age bucket and priority: columns [age_bucket, priority, count]."""
+        now = _utc_param(reference_now if reference_now is not None else datetime.now(timezone.utc))
+        where, params = self._open_where(scope)
+        days = (
+            "greatest((epoch_us(CAST(? AS TIMESTAMPTZ)) - epoch_us(created))"
+            f" / {float(_US_PER_DAY)}, 0.0)"
+        )
+        rows = self._query(
+            f"SELECT {_age_bucket_sql('open_days')} AS bucket, priority, count(*) FROM ("
+            f"SELECT {days} AS open_days, {_PRIORITY_SQL} AS priority FROM issues "
+            f"WHERE {where} AND created IS NOT NULL) GROUP BY 1, 2",
+            [now, *params],
+        ).fetchall()
+        if not rows:
+            return pd.DataFrame(columns=["age_bucket", "priority", "count"])
+
+        found = pd.DataFrame(rows, columns=["bucket", "priority", "count"])
+        priority = found["priority"].astype(str).str.strip()
+        found = found.assign(
+            age_bucket=pd.Categorical.from_codes(
+                found["bucket"].astype(int),
+                categories=list(OPEN_AGE_BUCKET_LABELS),
+                ordered=True,
+            ),
+            priority=priority.where(priority.str.len() > 0, "(sin priority)"),
+        )
+        grouped = (
+            found.groupby(["age_bucket", "priority"], dropna=False, observed=False)["count"]
+            .sum()
+            .reset_index(name="count")
+        )
+        grouped["count"] = grouped["count"].astype(int)
+        return grouped
+
+    def top_open_assignees(
+        self, scope: IssuesSqlScope, *, limit: int = 12
+    ) -> List[Tuple[str, int]]:
+        """Assignees with most open issues; ties keep alphabetical order."""
+        where, params = self._open_where(scope)
+        rows = self._query(
+            f"SELECT {_ASSIGNEE_SQL} AS assignee, count(*) AS n FROM issues WHERE {where} "
+            "GROUP BY 1 ORDER BY n DESC, assignee ASC LIMIT ?",
+            [*params, max(int(limit), 0)],
+        ).fetchall()
+        return [(str(assignee), int(n)) for assignee, n in rows]
+
+
+@lru_cache(maxsize=4)
+def _engine_for_revision(parquet_path: str, parquet_mtime_ns: int) -> IssuesSqlEngine:
+    del parquet_mtime_ns  # cache invalidation key only
+    return IssuesSqlEngine(Path(parquet_path))
+
+
+def issues_sql_engine(path: str) -> IssuesSqlEngine | None:
+    """
+    SQL engine over the Parquet read model of `path`, or None to stay on pandas.
+
+    None when the engine is not configured, duckdb is missing, or the sidecar is
+    absent, stale or lacks the scope columns.
+    """
+    if query_engine_name() != "duckdb" or not sql_engine_available():
+        return None
+    parquet_path = issues_parquet_path(path)
+    if parquet_path is None:
+        return None
+    try:
+        engine = _engine_for_revision(str(parquet_path), parquet_path.stat().st_mtime_ns)
+    except Exception:
+        return None
+    return engine if engine.supports_scope_queries() else None
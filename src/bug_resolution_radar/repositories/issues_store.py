@@ -6,10 +6,18 @@ import json
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Collection, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
+from bug_resolution_radar.analytics.daily_cube import (
+    apply_cube_delta,
+    build_daily_cube,
+    empty_cube,
+    normalize_cube,
+)
+from bug_resolution_radar.analytics.search_index import IssueSearchIndex
 from bug_resolution_radar.models.schema import IssuesDocument
 
 _DATETIME_COLUMNS = ("created", "updated", "resolved")
@@ -23,6 +31,10 @@ def _workspace_index_path(path: Path) -> Path:
     return path.with_suffix(".workspace.json")
 
 
+def _cube_path(path: Path) -> Path:
+    return path.with_suffix(".cube.parquet")
+
+
 def _atomic_write_text(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
@@ -87,6 +99,26 @@ def _issues_to_dataframe(doc: IssuesDocument) -> pd.DataFrame:
     return _normalize_issue_dataframe(pd.DataFrame(rows))
 
 
+def _issue_doc_keys(doc: IssuesDocument) -> List[str]:
+    out: List[str] = []
+    for issue in doc.issues:
+        sid = str(issue.source_id or "").strip().lower()
+        key = str(issue.key or "").strip().upper()
+        out.append(f"{sid}::{key}" if sid else key)
+    return out
+
+
+def _frame_merge_keys(df: pd.DataFrame) -> pd.Series:
+    def _text(column: str) -> pd.Series:
+        if column not in df.columns:
+            return pd.Series("", index=df.index, dtype="object")
+        return df[column].fillna("").astype(str).str.strip()
+
+    sid = _text("source_id").str.lower()
+    key = _text("key").str.upper()
+    return pd.Series(np.where(sid.ne(""), sid + "::" + key, key), index=df.index)
+
+
 def _build_workspace_index(df: pd.DataFrame) -> dict[str, Any]:
     safe = df if isinstance(df, pd.DataFrame) else pd.DataFrame()
     if safe.empty or "country" not in safe.columns or "source_id" not in safe.columns:
@@ -129,12 +161,14 @@ def _build_workspace_index(df: pd.DataFrame) -> dict[str, Any]:
         )
         source_rows = [
             {
-                "source_id": str(row["source_id"]),
+                "source_id": str(source_id),
                 "country": str(country),
-                "alias": str(row["source_alias"] or row["source_id"]),
-                "source_type": str(row["source_type"] or "").strip().lower() or "jira",
+                "alias": str(alias or source_id),
+                "source_type": str(source_type or "").strip().lower() or "jira",
             }
-            for _, row in rows.iterrows()
+            for source_id, alias, source_type in zip(
+                rows["source_id"], rows["source_alias"], rows["source_type"]
+            )
         ]
         countries.append({"country": str(country), "sourceCount": len(source_rows)})
         sources_by_country[str(country)] = source_rows
@@ -148,8 +182,15 @@ def _build_workspace_index(df: pd.DataFrame) -> dict[str, Any]:
     }
 
 
-def _sync_read_models(path: Path, df: pd.DataFrame) -> None:
-    index_payload = _build_workspace_index(df)
+def _sync_read_models(
+    path: Path,
+    df: pd.DataFrame,
+    *,
+    index_payload: Optional[dict[str, Any]] = None,
+    cube: Optional[pd.DataFrame] = None,
+) -> None:
+    if index_payload is None:
+        index_payload = _build_workspace_index(df)
     try:
         _atomic_write_text(
             _workspace_index_path(path),
@@ -159,27 +200,139 @@ def _sync_read_models(path: Path, df: pd.DataFrame) -> None:
         pass
 
     parquet_target = _parquet_path(path)
+    cube_target = _cube_path(path)
     if df.empty:
+        for target in (parquet_target, cube_target):
+            try:
+                target.unlink(missing_ok=True)
+            except Exception:
+                pass
+        return
+
+    try:
+        _atomic_write_parquet(parquet_target, df)
+    except Exception:
         try:
             parquet_target.unlink(missing_ok=True)
         except Exception:
             pass
-        return
 
+    # The cube is materialised by its first reader (`load_issues_cube`); saves only keep
+    # an existing one in sync (delta patch) and otherwise drop it as stale.
     try:
-        _atomic_write_parquet(parquet_target, df)
+        if cube is None:
+            cube_target.unlink(missing_ok=True)
+        else:
+            _atomic_write_parquet(cube_target, cube)
     except Exception:
         try:
-            parquet_target.unlink(missing_ok=True)
+            cube_target.unlink(missing_ok=True)
         except Exception:
             pass
 
 
-def save_issues_doc(path: str, doc: IssuesDocument) -> None:
-    """Save `IssuesDocument` to JSON and refresh read-optimized sidecars."""
+def _touch_read_models(path: Path) -> bool:
+    sidecars = (_parquet_path(path), _workspace_index_path(path))
+    if not all(sidecar.exists() for sidecar in sidecars):
+        return False
+    for sidecar in sidecars:
+        os.utime(sidecar)
+    cube_target = _cube_path(path)
+    if cube_target.exists():
+        os.utime(cube_target)
+    return True
+
+
+def _index_covers_issues(index_payload: dict[str, Any], issues: List[Any]) -> bool:
+    known: dict[tuple[str, str], tuple[str, str]] = {}
+    for bucket in dict(index_payload.get("sourcesByCountry") or {}).values():
+        for row in list(bucket or []):
+            known[(str(row.get("country") or ""), str(row.get("source_id") or ""))] = (
+                str(row.get("alias") or ""),
+                str(row.get("source_type") or ""),
+            )
+    for issue in issues:
+        country = str(issue.country or "").strip()
+        source_id = str(issue.source_id or "").strip()
+        if not country or not source_id:
+            continue
+        entry = known.get((country, source_id))
+        alias = str(issue.source_alias or "").strip() or source_id
+        source_type = str(issue.source_type or "").strip().lower() or "jira"
+        if entry is None or entry != (alias, source_type):
+            return False
+    return True
+
+
+def _apply_read_model_delta(path: Path, doc: IssuesDocument, changed_keys: Collection[str]) -> bool:
+    """Patch sidecars with the changed issues only; `False` asks for a full rebuild."""
+    if not changed_keys:
+        return _touch_read_models(path)
+    parquet_target = _parquet_path(path)
+    index_target = _workspace_index_path(path)
+    if not parquet_target.exists() or not index_target.exists():
+        return False
+    doc_keys = _issue_doc_keys(doc)
+    if len(set(doc_keys)) != len(doc_keys):
+        return False
+    changed = set(changed_keys)
+    changed_issues = [issue for key, issue in zip(doc_keys, doc.issues) if key in changed]
+
+    current = _normalize_issue_dataframe(pd.read_parquet(parquet_target))
+    changed_mask = (
+        _frame_merge_keys(current).isin(changed)
+        if not current.empty
+        else pd.Series(False, index=current.index)
+    )
+    kept = current.loc[~changed_mask] if not current.empty else current
+    fresh = _issues_to_dataframe(IssuesDocument(issues=changed_issues))
+    combined = pd.concat([kept, fresh], ignore_index=True) if not kept.empty else fresh
+    if len(combined) != len(doc_keys):
+        return False
+    positions = pd.Series(range(len(doc_keys)), index=doc_keys)
+    order = positions.reindex(_frame_merge_keys(combined).to_numpy())
+    if order.isna().any():
+        return False
+    combined = combined.iloc[np.argsort(order.to_numpy(), kind="stable")].reset_index(drop=True)
+
+    index_payload = json.loads(index_target.read_text(encoding="utf-8"))
+    if isinstance(index_payload, dict) and _index_covers_issues(index_payload, changed_issues):
+        index_payload = {
+            **index_payload,
+            "rowCount": int(len(combined)),
+            "hasData": bool(len(combined)),
+        }
+    else:
+        index_payload = None
+    cube: Optional[pd.DataFrame] = None
+    cube_target = _cube_path(path)
+    if cube_target.exists() and cube_target.stat().st_mtime_ns >= parquet_target.stat().st_mtime_ns:
+        cube = apply_cube_delta(
+            pd.read_parquet(cube_target), removed=current.loc[changed_mask], added=fresh
+        )
+    _sync_read_models(path, combined, index_payload=index_payload, cube=cube)
+    return True
+
+
+def save_issues_doc(
+    path: str, doc: IssuesDocument, *, changed_keys: Optional[Collection[str]] = None
+) -> None:
+    """
+    Save `IssuesDocument` to JSON and refresh read-optimized sidecars.
+
+    `changed_keys` (merge keys from the ingest change set) lets the sidecars be
+    patched for those rows only; an empty collection just re-stamps them as
+    current. `None` rebuilds everything from the document.
+    """
     resolved = Path(path)
     payload = doc.model_dump_json(ensure_ascii=False)
     _atomic_write_text(resolved, payload)
+    if changed_keys is not None:
+        try:
+            if _apply_read_model_delta(resolved, doc, changed_keys):
+                return
+        except Exception:
+            pass
     try:
         _sync_read_models(resolved, _issues_to_dataframe(doc))
     except Exception:
@@ -219,6 +372,16 @@ def load_issues_df(path: str) -> pd.DataFrame:
     ).copy(deep=False)
 
 
+def issues_parquet_path(path: str) -> Optional[Path]:
+    """Parquet read model of `path` when it exists and is not older than the JSON document."""
+    resolved = Path(path)
+    json_mtime_ns = resolved.stat().st_mtime_ns if resolved.exists() else -1
+    parquet_path = _parquet_path(resolved)
+    if not parquet_path.exists() or parquet_path.stat().st_mtime_ns < json_mtime_ns:
+        return None
+    return parquet_path.resolve()
+
+
 @lru_cache(maxsize=8)
 def _load_workspace_index_cached(
     path: str,
@@ -262,6 +425,65 @@ def load_issues_workspace_index(path: str) -> dict[str, Any]:
     )
 
 
+@lru_cache(maxsize=8)
+def _load_issues_cube_cached(path: str, json_mtime_ns: int, cube_mtime_ns: int) -> pd.DataFrame:
+    resolved = Path(path)
+    cube_path = _cube_path(resolved)
+    if cube_mtime_ns >= json_mtime_ns and cube_path.exists():
+        try:
+            return normalize_cube(pd.read_parquet(cube_path))
+        except Exception:
+            pass
+
+    df = load_issues_df(path)
+    if df.empty:
+        return empty_cube()
+    cube = build_daily_cube(df)
+    try:
+        _atomic_write_parquet(cube_path, cube)
+    except Exception:
+        pass
+    return cube
+
+
+def load_issues_cube(path: str) -> pd.DataFrame:
+    """Load the daily aggregate cube sidecar, rebuilding it when missing or stale."""
+    resolved = Path(path)
+    json_mtime_ns = resolved.stat().st_mtime_ns if resolved.exists() else -1
+    cube_path = _cube_path(resolved)
+    cube_mtime_ns = cube_path.stat().st_mtime_ns if cube_path.exists() else -1
+    return _load_issues_cube_cached(
+        str(resolved.resolve()),
+        json_mtime_ns,
+        cube_mtime_ns,
+    ).copy(deep=False)
+
+
+@lru_cache(maxsize=4)
+def _load_issues_search_index_cached(
+    path: str, json_mtime_ns: int, parquet_mtime_ns: int
+) -> IssueSearchIndex:
+    return IssueSearchIndex(_load_issues_df_cached(path, json_mtime_ns, parquet_mtime_ns))
+
+
+def load_issues_search_index(path: str) -> IssueSearchIndex:
+    """
+    Text search index over the issues read model, one per read-model revision.
+
+    Its labels match the frames returned by `load_issues_df` for the same
+    revision; callers check `covers_rows` before filtering a frame with it.
+    """
+    resolved = Path(path)
+    json_mtime_ns = resolved.stat().st_mtime_ns if resolved.exists() else -1
+    parquet_path = _parquet_path(resolved)
+    parquet_mtime_ns = parquet_path.stat().st_mtime_ns if parquet_path.exists() else -1
+    return _load_issues_search_index_cached(
+        str(resolved.resolve()),
+        json_mtime_ns,
+        parquet_mtime_ns,
+    )
+
+
 def df_from_issues_doc(doc: IssuesDocument) -> pd.DataFrame:
     """Convert `IssuesDocument` into a pandas DataFrame."""
     return _issues_to_dataframe(doc)
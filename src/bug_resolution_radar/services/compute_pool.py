@@ -0,0 +1,157 @@
+"""Bounded executor with request coalescing for CPU-bound API work."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, TypeVar
+
+from bug_resolution_radar.common.utils import int_env
+
+T = TypeVar("T")
+
+_LATENCY_SAMPLES = 512
+
+
+def default_compute_workers() -> int:
+    cores = os.cpu_count() or 2
+    return max(1, int_env("BUG_RESOLUTION_RADAR_API_COMPUTE_WORKERS", cores))
+
+
+def _percentile(samples: Deque[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round((pct / 100.0) * (len(ordered) - 1)))))
+    return float(ordered[idx])
+
+
+class ComputePool:
+    """
+    Dedicated thread pool for pandas/plotly work triggered by API handlers.
+
+    Keeps heavy requests off Starlette's shared threadpool and coalesces identical
+    in-flight calls: while a computation for `key` is running, later callers with
+    the same key await that result instead of starting another one.
+    """
+
+    def __init__(self, *, max_workers: Optional[int] = None, name: str = "api-compute") -> None:
+        self.name = str(name or "api-compute")
+        self._max_workers = int(max_workers) if max_workers else None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future[Any]] = {}
+        self._queued = 0
+        self._running = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._coalesced = 0
+        self._wait_ms: Deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self._run_ms: Deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers or default_compute_workers()
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self.name
+                )
+            return self._executor
+
+    def _instrumented(self, fn: Callable[[], T], queued_at: float) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._wait_ms.append((started - queued_at) * 1000.0)
+        ok = False
+        try:
+            result = fn()
+            ok = True
+            return result
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._run_ms.append((time.perf_counter() - started) * 1000.0)
+                if ok:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+
+    def submit(
+        self, fn: Callable[..., T], /, *args: Any, key: Optional[Hashable] = None, **kwargs: Any
+    ) -> Future[T]:
+        """Schedule `fn` (or join the in-flight call registered under `key`)."""
+        executor = self._ensure_executor()
+        with self._lock:
+            if key is not None:
+                existing = self._inflight.get(key)
+                if existing is not None:
+                    self._coalesced += 1
+                    return existing
+            self._queued += 1
+            self._submitted += 1
+            queued_at = time.perf_counter()
+            future: Future[T] = executor.submit(
+                self._instrumented, lambda: fn(*args, **kwargs), queued_at
+            )
+            if key is not None:
+                self._inflight[key] = future
+        if key is not None:
+            future.add_done_callback(partial(self._forget, key))
+        return future
+
+    def _forget(self, key: Hashable, future: Future[Any]) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                self._inflight.pop(key, None)
+
+    async def run(
+        self, fn: Callable[..., T], /, *args: Any, key: Optional[Hashable] = None, **kwargs: Any
+    ) -> T:
+        """Await `fn(*args, **kwargs)` on the pool without blocking the event loop."""
+        future = self.submit(fn, *args, key=key, **kwargs)
+        # Shield the shared future: a disconnected client must not cancel coalesced peers.
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def is_idle(self) -> bool:
+        """True while no request is queued or running (background work may proceed)."""
+        with self._lock:
+            return self._queued == 0 and self._running == 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "max_workers": int(self.max_workers),
+                "queue_depth": int(self._queued),
+                "running": int(self._running),
+                "inflight_keys": int(len(self._inflight)),
+                "submitted": int(self._submitted),
+                "completed": int(self._completed),
+                "failed": int(self._failed),
+                "coalesced": int(self._coalesced),
+                "queue_wait_p50_ms": round(_percentile(self._wait_ms, 50), 3),
+                "queue_wait_p95_ms": round(_percentile(self._wait_ms, 95), 3),
+                "run_p50_ms": round(_percentile(self._run_ms, 50), 3),
+                "run_p95_ms": round(_percentile(self._run_ms, 95), 3),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._inflight.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+API_COMPUTE_POOL = ComputePool()
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import base64
 import json
 from collections import OrderedDict
-from dataclasses import dataclass
+from concurrent.futures import Future
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from threading import Lock
 from time import monotonic
-from typing import Any, Sequence, cast
+from typing import Any, Optional, Sequence, cast
 
 import pandas as pd
 import plotly.graph_objects as go
 
-from bug_resolution_radar.analytics.analysis_window import apply_analysis_depth_filter
+from bug_resolution_radar.analytics.analysis_window import (
+    analysis_depth_cutoff,
+    apply_analysis_depth_filter,
+)
+from bug_resolution_radar.analytics.daily_cube import (
+    cube_daily_totals,
+    cube_period_counts,
+    cube_timeseries_daily,
+    slice_cube,
+)
 from bug_resolution_radar.analytics.duplicate_insights import prepare_duplicates_payload
 from bug_resolution_radar.analytics.duplicates import exact_title_duplicate_stats
 from bug_resolution_radar.analytics.filtering import (
@@ -44,7 +55,7 @@ from bug_resolution_radar.analytics.issues import (
     priority_rank,
     sort_issues_for_display,
 )
-from bug_resolution_radar.analytics.kpis import compute_kpis
+from bug_resolution_radar.analytics.kpis import build_timeseries_chart, compute_kpis
 from bug_resolution_radar.analytics.period_functionality_followup import (
     build_period_functionality_followup_summary,
     format_top_row_label,
@@ -52,9 +63,11 @@ from bug_resolution_radar.analytics.period_functionality_followup import (
 from bug_resolution_radar.analytics.period_summary import (
     build_country_quincenal_result,
     format_window_label,
+    scope_country_sources,
     source_label_map,
 )
 from bug_resolution_radar.analytics.quincenal_scope import (
+    QUINCENAL_SCOPE_ALL,
     QUINCENAL_SCOPE_CLOSED_CURRENT,
     QUINCENAL_SCOPE_CREATED_CURRENT,
     QUINCENAL_SCOPE_CREATED_MONTH,
@@ -62,9 +75,11 @@ from bug_resolution_radar.analytics.quincenal_scope import (
     QUINCENAL_SCOPE_OPEN_TOTAL,
     QUINCENAL_SCOPE_RESOLUTION_CLOSED_CURRENT,
     apply_issue_key_scope,
+    normalize_quincenal_scope_label,
     quincenal_scope_options,
     should_show_open_split,
 )
+from bug_resolution_radar.analytics.search_index import IssueSearchIndex
 from bug_resolution_radar.analytics.topic_expandable_summary import (
     build_topic_expandable_summaries,
 )
@@ -73,29 +88,47 @@ from bug_resolution_radar.analytics.trend_constants import (
     order_statuses_canonical,
 )
 from bug_resolution_radar.analytics.trend_insights import (
+    TrendInsightPack,
     build_duplicates_brief,
     build_ops_health_brief,
     build_people_plan_recommendations,
     build_topic_brief,
     build_trend_insight_pack,
 )
-from bug_resolution_radar.config import Settings
-from bug_resolution_radar.repositories.issues_store import load_issues_df
+from bug_resolution_radar.config import Settings, rollup_source_ids, settings_cache_token
+from bug_resolution_radar.repositories.issues_sql import (
+    IssuesSqlEngine,
+    IssuesSqlScope,
+    issues_sql_engine,
+)
+from bug_resolution_radar.repositories.issues_store import (
+    load_issues_cube,
+    load_issues_df,
+    load_issues_search_index,
+)
 from bug_resolution_radar.services.insights_learning_store import (
     InsightsLearningStore,
     default_learning_path,
     learning_scope_key,
 )
-from bug_resolution_radar.services.workspace import WorkspaceSelection, apply_workspace_source_scope
+from bug_resolution_radar.services.workspace import (
+    WorkspaceSelection,
+    apply_workspace_source_scope,
+    normalize_workspace_mode,
+)
 from bug_resolution_radar.theme.design_tokens import BBVA_LIGHT
 from bug_resolution_radar.theme.plotly_style import apply_plotly_bbva
 
 _SCOPE_CONTEXT_CACHE_MAX_ENTRIES = 24
 _SCOPE_CONTEXT_CACHE_TTL_SECONDS = 12.0
+# key -> (expires_at, context); prewarmed scopes are stored with a longer TTL.
 _scope_context_cache: OrderedDict[tuple[Any, ...], tuple[float, "DashboardScopeContext"]] = (
     OrderedDict()
 )
 _scope_context_cache_lock = Lock()
+# Single-flight registry: concurrent requests for the same scope wait for one build.
+_scope_context_inflight: dict[tuple[Any, ...], Future[DashboardScopeContext]] = {}
+_scope_artifact_lock = Lock()
 
 
 def _fig_payload(fig: Any) -> dict[str, Any] | None:
@@ -721,9 +754,11 @@ def build_status_priority_matrix_payload(
                 "cells": [
                     {
                         "priority": priority,
-                        "count": int(counts.at[status, priority])
-                        if status in counts.index and priority in counts.columns
-                        else 0,
+                        "count": (
+                            int(counts.at[status, priority])
+                            if status in counts.index and priority in counts.columns
+                            else 0
+                        ),
                     }
                     for priority in priorities
                 ],
@@ -793,6 +828,8 @@ class DashboardQuery:
     issue_like_query: str = ""
     chart_ids: tuple[str, ...] = ()
     dark_mode: bool = False
+    # Explicit source subset (country reports); overrides the workspace rollup.
+    source_ids: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -802,14 +839,153 @@ class DashboardScopeContext:
     open_df: pd.DataFrame
     source_ids: tuple[str, ...]
     kpis: dict[str, Any]
+    # Chart figures / insight packs derived from this scope, shared by the API
+    # views and the PPT reports while the context stays cached.
+    artifacts: dict[tuple[str, ...], Any] = field(default_factory=dict, compare=False, repr=False)
 
 
-def load_workspace_dataframe(settings: Settings, *, query: DashboardQuery) -> pd.DataFrame:
-    df = load_issues_df(settings.DATA_PATH)
-    scoped_df = apply_workspace_source_scope(df, settings=settings, selection=query.workspace)
+def build_report_scope_query(
+    *,
+    country: str,
+    source_ids: Sequence[str],
+    filters: FilterState | None = None,
+    quincenal_scope: str = QUINCENAL_SCOPE_ALL,
+) -> DashboardQuery:
+    """Express a report scope as the dashboard query that selects the same rows."""
+    clean_source_ids = tuple(normalize_filter_tokens(list(source_ids or [])))
+    single_source = len(clean_source_ids) == 1
+    return DashboardQuery(
+        workspace=WorkspaceSelection(
+            country=str(country or "").strip(),
+            source_id=clean_source_ids[0] if single_source else "",
+            scope_mode="source" if single_source else "country",
+        ),
+        filters=filters or FilterState(status=[], priority=[], assignee=[]),
+        quincenal_scope=str(quincenal_scope or QUINCENAL_SCOPE_ALL).strip() or QUINCENAL_SCOPE_ALL,
+        source_ids=() if single_source else clean_source_ids,
+    )
+
+
+def _scope_workspace_frame(
+    settings: Settings, df: pd.DataFrame, *, query: DashboardQuery
+) -> pd.DataFrame:
+    if query.source_ids:
+        scoped_df = scope_country_sources(
+            df, country=query.workspace.country, source_ids=query.source_ids
+        )
+    else:
+        scoped_df = apply_workspace_source_scope(df, settings=settings, selection=query.workspace)
     return apply_analysis_depth_filter(scoped_df, settings=settings)
 
 
+def _sql_source_scope(
+    settings: Settings, engine: IssuesSqlEngine, *, query: DashboardQuery
+) -> IssuesSqlScope:
+    """`_scope_workspace_frame` source selection expressed as a pushed-down predicate."""
+    country = str(query.workspace.country or "").strip()
+    if query.source_ids:
+        return IssuesSqlScope(country=country, source_ids=tuple(query.source_ids))
+    source_id = str(query.workspace.source_id or "").strip()
+    if normalize_workspace_mode(query.workspace.scope_mode) == "source":
+        return IssuesSqlScope(country=country, source_ids=(source_id,) if source_id else ())
+    rollup = rollup_source_ids(
+        settings,
+        country=country,
+        available_source_ids=engine.source_ids(country=country),
+    )
+    return IssuesSqlScope(country=country, source_ids=tuple(rollup))
+
+
+def _sql_windowed_scope(
+    settings: Settings, engine: IssuesSqlEngine, *, query: DashboardQuery
+) -> IssuesSqlScope:
+    """Source scope plus the analysis depth cut `apply_analysis_depth_filter` applies."""
+    scope = _sql_source_scope(settings, engine, query=query)
+    oldest = engine.oldest_created(scope)
+    cutoff = (
+        analysis_depth_cutoff(settings, df=pd.DataFrame({"created": [oldest]}))
+        if oldest is not None
+        else None
+    )
+    return replace(scope, require_created=True, created_since=cutoff)
+
+
+def _sql_workspace_frame(
+    settings: Settings, engine: IssuesSqlEngine, *, query: DashboardQuery
+) -> pd.DataFrame:
+    return engine.scope_frame(_sql_windowed_scope(settings, engine, query=query))
+
+
+def _sql_aggregate_scope(
+    settings: Settings, query: DashboardQuery
+) -> tuple[IssuesSqlEngine, IssuesSqlScope] | None:
+    """
+    Engine and pushed-down scope selecting exactly `dff` for `query`, if SQL can answer.
+
+    Quincenal cuts, explicit issue subsets and like filters are resolved in pandas,
+    so queries using them (and the default pandas engine) return None.
+    """
+    if (
+        normalize_quincenal_scope_label(query.quincenal_scope) != QUINCENAL_SCOPE_ALL
+        or query.issue_scope_keys
+        or str(query.issue_like_query or "").strip()
+    ):
+        return None
+    engine = issues_sql_engine(settings.DATA_PATH)
+    if engine is None:
+        return None
+    scope = replace(
+        _sql_windowed_scope(settings, engine, query=query),
+        status=tuple(str(v) for v in list(query.filters.status or [])),
+        priority=tuple(str(v) for v in list(query.filters.priority or [])),
+        assignee=tuple(str(v) for v in list(query.filters.assignee or [])),
+    )
+    return engine, scope
+
+
+def _scope_kpis(
+    dff: pd.DataFrame,
+    *,
+    settings: Settings,
+    include_timeseries_chart: bool,
+    sql: tuple[IssuesSqlEngine, IssuesSqlScope] | None,
+) -> dict[str, Any]:
+    """`compute_kpis`, with totals, open priorities, time series and age cut from SQL."""
+    kpis = dict(
+        compute_kpis(
+            dff,
+            settings=settings,
+            include_timeseries_chart=include_timeseries_chart and sql is None,
+        )
+        or {}
+    )
+    if sql is None:
+        return kpis
+    engine, scope = sql
+    issues_total = sum(engine.status_counts(scope).values())
+    by_priority = engine.open_priority_counts(scope)
+    open_total = sum(by_priority.values())
+    kpis.update(
+        issues_total=issues_total,
+        issues_open=open_total,
+        issues_closed=max(issues_total - open_total, 0),
+        open_now_total=open_total,
+        open_now_by_priority=by_priority,
+        open_age_priority=engine.open_age_priority(scope),
+    )
+    if include_timeseries_chart:
+        kpis["timeseries_daily"] = engine.timeseries_daily(scope)
+        kpis["timeseries_chart"] = build_timeseries_chart(kpis["timeseries_daily"])
+    return kpis
+
+
+def load_workspace_dataframe(settings: Settings, *, query: DashboardQuery) -> pd.DataFrame:
+    engine = issues_sql_engine(settings.DATA_PATH)
+    if engine is not None:
+        return _sql_workspace_frame(settings, engine, query=query)
+    return _scope_workspace_frame(settings, load_issues_df(settings.DATA_PATH), query=query)
+
+
 def _data_revision_key(settings: Settings) -> tuple[str, int, int]:
     resolved = Path(str(settings.DATA_PATH)).expanduser()
     try:
@@ -826,6 +1002,7 @@ def _scope_context_cache_key(
 ) -> tuple[Any, ...]:
     data_path, mtime_ns, size = _data_revision_key(settings)
     return (
+        settings_cache_token(settings),
         data_path,
         mtime_ns,
         size,
@@ -839,17 +1016,38 @@ def _scope_context_cache_key(
         tuple(str(item or "").strip() for item in list(query.issue_scope_keys or [])),
         str(query.issue_sort_col or "").strip(),
         str(query.issue_like_query or "").strip(),
+        tuple(str(item or "").strip() for item in list(query.source_ids or [])),
     )
 
 
+def _like_search_index(
+    settings: Settings, scoped_df: pd.DataFrame, *, query: DashboardQuery
+) -> IssueSearchIndex | None:
+    """Read-model search index for the like filter, when it covers the scoped rows."""
+    if not str(query.issue_like_query or "").strip():
+        return None
+    try:
+        index = load_issues_search_index(settings.DATA_PATH)
+    except Exception:
+        return None
+    if not index.supports_like(query.issue_sort_col) or not index.covers_rows(scoped_df):
+        return None
+    return index
+
+
 def _build_scope_context(
     settings: Settings,
     *,
     query: DashboardQuery,
     include_kpis: bool,
     include_timeseries_chart: bool,
+    df_all: pd.DataFrame | None = None,
 ) -> DashboardScopeContext:
-    scoped_df = load_workspace_dataframe(settings, query=query)
+    scoped_df = (
+        load_workspace_dataframe(settings, query=query)
+        if df_all is None
+        else _scope_workspace_frame(settings, df_all, query=query)
+    )
     dff = apply_filters(scoped_df, query.filters)
     source_ids = tuple(_active_source_ids(scoped_df, query=query))
     dff = apply_dashboard_issue_scope(
@@ -861,13 +1059,17 @@ def _build_scope_context(
         issue_keys=query.issue_scope_keys,
         sort_col=query.issue_sort_col,
         like_query=query.issue_like_query,
+        search_index=(
+            _like_search_index(settings, scoped_df, query=query) if df_all is None else None
+        ),
     )
     open_df = open_only(dff)
     kpis = (
-        compute_kpis(
+        _scope_kpis(
             dff,
             settings=settings,
             include_timeseries_chart=include_timeseries_chart,
+            sql=_sql_aggregate_scope(settings, query) if df_all is None else None,
         )
         if include_kpis
         else {}
@@ -877,7 +1079,7 @@ def _build_scope_context(
         dff=dff,
         open_df=open_df,
         source_ids=source_ids,
-        kpis=dict(kpis or {}),
+        kpis=kpis,
     )
 
 
@@ -900,6 +1102,7 @@ def _context_with_requested_kpis(
     context: DashboardScopeContext,
     *,
     settings: Settings,
+    query: DashboardQuery,
     include_kpis: bool,
     include_timeseries_chart: bool,
 ) -> DashboardScopeContext:
@@ -911,25 +1114,25 @@ def _context_with_requested_kpis(
         return context
     if not include_kpis:
         return context
-    kpis = compute_kpis(
+    kpis = _scope_kpis(
         context.dff,
         settings=settings,
         include_timeseries_chart=include_timeseries_chart,
+        sql=_sql_aggregate_scope(settings, query),
     )
     return DashboardScopeContext(
         scoped_df=context.scoped_df,
         dff=context.dff,
         open_df=context.open_df,
         source_ids=context.source_ids,
-        kpis=dict(kpis or {}),
+        kpis=kpis,
+        artifacts=context.artifacts,
     )
 
 
 def _prune_scope_context_cache(now: float) -> None:
     stale_keys = [
-        key
-        for key, (seen_at, _ctx) in _scope_context_cache.items()
-        if now - seen_at > _SCOPE_CONTEXT_CACHE_TTL_SECONDS
+        key for key, (expires_at, _ctx) in _scope_context_cache.items() if now > expires_at
     ]
     for key in stale_keys:
         _scope_context_cache.pop(key, None)
@@ -943,36 +1146,142 @@ def load_scope_context(
     query: DashboardQuery,
     include_kpis: bool = False,
     include_timeseries_chart: bool = False,
+    df_all: pd.DataFrame | None = None,
+    ttl_seconds: float | None = None,
 ) -> DashboardScopeContext:
+    """
+    Resolve the filtered scope for `query`, reusing recent results for the same data revision.
+
+    Passing `df_all` scopes an already loaded dataset instead; such contexts are not cached
+    because the frame is not tied to a file revision. `ttl_seconds` overrides how long a
+    context built by this call stays cached (background prewarming keeps them longer).
+    """
+    if df_all is not None:
+        return _build_scope_context(
+            settings,
+            query=query,
+            include_kpis=include_kpis,
+            include_timeseries_chart=include_timeseries_chart,
+            df_all=df_all,
+        )
     cache_key = _scope_context_cache_key(settings, query=query)
     now = monotonic()
     with _scope_context_cache_lock:
         cached = _scope_context_cache.get(cache_key)
-        if cached is not None and (now - cached[0]) <= _SCOPE_CONTEXT_CACHE_TTL_SECONDS:
+        if cached is not None and now <= cached[0]:
             _scope_context_cache.move_to_end(cache_key)
             context = _context_with_requested_kpis(
                 cached[1],
                 settings=settings,
+                query=query,
                 include_kpis=include_kpis,
                 include_timeseries_chart=include_timeseries_chart,
             )
-            if context is not cached[1]:
-                _scope_context_cache[cache_key] = (now, context)
+            expires_at = (
+                cached[0] if ttl_seconds is None else max(cached[0], now + float(ttl_seconds))
+            )
+            if context is not cached[1] or expires_at != cached[0]:
+                _scope_context_cache[cache_key] = (expires_at, context)
             return context
+        pending = _scope_context_inflight.get(cache_key)
+        owner = pending is None
+        if pending is None:
+            pending = Future()
+            _scope_context_inflight[cache_key] = pending
+
+    if not owner:
+        return _context_with_requested_kpis(
+            pending.result(),
+            settings=settings,
+            query=query,
+            include_kpis=include_kpis,
+            include_timeseries_chart=include_timeseries_chart,
+        )
 
-    context = _build_scope_context(
-        settings,
-        query=query,
-        include_kpis=include_kpis,
-        include_timeseries_chart=include_timeseries_chart,
-    )
+    try:
+        context = _build_scope_context(
+            settings,
+            query=query,
+            include_kpis=include_kpis,
+            include_timeseries_chart=include_timeseries_chart,
+        )
+    except BaseException as exc:
+        with _scope_context_cache_lock:
+            _scope_context_inflight.pop(cache_key, None)
+        pending.set_exception(exc)
+        raise
+    ttl = _SCOPE_CONTEXT_CACHE_TTL_SECONDS if ttl_seconds is None else float(ttl_seconds)
     with _scope_context_cache_lock:
-        _scope_context_cache[cache_key] = (now, context)
+        _scope_context_cache[cache_key] = (now + ttl, context)
         _scope_context_cache.move_to_end(cache_key)
         _prune_scope_context_cache(now)
+        _scope_context_inflight.pop(cache_key, None)
+    pending.set_result(context)
     return context
 
 
+def _scope_artifact(context: DashboardScopeContext, key: tuple[str, ...], build: Any) -> Any:
+    with _scope_artifact_lock:
+        if key in context.artifacts:
+            return context.artifacts[key]
+    value = build()
+    with _scope_artifact_lock:
+        return context.artifacts.setdefault(key, value)
+
+
+def scope_chart_figure(
+    context: DashboardScopeContext,
+    chart_id: str,
+    *,
+    dark_mode: bool = False,
+    open_df: pd.DataFrame | None = None,
+    open_scope: str = "open",
+) -> go.Figure | None:
+    """
+    Render a trend registry chart once per cached scope context.
+
+    `open_df`/`open_scope` select an alternative open-issues frame (e.g. terminal status
+    filters in trend detail); `open_scope` labels that variant in the memo key.
+    """
+    cid = str(chart_id or "").strip()
+    spec = build_trends_registry().get(cid)
+    if spec is None:
+        return None
+    chosen_open = context.open_df if open_df is None else open_df
+
+    def _render() -> go.Figure | None:
+        chart_ctx = ChartContext(
+            dff=context.dff.copy(deep=False),
+            open_df=chosen_open.copy(deep=False),
+            kpis=dict(context.kpis or {}),
+            dark_mode=bool(dark_mode),
+        )
+        return spec.render(chart_ctx)
+
+    key = ("figure", cid, str(open_scope), "dark" if dark_mode else "light")
+    return cast(Optional[go.Figure], _scope_artifact(context, key, _render))
+
+
+def scope_trend_insight_pack(
+    context: DashboardScopeContext,
+    chart_id: str,
+    *,
+    open_df: pd.DataFrame | None = None,
+    open_scope: str = "open",
+) -> TrendInsightPack:
+    """Build the insight pack for `chart_id` once per cached scope context."""
+    cid = str(chart_id or "").strip()
+    chosen_open = context.open_df if open_df is None else open_df
+    return cast(
+        TrendInsightPack,
+        _scope_artifact(
+            context,
+            ("pack", cid, str(open_scope)),
+            lambda: build_trend_insight_pack(cid, dff=context.dff, open_df=chosen_open),
+        ),
+    )
+
+
 def build_dashboard_snapshot(
     settings: Settings,
     *,
@@ -1005,7 +1314,7 @@ def build_dashboard_snapshot(
         spec = registry.get(chart_id)
         if spec is None:
             continue
-        fig = spec.render(ctx)
+        fig = scope_chart_figure(context, chart_id, dark_mode=query.dark_mode)
         charts.append(
             {
                 "id": chart_id,
@@ -1046,6 +1355,131 @@ def build_dashboard_snapshot(
     }
 
 
+ISSUE_ROW_COLUMNS: tuple[str, ...] = (
+    "key",
+    "summary",
+    "description",
+    "status",
+    "type",
+    "priority",
+    "assignee",
+    "created",
+    "updated",
+    "resolved",
+    "source_type",
+    "source_alias",
+    "source_id",
+    "country",
+    "url",
+)
+_ISSUE_ROW_DATETIME_COLUMNS = ("created", "updated", "resolved")
+
+
+@dataclass(frozen=True)
+class _IssueSortIndex:
+    """Row positions of a scope sorted by one column (ties by key, source), plus sorted values."""
+
+    order: Any
+    values: list[Any]
+    ties: list[str]
+    ascending: bool
+    is_datetime: bool
+
+    def _beyond(self, value: Any, tie: str, cursor_value: Any, cursor_tie: str) -> bool:
+        value_missing = bool(pd.isna(value))
+        if cursor_value is None:
+            return value_missing and (tie > cursor_tie if self.ascending else tie < cursor_tie)
+        if value_missing:
+            return True
+        if value == cursor_value:
+            return tie > cursor_tie if self.ascending else tie < cursor_tie
+        return bool(value > cursor_value) if self.ascending else bool(value < cursor_value)
+
+    def first_rank_after(self, cursor_value: Any, cursor_tie: str) -> int:
+        """Binary search for the first rank sorted strictly after the cursor row."""
+        lo, hi = 0, len(self.values)
+        try:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._beyond(self.values[mid], self.ties[mid], cursor_value, cursor_tie):
+                    hi = mid
+                else:
+                    lo = mid + 1
+        except TypeError as exc:
+            raise ValueError("Cursor de paginación no válido.") from exc
+        return lo
+
+
+def _text_values(df: pd.DataFrame, column: str) -> list[str]:
+    if column not in df.columns:
+        return [""] * len(df)
+    return list(df[column].fillna("").astype(str))
+
+
+def _issue_tie(key: Any, source_id: Any) -> str:
+    return f"{key}\x1f{source_id}"
+
+
+def _issue_sort_index(
+    context: DashboardScopeContext, *, column: str, ascending: bool
+) -> _IssueSortIndex:
+    def _build() -> _IssueSortIndex:
+        dff = context.dff
+        frame = pd.DataFrame(
+            {
+                "value": dff[column].reset_index(drop=True),
+                "tie": [
+                    _issue_tie(key, sid)
+                    for key, sid in zip(
+                        _text_values(dff, "key"),
+                        _text_values(dff, "source_id"),
+                    )
+                ],
+            }
+        )
+        ordered = frame.sort_values(
+            ["value", "tie"], ascending=ascending, kind="mergesort", na_position="last"
+        )
+        return _IssueSortIndex(
+            order=ordered.index.to_numpy(),
+            values=ordered["value"].tolist(),
+            ties=ordered["tie"].tolist(),
+            ascending=ascending,
+            is_datetime=pd.api.types.is_datetime64_any_dtype(dff[column]),
+        )
+
+    direction = "asc" if ascending else "desc"
+    index: _IssueSortIndex = _scope_artifact(context, ("issue_sort", column, direction), _build)
+    return index
+
+
+def _encode_issue_cursor(sort_index: _IssueSortIndex, rank: int) -> str:
+    value = sort_index.values[rank]
+    if pd.isna(value):
+        value = None
+    elif isinstance(value, pd.Timestamp):
+        value = value.isoformat()
+    elif hasattr(value, "item"):
+        value = value.item()
+    key, _, source_id = sort_index.ties[rank].partition("\x1f")
+    payload = {"v": value, "k": key, "s": source_id}
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_issue_cursor(token: str, sort_index: _IssueSortIndex) -> tuple[Any, str]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value = payload["v"]
+        tie = _issue_tie(payload["k"], payload["s"])
+        if value is not None and sort_index.is_datetime:
+            value = pd.Timestamp(value)
+    except Exception as exc:
+        raise ValueError("Cursor de paginación no válido.") from exc
+    return value, tie
+
+
 def build_issue_rows(
     settings: Settings,
     *,
@@ -1054,62 +1488,101 @@ def build_issue_rows(
     limit: int = 100,
     sort_by: str = "updated",
     sort_dir: str = "desc",
+    after: str = "",
+    columns: Sequence[str] = (),
 ) -> dict[str, Any]:
+    """
+    One page of issue rows for the scope.
+
+    The sort permutation per (column, direction) is cached on the scope context,
+    so a page costs a slice of it plus stringifying the page. `after` is the
+    `nextCursor` of the previous page (keyset pagination; `offset` is then
+    ignored) and `columns` projects the row fields (`key` is always included).
+    """
     context = load_scope_context(settings, query=query)
-    dff = context.dff.copy(deep=False)
+    dff = context.dff
+    wanted = [column for column in ISSUE_ROW_COLUMNS if column in set(columns or ())]
+    out_columns = ["key", *[c for c in wanted if c != "key"]] if wanted else list(ISSUE_ROW_COLUMNS)
 
     sort_column = (
         sort_by if sort_by in dff.columns else ("updated" if "updated" in dff.columns else "key")
     )
     ascending = str(sort_dir or "desc").strip().lower() == "asc"
-    if sort_column in dff.columns:
-        dff = dff.sort_values(sort_column, ascending=ascending, kind="mergesort")
-    page = dff.iloc[max(offset, 0) : max(offset, 0) + max(limit, 1)].copy(deep=False)
-    columns = [
-        "key",
-        "summary",
-        "description",
-        "status",
-        "type",
-        "priority",
-        "assignee",
-        "created",
-        "updated",
-        "resolved",
-        "source_type",
-        "source_alias",
-        "source_id",
-        "country",
-        "url",
-    ]
-    for column in columns:
-        if column not in page.columns:
-            page[column] = ""
-    for column in ("created", "updated", "resolved"):
-        if column in page.columns:
+    size = max(limit, 1)
+    if sort_column in dff.columns and not dff.empty:
+        sort_index = _issue_sort_index(context, column=sort_column, ascending=ascending)
+        token = str(after or "").strip()
+        if token:
+            start = sort_index.first_rank_after(*_decode_issue_cursor(token, sort_index))
+        else:
+            start = max(offset, 0)
+        page = dff.take(sort_index.order[start : start + size])
+    else:
+        sort_index = None
+        start = max(offset, 0)
+        page = dff.iloc[start : start + size]
+
+    page = page.reindex(columns=out_columns)
+    for column in out_columns:
+        if column in _ISSUE_ROW_DATETIME_COLUMNS:
             page[column] = page[column].astype(str).replace({"NaT": "", "nan": ""})
-    for column in (
-        "key",
-        "summary",
-        "description",
-        "status",
-        "type",
-        "priority",
-        "assignee",
-        "source_type",
-        "source_alias",
-        "source_id",
-        "country",
-        "url",
-    ):
-        if column in page.columns:
+        else:
             page[column] = page[column].fillna("").astype(str)
+    rows = page.fillna("").to_dict(orient="records")
+    next_cursor = None
+    end = start + len(rows)
+    if sort_index is not None and rows and end < len(dff):
+        next_cursor = _encode_issue_cursor(sort_index, end - 1)
     return {
         "total": int(len(dff)),
-        "rows": page.loc[:, columns].fillna("").to_dict(orient="records"),
+        "rows": rows,
+        "nextCursor": next_cursor,
     }
 
 
+def build_issue_search(
+    settings: Settings,
+    *,
+    query: DashboardQuery,
+    text: str,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """Ranked text search over key, summary, labels, assignee and description in the scope."""
+    context = load_scope_context(settings, query=query)
+    dff = context.dff
+    needle = str(text or "").strip()
+    if not needle or dff.empty:
+        return {"query": needle, "total": 0, "items": []}
+
+    index = load_issues_search_index(settings.DATA_PATH)
+    if index.covers_rows(dff):
+        results = index.search(needle, limit=limit, within=dff.index)
+    else:
+        scoped_index = _scope_artifact(context, ("search_index",), lambda: IssueSearchIndex(dff))
+        results = scoped_index.search(needle, limit=limit)
+
+    fields = {
+        "key": "key",
+        "summary": "summary",
+        "status": "status",
+        "priority": "priority",
+        "assignee": "assignee",
+        "sourceId": "source_id",
+        "url": "url",
+    }
+    rows = dff.loc[[hit.label for hit in results.hits]].reindex(columns=list(fields.values()))
+    records = rows.fillna("").astype(str).to_dict(orient="records")
+    items = [
+        {
+            **{name: record[column].strip() for name, column in fields.items()},
+            "score": hit.score,
+            "matchedFields": list(hit.fields),
+        }
+        for hit, record in zip(results.hits, records)
+    ]
+    return {"query": needle, "total": results.total, "items": items}
+
+
 def build_kanban_columns(
     settings: Settings,
     *,
@@ -1250,12 +1723,7 @@ def build_trend_detail(
         open_df=open_df,
         active_status_filters=list(query.filters.status or []),
     )
-    chart_context = ChartContext(
-        dff=dff,
-        open_df=trend_open_df,
-        kpis=dict(context.kpis or {}),
-        dark_mode=query.dark_mode,
-    )
+    open_scope = "terminal" if adapted_for_terminal else "open"
     registry = build_trends_registry()
     spec = registry.get(str(chart_id or "").strip())
     if spec is None:
@@ -1267,7 +1735,9 @@ def build_trend_detail(
             "executiveTip": None,
             "adaptedForTerminal": adapted_for_terminal,
         }
-    pack = build_trend_insight_pack(str(chart_id or "").strip(), dff=dff, open_df=trend_open_df)
+    pack = scope_trend_insight_pack(
+        context, str(chart_id or "").strip(), open_df=trend_open_df, open_scope=open_scope
+    )
     baseline_snapshot = _load_trend_baseline_snapshot(settings, workspace=query.workspace)
     current_snapshot = _build_operational_snapshot(dff=dff, open_df=trend_open_df)
     return {
@@ -1276,7 +1746,15 @@ def build_trend_detail(
             "title": spec.title,
             "subtitle": spec.subtitle,
             "group": spec.group,
-            "figure": _fig_payload(spec.render(chart_context)),
+            "figure": _fig_payload(
+                scope_chart_figure(
+                    context,
+                    str(chart_id or "").strip(),
+                    dark_mode=query.dark_mode,
+                    open_df=trend_open_df,
+                    open_scope=open_scope,
+                )
+            ),
         },
         "metrics": [
             {"label": metric.label, "value": metric.value} for metric in list(pack.metrics or [])
@@ -1298,6 +1776,79 @@ def build_trend_detail(
     }
 
 
+def build_daily_flow(
+    settings: Settings,
+    *,
+    country: str = "",
+    source_ids: Sequence[str] = (),
+    priorities: Sequence[str] = (),
+    status_buckets: Sequence[str] = (),
+    themes: Sequence[str] = (),
+    lookback_days: int = 90,
+) -> dict[str, Any]:
+    """
+    Daily created/closed flow and window totals answered from the daily aggregate cube.
+
+    A country without explicit sources rolls up the same sources as the country
+    workspace scope. Cost depends on the number of cube cells, not on issues.
+    """
+    cube = load_issues_cube(settings.DATA_PATH)
+    country_txt = str(country or "").strip()
+    selected = [str(sid or "").strip() for sid in list(source_ids or []) if str(sid).strip()]
+    if country_txt and not selected and not cube.empty:
+        available = sorted(
+            {sid for sid in cube.loc[cube["country"].eq(country_txt), "source_id"] if sid}
+        )
+        selected = rollup_source_ids(settings, country=country_txt, available_source_ids=available)
+    scoped = slice_cube(
+        cube,
+        country=country_txt,
+        source_ids=selected,
+        priorities=priorities,
+        status_buckets=status_buckets,
+        themes=themes,
+    )
+    flow = cube_timeseries_daily(scoped, lookback_days=lookback_days)
+    totals = cube_daily_totals(scoped)
+    open_at_end = (
+        totals.set_index("date")["open_at_end"]
+        .reindex(pd.DatetimeIndex(flow["date"]), method="ffill")
+        .fillna(0)
+        .tolist()
+        if not totals.empty and not flow.empty
+        else [0] * len(flow)
+    )
+    period: dict[str, Any] = {}
+    if not flow.empty:
+        start = pd.Timestamp(flow["date"].min())
+        end = pd.Timestamp(flow["date"].max())
+        period = {
+            "start": start.date().isoformat(),
+            "end": end.date().isoformat(),
+            **cube_period_counts(scoped, start=start, end=end),
+        }
+    return {
+        "sourceIds": selected,
+        "daily": [
+            {
+                "date": pd.Timestamp(day).date().isoformat(),
+                "created": int(created),
+                "closed": int(closed),
+                "openBacklogProxy": int(proxy),
+                "openAtEnd": int(open_now),
+            }
+            for day, created, closed, proxy, open_now in zip(
+                flow["date"],
+                flow["created"],
+                flow["closed"],
+                flow["open_backlog_proxy"],
+                open_at_end,
+            )
+        ],
+        "period": period,
+    }
+
+
 def _scope_reference_day(df: pd.DataFrame) -> pd.Timestamp | None:
     safe = df if isinstance(df, pd.DataFrame) else pd.DataFrame()
     if safe.empty:
@@ -1664,6 +2215,8 @@ def _build_theme_trend_figure(
 
 
 def _active_source_ids(scoped_df: pd.DataFrame, *, query: DashboardQuery) -> list[str]:
+    if query.source_ids:
+        return [str(source_id) for source_id in query.source_ids]
     if query.workspace.source_id:
         return [str(query.workspace.source_id)]
     if (
@@ -2142,17 +2695,19 @@ def _build_functionality_payload(
             "selectedPriorities": list(combo_ctx.selected_priorities),
             "selectedFunctionalities": list(combo_ctx.selected_functionalities),
         },
-        "chart": {
-            "title": "Tendencia por funcionalidad",
-            "subtitle": (
-                "Vista quincenal acumulada"
-                if use_accumulated_scope
-                else "Vista diaria de la quincena analizada"
-            ),
-            "figure": chart_payload,
-        }
-        if chart_payload is not None
-        else None,
+        "chart": (
+            {
+                "title": "Tendencia por funcionalidad",
+                "subtitle": (
+                    "Vista quincenal acumulada"
+                    if use_accumulated_scope
+                    else "Vista diaria de la quincena analizada"
+                ),
+                "figure": chart_payload,
+            }
+            if chart_payload is not None
+            else None
+        ),
         "topics": topics,
         "tip": "El % indica el peso real de cada tema dentro del backlog abierto filtrado.",
     }
@@ -2222,7 +2777,10 @@ def _build_duplicates_payload(dff_quincenal: pd.DataFrame) -> dict[str, Any]:
     }
 
 
-def _build_people_payload(dff_quincenal: pd.DataFrame) -> dict[str, Any]:
+def _build_people_payload(
+    dff_quincenal: pd.DataFrame, *, ranking: Sequence[tuple[str, int]] | None = None
+) -> dict[str, Any]:
+    """People cards; `ranking` (assignee, open count) replaces the pandas top-12 ranking."""
     open_df = open_only(dff_quincenal)
     if open_df.empty or "assignee" not in open_df.columns:
         return {"cards": []}
@@ -2248,7 +2806,11 @@ def _build_people_payload(dff_quincenal: pd.DataFrame) -> dict[str, Any]:
         df2["age_days"] = pd.NA
 
     total_open = int(len(df2))
-    counts = df2.groupby("assignee").size().sort_values(ascending=False).head(12)
+    counts = (
+        pd.Series(dict(ranking), dtype="int64")
+        if ranking is not None
+        else df2.groupby("assignee").size().sort_values(ascending=False, kind="mergesort").head(12)
+    )
     cards: list[dict[str, Any]] = []
     for assignee, count in counts.items():
         sub = df2.loc[df2["assignee"].eq(str(assignee))].copy(deep=False)
@@ -2308,9 +2870,11 @@ def _build_people_payload(dff_quincenal: pd.DataFrame) -> dict[str, Any]:
                     "value": (
                         f"{float(aging_p90_days):.0f}d" if aging_p90_days is not None else "—"
                     ),
-                    "caption": "Casos más lentos"
-                    if aging_p90_days is not None
-                    else "Sin fecha de creación",
+                    "caption": (
+                        "Casos más lentos"
+                        if aging_p90_days is not None
+                        else "Sin fecha de creación"
+                    ),
                 },
                 "recommendations": list(recommendations[:4]),
                 "oldestIssues": _issue_records_from_df(oldest, limit=3, age_days_col="age_days"),
@@ -2319,6 +2883,19 @@ def _build_people_payload(dff_quincenal: pd.DataFrame) -> dict[str, Any]:
     return {"cards": cards}
 
 
+def _sql_people_ranking(
+    settings: Settings, query: DashboardQuery, dff: pd.DataFrame, dff_quincenal: pd.DataFrame
+) -> list[tuple[str, int]] | None:
+    """Top open assignees of the insights cut from SQL, or None to rank in pandas."""
+    sql = _sql_aggregate_scope(settings, query)
+    if sql is None or dff_quincenal.empty:
+        return None
+    engine, scope = sql
+    # `_insights_quincenal_df` keeps the whole scope when no quincenal subset applies.
+    keys = tuple(_issue_keys(dff_quincenal)) if len(dff_quincenal) < len(dff) else ()
+    return engine.top_open_assignees(replace(scope, keys=keys), limit=12)
+
+
 def _build_ops_health_payload(dff_quincenal: pd.DataFrame) -> dict[str, Any]:
     dff = dff_quincenal if isinstance(dff_quincenal, pd.DataFrame) else pd.DataFrame()
     open_df = open_only(dff)
@@ -2449,7 +3026,9 @@ def build_intelligence_snapshot(
         apply_default_status_when_empty=not bool(insights_status_manual),
     )
     duplicates = _build_duplicates_payload(dff_quincenal)
-    people = _build_people_payload(dff_quincenal)
+    people = _build_people_payload(
+        dff_quincenal, ranking=_sql_people_ranking(settings, query, dff, dff_quincenal)
+    )
     ops_health = _build_ops_health_payload(dff_quincenal)
     return {
         "tabs": [
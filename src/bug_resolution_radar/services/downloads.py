@@ -111,13 +111,17 @@ def unique_download_path(download_dir: Path, *, file_name: str) -> Path:
     return download_dir / f"{stem}_{os.getpid()}{suffix}"
 
 
+def reserve_download_path(settings: Settings, *, file_name: str) -> Path:
+    """Unused path in the download directory for an export written in place."""
+    return unique_download_path(ensure_download_dir(settings), file_name=file_name)
+
+
 def save_download_content(
     settings: Settings,
     *,
     file_name: str,
     content: bytes,
 ) -> Path:
-    download_dir = ensure_download_dir(settings)
-    export_path = unique_download_path(download_dir, file_name=file_name)
+    export_path = reserve_download_path(settings, file_name=file_name)
     export_path.write_bytes(bytes(content or b""))
     return export_path
@@ -4,30 +4,43 @@ from __future__ import annotations
 
 import json
 import math
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Mapping, Optional
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Mapping, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
+from bug_resolution_radar.common.utils import int_env
 from bug_resolution_radar.models.schema_helix import HelixWorkItem
+from bug_resolution_radar.repositories.helix_store import (
+    HELIX_ITEM_FRONT_FIELDS,
+    helix_export_frame,
+    item_front_column,
+    load_helix_export_table,
+)
+from bug_resolution_radar.services.tabular_export import (
+    excel_id_column_width,
+    write_csv_batches,
+    write_xlsx_batches,
+)
 
-_HELIX_FRONT_EXPORT_FIELDS: tuple[str, ...] = (
-    "id",
-    "priority",
-    "summary",
-    "status",
-    "assignee",
-    "incidentType",
-    "service",
-    "customerName",
-    "bbva_matrixservicen1",
-    "bbva_sourceservicen1",
-    "bbva_startdatetime",
-    "bbva_closeddate",
-    "lastModifiedDate",
-    "targetDate",
-    "workItemId",
+_HELIX_FRONT_EXPORT_FIELDS: tuple[str, ...] = HELIX_ITEM_FRONT_FIELDS
+_ID_COLUMN = "ID de la Incidencia"
+_URL_COLUMN = "__item_url__"
+# Issue columns consulted (in order) before the Helix item value of a front field.
+_ISSUE_CANDIDATES: Mapping[str, tuple[str, ...]] = {"id": ("id", "key")}
+_SIDECAR_ONLY_COLUMNS = frozenset(
+    {"merge_key", "source_id", _ID_COLUMN, _URL_COLUMN}
+    | {item_front_column(field) for field in HELIX_ITEM_FRONT_FIELDS}
 )
+HELIX_RAW_SHEET = "Helix Raw"
+
+
+def _default_batch_rows() -> int:
+    return max(1, int_env("BUG_RESOLUTION_RADAR_HELIX_EXPORT_BATCH_ROWS", 5000))
 
 
 def _jsonable_text(value: Any) -> Any:
@@ -65,106 +78,17 @@ def _coerce_export_scalar(value: Any) -> Any:
     return _jsonable_text(value)
 
 
-def _preferred_issue_value(
-    issue_row: Mapping[str, Any], item: HelixWorkItem, *candidates: str, fallback: Any = ""
-) -> Any:
-    for candidate in candidates:
-        if candidate in issue_row:
-            value = issue_row.get(candidate)
-            if value not in (None, ""):
-                return value
-    if fallback not in (None, ""):
-        return fallback
-    return ""
-
-
-def _front_export_fields(issue_row: Mapping[str, Any], item: HelixWorkItem) -> dict[str, Any]:
-    raw_fields = item.raw_fields if isinstance(item.raw_fields, Mapping) else {}
-    work_item_id = (
-        raw_fields.get("workItemId")
-        or raw_fields.get("workItemID")
-        or raw_fields.get("InstanceId")
-        or raw_fields.get("instanceId")
-        or ""
-    )
-    return {
-        "id": _preferred_issue_value(issue_row, item, "id", "key", fallback=item.id),
-        "priority": _preferred_issue_value(issue_row, item, "priority", fallback=item.priority),
-        "summary": _preferred_issue_value(issue_row, item, "summary", fallback=item.summary),
-        "status": _preferred_issue_value(issue_row, item, "status", fallback=item.status),
-        "assignee": _preferred_issue_value(issue_row, item, "assignee", fallback=item.assignee),
-        "incidentType": _preferred_issue_value(
-            issue_row,
-            item,
-            "incidentType",
-            fallback=item.incident_type or raw_fields.get("incidentType") or "",
-        ),
-        "service": _preferred_issue_value(issue_row, item, "service", fallback=item.service),
-        "customerName": _preferred_issue_value(
-            issue_row,
-            item,
-            "customerName",
-            fallback=item.customer_name or raw_fields.get("customerName") or "",
-        ),
-        "bbva_matrixservicen1": _preferred_issue_value(
-            issue_row,
-            item,
-            "bbva_matrixservicen1",
-            fallback=item.matrix_service_n1 or raw_fields.get("bbva_matrixservicen1") or "",
-        ),
-        "bbva_sourceservicen1": _preferred_issue_value(
-            issue_row,
-            item,
-            "bbva_sourceservicen1",
-            fallback=item.source_service_n1 or raw_fields.get("bbva_sourceservicen1") or "",
-        ),
-        "bbva_startdatetime": _preferred_issue_value(
-            issue_row,
-            item,
-            "bbva_startdatetime",
-            fallback=item.start_datetime or raw_fields.get("bbva_startdatetime") or "",
-        ),
-        "bbva_closeddate": _preferred_issue_value(
-            issue_row,
-            item,
-            "bbva_closeddate",
-            fallback=item.closed_date or raw_fields.get("bbva_closeddate") or "",
-        ),
-        "lastModifiedDate": _preferred_issue_value(
-            issue_row,
-            item,
-            "lastModifiedDate",
-            fallback=item.last_modified or raw_fields.get("lastModifiedDate") or "",
-        ),
-        "targetDate": _preferred_issue_value(
-            issue_row,
-            item,
-            "targetDate",
-            fallback=item.target_date or raw_fields.get("targetDate") or "",
-        ),
-        "workItemId": _preferred_issue_value(
-            issue_row,
-            item,
-            "workItemId",
-            fallback=work_item_id,
-        ),
-    }
+def _present(series: pd.Series) -> pd.Series:
+    values = series.astype("object")
+    return values.notna() & ~values.eq("")
 
 
-def build_helix_raw_export_frame(
-    filtered_issues_df: pd.DataFrame,
-    *,
-    helix_items_by_merge_key: Mapping[str, HelixWorkItem],
-) -> Optional[pd.DataFrame]:
-    """Build a raw Helix sheet for the filtered scope.
-
-    Returns None when input is empty, mixed-source, or no matching Helix items are found.
-    """
+def _helix_scope_rows(filtered_issues_df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """Issue rows with a key when the scope is Helix only; `None` otherwise."""
     if filtered_issues_df is None or filtered_issues_df.empty:
         return None
     if "source_type" not in filtered_issues_df.columns or "key" not in filtered_issues_df.columns:
         return None
-
     src_types = (
         filtered_issues_df["source_type"]
         .fillna("")
@@ -177,47 +101,158 @@ def build_helix_raw_export_frame(
     src_types = [s for s in src_types if s]
     if not src_types or any(s != "helix" for s in src_types):
         return None
+    keys = filtered_issues_df["key"].fillna("").astype(str).str.strip().str.upper()
+    return filtered_issues_df.loc[keys.ne("")]
+
+
+def _issue_merge_keys(issues: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    keys = issues["key"].fillna("").astype(str).str.strip().str.upper()
+    if "source_id" in issues.columns:
+        sources = issues["source_id"].fillna("").astype(str).str.strip().str.lower()
+    else:
+        sources = pd.Series("", index=issues.index)
+    merge_keys = (sources + "::" + keys).where(sources.ne(""), keys)
+    return merge_keys, keys
+
+
+@dataclass(frozen=True)
+class HelixRawExport:
+    """
+    Raw Helix rows for a filtered scope, joined on merge key and built in batches.
+
+    `issues` keeps the matched issue rows in export order and `positions` their
+    row in `table` (the projected raw export sidecar), so only one batch of
+    cells is ever materialised as Python objects.
+    """
+
+    columns: list[str]
+    issues: pd.DataFrame
+    positions: np.ndarray
+    table: pa.Table
+    batch_rows: int
+
+    def __len__(self) -> int:
+        return int(self.positions.size)
+
+    def batches(self) -> Iterator[pd.DataFrame]:
+        front = {_ID_COLUMN, _URL_COLUMN, *_HELIX_FRONT_EXPORT_FIELDS}
+        raw_columns = [column for column in self.columns if column not in front]
+        item_columns = [item_front_column(field) for field in _HELIX_FRONT_EXPORT_FIELDS]
+        for start in range(0, len(self), self.batch_rows):
+            stop = start + self.batch_rows
+            issues = self.issues.iloc[start:stop].reset_index(drop=True)
+            raw = (
+                self.table.take(pa.array(self.positions[start:stop]))
+                .select([_URL_COLUMN, *item_columns, *raw_columns])
+                .to_pandas()
+            )
+            out = pd.DataFrame(index=raw.index)
+            out[_ID_COLUMN] = issues["key"].astype(str).str.strip()
+            for field in _HELIX_FRONT_EXPORT_FIELDS:
+                value = raw[item_front_column(field)].fillna("")
+                for candidate in reversed(_ISSUE_CANDIDATES.get(field, (field,))):
+                    if candidate in issues.columns:
+                        issue_value = issues[candidate].astype("object")
+                        value = issue_value.where(_present(issue_value), value)
+                out[field] = value.map(_coerce_export_scalar)
+            url = raw[_URL_COLUMN].fillna("").astype(str)
+            if "url" in issues.columns:
+                issue_url = issues["url"].fillna("").astype(str).str.strip()
+                url = url.where(url.ne(""), issue_url)
+            out[_URL_COLUMN] = url
+            for column in raw_columns:
+                out[column] = raw[column]
+            out.index = pd.RangeIndex(start, start + len(out))
+            yield out[self.columns]
+
+    def to_frame(self) -> pd.DataFrame:
+        parts = list(self.batches())
+        if not parts:
+            return pd.DataFrame(columns=self.columns)
+        return pd.concat(parts) if len(parts) > 1 else parts[0]
 
-    issue_columns = list(filtered_issues_df.columns)
-    raw_rows: list[dict[str, Any]] = []
-
-    for row_values in filtered_issues_df.itertuples(index=False, name=None):
-        issue_row = dict(zip(issue_columns, row_values))
-        source_id = str(issue_row.get("source_id") or "").strip().lower()
-        key = str(issue_row.get("key") or "").strip().upper()
-        if not key:
-            continue
-        merge_key = f"{source_id}::{key}" if source_id else key
-        item = helix_items_by_merge_key.get(merge_key) or helix_items_by_merge_key.get(key)
-        if item is None:
-            continue
-
-        raw_fields = item.raw_fields or {}
-        raw_row: dict[str, Any] = {
-            "ID de la Incidencia": str(issue_row.get("key") or item.id or "").strip()
-        }
-        raw_row.update(
-            {
-                column: _coerce_export_scalar(value)
-                for column, value in _front_export_fields(issue_row, item).items()
-            }
+    def write_xlsx(self, target: str | Path | BinaryIO) -> None:
+        write_xlsx_batches(
+            target,
+            sheet_name=HELIX_RAW_SHEET,
+            columns=self.columns,
+            batches=self.batches(),
+            hyperlink_columns=[(_ID_COLUMN, _URL_COLUMN)],
+            id_column_width=excel_id_column_width(_ID_COLUMN, self.issues["key"].tolist()),
         )
-        raw_row["__item_url__"] = str(item.url or issue_row.get("url") or "").strip()
-        for key, value in raw_fields.items():
-            normalized_key = str(key)
-            if normalized_key in raw_row:
-                continue
-            raw_row[normalized_key] = _coerce_export_scalar(value)
-        raw_rows.append(raw_row)
-
-    if not raw_rows:
+
+    def write_csv(self, target: str | Path | BinaryIO) -> None:
+        write_csv_batches(target, columns=self.columns, batches=self.batches())
+
+
+def _plan_export(
+    issues: pd.DataFrame, table: pa.Table, *, batch_rows: Optional[int]
+) -> Optional[HelixRawExport]:
+    if table.num_rows == 0:
+        return None
+    by_merge_key = pd.Series(
+        np.arange(table.num_rows, dtype=np.int64),
+        index=table["merge_key"].to_pandas().astype(str).to_numpy(),
+    )
+    by_merge_key = by_merge_key[~by_merge_key.index.duplicated(keep="last")]
+    merge_keys, keys = _issue_merge_keys(issues)
+    positions = by_merge_key.reindex(merge_keys.to_numpy())
+    fallback = by_merge_key.reindex(keys.to_numpy())
+    positions = positions.fillna(pd.Series(fallback.to_numpy(), index=positions.index))
+    matched = positions.notna().to_numpy()
+    if not matched.any():
         return None
 
-    raw_df = pd.DataFrame(raw_rows)
-    front = [
-        c
-        for c in ("ID de la Incidencia", *_HELIX_FRONT_EXPORT_FIELDS, "__item_url__")
-        if c in raw_df.columns
+    selected = positions.to_numpy()[matched].astype(np.int64)
+    # Raw columns in sidecar order, keeping only those with a value in the scope.
+    taken = table.take(pa.array(np.unique(selected)))
+    raw_columns = [
+        name
+        for name in table.column_names
+        if name not in _SIDECAR_ONLY_COLUMNS
+        and name not in _HELIX_FRONT_EXPORT_FIELDS
+        and taken[name].null_count < taken.num_rows
     ]
-    rest = [c for c in raw_df.columns if c not in front]
-    return raw_df[front + rest].copy()
+    return HelixRawExport(
+        columns=[_ID_COLUMN, *_HELIX_FRONT_EXPORT_FIELDS, _URL_COLUMN, *raw_columns],
+        issues=issues.loc[matched].reset_index(drop=True),
+        positions=selected,
+        table=table,
+        batch_rows=max(1, int(batch_rows or _default_batch_rows())),
+    )
+
+
+def open_helix_raw_export(
+    filtered_issues_df: pd.DataFrame, *, helix_path: str, batch_rows: Optional[int] = None
+) -> Optional[HelixRawExport]:
+    """Raw export for the filtered scope, read from the Helix raw export sidecar.
+
+    Returns None when input is empty, mixed-source, or no matching Helix items are found.
+    """
+    issues = _helix_scope_rows(filtered_issues_df)
+    if issues is None or issues.empty:
+        return None
+    merge_keys, keys = _issue_merge_keys(issues)
+    wanted = set(merge_keys.tolist()) | set(keys.tolist())
+    table = load_helix_export_table(helix_path, merge_keys=wanted)
+    return _plan_export(issues, table, batch_rows=batch_rows)
+
+
+def build_helix_raw_export_frame(
+    filtered_issues_df: pd.DataFrame,
+    *,
+    helix_items_by_merge_key: Mapping[str, HelixWorkItem],
+) -> Optional[pd.DataFrame]:
+    """Build a raw Helix sheet for the filtered scope.
+
+    Returns None when input is empty, mixed-source, or no matching Helix items are found.
+    """
+    issues = _helix_scope_rows(filtered_issues_df)
+    if issues is None or issues.empty:
+        return None
+    items = {id(item): item for item in helix_items_by_merge_key.values()}
+    frame = helix_export_frame(items.values())
+    export = _plan_export(
+        issues, pa.Table.from_pandas(frame, preserve_index=False), batch_rows=len(issues)
+    )
+    return None if export is None else export.to_frame()
@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import threading
 import time
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, List
+from typing import Any, Deque, Dict, Iterator, List, Set
 
 from bug_resolution_radar.common.utils import now_iso
 from bug_resolution_radar.config import Settings
+from bug_resolution_radar.services.ingest_profiler import IngestRunProfiler
 from bug_resolution_radar.services.ingest_runner import run_helix_ingest, run_jira_ingest
+from bug_resolution_radar.services.scope_prewarm import schedule_prewarm
 
 _CONNECTORS = {"jira", "helix"}
 
 
+def _coerce_int(value: Any, default: int) -> int:
+    try:
+        return int(str(value).strip())
+    except Exception:
+        return int(default)
+
+
+_EVENT_BUFFER_SIZE = max(32, _coerce_int(os.getenv("INGEST_PROGRESS_EVENT_BUFFER", "512"), 512))
+
+
 @dataclass
 class _IngestProgress:
     connector: str
@@ -33,18 +47,60 @@ class _IngestProgress:
     result: Dict[str, Any] | None = None
     started_monotonic: float = 0.0
     max_run_seconds: int = 0
+    profiler: IngestRunProfiler | None = None
+    # Incremental progress events, numbered per connector across runs so a
+    # stream can resume from the last `seq` it delivered.
+    event_seq: int = 0
+    events: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=_EVENT_BUFFER_SIZE))
+
+
+class IngestEventWaiter:
+    """
+    Wakes one asyncio consumer (an SSE stream) when a connector emits events.
+
+    Ingest workers run in plain threads, so the wake-up is handed over with
+    `call_soon_threadsafe`; the consumer never holds a thread while idle.
+    """
+
+    def __init__(self, connector: str) -> None:
+        self.connector = _normalize_connector(connector)
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        with _LOCK:
+            _WAITERS.setdefault(self.connector, set()).add(self)
+
+    def _wake(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # Loop already closed: the stream is gone and `close` will drop us.
+            return
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait until new events are emitted; False when `timeout` expires first."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=max(0.0, float(timeout)))
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+        return True
+
+    def close(self) -> None:
+        with _LOCK:
+            _WAITERS.get(self.connector, set()).discard(self)
+
+    def __enter__(self) -> "IngestEventWaiter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
 
 _LOCK = threading.Lock()
 _PROGRESS: Dict[str, _IngestProgress] = {}
 _RUNNING_WORKERS: Dict[str, tuple[int, threading.Thread]] = {}
-
-
-def _coerce_int(value: Any, default: int) -> int:
-    try:
-        return int(str(value).strip())
-    except Exception:
-        return int(default)
+_WAITERS: Dict[str, Set[IngestEventWaiter]] = {}
 
 
 def _resolve_max_run_seconds(settings: Settings, *, connector: str, total_sources: int) -> int:
@@ -108,9 +164,50 @@ def _snapshot(entry: _IngestProgress) -> Dict[str, Any]:
         "maxRunSeconds": int(entry.max_run_seconds or 0),
         "messages": [dict(msg) for msg in list(entry.messages or [])],
         "result": dict(entry.result or {}) if isinstance(entry.result, dict) else entry.result,
+        "telemetry": entry.profiler.live_snapshot() if entry.profiler is not None else None,
+        "lastSeq": int(entry.event_seq),
     }
 
 
+def _emit(entry: _IngestProgress, event_type: str, /, **data: Any) -> None:
+    # Caller holds `_LOCK`.
+    entry.event_seq = int(entry.event_seq) + 1
+    entry.events.append(
+        {
+            "seq": int(entry.event_seq),
+            "runId": int(entry.run_id),
+            "type": str(event_type),
+            "at": now_iso(),
+            **data,
+        }
+    )
+    for waiter in list(_WAITERS.get(entry.connector, ())):
+        waiter._wake()
+
+
+def _emit_run_finished(entry: _IngestProgress) -> None:
+    _emit(
+        entry,
+        "run_finished",
+        state=str(entry.state or "error"),
+        summary=str(entry.summary or ""),
+        finishedAt=str(entry.finished_at or ""),
+        totalSources=int(entry.total_sources),
+        completedSources=int(entry.completed_sources),
+        successCount=int(entry.success_count),
+    )
+
+
+def _record_profiler_event(
+    connector: str, *, run_id: int, kind: str, payload: Dict[str, Any]
+) -> None:
+    with _LOCK:
+        entry = _entry(connector)
+        if int(entry.run_id) != int(run_id) or entry.state != "running":
+            return
+        _emit(entry, kind, **payload)
+
+
 @contextmanager
 def _sync_settings_to_process_env(settings: Settings) -> Iterator[None]:
     previous: Dict[str, tuple[bool, str]] = {}
@@ -160,6 +257,21 @@ def _start_progress(
         entry.result = None
         entry.started_monotonic = float(started_monotonic)
         entry.max_run_seconds = max(0, int(max_run_seconds))
+        run_id = int(entry.run_id)
+        entry.profiler = IngestRunProfiler(
+            connector=key,
+            run_id=run_id,
+            listener=lambda kind, payload: _record_profiler_event(
+                key, run_id=run_id, kind=kind, payload=payload
+            ),
+        )
+        _emit(
+            entry,
+            "run_started",
+            startedAt=started_at_iso,
+            totalSources=int(entry.total_sources),
+            maxRunSeconds=int(entry.max_run_seconds),
+        )
         return int(entry.run_id), _snapshot(entry)
 
 
@@ -215,6 +327,8 @@ def _recover_stuck_run_if_needed(connector: str) -> bool:
             "total_sources": int(entry.total_sources),
             "messages": [dict(msg) for msg in list(entry.messages or [])],
         }
+        _emit(entry, "error", message=detail)
+        _emit_run_finished(entry)
         _clear_running_worker(key, run_id=int(entry.run_id))
         return True
 
@@ -240,6 +354,15 @@ def _append_progress(
         if ok:
             entry.success_count = int(entry.success_count) + 1
         entry.messages.append({"ok": bool(ok), "message": str(message or "").strip()})
+        _emit(
+            entry,
+            "source_finished",
+            ok=bool(ok),
+            message=str(message or "").strip(),
+            completedSources=int(entry.completed_sources),
+            totalSources=int(entry.total_sources),
+            successCount=int(entry.success_count),
+        )
 
 
 def _mark_source_started(
@@ -261,16 +384,20 @@ def _mark_source_started(
         entry.total_sources = max(0, int(total_sources))
         entry.current_source_label = label
         entry.current_source_index = max(0, int(source_index))
+        message = ""
         if label:
-            entry.messages.append(
-                {
-                    "ok": True,
-                    "message": (
-                        f"Iniciando {label} "
-                        f"({max(1, int(source_index))}/{max(1, int(total_sources))})."
-                    ),
-                }
+            message = (
+                f"Iniciando {label} ({max(1, int(source_index))}/{max(1, int(total_sources))})."
             )
+            entry.messages.append({"ok": True, "message": message})
+        _emit(
+            entry,
+            "source_started",
+            sourceLabel=label,
+            sourceIndex=int(entry.current_source_index),
+            totalSources=int(entry.total_sources),
+            message=message,
+        )
 
 
 def _finish_progress(connector: str, *, run_id: int, result: Dict[str, Any]) -> None:
@@ -301,6 +428,7 @@ def _finish_progress(connector: str, *, run_id: int, result: Dict[str, Any]) ->
                 for item in list(normalized_result.get("messages") or [])
             ]
         entry.result = normalized_result
+        _emit_run_finished(entry)
         _clear_running_worker(key, run_id=run_id)
 
 
@@ -323,9 +451,35 @@ def _fail_progress(connector: str, *, run_id: int, detail: str) -> None:
             "total_sources": int(entry.total_sources),
             "messages": [dict(msg) for msg in list(entry.messages or [])],
         }
+        _emit(entry, "error", message=str(detail or "").strip())
+        _emit_run_finished(entry)
         _clear_running_worker(key, run_id=run_id)
 
 
+def _persist_run_profile(profiler: IngestRunProfiler | None, result: Dict[str, Any]) -> None:
+    if profiler is None:
+        return
+    try:
+        record = profiler.build_record(
+            state=str(result.get("state") or "error"),
+            summary=str(result.get("summary") or ""),
+            total_sources=int(result.get("total_sources") or 0),
+            success_count=int(result.get("success_count") or 0),
+        )
+        profiler.persist(record)
+    except Exception:
+        # Profiling is best-effort; it must never turn a finished ingest into a failure.
+        return
+
+
+def _run_result(connector: str, *, run_id: int) -> Dict[str, Any]:
+    with _LOCK:
+        entry = _entry(connector)
+        if int(entry.run_id) != int(run_id) or not isinstance(entry.result, dict):
+            return {}
+        return dict(entry.result)
+
+
 def get_ingest_progress(connector: str) -> Dict[str, Any]:
     key = _normalize_connector(connector)
     _recover_stuck_run_if_needed(key)
@@ -333,6 +487,31 @@ def get_ingest_progress(connector: str) -> Dict[str, Any]:
         return _snapshot(_entry(key))
 
 
+def ingest_events_since(connector: str, after_seq: int | None = None) -> Dict[str, Any]:
+    """
+    Progress events newer than `after_seq`, for streaming consumers.
+
+    When the consumer cannot resume (first connection, `after_seq` already
+    evicted from the buffer, or numbered by an earlier process) `snapshot`
+    carries the full progress payload instead and `events` is empty.
+    """
+    key = _normalize_connector(connector)
+    _recover_stuck_run_if_needed(key)
+    with _LOCK:
+        entry = _entry(key)
+        last_seq = int(entry.event_seq)
+        oldest_seq = int(entry.events[0]["seq"]) if entry.events else last_seq + 1
+        after = -1 if after_seq is None else int(after_seq)
+        if oldest_seq - 1 <= after <= last_seq:
+            return {
+                "connector": key,
+                "lastSeq": last_seq,
+                "events": [dict(event) for event in entry.events if int(event["seq"]) > after],
+                "snapshot": None,
+            }
+        return {"connector": key, "lastSeq": last_seq, "events": [], "snapshot": _snapshot(entry)}
+
+
 def start_ingest_job(
     connector: str,
     *,
@@ -358,6 +537,8 @@ def start_ingest_job(
 
     run_id, initial_snapshot = started
     settings_snapshot = settings.model_copy(deep=True)
+    with _LOCK:
+        profiler = _entry(key).profiler
 
     def _worker() -> None:
         try:
@@ -366,6 +547,7 @@ def start_ingest_job(
                     result = run_jira_ingest(
                         settings_snapshot,
                         selected_sources=sources,
+                        profiler=profiler,
                         on_source_start=lambda label, index, total: _mark_source_started(
                             key,
                             run_id=run_id,
@@ -386,6 +568,7 @@ def start_ingest_job(
                     result = run_helix_ingest(
                         settings_snapshot,
                         selected_sources=sources,
+                        profiler=profiler,
                         on_source_start=lambda label, index, total: _mark_source_started(
                             key,
                             run_id=run_id,
@@ -403,12 +586,16 @@ def start_ingest_job(
                         ),
                     )
             _finish_progress(key, run_id=run_id, result=result)
+            if str(result.get("state") or "") in {"success", "partial"}:
+                # Warm the most used dashboard scopes before users open them.
+                schedule_prewarm(settings_snapshot)
         except Exception as exc:
             _fail_progress(
                 key,
                 run_id=run_id,
                 detail=f"Error inesperado de orquestación {key.upper()}: {type(exc).__name__}: {exc}",
             )
+        _persist_run_profile(profiler, _run_result(key, run_id=run_id))
 
     worker_thread = threading.Thread(target=_worker, name=f"{key}-ingest-worker", daemon=True)
     with _LOCK:
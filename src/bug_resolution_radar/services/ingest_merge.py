@@ -0,0 +1,132 @@
+"""Run-scoped merge index for ingest upserts with change tracking."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Set, TypeVar
+
+from bug_resolution_radar.models.schema import NormalizedIssue
+from bug_resolution_radar.models.schema_helix import HelixWorkItem
+
+T = TypeVar("T")
+
+
+def issue_merge_key(issue: NormalizedIssue) -> str:
+    sid = str(issue.source_id or "").strip().lower()
+    key = str(issue.key or "").strip().upper()
+    return f"{sid}::{key}" if sid else key
+
+
+def helix_merge_key(item: HelixWorkItem) -> str:
+    sid = str(item.source_id or "").strip().lower()
+    item_id = str(item.id or "").strip().upper()
+    return f"{sid}::{item_id}" if sid else item_id
+
+
+@dataclass
+class MergeChangeSet:
+    """Merge keys touched by one or more upserts, split by outcome."""
+
+    inserted: Set[str] = field(default_factory=set)
+    updated: Set[str] = field(default_factory=set)
+    unchanged: Set[str] = field(default_factory=set)
+
+    @property
+    def changed(self) -> Set[str]:
+        return self.inserted | self.updated
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.inserted and not self.updated
+
+    def absorb(self, other: "MergeChangeSet") -> None:
+        """Fold a later change set in; a key inserted earlier in the run stays inserted."""
+        for key in other.inserted:
+            self.unchanged.discard(key)
+            self.inserted.add(key)
+        for key in other.updated:
+            self.unchanged.discard(key)
+            if key not in self.inserted:
+                self.updated.add(key)
+        for key in other.unchanged:
+            if key not in self.inserted and key not in self.updated:
+                self.unchanged.add(key)
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "inserted": len(self.inserted),
+            "updated": len(self.updated),
+            "unchanged": len(self.unchanged),
+        }
+
+
+class MergeIndex(Generic[T]):
+    """
+    Merge key -> row position over a document's row list, kept for a whole run.
+
+    Building the index costs one pass over the existing rows; each upsert then
+    costs O(incoming). `rows` is updated in place, so the document can keep
+    pointing at it and no per-source dict/list rebuild is needed. Duplicate keys
+    in the initial rows collapse like a dict would: first position, last value.
+    """
+
+    def __init__(self, rows: Iterable[T], key_fn: Callable[[T], str]) -> None:
+        self._key_fn = key_fn
+        self._positions: Dict[str, int] = {}
+        self.rows: List[T] = []
+        for row in rows:
+            key = key_fn(row)
+            pos = self._positions.get(key)
+            if pos is None:
+                self._positions[key] = len(self.rows)
+                self.rows.append(row)
+            else:
+                self.rows[pos] = row
+        self.changes = MergeChangeSet()
+        self._undrained: Dict[str, Optional[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def get(self, key: str) -> T | None:
+        pos = self._positions.get(key)
+        return self.rows[pos] if pos is not None else None
+
+    def upsert(self, incoming: Iterable[T]) -> MergeChangeSet:
+        """Insert or replace rows by merge key; returns this call's change set."""
+        delta = MergeChangeSet()
+        for row in incoming:
+            key = self._key_fn(row)
+            pos = self._positions.get(key)
+            if pos is None:
+                self._positions[key] = len(self.rows)
+                self.rows.append(row)
+                self._undrained.setdefault(key, None)
+                delta.unchanged.discard(key)
+                delta.updated.discard(key)
+                delta.inserted.add(key)
+                continue
+            if self.rows[pos] == row:
+                if key not in delta.inserted and key not in delta.updated:
+                    delta.unchanged.add(key)
+                continue
+            self._undrained.setdefault(key, self.rows[pos])
+            self.rows[pos] = row
+            if key not in delta.inserted:
+                delta.unchanged.discard(key)
+                delta.updated.add(key)
+        self.changes.absorb(delta)
+        return delta
+
+    def drain_changed(self) -> Dict[str, Optional[T]]:
+        """
+        Keys inserted/updated since the previous drain, e.g. since the last checkpoint.
+
+        Each key maps to its row as it was before the first change of the period
+        (`None` for inserts), so callers can both patch sidecars and diff fields.
+        """
+        drained, self._undrained = self._undrained, {}
+        return drained
@@ -7,13 +7,17 @@ import math
 import os
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from ..common.utils import now_iso
 
 _PROFILE_WRITE_LOCK = threading.Lock()
+_MAX_RECENT_EVENTS = 50
+
+ProfilerListener = Callable[[str, Dict[str, Any]], None]
 
 
 def _coerce_bool(value: Any, *, default: bool) -> bool:
@@ -83,6 +87,14 @@ def _rss_kib() -> float:
     return raw
 
 
+def response_bytes(response: Any) -> int:
+    """Body size of an HTTP response, falling back to the decoded text length."""
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    return len(str(getattr(response, "text", "") or "").encode("utf-8"))
+
+
 def _phase_key(phase: str, source_id: str) -> str:
     return f"{str(phase or '').strip()}::{str(source_id or '').strip()}"
 
@@ -98,6 +110,28 @@ class PhaseSample:
     rss_delta_kib: float
 
 
+@dataclass(frozen=True)
+class PageSample:
+    source_id: str
+    source_label: str
+    page: int
+    status: int
+    elapsed_ms: float
+    bytes: int
+    rows: int
+    map_ms: float
+    chunk_size: int
+    read_timeout_s: float
+
+
+@dataclass(frozen=True)
+class AdaptationEvent:
+    kind: str
+    source_id: str
+    at_ms: float
+    detail: Dict[str, Any]
+
+
 class IngestRunProfiler:
     """Collect per-phase measurements and emit persisted run summaries."""
 
@@ -108,6 +142,7 @@ class IngestRunProfiler:
         run_id: int,
         enabled: Optional[bool] = None,
         output_path: Optional[str] = None,
+        listener: Optional[ProfilerListener] = None,
     ) -> None:
         default_enabled = _coerce_bool(os.getenv("INGEST_PROFILE_ENABLED"), default=True)
         self.enabled = default_enabled if enabled is None else bool(enabled)
@@ -116,12 +151,23 @@ class IngestRunProfiler:
         self.output_path = str(output_path or "").strip() or str(
             os.getenv("INGEST_PROFILE_JSONL_PATH", "data/observability/ingest_profiles.jsonl")
         )
+        self.listener = listener
+        self._lock = threading.Lock()
         self._samples: List[PhaseSample] = []
+        self._pages: List[PageSample] = []
+        self._events: Deque[AdaptationEvent] = deque(maxlen=_MAX_RECENT_EVENTS)
+        self._event_counts: Dict[str, int] = {}
         self._counters: Dict[str, int] = {}
+        self._current_phase = ""
         self._run_started_at = now_iso()
         self._run_start_wall = time.perf_counter()
         self._run_start_cpu = time.process_time()
 
+    @classmethod
+    def disabled(cls, connector: str = "") -> "IngestRunProfiler":
+        """No-op profiler so instrumented code paths never branch on `None`."""
+        return cls(connector=connector, run_id=0, enabled=False)
+
     class _PhaseScope:
         def __init__(
             self,
@@ -147,6 +193,8 @@ class IngestRunProfiler:
             self._start_wall = time.perf_counter()
             self._start_cpu = time.process_time()
             self._start_rss = _rss_kib()
+            with self._profiler._lock:
+                self._profiler._current_phase = self._phase
             return None
 
         def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
@@ -155,17 +203,19 @@ class IngestRunProfiler:
             elapsed_ms = max(0.0, (time.perf_counter() - self._start_wall) * 1000.0)
             cpu_ms = max(0.0, (time.process_time() - self._start_cpu) * 1000.0)
             rss_delta_kib = max(0.0, _rss_kib() - self._start_rss)
-            self._profiler._samples.append(
-                PhaseSample(
-                    phase=self._phase,
-                    source_id=self._source_id,
-                    source_label=self._source_label,
-                    attempt=self._attempt,
-                    elapsed_ms=elapsed_ms,
-                    cpu_ms=cpu_ms,
-                    rss_delta_kib=rss_delta_kib,
-                )
+            sample = PhaseSample(
+                phase=self._phase,
+                source_id=self._source_id,
+                source_label=self._source_label,
+                attempt=self._attempt,
+                elapsed_ms=elapsed_ms,
+                cpu_ms=cpu_ms,
+                rss_delta_kib=rss_delta_kib,
             )
+            with self._profiler._lock:
+                self._profiler._samples.append(sample)
+                if self._profiler._current_phase == self._phase:
+                    self._profiler._current_phase = ""
             return None
 
     def phase(
@@ -188,7 +238,97 @@ class IngestRunProfiler:
         name = str(counter_name or "").strip()
         if not name:
             return
-        self._counters[name] = int(self._counters.get(name, 0) or 0) + int(delta or 0)
+        with self._lock:
+            self._counters[name] = int(self._counters.get(name, 0) or 0) + int(delta or 0)
+
+    def record_page(
+        self,
+        *,
+        source_id: str,
+        source_label: str = "",
+        page: int,
+        status: int,
+        elapsed_ms: float,
+        bytes_received: int = 0,
+        rows: int = 0,
+        map_ms: float = 0.0,
+        chunk_size: int = 0,
+        read_timeout_s: float = 0.0,
+    ) -> None:
+        """Record one paged request: latency, payload size, rows and mapping cost."""
+        if not self.enabled:
+            return
+        sample = PageSample(
+            source_id=str(source_id or "").strip(),
+            source_label=str(source_label or "").strip(),
+            page=int(page or 0),
+            status=int(status or 0),
+            elapsed_ms=max(0.0, float(elapsed_ms or 0.0)),
+            bytes=max(0, int(bytes_received or 0)),
+            rows=max(0, int(rows or 0)),
+            map_ms=max(0.0, float(map_ms or 0.0)),
+            chunk_size=max(0, int(chunk_size or 0)),
+            read_timeout_s=max(0.0, float(read_timeout_s or 0.0)),
+        )
+        with self._lock:
+            self._pages.append(sample)
+            totals = self._page_totals() if self.listener is not None else {}
+        self._notify(
+            "page",
+            {
+                "sourceId": sample.source_id,
+                "sourceLabel": sample.source_label,
+                "page": sample.page,
+                "status": sample.status,
+                "elapsedMs": round(sample.elapsed_ms, 3),
+                "bytes": sample.bytes,
+                "rows": sample.rows,
+                "chunkSize": sample.chunk_size,
+                "readTimeoutSeconds": sample.read_timeout_s,
+                "totals": totals,
+            },
+        )
+
+    def record_event(self, kind: str, *, source_id: str = "", **detail: Any) -> None:
+        """Record a runtime adaptation (chunk-size cut, read-timeout raise, retry...)."""
+        if not self.enabled:
+            return
+        name = str(kind or "").strip()
+        if not name:
+            return
+        event = AdaptationEvent(
+            kind=name,
+            source_id=str(source_id or "").strip(),
+            at_ms=max(0.0, (time.perf_counter() - self._run_start_wall) * 1000.0),
+            detail=dict(detail),
+        )
+        with self._lock:
+            self._events.append(event)
+            self._event_counts[name] = int(self._event_counts.get(name, 0) or 0) + 1
+        self._notify(
+            "adaptation",
+            {"kind": name, "sourceId": event.source_id, "atMs": round(event.at_ms, 3), **detail},
+        )
+
+    def _page_totals(self) -> Dict[str, Any]:
+        # Caller holds `_lock`; same figures `live_snapshot` reports for the run so far.
+        latencies = [p.elapsed_ms for p in self._pages]
+        return {
+            "pages": len(self._pages),
+            "rows": sum(p.rows for p in self._pages),
+            "bytes": sum(p.bytes for p in self._pages),
+            "pageLatencyP50Ms": round(_percentile(latencies, 0.50), 3),
+            "pageLatencyP95Ms": round(_percentile(latencies, 0.95), 3),
+        }
+
+    def _notify(self, kind: str, payload: Dict[str, Any]) -> None:
+        if self.listener is None:
+            return
+        try:
+            self.listener(kind, payload)
+        except Exception:
+            # Progress listeners are observers; a failing one must not break the ingest.
+            return
 
     def _phase_stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
         buckets: Dict[str, List[PhaseSample]] = {}
@@ -224,6 +364,64 @@ class IngestRunProfiler:
             item["samples"] += 1.0
         return totals
 
+    def _page_stats(self) -> Dict[str, Dict[str, Any]]:
+        buckets: Dict[str, List[PageSample]] = {}
+        for sample in self._pages:
+            buckets.setdefault(sample.source_id, []).append(sample)
+
+        out: Dict[str, Dict[str, Any]] = {}
+        for source_id, pages in buckets.items():
+            out[source_id] = {
+                "source_label": next((p.source_label for p in pages if p.source_label), ""),
+                "pages": len(pages),
+                "errors": sum(1 for p in pages if p.status >= 400),
+                "rows_total": sum(p.rows for p in pages),
+                "bytes_total": sum(p.bytes for p in pages),
+                "latency_ms": _summary([p.elapsed_ms for p in pages]),
+                "map_ms": _summary([p.map_ms for p in pages]),
+                "bytes": _summary([float(p.bytes) for p in pages]),
+                "rows": _summary([float(p.rows) for p in pages]),
+            }
+        return out
+
+    def live_snapshot(self) -> Dict[str, Any]:
+        """Compact, JSON-ready view of the running profile for progress polling."""
+        with self._lock:
+            pages = list(self._pages)
+            events = list(self._events)
+            event_counts = dict(self._event_counts)
+            current_phase = self._current_phase
+        latencies = [p.elapsed_ms for p in pages]
+        last = pages[-1] if pages else None
+        return {
+            "enabled": bool(self.enabled),
+            "currentPhase": current_phase,
+            "pages": len(pages),
+            "rows": sum(p.rows for p in pages),
+            "bytes": sum(p.bytes for p in pages),
+            "pageLatencyP50Ms": round(_percentile(latencies, 0.50), 3),
+            "pageLatencyP95Ms": round(_percentile(latencies, 0.95), 3),
+            "lastPage": (
+                {
+                    "sourceId": last.source_id,
+                    "page": last.page,
+                    "status": last.status,
+                    "elapsedMs": round(last.elapsed_ms, 3),
+                    "bytes": last.bytes,
+                    "rows": last.rows,
+                    "chunkSize": last.chunk_size,
+                    "readTimeoutSeconds": last.read_timeout_s,
+                }
+                if last is not None
+                else None
+            ),
+            "adaptations": event_counts,
+            "recentEvents": [
+                {"kind": e.kind, "sourceId": e.source_id, "atMs": round(e.at_ms, 3), **e.detail}
+                for e in events[-10:]
+            ],
+        }
+
     def build_record(
         self,
         *,
@@ -234,8 +432,19 @@ class IngestRunProfiler:
     ) -> Dict[str, Any]:
         run_elapsed_ms = max(0.0, (time.perf_counter() - self._run_start_wall) * 1000.0)
         run_cpu_ms = max(0.0, (time.process_time() - self._run_start_cpu) * 1000.0)
+        with self._lock:
+            phase_stats = self._phase_stats()
+            source_phase_totals = self._source_stats()
+            page_stats = self._page_stats()
+            events = [
+                {"kind": e.kind, "source_id": e.source_id, "at_ms": e.at_ms, **e.detail}
+                for e in self._events
+            ]
+            event_counts = dict(self._event_counts)
+            counters = {k: int(v or 0) for k, v in self._counters.items()}
+            sample_count = len(self._samples)
         return {
-            "schema_version": "1.0",
+            "schema_version": "1.1",
             "connector": self.connector,
             "run_id": self.run_id,
             "state": str(state or "unknown").strip().lower(),
@@ -246,10 +455,13 @@ class IngestRunProfiler:
             "success_count": int(success_count or 0),
             "run_elapsed_ms": run_elapsed_ms,
             "run_cpu_ms": run_cpu_ms,
-            "phase_stats": self._phase_stats(),
-            "source_phase_totals": self._source_stats(),
-            "counters": {k: int(v or 0) for k, v in self._counters.items()},
-            "sample_count": len(self._samples),
+            "phase_stats": phase_stats,
+            "source_phase_totals": source_phase_totals,
+            "page_stats": page_stats,
+            "adaptation_counts": event_counts,
+            "adaptation_events": events,
+            "counters": counters,
+            "sample_count": sample_count,
         }
 
     def persist(self, record: Dict[str, Any]) -> None:
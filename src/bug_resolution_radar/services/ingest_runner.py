@@ -7,12 +7,20 @@ from typing import Any, Callable, Dict, List
 
 from bug_resolution_radar.common.utils import now_iso
 from bug_resolution_radar.config import Settings
+from bug_resolution_radar.ingest.connection_context import IngestConnectionContext
 from bug_resolution_radar.ingest.helix_ingest import ingest_helix
 from bug_resolution_radar.ingest.jira_ingest import ingest_jira
 from bug_resolution_radar.models.schema import IssuesDocument, NormalizedIssue
 from bug_resolution_radar.models.schema_helix import HelixDocument, HelixWorkItem
 from bug_resolution_radar.repositories.helix_repo import HelixRepo
+from bug_resolution_radar.repositories.issue_changelog import append_issue_changes
 from bug_resolution_radar.repositories.issues_store import load_issues_doc, save_issues_doc
+from bug_resolution_radar.services.ingest_merge import (
+    MergeIndex,
+    helix_merge_key,
+    issue_merge_key,
+)
+from bug_resolution_radar.services.ingest_profiler import IngestRunProfiler
 
 SourceProgressCallback = Callable[[bool, str, int, int], None]
 SourceStartCallback = Callable[[str, int, int], None]
@@ -23,12 +31,6 @@ def _get_helix_path(settings: Settings) -> str:
     return path or "data/helix.json"
 
 
-def _issue_merge_key(issue: NormalizedIssue) -> str:
-    sid = str(issue.source_id or "").strip().lower()
-    key = str(issue.key or "").strip().upper()
-    return f"{sid}::{key}" if sid else key
-
-
 def _source_progress_label(source: Dict[str, str]) -> str:
     alias = str(source.get("alias", "")).strip()
     country = str(source.get("country", "")).strip()
@@ -37,26 +39,30 @@ def _source_progress_label(source: Dict[str, str]) -> str:
     return alias or country or str(source.get("source_id", "")).strip() or "Fuente"
 
 
-def _merge_issues(doc: IssuesDocument, incoming: List[NormalizedIssue]) -> IssuesDocument:
-    merged: Dict[str, NormalizedIssue] = {_issue_merge_key(issue): issue for issue in doc.issues}
-    for issue in incoming:
-        merged[_issue_merge_key(issue)] = issue
-    doc.issues = list(merged.values())
-    return doc
-
-
-def _helix_merge_key(item: HelixWorkItem) -> str:
-    sid = str(item.source_id or "").strip().lower()
-    item_id = str(item.id or "").strip().upper()
-    return f"{sid}::{item_id}" if sid else item_id
+def _finish_connections(
+    prof: IngestRunProfiler, connections: IngestConnectionContext, *, owned: bool
+) -> None:
+    for name, value in connections.stats().items():
+        if value:
+            prof.increment(f"connection_{name}", int(value))
+    if owned:
+        connections.close()
 
 
-def _merge_helix_items(doc: HelixDocument, incoming: List[HelixWorkItem]) -> HelixDocument:
-    merged: Dict[str, HelixWorkItem] = {_helix_merge_key(item): item for item in doc.items}
-    for item in incoming:
-        merged[_helix_merge_key(item)] = item
-    doc.items = list(merged.values())
-    return doc
+def _save_issues_checkpoint(
+    settings: Settings,
+    doc: IssuesDocument,
+    index: MergeIndex[NormalizedIssue],
+    baseline: List[NormalizedIssue],
+) -> None:
+    """Persist the issues doc and append the drained field changes to the change log."""
+    pending = index.drain_changed()
+    save_issues_doc(settings.DATA_PATH, doc, changed_keys=pending)
+    try:
+        append_issue_changes(settings.DATA_PATH, pending, index.get, all_rows=baseline)
+    except Exception:
+        # The change log feeds trend baselines; it must never fail an ingest.
+        pass
 
 
 def _is_closed_status(value: str) -> bool:
@@ -107,55 +113,89 @@ def run_jira_ingest(
     on_source_result: SourceProgressCallback | None = None,
     on_source_start: SourceStartCallback | None = None,
     persist_each_source: bool = True,
+    profiler: IngestRunProfiler | None = None,
+    connections: IngestConnectionContext | None = None,
 ) -> dict[str, Any]:
-    work_doc = load_issues_doc(settings.DATA_PATH)
-    messages: list[dict[str, Any]] = []
-    success_count = 0
-    checkpoints_saved = 0
-    sources = list(selected_sources or [])
-    total_sources = len(sources)
-    completed_sources = 0
-    for position, src in enumerate(sources, start=1):
-        if on_source_start is not None:
-            on_source_start(_source_progress_label(src), int(position), int(total_sources))
-        ok, msg, new_doc = ingest_jira(
-            settings=settings, dry_run=False, existing_doc=work_doc, source=src
-        )
-        source_ok = bool(ok)
-        source_message = str(msg or "").strip()
-        if source_ok and new_doc is not None:
-            work_doc = new_doc
-            if persist_each_source:
-                save_issues_doc(settings.DATA_PATH, work_doc)
-                checkpoints_saved += 1
-            success_count += 1
-        elif source_ok and new_doc is None:
-            source_ok = False
-            if not source_message:
-                source_message = (
-                    "Ingesta Jira sin documento resultado; no se pudo confirmar persistencia."
+    prof = profiler if profiler is not None else IngestRunProfiler.disabled("jira")
+    conns = connections if connections is not None else IngestConnectionContext()
+    try:
+        with prof.phase(phase="load_cached_docs"):
+            work_doc = load_issues_doc(settings.DATA_PATH)
+            # One merge index for the whole run: each source upserts in O(its issues).
+            issue_index = MergeIndex(work_doc.issues, issue_merge_key)
+            work_doc.issues = issue_index.rows
+            issue_baseline = list(issue_index.rows)
+        messages: list[dict[str, Any]] = []
+        success_count = 0
+        checkpoints_saved = 0
+        sources = list(selected_sources or [])
+        total_sources = len(sources)
+        completed_sources = 0
+        for position, src in enumerate(sources, start=1):
+            if on_source_start is not None:
+                on_source_start(_source_progress_label(src), int(position), int(total_sources))
+            source_id = str(src.get("source_id", "")).strip()
+            source_label = _source_progress_label(src)
+            with prof.phase(phase="source_ingest", source_id=source_id, source_label=source_label):
+                ok, msg, new_doc = ingest_jira(
+                    settings=settings,
+                    dry_run=False,
+                    existing_doc=work_doc,
+                    source=src,
+                    profiler=prof,
+                    connections=conns,
+                    merge_index=issue_index,
+                )
+            source_ok = bool(ok)
+            source_message = str(msg or "").strip()
+            if source_ok and new_doc is not None:
+                if new_doc.issues is not issue_index.rows:
+                    # The connector merged into its own copy; fold it back into the run index.
+                    issue_index.upsert(new_doc.issues)
+                    new_doc.issues = issue_index.rows
+                work_doc = new_doc
+                if persist_each_source:
+                    with prof.phase(
+                        phase="persist_results", source_id=source_id, source_label=source_label
+                    ):
+                        _save_issues_checkpoint(settings, work_doc, issue_index, issue_baseline)
+                    checkpoints_saved += 1
+                success_count += 1
+            elif source_ok and new_doc is None:
+                source_ok = False
+                if not source_message:
+                    source_message = (
+                        "Ingesta Jira sin documento resultado; no se pudo confirmar persistencia."
+                    )
+            prof.increment("sources_ok" if source_ok else "sources_failed")
+            messages.append({"ok": bool(source_ok), "message": source_message})
+            completed_sources += 1
+            if on_source_result is not None:
+                on_source_result(
+                    bool(source_ok),
+                    source_message,
+                    int(completed_sources),
+                    int(total_sources),
                 )
-        messages.append({"ok": bool(source_ok), "message": source_message})
-        completed_sources += 1
-        if on_source_result is not None:
-            on_source_result(
-                bool(source_ok),
-                source_message,
-                int(completed_sources),
-                int(total_sources),
-            )
-
-    if success_count > 0 and (not persist_each_source or checkpoints_saved <= 0):
-        save_issues_doc(settings.DATA_PATH, work_doc)
+
+        if success_count > 0 and (not persist_each_source or checkpoints_saved <= 0):
+            with prof.phase(phase="persist_results"):
+                _save_issues_checkpoint(settings, work_doc, issue_index, issue_baseline)
+    finally:
+        # Also on failure: close run-owned pools and report their stats.
+        _finish_connections(prof, conns, owned=connections is None)
 
     return {
-        "state": "success"
-        if success_count == total_sources and total_sources > 0
-        else ("partial" if success_count > 0 else "error"),
+        "state": (
+            "success"
+            if success_count == total_sources and total_sources > 0
+            else ("partial" if success_count > 0 else "error")
+        ),
         "summary": f"Reingesta Jira finalizada: {success_count}/{total_sources} fuentes OK.",
         "success_count": int(success_count),
         "total_sources": int(total_sources),
         "messages": messages,
+        "changes": {"issues": issue_index.changes.counts()},
     }
 
 
@@ -166,85 +206,123 @@ def run_helix_ingest(
     on_source_result: SourceProgressCallback | None = None,
     on_source_start: SourceStartCallback | None = None,
     persist_each_source: bool = True,
+    profiler: IngestRunProfiler | None = None,
+    connections: IngestConnectionContext | None = None,
 ) -> dict[str, Any]:
-    helix_path = _get_helix_path(settings)
-    helix_repo = HelixRepo(Path(helix_path))
-    merged_helix = helix_repo.load() or HelixDocument.empty()
-    issues_doc = load_issues_doc(settings.DATA_PATH)
-    helix_browser = (
-        str(getattr(settings, "HELIX_BROWSER", "chrome") or "chrome").strip() or "chrome"
-    )
-    helix_proxy = str(getattr(settings, "HELIX_PROXY", "") or "").strip()
-    helix_ssl_verify = str(getattr(settings, "HELIX_SSL_VERIFY", "") or "").strip()
-
-    messages: list[dict[str, Any]] = []
-    success_count = 0
-    has_partial_updates = False
-    checkpoints_saved = 0
-    sources = list(selected_sources or [])
-    total_sources = len(sources)
-    completed_sources = 0
-    for position, src in enumerate(sources, start=1):
-        if on_source_start is not None:
-            on_source_start(_source_progress_label(src), int(position), int(total_sources))
-        ok, msg, new_helix_doc = ingest_helix(
-            browser=helix_browser,
-            country=str(src.get("country", "")).strip(),
-            source_alias=str(src.get("alias", "")).strip(),
-            source_id=str(src.get("source_id", "")).strip(),
-            proxy=helix_proxy,
-            ssl_verify=helix_ssl_verify,
-            service_origin_buug=src.get("service_origin_buug"),
-            service_origin_n1=src.get("service_origin_n1"),
-            service_origin_n2=src.get("service_origin_n2"),
-            dry_run=False,
-            existing_doc=HelixDocument.empty(),
-            cache_doc=merged_helix,
+    prof = profiler if profiler is not None else IngestRunProfiler.disabled("helix")
+    conns = connections if connections is not None else IngestConnectionContext()
+    try:
+        helix_path = _get_helix_path(settings)
+        helix_repo = HelixRepo(Path(helix_path))
+        with prof.phase(phase="load_cached_docs"):
+            merged_helix = helix_repo.load() or HelixDocument.empty()
+            issues_doc = load_issues_doc(settings.DATA_PATH)
+            helix_index = MergeIndex(merged_helix.items, helix_merge_key)
+            merged_helix.items = helix_index.rows
+            issue_index = MergeIndex(issues_doc.issues, issue_merge_key)
+            issues_doc.issues = issue_index.rows
+            issue_baseline = list(issue_index.rows)
+        helix_browser = (
+            str(getattr(settings, "HELIX_BROWSER", "chrome") or "chrome").strip() or "chrome"
         )
-        source_ok = bool(ok)
-        source_message = str(msg or "").strip()
-        checkpoint_required = False
-        if new_helix_doc is not None:
-            checkpoint_required = True
-            merged_helix.ingested_at = new_helix_doc.ingested_at
-            merged_helix.helix_base_url = new_helix_doc.helix_base_url
-            merged_helix.query = "multi-source"
-        if new_helix_doc is not None and new_helix_doc.items:
-            has_partial_updates = True
-            merged_helix = _merge_helix_items(merged_helix, new_helix_doc.items)
-            issues_doc = _merge_issues(
-                issues_doc, [_helix_item_to_issue(item) for item in new_helix_doc.items]
-            )
-        if persist_each_source and checkpoint_required:
+        helix_proxy = str(getattr(settings, "HELIX_PROXY", "") or "").strip()
+        helix_ssl_verify = str(getattr(settings, "HELIX_SSL_VERIFY", "") or "").strip()
+
+        messages: list[dict[str, Any]] = []
+        success_count = 0
+        has_partial_updates = False
+        checkpoints_saved = 0
+        sources = list(selected_sources or [])
+        total_sources = len(sources)
+        completed_sources = 0
+        for position, src in enumerate(sources, start=1):
+            if on_source_start is not None:
+                on_source_start(_source_progress_label(src), int(position), int(total_sources))
+            source_id = str(src.get("source_id", "")).strip()
+            source_label = _source_progress_label(src)
+            with prof.phase(phase="source_ingest", source_id=source_id, source_label=source_label):
+                ok, msg, new_helix_doc = ingest_helix(
+                    browser=helix_browser,
+                    country=str(src.get("country", "")).strip(),
+                    source_alias=str(src.get("alias", "")).strip(),
+                    source_id=source_id,
+                    proxy=helix_proxy,
+                    ssl_verify=helix_ssl_verify,
+                    service_origin_buug=src.get("service_origin_buug"),
+                    service_origin_n1=src.get("service_origin_n1"),
+                    service_origin_n2=src.get("service_origin_n2"),
+                    dry_run=False,
+                    existing_doc=HelixDocument.empty(),
+                    cache_doc=merged_helix,
+                    profiler=prof,
+                    connections=conns,
+                )
+            source_ok = bool(ok)
+            source_message = str(msg or "").strip()
+            checkpoint_required = False
+            if new_helix_doc is not None:
+                checkpoint_required = True
+                merged_helix.ingested_at = new_helix_doc.ingested_at
+                merged_helix.helix_base_url = new_helix_doc.helix_base_url
+                merged_helix.query = "multi-source"
+                merged_helix.source_watermarks.update(new_helix_doc.source_watermarks)
+            if new_helix_doc is not None and new_helix_doc.items:
+                has_partial_updates = True
+                with prof.phase(
+                    phase="source_merge", source_id=source_id, source_label=source_label
+                ):
+                    helix_delta = helix_index.upsert(new_helix_doc.items)
+                    # Only changed items (or ones missing from the issues doc) need re-mapping.
+                    issue_index.upsert(
+                        _helix_item_to_issue(item)
+                        for item in new_helix_doc.items
+                        if helix_merge_key(item) in helix_delta.changed
+                        or helix_merge_key(item) not in issue_index
+                    )
+            if persist_each_source and checkpoint_required:
+                issues_doc.ingested_at = now_iso()
+                with prof.phase(
+                    phase="persist_results", source_id=source_id, source_label=source_label
+                ):
+                    helix_repo.save(merged_helix, changed_keys=helix_index.drain_changed())
+                    _save_issues_checkpoint(settings, issues_doc, issue_index, issue_baseline)
+                checkpoints_saved += 1
+            if source_ok:
+                success_count += 1
+            prof.increment("sources_ok" if source_ok else "sources_failed")
+            messages.append({"ok": bool(source_ok), "message": source_message})
+            completed_sources += 1
+            if on_source_result is not None:
+                on_source_result(
+                    bool(source_ok),
+                    source_message,
+                    int(completed_sources),
+                    int(total_sources),
+                )
+
+        if (success_count > 0 or has_partial_updates) and (
+            not persist_each_source or checkpoints_saved <= 0
+        ):
             issues_doc.ingested_at = now_iso()
-            helix_repo.save(merged_helix)
-            save_issues_doc(settings.DATA_PATH, issues_doc)
-            checkpoints_saved += 1
-        if source_ok:
-            success_count += 1
-        messages.append({"ok": bool(source_ok), "message": source_message})
-        completed_sources += 1
-        if on_source_result is not None:
-            on_source_result(
-                bool(source_ok),
-                source_message,
-                int(completed_sources),
-                int(total_sources),
-            )
-
-    if (success_count > 0 or has_partial_updates) and (
-        not persist_each_source or checkpoints_saved <= 0
-    ):
-        issues_doc.ingested_at = now_iso()
-        helix_repo.save(merged_helix)
-        save_issues_doc(settings.DATA_PATH, issues_doc)
+            with prof.phase(phase="persist_results"):
+                helix_repo.save(merged_helix, changed_keys=helix_index.drain_changed())
+                _save_issues_checkpoint(settings, issues_doc, issue_index, issue_baseline)
+    finally:
+        # Also on failure: close run-owned pools and report their stats.
+        _finish_connections(prof, conns, owned=connections is None)
 
     return {
-        "state": "success"
-        if success_count == total_sources and total_sources > 0
-        else ("partial" if success_count > 0 else "error"),
+        "state": (
+            "success"
+            if success_count == total_sources and total_sources > 0
+            else ("partial" if success_count > 0 else "error")
+        ),
         "summary": f"Reingesta Helix finalizada: {success_count}/{total_sources} fuentes OK.",
         "success_count": int(success_count),
         "total_sources": int(total_sources),
         "messages": messages,
+        "changes": {
+            "issues": issue_index.changes.counts(),
+            "helix": helix_index.changes.counts(),
+        },
     }
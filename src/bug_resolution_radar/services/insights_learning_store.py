@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
 from bug_resolution_radar.common.utils import now_iso
 from bug_resolution_radar.config import Settings
+from bug_resolution_radar.services.state_db import ensure_state_db, state_db, state_db_path
 
 
 def _as_dict(value: Any) -> Dict[str, Any]:
@@ -45,50 +47,96 @@ def learning_payload_hash(
     return json.dumps(payload, ensure_ascii=False, sort_keys=True)
 
 
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS learning_scopes ("
+    " scope TEXT PRIMARY KEY,"
+    " country TEXT NOT NULL DEFAULT '',"
+    " source_id TEXT NOT NULL DEFAULT '',"
+    " state TEXT NOT NULL,"
+    " interactions INTEGER NOT NULL DEFAULT 0,"
+    " last_snapshot TEXT NOT NULL,"
+    " updated_at TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS learning_scopes_source_id ON learning_scopes (source_id)",
+)
+
+# Scopes of a source: explicit `source_id`, or the `<country>::<source_id>` key
+# suffix for records written before `source_id` was stored.
+_SOURCE_SCOPES_WHERE = "source_id = ? OR (source_id = '' AND substr(scope, -length(?)) = ?)"
+
+
+def _json_dict(raw: Any) -> Dict[str, Any]:
+    try:
+        return _as_dict(json.loads(str(raw or "")))
+    except ValueError:
+        return {}
+
+
+def _dump(value: Dict[str, Any]) -> str:
+    return json.dumps(_as_dict(value), ensure_ascii=False)
+
+
 class InsightsLearningStore:
-    """Local JSON store with per-scope learning state."""
+    """
+    Per-scope learning state stored in SQLite next to `path`.
+
+    `path` is the legacy JSON file: it is imported once into the database and
+    left untouched. Writes are single-row upserts or deletes committed on their own.
+    """
 
     def __init__(self, path: Path) -> None:
         self.path = path
-        self._raw: Dict[str, Any] = {"version": 1, "scopes": {}}
+        self.db_path = state_db_path(path)
 
-    def load(self) -> None:
+    def _migrate_json(self, con: sqlite3.Connection) -> None:
         if not self.path.exists():
-            self._raw = {"version": 1, "scopes": {}}
             return
         try:
             data = json.loads(self.path.read_text(encoding="utf-8"))
         except Exception:
-            self._raw = {"version": 1, "scopes": {}}
             return
-        if not isinstance(data, dict):
-            self._raw = {"version": 1, "scopes": {}}
-            return
-        scopes = data.get("scopes")
-        if not isinstance(scopes, dict):
-            scopes = {}
-        self._raw = {"version": int(data.get("version", 1) or 1), "scopes": scopes}
+        scopes = _as_dict(_as_dict(data).get("scopes"))
+        rows = []
+        for scope, record in scopes.items():
+            rec = _as_dict(record)
+            rows.append(
+                (
+                    str(scope),
+                    str(rec.get("country") or "").strip(),
+                    str(rec.get("source_id") or "").strip(),
+                    _dump(_as_dict(rec.get("state"))),
+                    _safe_int(rec.get("interactions"), default=0),
+                    _dump(_as_dict(rec.get("last_snapshot"))),
+                    str(rec.get("updated_at") or now_iso()),
+                )
+            )
+        con.executemany(
+            "INSERT OR IGNORE INTO learning_scopes "
+            "(scope, country, source_id, state, interactions, last_snapshot, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def load(self) -> None:
+        ensure_state_db(self.db_path, schema=_SCHEMA, migrate=self._migrate_json)
 
     def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = self.path.with_name(self.path.name + ".tmp")
-        tmp.write_text(json.dumps(self._raw, ensure_ascii=False, indent=2), encoding="utf-8")
-        tmp.replace(self.path)
+        """Nothing to flush: every mutation commits as it is made."""
+        self.load()
 
     def get_scope(self, scope: str) -> Tuple[Dict[str, Any], int]:
-        scopes = _as_dict(self._raw.get("scopes"))
-        record = _as_dict(scopes.get(scope))
-        state = _as_dict(record.get("state"))
-        interactions = _safe_int(record.get("interactions"), default=0)
+        state, interactions, _snapshot = self.get_scope_bundle(scope)
         return state, interactions
 
     def get_scope_bundle(self, scope: str) -> Tuple[Dict[str, Any], int, Dict[str, Any]]:
-        scopes = _as_dict(self._raw.get("scopes"))
-        record = _as_dict(scopes.get(scope))
-        state = _as_dict(record.get("state"))
-        interactions = _safe_int(record.get("interactions"), default=0)
-        snapshot = _as_dict(record.get("last_snapshot"))
-        return state, interactions, snapshot
+        self.load()
+        with state_db(self.db_path) as con:
+            row = con.execute(
+                "SELECT state, interactions, last_snapshot FROM learning_scopes WHERE scope = ?",
+                (scope,),
+            ).fetchone()
+        if row is None:
+            return {}, 0, {}
+        return _json_dict(row[0]), _safe_int(row[1], default=0), _json_dict(row[2])
 
     def set_scope(
         self,
@@ -100,71 +148,63 @@ class InsightsLearningStore:
         source_id: str,
         snapshot: Dict[str, Any] | None = None,
     ) -> None:
-        scopes = _as_dict(self._raw.get("scopes"))
-        current = _as_dict(scopes.get(scope))
-        resolved_snapshot = (
-            _as_dict(snapshot)
-            if isinstance(snapshot, dict)
-            else _as_dict(current.get("last_snapshot"))
-        )
-        scopes[scope] = {
-            "state": _as_dict(state),
-            "interactions": int(interactions),
-            "country": str(country or ""),
-            "source_id": str(source_id or ""),
-            "last_snapshot": resolved_snapshot,
-            "updated_at": now_iso(),
-        }
-        self._raw["scopes"] = scopes
-        self._raw["version"] = 1
+        self.load()
+        keep_snapshot = not isinstance(snapshot, dict)
+        with state_db(self.db_path, write=True) as con:
+            con.execute(
+                "INSERT INTO learning_scopes "
+                "(scope, country, source_id, state, interactions, last_snapshot, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(scope) DO UPDATE SET "
+                "country = excluded.country, source_id = excluded.source_id, "
+                "state = excluded.state, interactions = excluded.interactions, "
+                "last_snapshot = CASE WHEN ? THEN learning_scopes.last_snapshot "
+                "ELSE excluded.last_snapshot END, "
+                "updated_at = excluded.updated_at",
+                (
+                    scope,
+                    str(country or "").strip(),
+                    str(source_id or "").strip(),
+                    _dump(state),
+                    int(interactions),
+                    _dump(snapshot or {}),
+                    now_iso(),
+                    keep_snapshot,
+                ),
+            )
 
     def remove_source(self, source_id: str) -> int:
         sid = str(source_id or "").strip()
         if not sid:
             return 0
-
-        scopes = _as_dict(self._raw.get("scopes"))
-        kept: Dict[str, Any] = {}
-        removed = 0
+        self.load()
         suffix = f"::{sid}"
-
-        for scope_key, record in scopes.items():
-            record_dict = _as_dict(record)
-            rec_source_id = str(record_dict.get("source_id") or "").strip()
-            scope_txt = str(scope_key or "")
-            if rec_source_id == sid or (not rec_source_id and scope_txt.endswith(suffix)):
-                removed += 1
-                continue
-            kept[scope_txt] = record_dict
-
-        if removed > 0:
-            self._raw["scopes"] = kept
-            self._raw["version"] = 1
-
-        return removed
+        with state_db(self.db_path, write=True) as con:
+            cursor = con.execute(
+                f"DELETE FROM learning_scopes WHERE {_SOURCE_SCOPES_WHERE}", (sid, suffix, suffix)
+            )
+            return int(cursor.rowcount)
 
     def count_source_scopes(self, source_id: str) -> int:
         sid = str(source_id or "").strip()
         if not sid:
             return 0
-
-        scopes = _as_dict(self._raw.get("scopes"))
+        self.load()
         suffix = f"::{sid}"
-        count = 0
-        for scope_key, record in scopes.items():
-            record_dict = _as_dict(record)
-            rec_source_id = str(record_dict.get("source_id") or "").strip()
-            scope_txt = str(scope_key or "")
-            if rec_source_id == sid or (not rec_source_id and scope_txt.endswith(suffix)):
-                count += 1
-        return count
+        with state_db(self.db_path) as con:
+            row = con.execute(
+                f"SELECT count(*) FROM learning_scopes WHERE {_SOURCE_SCOPES_WHERE}",
+                (sid, suffix, suffix),
+            ).fetchone()
+        return int(row[0]) if row else 0
 
     def count_all_scopes(self) -> int:
-        scopes = _as_dict(self._raw.get("scopes"))
-        return len(scopes)
+        self.load()
+        with state_db(self.db_path) as con:
+            row = con.execute("SELECT count(*) FROM learning_scopes").fetchone()
+        return int(row[0]) if row else 0
 
     def clear_all(self) -> int:
-        scopes = _as_dict(self._raw.get("scopes"))
-        removed = len(scopes)
-        self._raw = {"version": 1, "scopes": {}}
-        return removed
+        self.load()
+        with state_db(self.db_path, write=True) as con:
+            return int(con.execute("DELETE FROM learning_scopes").rowcount)
@@ -3,34 +3,87 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
+
+from bug_resolution_radar.common.utils import now_iso
+from bug_resolution_radar.services.state_db import ensure_state_db, state_db, state_db_path
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS notes ("
+    " issue_key TEXT PRIMARY KEY,"
+    " note TEXT NOT NULL,"
+    " updated_at TEXT NOT NULL)",
+)
+# Below SQLite's historical 999 bound-parameter limit.
+_BULK_READ_CHUNK = 500
 
 
 class NotesStore:
+    """
+    Issue notes keyed by issue key, stored in SQLite next to `path`.
+
+    `path` is the legacy JSON file: it is imported once into the database and
+    left untouched. Every `set` is a single-row upsert committed on its own.
+    """
+
     def __init__(self, path: Path) -> None:
         self.path = path
-        self._notes: Dict[str, str] = {}
+        self.db_path = state_db_path(path)
+
+    def _migrate_json(self, con: sqlite3.Connection) -> None:
+        if not self.path.exists():
+            return
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(raw, dict):
+            return
+        updated_at = now_iso()
+        con.executemany(
+            "INSERT OR IGNORE INTO notes (issue_key, note, updated_at) VALUES (?, ?, ?)",
+            [(str(key), str(note), updated_at) for key, note in raw.items() if note is not None],
+        )
 
     def load(self) -> None:
-        if self.path.exists():
-            try:
-                raw = json.loads(self.path.read_text(encoding="utf-8"))
-            except Exception:
-                self._notes = {}
-                return
-            self._notes = raw if isinstance(raw, dict) else {}
-        else:
-            self._notes = {}
+        ensure_state_db(self.db_path, schema=_SCHEMA, migrate=self._migrate_json)
 
     def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(
-            json.dumps(self._notes, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        """Nothing to flush: `set` commits each note as it is written."""
+        self.load()
 
     def get(self, key: str) -> Optional[str]:
-        return self._notes.get(key)
+        self.load()
+        with state_db(self.db_path) as con:
+            row = con.execute("SELECT note FROM notes WHERE issue_key = ?", (key,)).fetchone()
+        return None if row is None else str(row[0])
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Notes for a page of issues; keys without a note are left out."""
+        wanted: List[str] = list(dict.fromkeys(str(key) for key in keys if str(key)))
+        if not wanted:
+            return {}
+        self.load()
+        out: Dict[str, str] = {}
+        with state_db(self.db_path) as con:
+            for start in range(0, len(wanted), _BULK_READ_CHUNK):
+                chunk = wanted[start : start + _BULK_READ_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = con.execute(
+                    f"SELECT issue_key, note FROM notes WHERE issue_key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                out.update({str(key): str(note) for key, note in rows})
+        return out
 
     def set(self, key: str, note: str) -> None:
-        self._notes[key] = note
+        self.load()
+        with state_db(self.db_path, write=True) as con:
+            con.execute(
+                "INSERT INTO notes (issue_key, note, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(issue_key) DO UPDATE SET "
+                "note = excluded.note, updated_at = excluded.updated_at",
+                (key, note, now_iso()),
+            )
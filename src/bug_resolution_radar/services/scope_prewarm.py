@@ -0,0 +1,328 @@
+"""Post-ingest prewarming of the dashboard scopes users open most often."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bug_resolution_radar.analytics.filtering import FilterState
+from bug_resolution_radar.common.utils import int_env
+from bug_resolution_radar.config import Settings, settings_cache_token
+from bug_resolution_radar.services.compute_pool import API_COMPUTE_POOL
+from bug_resolution_radar.services.dashboard_snapshot import (
+    DashboardQuery,
+    build_dashboard_snapshot,
+    load_scope_context,
+)
+from bug_resolution_radar.services.workspace import WorkspaceSelection
+
+ScopeKey = Tuple[Any, ...]
+
+_USAGE_FILE_NAME = "scope_usage.json"
+_USAGE_SCHEMA_VERSION = 1
+_USAGE_MAX_SCOPES = 64
+_USAGE_MAX_HITS_PER_SCOPE = 200
+_USAGE_FLUSH_SECONDS = 30.0
+_PAYLOAD_CACHE_MAX_ENTRIES = 16
+_IDLE_POLL_SECONDS = 0.2
+_MAX_YIELD_SECONDS = 30.0
+
+
+def _prewarm_scope_limit() -> int:
+    """Scopes prewarmed after each ingest; `0` disables prewarming."""
+    return max(0, int_env("BUG_RESOLUTION_RADAR_PREWARM_SCOPES", 6))
+
+
+def _prewarm_ttl_seconds() -> int:
+    return max(1, int_env("BUG_RESOLUTION_RADAR_PREWARM_TTL_SECONDS", 900))
+
+
+def _usage_window_seconds() -> int:
+    return max(1, int_env("BUG_RESOLUTION_RADAR_PREWARM_USAGE_DAYS", 7)) * 86400
+
+
+def scope_usage_key(query: DashboardQuery) -> ScopeKey | None:
+    """
+    Identity of a dashboard scope for usage ranking, or None when it is not worth prewarming.
+
+    Issue-level narrowing (explicit keys, like search) is too specific to be reused.
+    """
+    if query.issue_scope_keys or str(query.issue_like_query or "").strip():
+        return None
+    return (
+        str(query.workspace.country or "").strip(),
+        str(query.workspace.source_id or "").strip(),
+        str(query.workspace.scope_mode or "").strip(),
+        tuple(str(item) for item in query.source_ids),
+        tuple(str(item) for item in list(query.filters.status or [])),
+        tuple(str(item) for item in list(query.filters.priority or [])),
+        tuple(str(item) for item in list(query.filters.assignee or [])),
+        str(query.quincenal_scope or "").strip(),
+        str(query.issue_sort_col or "").strip(),
+        tuple(str(item) for item in query.chart_ids),
+        bool(query.dark_mode),
+    )
+
+
+def _query_from_key(key: ScopeKey) -> DashboardQuery:
+    country, source_id, scope_mode, source_ids, status, priority, assignee = key[:7]
+    quincenal_scope, issue_sort_col, chart_ids, dark_mode = key[7:]
+    return DashboardQuery(
+        workspace=WorkspaceSelection(country=country, source_id=source_id, scope_mode=scope_mode),
+        filters=FilterState(status=list(status), priority=list(priority), assignee=list(assignee)),
+        quincenal_scope=quincenal_scope,
+        issue_sort_col=issue_sort_col,
+        chart_ids=tuple(chart_ids),
+        dark_mode=bool(dark_mode),
+        source_ids=tuple(source_ids),
+    )
+
+
+def _key_from_json(raw: Any) -> ScopeKey | None:
+    if not isinstance(raw, list) or len(raw) != 11:
+        return None
+    try:
+        return (
+            str(raw[0]),
+            str(raw[1]),
+            str(raw[2]),
+            tuple(str(item) for item in raw[3]),
+            tuple(str(item) for item in raw[4]),
+            tuple(str(item) for item in raw[5]),
+            tuple(str(item) for item in raw[6]),
+            str(raw[7]),
+            str(raw[8]),
+            tuple(str(item) for item in raw[9]),
+            bool(raw[10]),
+        )
+    except TypeError:
+        return None
+
+
+class ScopeUsageTracker:
+    """
+    Recent dashboard scope requests for one data file, persisted next to it.
+
+    The hit log survives restarts (the morning ingest usually runs in a freshly
+    started app) and is written at most every `_USAGE_FLUSH_SECONDS`.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._hits: OrderedDict[ScopeKey, List[float]] = OrderedDict()
+        self._loaded = False
+        self._dirty = False
+        self._flushed_at = 0.0
+
+    def _load_locked(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        for row in list(payload.get("scopes") or []) if isinstance(payload, dict) else []:
+            key = _key_from_json(row.get("scope")) if isinstance(row, dict) else None
+            if key is None:
+                continue
+            hits = [float(ts) for ts in list(row.get("hits") or []) if isinstance(ts, (int, float))]
+            self._hits[key] = hits[-_USAGE_MAX_HITS_PER_SCOPE:]
+
+    def _prune_locked(self, now: float) -> None:
+        horizon = now - _usage_window_seconds()
+        for key in list(self._hits):
+            recent = [ts for ts in self._hits[key] if ts >= horizon]
+            if recent:
+                self._hits[key] = recent
+            else:
+                self._hits.pop(key, None)
+        while len(self._hits) > _USAGE_MAX_SCOPES:
+            self._hits.popitem(last=False)
+
+    def record(self, query: DashboardQuery, *, now: Optional[float] = None) -> None:
+        key = scope_usage_key(query)
+        if key is None:
+            return
+        ts = time.time() if now is None else float(now)
+        with self._lock:
+            self._load_locked()
+            hits = self._hits.pop(key, [])
+            hits.append(ts)
+            self._hits[key] = hits[-_USAGE_MAX_HITS_PER_SCOPE:]
+            self._dirty = True
+            if len(self._hits) > _USAGE_MAX_SCOPES:
+                self._prune_locked(ts)
+            due = time.monotonic() - self._flushed_at >= _USAGE_FLUSH_SECONDS
+        if due:
+            self.flush()
+
+    def top(self, limit: int, *, now: Optional[float] = None) -> List[DashboardQuery]:
+        """Most requested scopes within the usage window, most recent first on ties."""
+        ts = time.time() if now is None else float(now)
+        with self._lock:
+            self._load_locked()
+            self._prune_locked(ts)
+            ranked = sorted(
+                self._hits.items(), key=lambda item: (len(item[1]), item[1][-1]), reverse=True
+            )
+        return [_query_from_key(key) for key, _hits in ranked[: max(0, int(limit))]]
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "schema_version": _USAGE_SCHEMA_VERSION,
+                "scopes": [
+                    {"scope": list(key), "hits": [round(ts, 3) for ts in hits]}
+                    for key, hits in self._hits.items()
+                ],
+            }
+            self._dirty = False
+            self._flushed_at = time.monotonic()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError:
+            # Usage ranking is advisory; losing a flush only makes prewarming less precise.
+            return
+
+
+_trackers: Dict[str, ScopeUsageTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def scope_usage_tracker(settings: Settings) -> ScopeUsageTracker:
+    path = Path(str(settings.DATA_PATH)).expanduser().resolve().parent / _USAGE_FILE_NAME
+    with _trackers_lock:
+        tracker = _trackers.get(str(path))
+        if tracker is None:
+            tracker = ScopeUsageTracker(path)
+            _trackers[str(path)] = tracker
+        return tracker
+
+
+def record_scope_usage(settings: Settings, query: DashboardQuery) -> None:
+    scope_usage_tracker(settings).record(query)
+
+
+def _data_revision(settings: Settings) -> Tuple[str, int, int]:
+    resolved = Path(str(settings.DATA_PATH)).expanduser()
+    try:
+        stats = resolved.stat()
+        return (str(resolved.resolve()), int(stats.st_mtime_ns), int(stats.st_size))
+    except Exception:
+        return (str(resolved.resolve()), -1, -1)
+
+
+# (settings token, data revision, scope) -> (expires_at, dashboard payload)
+_payload_cache: OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = OrderedDict()
+_payload_cache_lock = threading.Lock()
+
+
+def _payload_key(settings: Settings, query: DashboardQuery) -> Tuple[Any, ...] | None:
+    scope = scope_usage_key(query)
+    if scope is None:
+        return None
+    return (settings_cache_token(settings), _data_revision(settings), scope)
+
+
+def prewarmed_dashboard_snapshot(
+    settings: Settings, query: DashboardQuery
+) -> Dict[str, Any] | None:
+    """Dashboard payload prewarmed for this exact scope and data revision, if still fresh."""
+    key = _payload_key(settings, query)
+    if key is None:
+        return None
+    now = time.monotonic()
+    with _payload_cache_lock:
+        cached = _payload_cache.get(key)
+        if cached is None:
+            return None
+        if now > cached[0]:
+            _payload_cache.pop(key, None)
+            return None
+        return dict(cached[1])
+
+
+def _store_payload(key: Tuple[Any, ...], payload: Dict[str, Any], *, ttl: float) -> None:
+    now = time.monotonic()
+    with _payload_cache_lock:
+        for stale in [k for k, (expires_at, _p) in _payload_cache.items() if now > expires_at]:
+            _payload_cache.pop(stale, None)
+        _payload_cache[key] = (now + ttl, payload)
+        _payload_cache.move_to_end(key)
+        while len(_payload_cache) > _PAYLOAD_CACHE_MAX_ENTRIES:
+            _payload_cache.popitem(last=False)
+
+
+def _yield_to_requests(is_idle: Callable[[], bool]) -> None:
+    """Low priority: wait (bounded) while interactive API work is queued or running."""
+    deadline = time.monotonic() + _MAX_YIELD_SECONDS
+    while not is_idle() and time.monotonic() < deadline:
+        time.sleep(_IDLE_POLL_SECONDS)
+
+
+def prewarm_scopes(
+    settings: Settings,
+    *,
+    limit: Optional[int] = None,
+    is_idle: Callable[[], bool] = API_COMPUTE_POOL.is_idle,
+) -> Dict[str, Any]:
+    """Build scope contexts and dashboard payloads for the top scopes; returns counters."""
+    top = scope_usage_tracker(settings).top(_prewarm_scope_limit() if limit is None else limit)
+    ttl = float(_prewarm_ttl_seconds())
+    warmed = failed = 0
+    started = time.perf_counter()
+    for query in top:
+        key = _payload_key(settings, query)
+        if key is None:
+            continue
+        _yield_to_requests(is_idle)
+        try:
+            load_scope_context(
+                settings,
+                query=query,
+                include_kpis=True,
+                include_timeseries_chart=True,
+                ttl_seconds=ttl,
+            )
+            _store_payload(key, build_dashboard_snapshot(settings, query=query), ttl=ttl)
+            warmed += 1
+        except Exception:
+            # A scope that no longer resolves (source removed...) must not stop the others.
+            failed += 1
+    return {
+        "scopes": len(top),
+        "warmed": warmed,
+        "failed": failed,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 3),
+    }
+
+
+_prewarm_lock = threading.Lock()
+_prewarm_thread: Optional[threading.Thread] = None
+
+
+def schedule_prewarm(settings: Settings) -> bool:
+    """Start prewarming in a background thread; False when disabled or already running."""
+    global _prewarm_thread
+    if _prewarm_scope_limit() <= 0:
+        return False
+    snapshot = settings.model_copy(deep=True)
+    with _prewarm_lock:
+        if _prewarm_thread is not None and _prewarm_thread.is_alive():
+            return False
+        _prewarm_thread = threading.Thread(
+            target=prewarm_scopes, args=(snapshot,), name="scope-prewarm", daemon=True
+        )
+        _prewarm_thread.start()
+    return True
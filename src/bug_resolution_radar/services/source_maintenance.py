@@ -9,6 +9,10 @@ from bug_resolution_radar.config import Settings, helix_sources, jira_sources, t
 from bug_resolution_radar.models.schema import IssuesDocument
 from bug_resolution_radar.models.schema_helix import HelixDocument
 from bug_resolution_radar.repositories.helix_repo import HelixRepo
+from bug_resolution_radar.repositories.issue_changelog import (
+    clear_issue_changes,
+    drop_source_changes,
+)
 from bug_resolution_radar.repositories.issues_store import load_issues_doc, save_issues_doc
 from bug_resolution_radar.services.insights_learning_store import (
     InsightsLearningStore,
@@ -107,6 +111,8 @@ def purge_source_cache(settings: Settings, source_id: str) -> Dict[str, int]:
     issues_removed = issues_before - len(issues_doc.issues)
     if issues_removed > 0:
         save_issues_doc(settings.DATA_PATH, issues_doc)
+    # The change log would otherwise keep the purged issues in every point-in-time state.
+    drop_source_changes(settings.DATA_PATH, target)
 
     helix_items_removed = 0
     helix_repo = HelixRepo(_helix_data_path(settings))
@@ -115,7 +121,10 @@ def purge_source_cache(settings: Settings, source_id: str) -> Dict[str, int]:
         helix_before = len(helix_doc.items)
         helix_doc.items = [i for i in helix_doc.items if _sid(i.source_id) != target]
         helix_items_removed = helix_before - len(helix_doc.items)
-        if helix_items_removed > 0:
+        watermark_keys = [k for k in helix_doc.source_watermarks if _sid(k) == target]
+        for key in watermark_keys:
+            helix_doc.source_watermarks.pop(key, None)
+        if helix_items_removed > 0 or watermark_keys:
             helix_repo.save(helix_doc)
 
     learning_scopes_removed = 0
@@ -184,7 +193,7 @@ def cache_inventory(settings: Settings) -> List[Dict[str, Any]]:
     paths = {
         "issues": issues_path,
         "helix": helix_path,
-        "learning": learning_path,
+        "learning": learning_store.db_path,
     }
 
     rows: List[Dict[str, Any]] = []
@@ -212,6 +221,7 @@ def reset_cache_store(settings: Settings, cache_id: str) -> Dict[str, Any]:
         before_doc = load_issues_doc(str(path))
         before = len(before_doc.issues)
         save_issues_doc(str(path), IssuesDocument.empty())
+        clear_issue_changes(path)
         after = len(load_issues_doc(str(path)).issues)
     elif target == "helix":
         path = _helix_data_path(settings)
@@ -0,0 +1,84 @@
+"""Embedded SQLite (WAL) storage shared by the small local state stores."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+
+from bug_resolution_radar.common.utils import now_iso
+
+_BUSY_TIMEOUT_SECONDS = 5.0
+_MIGRATION_META_KEY = "json_migrated_at"
+
+_ready_paths: set[str] = set()
+_ready_lock = threading.Lock()
+
+
+def state_db_path(json_path: Path) -> Path:
+    """Database that replaces a legacy JSON store: same name, `.sqlite3` suffix."""
+    return json_path.with_suffix(".sqlite3")
+
+
+@contextmanager
+def state_db(db_path: Path, *, write: bool = False) -> Iterator[sqlite3.Connection]:
+    """
+    Short-lived connection in WAL mode.
+
+    Readers never block the writer; `write=True` wraps the block in one
+    `BEGIN IMMEDIATE` transaction so concurrent writers queue on the busy
+    timeout instead of losing each other's updates.
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(str(db_path), timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+    try:
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        if not write:
+            yield con
+            return
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            yield con
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+    finally:
+        con.close()
+
+
+def ensure_state_db(
+    db_path: Path,
+    *,
+    schema: Sequence[str],
+    migrate: Callable[[sqlite3.Connection], None],
+) -> None:
+    """
+    Create the schema and import the legacy JSON store exactly once.
+
+    The import is recorded in `store_meta` inside the same transaction, so it
+    runs once per database even with several processes starting together.
+    """
+    key = str(db_path.resolve())
+    with _ready_lock:
+        if key in _ready_paths and db_path.exists():
+            return
+        with state_db(db_path, write=True) as con:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            for statement in schema:
+                con.execute(statement)
+            migrated = con.execute(
+                "SELECT value FROM store_meta WHERE key = ?", (_MIGRATION_META_KEY,)
+            ).fetchone()
+            if migrated is None:
+                migrate(con)
+                con.execute(
+                    "INSERT INTO store_meta (key, value) VALUES (?, ?)",
+                    (_MIGRATION_META_KEY, now_iso()),
+                )
+        _ready_paths.add(key)
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import io
+import math
 from datetime import date, datetime, timezone
 from io import BytesIO
-from typing import Any, Mapping, Sequence, cast
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Mapping, Sequence, cast
 
 import pandas as pd
+import xlsxwriter
 
 EXCEL_DATETIME_NUMFMT = "dd/mm/yyyy hh:mm:ss"
 EXCEL_DEFAULT_HEADER_ROW_HEIGHT = 21.0
@@ -62,9 +66,9 @@ def dataframe_to_xlsx_bytes(
     return dataframes_to_xlsx_bytes(
         [(str(sheet_name or "Export"), clean)],
         include_index=include_index,
-        hyperlink_columns_by_sheet={str(sheet_name or "Export"): link_specs}
-        if link_specs
-        else None,
+        hyperlink_columns_by_sheet=(
+            {str(sheet_name or "Export"): link_specs} if link_specs else None
+        ),
     )
 
 
@@ -130,16 +134,22 @@ def _apply_excel_id_sizing(ws: Any, df: pd.DataFrame) -> None:
         id_col_idx = int(df.columns.get_loc(id_col_name))
     except Exception:
         return
-    max_chars = max(
-        _excel_text_len(id_col_name),
-        max(_excel_text_len(value) for value in df[id_col_name].tolist()),
+    ws.set_column(
+        id_col_idx, id_col_idx, excel_id_column_width(id_col_name, df[id_col_name].tolist())
     )
-    target_width = min(EXCEL_ID_COL_MAX_WIDTH, max(EXCEL_ID_COL_MIN_WIDTH, float(max_chars + 2)))
-    ws.set_column(id_col_idx, id_col_idx, float(target_width))
     ws.set_row(0, EXCEL_DEFAULT_HEADER_ROW_HEIGHT)
     for row_idx, id_value in enumerate(df[id_col_name].tolist(), start=1):
-        line_count = max(1, str(id_value or "").count("\n") + 1)
-        ws.set_row(row_idx, EXCEL_DEFAULT_DATA_ROW_HEIGHT * float(line_count))
+        ws.set_row(row_idx, _excel_id_row_height(id_value))
+
+
+def excel_id_column_width(name: str, values: Iterable[Any]) -> float:
+    max_chars = max(_excel_text_len(name), max((_excel_text_len(v) for v in values), default=0))
+    return float(min(EXCEL_ID_COL_MAX_WIDTH, max(EXCEL_ID_COL_MIN_WIDTH, float(max_chars + 2))))
+
+
+def _excel_id_row_height(id_value: Any) -> float:
+    line_count = max(1, str(id_value or "").count("\n") + 1)
+    return EXCEL_DEFAULT_DATA_ROW_HEIGHT * float(line_count)
 
 
 def _write_excel_sheet(
@@ -214,3 +224,99 @@ def dataframes_to_xlsx_bytes(
                 hyperlink_columns=list((hyperlink_columns_by_sheet or {}).get(raw_sheet_name, ())),
             )
     return bio.getvalue()
+
+
+def _is_blank_cell(value: Any) -> bool:
+    if value is None or value is pd.NaT:
+        return True
+    return isinstance(value, float) and math.isnan(value)
+
+
+def write_xlsx_batches(
+    target: str | Path | BinaryIO,
+    *,
+    sheet_name: str,
+    columns: Sequence[str],
+    batches: Iterable[pd.DataFrame],
+    hyperlink_columns: Sequence[tuple[str, str]] = (),
+    id_column_width: float | None = None,
+) -> None:
+    """
+    Stream row batches into a single-sheet workbook with the layout of `dataframes_to_xlsx_bytes`.
+
+    Rows are flushed to disk as they are written (xlsxwriter constant memory
+    mode), so memory is bounded by one batch. The ID column width must be
+    known up front (`id_column_width`) because it precedes the rows in the file.
+    """
+    links = {
+        visible: url for visible, url in hyperlink_columns if visible in columns and url in columns
+    }
+    visible_columns = [column for column in columns if column not in set(links.values())]
+    link_positions = {visible_columns.index(visible): url for visible, url in links.items()}
+    id_col_name = next(
+        (name for name in ("ID de la Incidencia", "key", "id") if name in visible_columns), None
+    )
+    workbook = xlsxwriter.Workbook(
+        cast(Any, str(target) if isinstance(target, Path) else target),
+        {"constant_memory": True},
+    )
+    try:
+        ws = workbook.add_worksheet(_safe_excel_sheet_name(sheet_name, used=set()))
+        header_format = workbook.add_format(
+            {"bold": True, "border": 1, "align": "center", "valign": "top"}
+        )
+        datetime_format = workbook.add_format({"num_format": EXCEL_DATETIME_NUMFMT})
+        hyperlink_format = workbook.get_default_url_format()
+        id_idx = visible_columns.index(id_col_name) if id_col_name else None
+        if id_idx is not None and id_column_width is not None:
+            ws.set_column(id_idx, id_idx, float(id_column_width))
+            ws.set_row(0, EXCEL_DEFAULT_HEADER_ROW_HEIGHT)
+        for col_idx, name in enumerate(visible_columns):
+            ws.write_string(0, col_idx, str(name), header_format)
+
+        row_idx = 0
+        for batch in batches:
+            values = [batch[column].tolist() for column in visible_columns]
+            urls = {pos: batch[url].tolist() for pos, url in link_positions.items()}
+            for offset, row in enumerate(zip(*values)):
+                row_idx += 1
+                if id_idx is not None and id_column_width is not None:
+                    ws.set_row(row_idx, _excel_id_row_height(row[id_idx]))
+                for col_idx, raw_value in enumerate(row):
+                    value = _safe_excel_scalar(raw_value)
+                    url_txt = str(urls[col_idx][offset] or "").strip() if col_idx in urls else ""
+                    if url_txt.startswith(("http://", "https://")):
+                        label = "" if _is_blank_cell(value) else str(value).strip()
+                        ws.write_url(
+                            row_idx, col_idx, url_txt, hyperlink_format, string=label or url_txt
+                        )
+                    elif _is_blank_cell(value):
+                        continue
+                    elif isinstance(value, datetime):
+                        ws.write_datetime(row_idx, col_idx, value, datetime_format)
+                    else:
+                        ws.write(row_idx, col_idx, value)
+    finally:
+        workbook.close()
+
+
+def write_csv_batches(
+    target: str | Path | BinaryIO,
+    *,
+    columns: Sequence[str],
+    batches: Iterable[pd.DataFrame],
+) -> None:
+    """Stream row batches as UTF-8 (BOM) CSV, same encoding as `dataframe_to_csv_bytes`."""
+    handle: BinaryIO = (
+        open(target, "wb") if isinstance(target, (str, Path)) else target  # noqa: SIM115
+    )
+    text = io.TextIOWrapper(handle, encoding="utf-8-sig", newline="")
+    try:
+        pd.DataFrame(columns=list(columns)).to_csv(text, index=False)
+        for batch in batches:
+            batch.loc[:, list(columns)].to_csv(text, index=False, header=False)
+        text.flush()
+    finally:
+        text.detach()
+        if handle is not target:
+            handle.close()
@@ -0,0 +1,84 @@
+"""Background warm-up of the heavy modules and the issues read model after API boot."""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from bug_resolution_radar.common.utils import bool_env
+from bug_resolution_radar.config import Settings
+
+# Deferred by `api.app` so the health check and the SPA are served first.
+WARMUP_MODULES: tuple[str, ...] = (
+    "pandas",
+    "bug_resolution_radar.services.dashboard_snapshot",
+    "bug_resolution_radar.services.scope_prewarm",
+    # python-pptx, Pillow and plotly.
+    "bug_resolution_radar.reports.service",
+    "bug_resolution_radar.services.ingest_async",
+)
+
+
+def _warmup_enabled() -> bool:
+    return bool_env("BUG_RESOLUTION_RADAR_WARMUP", True)
+
+
+def warm_up(settings: Settings, *, modules: Sequence[str] = WARMUP_MODULES) -> Dict[str, Any]:
+    """Import `modules` and load the issues read model (Parquet sidecar); returns counters."""
+    started = time.perf_counter()
+    imported = failed = 0
+    for name in modules:
+        try:
+            importlib.import_module(name)
+            imported += 1
+        except Exception:
+            # A missing optional dependency only means that module loads on first use.
+            failed += 1
+
+    issues = -1
+    try:
+        from bug_resolution_radar.repositories.issues_store import load_issues_df
+
+        issues = int(len(load_issues_df(str(settings.DATA_PATH))))
+    except Exception:
+        issues = -1
+    return {
+        "modules": imported,
+        "failed": failed,
+        "issues": issues,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 3),
+    }
+
+
+_warmup_lock = threading.Lock()
+_warmup_thread: Optional[threading.Thread] = None
+
+
+def _run_warmup(load_settings: Callable[[], Settings]) -> None:
+    try:
+        settings = load_settings()
+    except Exception:
+        return
+    warm_up(settings)
+
+
+def schedule_warmup(load_settings: Callable[[], Settings]) -> bool:
+    """
+    Start the warm-up once per process in a background thread.
+
+    Settings are resolved inside the thread so callers (the health check) stay
+    instant. Returns False when disabled or already started.
+    """
+    global _warmup_thread
+    if not _warmup_enabled():
+        return False
+    with _warmup_lock:
+        if _warmup_thread is not None:
+            return False
+        _warmup_thread = threading.Thread(
+            target=_run_warmup, args=(load_settings,), name="api-warmup", daemon=True
+        )
+        _warmup_thread.start()
+    return True
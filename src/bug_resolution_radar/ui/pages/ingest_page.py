@@ -456,6 +456,8 @@ def _start_helix_ingest_job(settings: Settings, *, selected_sources: List[Dict[s
                         )
                         new_helix_doc = None
 
+                    if new_helix_doc is not None:
+                        merged_helix.source_watermarks.update(new_helix_doc.source_watermarks)
                     if new_helix_doc is not None and new_helix_doc.items:
                         with profiler.phase(
                             phase="source_merge",
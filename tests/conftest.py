@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_report_render_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Persistent render caches must never leak between tests nor into the repo tree.
+    monkeypatch.setenv("BUG_RESOLUTION_RADAR_PPT_DISK_CACHE_DIR", str(tmp_path / "render-cache"))
+    monkeypatch.setenv("INGEST_PROFILE_JSONL_PATH", str(tmp_path / "ingest_profiles.jsonl"))
+    # The post-boot warm-up would load the real settings' data file in a background thread.
+    monkeypatch.setenv("BUG_RESOLUTION_RADAR_WARMUP", "0")
+    # Default `Settings()` paths ("data/issues.json", ...) are cwd-relative; their
+    # sidecars (workspace index, cube) must land in the test's tmp dir.
+    monkeypatch.chdir(tmp_path)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import os
+import subprocess
+import sys
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
@@ -19,6 +22,7 @@ from bug_resolution_radar.repositories.issues_store import save_issues_doc
 
 api_app = importlib.import_module("bug_resolution_radar.api.app")
 dashboard_snapshot = importlib.import_module("bug_resolution_radar.services.dashboard_snapshot")
+warmup = importlib.import_module("bug_resolution_radar.services.warmup")
 
 
 def _settings(tmp_path: Path) -> Settings:
@@ -279,6 +283,66 @@ def test_health_endpoint_reports_ok() -> None:
     assert response.json()["ok"] is True
 
 
+def test_api_module_import_defers_heavy_dependencies() -> None:
+    heavy = ("pandas", "numpy", "pyarrow", "plotly", "pptx", "PIL", "requests", "browser_cookie3")
+    script = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        "import bug_resolution_radar.api.app\n"
+        "print(time.perf_counter() - started)\n"
+        f"print(','.join(name for name in {heavy!r} if name in sys.modules))\n"
+    )
+    src_root = str(Path(api_app.__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_root, env.get("PYTHONPATH", "")]))
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+    )
+    elapsed, loaded = result.stdout.splitlines()[-2:]
+
+    assert loaded == ""
+    # FastAPI alone takes ~0.35s here; generous for slow CI machines.
+    assert float(elapsed) < 3.0
+
+
+def test_health_endpoint_schedules_warmup_once(monkeypatch, tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    warmed: list[Settings] = []
+    monkeypatch.setenv("BUG_RESOLUTION_RADAR_WARMUP", "1")
+    monkeypatch.setattr(warmup, "_warmup_thread", None)
+    monkeypatch.setattr(warmup, "warm_up", warmed.append)
+    monkeypatch.setattr(api_app, "load_settings", lambda: settings)
+    client = TestClient(api_app.create_app())
+
+    assert client.get("/api/health").status_code == 200
+    assert client.get("/api/health").status_code == 200
+    thread = warmup._warmup_thread
+    assert thread is not None
+    thread.join(timeout=5)
+    assert warmed == [settings]
+
+
+def test_warm_up_loads_modules_and_issues_read_model(tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    _seed_issues(settings)
+
+    stats = warmup.warm_up(settings, modules=("json", "bug_resolution_radar.missing_module"))
+
+    assert stats["modules"] == 1
+    assert stats["failed"] == 1
+    assert stats["issues"] > 0
+
+
+def test_metrics_endpoint_exposes_compute_pool_stats() -> None:
+    client = TestClient(api_app.create_app())
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    compute = response.json()["compute"]
+    assert compute["max_workers"] >= 1
+    assert {"queue_depth", "coalesced", "run_p95_ms"} <= set(compute)
+
+
 def test_frontend_spa_routes_fallback_to_index(monkeypatch, tmp_path: Path) -> None:
     frontend_dist = tmp_path / "frontend-dist"
     frontend_dist.mkdir()
@@ -423,6 +487,51 @@ def test_trend_detail_and_issue_keys_endpoints_return_filtered_contracts(
     assert keys_response.json() == {"total": 1, "keys": ["RAD-1"]}
 
 
+def test_issue_search_endpoint_ranks_scope_matches(monkeypatch, tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    source_id = _seed_issues(settings)
+    monkeypatch.setattr(api_app, "load_settings", lambda: settings)
+
+    client = TestClient(api_app.create_app())
+    params = {"country": "España", "sourceId": source_id, "scopeMode": "source"}
+    hit = client.get("/api/issues/search", params={**params, "q": "logi"})
+    miss = client.get("/api/issues/search", params={**params, "q": "pagos"})
+    liked = client.get(
+        "/api/issues", params={**params, "issueSortCol": "summary", "issueLikeQuery": "N LOG"}
+    )
+
+    assert hit.status_code == 200
+    assert hit.json()["total"] == 1
+    item = hit.json()["items"][0]
+    assert item["key"] == "RAD-1"
+    assert item["sourceId"] == source_id
+    assert item["matchedFields"] == ["summary"]
+    assert miss.json() == {"query": "pagos", "total": 0, "items": []}
+    assert liked.json()["total"] == 1
+
+
+def test_daily_flow_endpoint_rolls_up_country_from_the_cube(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    settings = _settings(tmp_path)
+    source_id = _seed_issues(settings)
+    monkeypatch.setattr(api_app, "load_settings", lambda: settings)
+
+    client = TestClient(api_app.create_app())
+    response = client.get("/api/trends/daily-flow", params={"country": "España", "lookbackDays": 7})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["sourceIds"] == [source_id]
+    assert len(payload["daily"]) == 7
+    assert payload["daily"][-1]["created"] == 1
+    assert payload["daily"][-1]["openAtEnd"] == 1
+    assert payload["period"]["created"] == 1
+    assert payload["period"]["finalized"] == 0
+    assert (tmp_path / "issues.cube.parquet").exists()
+
+
 def test_intelligence_endpoint_returns_streamlit_aligned_payload(
     monkeypatch,
     tmp_path: Path,
@@ -498,6 +607,12 @@ def test_issues_and_kanban_endpoints_serialize_rows_without_pandas_scalars(
     assert issue_payload["total"] == 1
     assert issue_payload["rows"][0]["key"] == "RAD-1"
     assert isinstance(issue_payload["rows"][0]["updated"], str)
+    assert issue_payload["nextCursor"] is None
+    bad_cursor = client.get(
+        "/api/issues",
+        params={"country": "España", "sourceId": source_id, "after": "no-es-un-cursor"},
+    )
+    assert bad_cursor.status_code == 400
 
     assert kanban_response.status_code == 200
     kanban_payload = kanban_response.json()
@@ -729,6 +844,48 @@ def test_ingest_progress_endpoint_returns_latest_snapshot(
     assert payload["completedSources"] == 2
 
 
+def test_ingest_events_stream_resumes_and_pushes_final_snapshot(monkeypatch) -> None:
+    ingest_async = importlib.import_module("bug_resolution_radar.services.ingest_async")
+    with ingest_async._LOCK:
+        ingest_async._PROGRESS.clear()
+        ingest_async._RUNNING_WORKERS.clear()
+    run_id, _ = ingest_async._start_progress("jira", total_sources=1, max_run_seconds=600)
+    ingest_async._finish_progress(
+        "jira",
+        run_id=run_id,
+        result={"state": "success", "summary": "ok", "success_count": 1, "total_sources": 1},
+    )
+    monkeypatch.setattr(api_app, "_INGEST_STREAM_KEEPALIVE_SECONDS", 0.01)
+
+    class _Request:
+        polls = 0
+
+        async def is_disconnected(self) -> bool:
+            self.polls += 1
+            return self.polls > 2
+
+    async def _collect() -> list[str]:
+        stream = api_app._ingest_event_stream(_Request(), "jira", after_seq=0)
+        return [frame async for frame in stream]
+
+    frames = asyncio.run(_collect())
+
+    assert frames[0].startswith("retry: ")
+    assert frames[1].startswith("id: 1\nevent: progress\n")
+    assert '"type":"run_started"' in frames[1]
+    assert frames[2].startswith("id: 2\nevent: progress\n")
+    assert frames[3].startswith("id: 2\nevent: snapshot\n")
+    assert '"state":"success"' in frames[3]
+    assert frames[4:] == [": keepalive\n\n", ": keepalive\n\n"]
+
+
+def test_ingest_events_endpoint_rejects_unknown_connector() -> None:
+    client = TestClient(api_app.create_app())
+    response = client.get("/api/ingest/sap/events")
+
+    assert response.status_code == 404
+
+
 def test_helix_ingest_test_endpoint_syncs_settings_into_process_env(
     monkeypatch,
     tmp_path: Path,
@@ -826,6 +983,10 @@ def test_notes_endpoint_roundtrip(monkeypatch, tmp_path: Path) -> None:
     assert get_response.status_code == 200
     assert get_response.json()["note"] == "Investigar con backend"
 
+    bulk = client.get("/api/notes", params={"keys": "RAD-9,RAD-1"})
+    assert bulk.status_code == 200
+    assert bulk.json() == {"notes": {"RAD-9": "Investigar con backend"}}
+
 
 def test_issues_export_endpoint_streams_file(monkeypatch, tmp_path: Path) -> None:
     settings = _settings(tmp_path)
@@ -974,6 +1135,25 @@ def test_issues_export_helix_raw_endpoint_streams_xlsx(monkeypatch, tmp_path: Pa
     assert frame.loc[0, "Status"] == "Analysing"
 
 
+def test_issues_export_helix_raw_endpoint_streams_csv(monkeypatch, tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    source_id = _seed_helix_issues(settings)
+    monkeypatch.setattr(api_app, "load_settings", lambda: settings)
+
+    client = TestClient(api_app.create_app())
+    response = client.get(
+        "/api/issues/export/helix-raw",
+        params={"format": "csv", "country": "España", "sourceId": source_id},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    frame = pd.read_csv(BytesIO(response.content), encoding="utf-8-sig")
+    assert frame.loc[0, "ID de la Incidencia"] == "INC0001"
+    assert frame.loc[0, "Status"] == "Analysing"
+    assert frame.loc[0, "__item_url__"] == "https://helix.example.com/INC0001"
+
+
 def test_issues_export_helix_raw_includes_all_imported_raw_fields(
     monkeypatch, tmp_path: Path
 ) -> None:
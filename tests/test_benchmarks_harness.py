@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.run import compare_results, run_benchmarks  # noqa: E402
+from benchmarks.workspace import WorkspaceSpec, generate_workspace  # noqa: E402
+
+
+def test_generate_workspace_is_deterministic_and_shaped_by_spec() -> None:
+    spec = WorkspaceSpec(issues=120, countries=("México",), raw_fields=6, seed=3)
+
+    first = generate_workspace(spec)
+    second = generate_workspace(spec)
+
+    keys = [issue.key for issue in first.issues_doc.issues]
+    assert keys == [issue.key for issue in second.issues_doc.issues]
+    assert len(keys) == 120
+    assert {issue.source_type for issue in first.issues_doc.issues} == {"jira", "helix"}
+    assert len(first.helix_doc.items) == sum(len(rows) for rows in first.helix_rows.values())
+    assert (
+        sum(len(rows) for rows in first.jira_payloads.values()) + len(first.helix_doc.items) == 120
+    )
+    assert any(
+        key.startswith("Campo ") for item in first.helix_doc.items for key in item.raw_fields
+    )
+
+
+def test_run_benchmarks_ingests_through_local_stand_ins(tmp_path: Path) -> None:
+    spec = WorkspaceSpec(issues=150, countries=("México",), raw_fields=4, description_chars=40)
+
+    report = run_benchmarks(
+        spec,
+        repeat=1,
+        only=["load_issues_df", "build_issue_rows_paging", "jira_ingest", "helix_ingest"],
+        workdir=tmp_path,
+    )
+
+    by_name = {row["name"]: row for row in report["scenarios"]}
+    assert list(by_name) == [
+        "load_issues_df",
+        "build_issue_rows_paging",
+        "jira_ingest",
+        "helix_ingest",
+    ]
+    assert by_name["load_issues_df"]["meta"]["rows"] == 150
+    assert by_name["build_issue_rows_paging"]["meta"]["rows"] == 150
+    assert by_name["jira_ingest"]["meta"]["state"] == "success"
+    assert by_name["helix_ingest"]["meta"]["state"] == "success"
+    assert by_name["helix_ingest"]["meta"]["requests"] >= 2
+
+    slower = {
+        "scenarios": [{**row, "p50_ms": row["p50_ms"] * 2 + 1} for row in report["scenarios"]]
+    }
+    deltas = compare_results(slower, report, threshold_pct=15.0)
+    assert [row["name"] for row in deltas] == list(by_name)
+    assert all(row["regression"] for row in deltas)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from bug_resolution_radar.services.compute_pool import ComputePool
+
+
+def test_run_coalesces_identical_inflight_keys() -> None:
+    pool = ComputePool(max_workers=2, name="test-compute")
+    release = threading.Event()
+    calls = {"n": 0}
+
+    def _work() -> dict[str, int]:
+        calls["n"] += 1
+        release.wait(timeout=5)
+        return {"value": 42}
+
+    async def _burst() -> list[dict[str, int]]:
+        tasks = [asyncio.ensure_future(pool.run(_work, key=("dashboard", "mx"))) for _ in range(4)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return list(await asyncio.gather(*tasks))
+
+    try:
+        results = asyncio.run(_burst())
+    finally:
+        pool.shutdown()
+
+    assert calls["n"] == 1
+    assert all(result is results[0] for result in results)
+    stats = pool.stats()
+    assert stats["submitted"] == 1
+    assert stats["coalesced"] == 3
+    assert stats["completed"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["inflight_keys"] == 0
+
+
+def test_run_propagates_errors_and_allows_retry() -> None:
+    pool = ComputePool(max_workers=1, name="test-compute")
+
+    def _boom() -> None:
+        raise ValueError("fallo")
+
+    try:
+        with pytest.raises(ValueError, match="fallo"):
+            asyncio.run(pool.run(_boom, key="k"))
+        assert asyncio.run(pool.run(lambda: "ok", key="k")) == "ok"
+    finally:
+        pool.shutdown()
+
+    stats = pool.stats()
+    assert stats["failed"] == 1
+    assert stats["completed"] == 1
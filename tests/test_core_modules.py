@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -9,7 +11,13 @@ import streamlit as st
 
 from bug_resolution_radar import config as cfg
 from bug_resolution_radar.common.security import mask_secret, safe_log_text
-from bug_resolution_radar.common.utils import now_iso, parse_age_buckets, parse_int_list
+from bug_resolution_radar.common.utils import (
+    bool_env,
+    int_env,
+    now_iso,
+    parse_age_buckets,
+    parse_int_list,
+)
 from bug_resolution_radar.services.notes import NotesStore
 from bug_resolution_radar.ui.common import (
     chip_style_from_color,
@@ -35,6 +43,19 @@ def test_parse_helpers() -> None:
     assert parse_age_buckets("0-2,3-7,>30") == [(0, 2), (3, 7), (30, 10**9)]
 
 
+def test_env_override_helpers_fall_back_to_default(monkeypatch: Any) -> None:
+    monkeypatch.setenv("RADAR_TEST_INT", " 12 ")
+    monkeypatch.setenv("RADAR_TEST_BOOL", "off")
+    assert int_env("RADAR_TEST_INT", 3) == 12
+    assert bool_env("RADAR_TEST_BOOL", True) is False
+
+    monkeypatch.setenv("RADAR_TEST_INT", "doce")
+    monkeypatch.setenv("RADAR_TEST_BOOL", "quizá")
+    assert int_env("RADAR_TEST_INT", 3) == 3
+    assert bool_env("RADAR_TEST_BOOL", True) is True
+    assert int_env("RADAR_TEST_UNSET", 7) == 7
+
+
 def test_notes_store_roundtrip(tmp_path: Path) -> None:
     store_path = tmp_path / "notes.json"
     store = NotesStore(store_path)
@@ -50,6 +71,42 @@ def test_notes_store_roundtrip(tmp_path: Path) -> None:
     assert reloaded.get("X-1") == "nota local"
 
 
+def test_notes_store_imports_legacy_json_and_reads_in_bulk(tmp_path: Path) -> None:
+    store_path = tmp_path / "notes.json"
+    store_path.write_text(json.dumps({"X-1": "antigua", "X-2": "otra"}), encoding="utf-8")
+
+    store = NotesStore(store_path)
+    store.load()
+    store.set("X-2", "editada")
+    store.set("X-3", "nueva")
+
+    assert store.get_many(["X-1", "X-2", "X-3", "X-4"]) == {
+        "X-1": "antigua",
+        "X-2": "editada",
+        "X-3": "nueva",
+    }
+    assert json.loads(store_path.read_text(encoding="utf-8"))["X-2"] == "otra"
+
+
+def test_notes_store_concurrent_writes_are_not_lost(tmp_path: Path) -> None:
+    store_path = tmp_path / "notes.json"
+    NotesStore(store_path).load()
+
+    def _write(worker: int) -> None:
+        store = NotesStore(store_path)
+        for idx in range(10):
+            store.set(f"W{worker}-{idx}", f"nota {worker}.{idx}")
+
+    threads = [threading.Thread(target=_write, args=(worker,)) for worker in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    keys = [f"W{worker}-{idx}" for worker in range(6) for idx in range(10)]
+    assert len(NotesStore(store_path).get_many(keys)) == 60
+
+
 def test_security_masking_helpers() -> None:
     assert mask_secret("abc") == "***"
     assert mask_secret("1234567890").startswith("123")
@@ -82,13 +139,41 @@ def test_config_ensure_env_from_example_and_load_save(monkeypatch: Any, tmp_path
     assert len(jira_cfg) == 1
     assert "\n" in jira_cfg[0]["jql"]
 
-    settings.JIRA_SOURCES_JSON = '[{"country":"México","alias":"Core","jql":"linea 1\\nlinea 2"}]'
+    settings = settings.model_copy(
+        update={
+            "JIRA_SOURCES_JSON": '[{"country":"México","alias":"Core","jql":"linea 1\\nlinea 2"}]'
+        }
+    )
     cfg.save_settings(settings)
     saved = env_path.read_text(encoding="utf-8")
     assert "JIRA_SOURCES_JSON=" in saved
     assert "linea 1\\nlinea 2" in saved
 
 
+def test_load_settings_reuses_snapshot_until_env_changes(monkeypatch: Any, tmp_path: Path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("APP_TITLE=Radar\n", encoding="utf-8")
+    monkeypatch.setattr(cfg, "ENV_PATH", env_path)
+    monkeypatch.setattr(cfg, "ENV_EXAMPLE_PATH", tmp_path / ".env.example")
+
+    first = cfg.load_settings()
+    assert cfg.load_settings() is first
+    token = cfg.settings_cache_token(first)
+    try:
+        first.APP_TITLE = "Mutado"  # type: ignore[misc]
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("load_settings() debe devolver un snapshot inmutable")
+
+    cfg.save_settings(first.model_copy(update={"APP_TITLE": "Rádar"}))
+
+    second = cfg.load_settings()
+    assert second is not first
+    assert second.APP_TITLE == "Rádar"
+    assert cfg.settings_cache_token(second) != token
+
+
 def test_config_resolves_relative_data_paths_against_env_location(
     monkeypatch: Any, tmp_path: Path
 ) -> None:
@@ -136,7 +221,7 @@ def test_config_save_settings_preserves_unknown_env_keys(monkeypatch: Any, tmp_p
     monkeypatch.setattr(cfg, "ENV_EXAMPLE_PATH", tmp_path / ".env.example")
 
     settings = cfg.load_settings()
-    settings.APP_TITLE = "Radar Pro"
+    settings = settings.model_copy(update={"APP_TITLE": "Radar Pro"})
     cfg.save_settings(settings)
 
     saved = env_path.read_text(encoding="utf-8")
@@ -162,7 +247,7 @@ def test_config_save_settings_can_prune_legacy_keys(monkeypatch: Any, tmp_path:
     monkeypatch.setattr(cfg, "ENV_EXAMPLE_PATH", tmp_path / ".env.example")
 
     settings = cfg.load_settings()
-    settings.APP_TITLE = "Radar Pro"
+    settings = settings.model_copy(update={"APP_TITLE": "Radar Pro"})
     cfg.save_settings(settings, drop_keys=cfg.LEGACY_ENV_KEYS_TO_PRUNE)
 
     saved = env_path.read_text(encoding="utf-8")
@@ -226,7 +311,7 @@ def test_config_roundtrip_quincena_last_finished_preference(
     settings = cfg.load_settings()
     assert str(settings.QUINCENA_LAST_FINISHED_ONLY).strip().lower() == "true"
 
-    settings.QUINCENA_LAST_FINISHED_ONLY = "false"
+    settings = settings.model_copy(update={"QUINCENA_LAST_FINISHED_ONLY": "false"})
     cfg.save_settings(settings)
     saved = env_path.read_text(encoding="utf-8")
     assert "QUINCENA_LAST_FINISHED_ONLY=false" in saved
@@ -242,7 +327,7 @@ def test_config_roundtrip_open_issues_focus_mode(monkeypatch: Any, tmp_path: Pat
     settings = cfg.load_settings()
     assert str(settings.OPEN_ISSUES_FOCUS_MODE).strip().lower() == "maestras"
 
-    settings.OPEN_ISSUES_FOCUS_MODE = "criticidad_alta"
+    settings = settings.model_copy(update={"OPEN_ISSUES_FOCUS_MODE": "criticidad_alta"})
     cfg.save_settings(settings)
     saved = env_path.read_text(encoding="utf-8")
     assert "OPEN_ISSUES_FOCUS_MODE=criticidad_alta" in saved
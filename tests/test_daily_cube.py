@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from bug_resolution_radar.analytics.daily_cube import (
+    apply_cube_delta,
+    build_daily_cube,
+    cube_daily_totals,
+    cube_period_counts,
+    cube_theme_daily_trend,
+    cube_timeseries_daily,
+    slice_cube,
+)
+from bug_resolution_radar.analytics.insights import build_theme_daily_trend
+from bug_resolution_radar.analytics.kpis import build_timeseries_daily
+from bug_resolution_radar.analytics.status_semantics import effective_closed_mask
+
+
+def _issues(n: int = 600) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    created = pd.Timestamp("2025-01-01", tz="UTC") + pd.to_timedelta(
+        rng.integers(0, 160 * 86400, n), unit="s"
+    )
+    resolved = created + pd.to_timedelta(rng.integers(0, 30 * 86400, n), unit="s")
+    resolved = resolved.where(rng.random(n) < 0.5)
+    return pd.DataFrame(
+        {
+            "key": [f"K-{i}" for i in range(n)],
+            "summary": rng.choice(
+                ["Error en login", "Fallo en transferencia", "Pago con tarjeta", "Otro"], n
+            ),
+            "status": np.where(
+                pd.notna(resolved), "Closed", rng.choice(["New", "Accepted", "Blocked"], n)
+            ),
+            "priority": rng.choice(["High", "Low", None], n),
+            "created": created,
+            "updated": created + pd.Timedelta(days=2),
+            "resolved": resolved,
+            "source_id": rng.choice(["jira:es:a", "jira:es:b", "helix:mx:c"], n),
+            "country": "España",
+        }
+    )
+
+
+def test_cube_slices_match_row_based_builders() -> None:
+    df = _issues()
+    cube = build_daily_cube(df)
+
+    pd.testing.assert_frame_equal(
+        cube_timeseries_daily(cube, lookback_days=45),
+        build_timeseries_daily(df, lookback_days=45),
+        check_dtype=False,
+    )
+    scope = ["jira:es:a", "jira:es:b"]
+    pd.testing.assert_frame_equal(
+        cube_timeseries_daily(slice_cube(cube, source_ids=scope)),
+        build_timeseries_daily(df.loc[df["source_id"].isin(scope)]),
+        check_dtype=False,
+    )
+    open_rows = df.loc[~effective_closed_mask(df)]
+    pd.testing.assert_frame_equal(
+        cube_theme_daily_trend(slice_cube(cube, status_buckets=["open"])),
+        build_theme_daily_trend(open_rows),
+        check_dtype=False,
+    )
+
+
+def test_cube_period_counts_and_open_at_end() -> None:
+    df = _issues()
+    cube = build_daily_cube(df)
+    start, end = pd.Timestamp("2025-03-01"), pd.Timestamp("2025-03-15")
+
+    counts = cube_period_counts(cube, start=start, end=end)
+    created_day = df["created"].dt.tz_convert(None).dt.normalize()
+    resolved_day = df["resolved"].dt.tz_convert(None).dt.normalize()
+    assert counts["created"] == int(created_day.between(start, end).sum())
+    assert counts["closed"] == int(resolved_day.between(start, end).sum())
+    assert counts["resolution_days_mean"] is not None
+
+    totals = cube_daily_totals(cube)
+    assert int(totals["open_at_end"].iloc[-1]) == int((~effective_closed_mask(df)).sum())
+
+
+def test_apply_cube_delta_matches_full_rebuild() -> None:
+    df = _issues()
+    cube = build_daily_cube(df)
+    before = df.iloc[:40]
+    after = before.assign(
+        status="Closed", resolved=before["created"] + pd.Timedelta(days=1), priority="Low"
+    )
+    extra = _issues(5).assign(key=lambda frame: "NEW-" + frame["key"])
+    updated = pd.concat([after, df.iloc[40:], extra], ignore_index=True)
+
+    patched = apply_cube_delta(cube, removed=before, added=pd.concat([after, extra]))
+
+    pd.testing.assert_frame_equal(patched, build_daily_cube(updated), check_exact=False)
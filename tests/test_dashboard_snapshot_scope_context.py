@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import pandas as pd
@@ -7,7 +8,14 @@ import pandas as pd
 from bug_resolution_radar.analytics.filtering import FilterState
 from bug_resolution_radar.config import Settings
 from bug_resolution_radar.services import dashboard_snapshot
-from bug_resolution_radar.services.dashboard_snapshot import DashboardQuery, build_issue_rows
+from bug_resolution_radar.services.dashboard_snapshot import (
+    DashboardQuery,
+    DashboardScopeContext,
+    build_issue_rows,
+    build_report_scope_query,
+    scope_chart_figure,
+    scope_trend_insight_pack,
+)
 from bug_resolution_radar.services.workspace import WorkspaceSelection
 
 
@@ -74,3 +82,209 @@ def test_build_issue_rows_skips_kpi_computation(monkeypatch: Any, tmp_path) -> N
 
     assert out["total"] == 2
     assert [row["key"] for row in out["rows"]] == ["MEX-2"]
+    assert out["nextCursor"]
+
+
+def test_build_issue_rows_pages_by_cursor_and_projects_columns(monkeypatch: Any, tmp_path) -> None:
+    settings = Settings(DATA_PATH=str(tmp_path / "issues.json"))
+    query = DashboardQuery(
+        workspace=WorkspaceSelection(country="México", source_id="jira:mexico:core"),
+        filters=FilterState(status=[], priority=[], assignee=[]),
+    )
+    updated = ["2026-04-03", None, "2026-04-01", "2026-04-03", "2026-04-02", None, "2026-04-01"]
+    scoped_df = pd.DataFrame(
+        {
+            "key": [f"MEX-{i}" for i in range(len(updated))],
+            "summary": [f"Issue {i}" for i in range(len(updated))],
+            "status": "New",
+            "source_id": "jira:mexico:core",
+            "updated": pd.to_datetime(updated, utc=True),
+        }
+    )
+    monkeypatch.setattr(
+        dashboard_snapshot,
+        "load_workspace_dataframe",
+        lambda settings, *, query: scoped_df,
+    )
+    dashboard_snapshot._scope_context_cache.clear()
+    sort_calls = {"value": 0}
+    original_sort_index = dashboard_snapshot._IssueSortIndex
+
+    def _counting_sort_index(*args: Any, **kwargs: Any) -> Any:
+        sort_calls["value"] += 1
+        return original_sort_index(*args, **kwargs)
+
+    monkeypatch.setattr(dashboard_snapshot, "_IssueSortIndex", _counting_sort_index)
+
+    for sort_dir in ("desc", "asc"):
+        expected = scoped_df.sort_values(
+            ["updated", "key"], ascending=sort_dir == "asc", na_position="last"
+        )["key"].tolist()
+        seen: list[str] = []
+        after = ""
+        while True:
+            page = build_issue_rows(
+                settings,
+                query=query,
+                limit=3,
+                sort_by="updated",
+                sort_dir=sort_dir,
+                after=after,
+                columns=["summary", "bogus"],
+            )
+            assert all(list(row) == ["key", "summary"] for row in page["rows"])
+            seen.extend(row["key"] for row in page["rows"])
+            if not page["nextCursor"]:
+                break
+            after = page["nextCursor"]
+        assert seen == expected
+
+        by_offset = build_issue_rows(
+            settings, query=query, offset=3, limit=3, sort_by="updated", sort_dir=sort_dir
+        )
+        assert [row["key"] for row in by_offset["rows"]] == expected[3:6]
+    assert sort_calls["value"] == 2
+
+
+def test_build_report_scope_query_maps_single_and_multi_source() -> None:
+    single = build_report_scope_query(country="México", source_ids=["jira:mexico:core"])
+    assert single.workspace.scope_mode == "source"
+    assert single.workspace.source_id == "jira:mexico:core"
+    assert single.source_ids == ()
+
+    multi = build_report_scope_query(
+        country="México", source_ids=["jira:mexico:core", "helix:mexico:ops"]
+    )
+    assert multi.workspace.scope_mode == "country"
+    assert multi.source_ids == ("jira:mexico:core", "helix:mexico:ops")
+
+
+def test_scope_artifacts_are_memoized_on_context(monkeypatch: Any) -> None:
+    dff = pd.DataFrame(
+        [
+            {
+                "key": "MEX-1",
+                "summary": "Primera",
+                "status": "New",
+                "priority": "High",
+                "created": pd.Timestamp("2026-04-01", tz="UTC"),
+                "resolved": pd.NaT,
+            }
+        ]
+    )
+    context = DashboardScopeContext(
+        scoped_df=dff, dff=dff, open_df=dff, source_ids=(), kpis={"open_now_total": 1}
+    )
+    calls = {"pack": 0}
+    original = dashboard_snapshot.build_trend_insight_pack
+
+    def _counting_pack(*args: Any, **kwargs: Any) -> Any:
+        calls["pack"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(dashboard_snapshot, "build_trend_insight_pack", _counting_pack)
+
+    first = scope_trend_insight_pack(context, "open_priority_pie")
+    assert scope_trend_insight_pack(context, "open_priority_pie") is first
+    assert calls["pack"] == 1
+
+    figure = scope_chart_figure(context, "open_priority_pie")
+    assert scope_chart_figure(context, "open_priority_pie") is figure
+    assert scope_chart_figure(context, "open_priority_pie", dark_mode=True) is not figure
+
+
+def test_load_scope_context_single_flight_for_concurrent_callers(
+    monkeypatch: Any, tmp_path
+) -> None:
+    settings = Settings(DATA_PATH=str(tmp_path / "issues.json"))
+    query = DashboardQuery(
+        workspace=WorkspaceSelection(country="México", source_id="jira:mexico:core"),
+        filters=FilterState(status=[], priority=[], assignee=[]),
+    )
+    started = threading.Event()
+    release = threading.Event()
+    calls = {"n": 0}
+
+    def _slow_scope(settings: Settings, *, query: DashboardQuery) -> pd.DataFrame:
+        calls["n"] += 1
+        started.set()
+        release.wait(timeout=5)
+        return pd.DataFrame(columns=["key", "status"])
+
+    monkeypatch.setattr(dashboard_snapshot, "load_workspace_dataframe", _slow_scope)
+    dashboard_snapshot._scope_context_cache.clear()
+
+    results: list[Any] = []
+    workers = [
+        threading.Thread(
+            target=lambda: results.append(
+                dashboard_snapshot.load_scope_context(settings, query=query)
+            )
+        )
+        for _ in range(3)
+    ]
+    workers[0].start()
+    assert started.wait(timeout=5)
+    for worker in workers[1:]:
+        worker.start()
+    release.set()
+    for worker in workers:
+        worker.join(timeout=5)
+
+    assert calls["n"] == 1
+    assert len(results) == 3
+    assert all(ctx is results[0] for ctx in results)
+
+
+def test_load_scope_context_keeps_prewarmed_contexts_past_default_ttl(
+    monkeypatch: Any, tmp_path
+) -> None:
+    settings = Settings(DATA_PATH=str(tmp_path / "issues.json"))
+    query = DashboardQuery(
+        workspace=WorkspaceSelection(country="México", source_id="jira:mexico:core"),
+        filters=FilterState(status=[], priority=[], assignee=[]),
+    )
+    calls = {"n": 0}
+
+    def _scope(settings: Settings, *, query: DashboardQuery) -> pd.DataFrame:
+        calls["n"] += 1
+        return pd.DataFrame(columns=["key", "status"])
+
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(dashboard_snapshot, "load_workspace_dataframe", _scope)
+    monkeypatch.setattr(dashboard_snapshot, "monotonic", lambda: clock["now"])
+    dashboard_snapshot._scope_context_cache.clear()
+
+    dashboard_snapshot.load_scope_context(settings, query=query, ttl_seconds=600)
+    clock["now"] += 120
+    dashboard_snapshot.load_scope_context(settings, query=query)
+    assert calls["n"] == 1
+
+    clock["now"] += 600
+    dashboard_snapshot.load_scope_context(settings, query=query)
+    assert calls["n"] == 2
+
+
+def test_kpi_upgrade_keeps_the_scope_artifacts(monkeypatch: Any, tmp_path) -> None:
+    settings = Settings(DATA_PATH=str(tmp_path / "issues.json"))
+    query = DashboardQuery(
+        workspace=WorkspaceSelection(country="México", source_id="jira:mexico:core"),
+        filters=FilterState(status=[], priority=[], assignee=[]),
+    )
+    monkeypatch.setattr(
+        dashboard_snapshot,
+        "load_workspace_dataframe",
+        lambda settings, *, query: pd.DataFrame(columns=["key", "status"]),
+    )
+    monkeypatch.setattr(
+        dashboard_snapshot, "compute_kpis", lambda dff, **kwargs: {"open_now_total": 0}
+    )
+    dashboard_snapshot._scope_context_cache.clear()
+
+    bare = dashboard_snapshot.load_scope_context(settings, query=query)
+    bare.artifacts[("figure", "open_priority_pie")] = "memoized"
+    upgraded = dashboard_snapshot.load_scope_context(settings, query=query, include_kpis=True)
+
+    assert upgraded is not bare
+    assert upgraded.kpis == {"open_now_total": 0}
+    assert upgraded.artifacts is bare.artifacts
@@ -316,6 +316,30 @@ def test_kaleido_png_bytes_uses_cache(monkeypatch: pytest.MonkeyPatch) -> None:
     assert calls["n"] == 1
 
 
+def test_kaleido_png_bytes_reuses_disk_cache_after_restart(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fig = go.Figure(data=[go.Bar(x=["A", "B"], y=[1, 3])])
+    calls = {"n": 0}
+
+    def _fake_render(*args: object, **kwargs: object) -> bytes:
+        del args, kwargs
+        calls["n"] += 1
+        return b"persisted-png"
+
+    _clear_ppt_png_cache()
+    monkeypatch.setattr(executive_ppt_module, "render_plotly_figure_png", _fake_render)
+
+    first = _kaleido_png_bytes(fig, scale=2, export_width=640, export_height=400)
+    # Simulate a process restart: the in-memory layer is gone, the disk layer stays.
+    executive_ppt_module._PPT_PNG_CACHE.clear()
+    second = _kaleido_png_bytes(fig, scale=2, export_width=640, export_height=400)
+
+    assert first == second == b"persisted-png"
+    assert calls["n"] == 1
+    assert executive_ppt_module.CHART_PNG_CACHE.stats()["hits"] == 1
+
+
 def test_prerender_section_images_populates_payload(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -397,6 +421,37 @@ def test_generate_scope_executive_ppt_uses_result_cache(
     assert out1.content == b"PPT-CACHED"
     assert out2.content == out1.content
 
+    # After a restart only the persisted copy remains and it is reused verbatim.
+    executive_ppt_module._PPT_RESULT_CACHE.clear()
+    out3 = generate_scope_executive_ppt(
+        settings,
+        country="México",
+        source_id="jira:mexico:core-mx",
+        dff_override=base_df,
+        open_df_override=base_df,
+        scoped_source_df_override=base_df,
+    )
+    assert calls["compose"] == 1
+    assert out3 == out1
+
+    # A persisted deck from a previous day is not reused: its dates and aging are stale.
+    class _NextDay(datetime):
+        @classmethod
+        def now(cls, tz: object = None) -> datetime:  # type: ignore[override]
+            return datetime.now(timezone.utc) + timedelta(days=1)
+
+    executive_ppt_module._PPT_RESULT_CACHE.clear()
+    monkeypatch.setattr(executive_ppt_module, "datetime", _NextDay)
+    generate_scope_executive_ppt(
+        settings,
+        country="México",
+        source_id="jira:mexico:core-mx",
+        dff_override=base_df,
+        open_df_override=base_df,
+        scoped_source_df_override=base_df,
+    )
+    assert calls["compose"] == 2
+
 
 def test_build_sections_keeps_resolution_chart_when_open_data_exists() -> None:
     dff = pd.DataFrame(
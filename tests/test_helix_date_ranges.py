@@ -7,12 +7,13 @@ from bug_resolution_radar.ingest.helix_ingest import (
     _cache_pending_refresh_ids,
     _frame_to_rows,
     _optimize_create_start_from_cache,
+    _plan_watermark_sync,
     _resolve_create_date_range_ms,
     _rows_to_dicts,
     _smartit_base_from_dashboard_url,
     _utc_year_create_date_range_ms,
 )
-from bug_resolution_radar.models.schema_helix import HelixWorkItem
+from bug_resolution_radar.models.schema_helix import HelixSourceWatermark, HelixWorkItem
 
 
 def test_utc_year_create_date_range_ms_uses_full_year_boundaries() -> None:
@@ -384,3 +385,60 @@ def test_frame_to_rows_handles_ragged_column_lengths() -> None:
         {"id": "INC-1", "priority": "High"},
         {"id": "INC-2", "priority": None},
     ]
+
+
+def test_build_arsql_sql_adds_last_modified_lower_bound_for_incremental_runs() -> None:
+    sql = _build_arsql_sql(
+        create_start_ms=1_000_000,
+        create_end_ms=9_000_000,
+        limit=10,
+        offset=0,
+        time_fields=["Submit Date"],
+        modified_since_ms=5_000_000,
+    )
+
+    assert "`HPD:Help Desk`.`Last Modified Date` BETWEEN 5000 AND 9000" in sql
+    assert "`HPD:Help Desk`.`Last Modified Date` BETWEEN 5000000 AND 9000000" in sql
+    assert "`HPD:Help Desk`.`Submit Date` BETWEEN 1000 AND 9000" in sql
+
+    disabled = _build_arsql_sql(
+        create_start_ms=1_000_000,
+        create_end_ms=9_000_000,
+        limit=10,
+        offset=0,
+        modified_since_ms=5_000_000,
+        disabled_fields={"Last Modified Date"},
+    )
+    assert "Last Modified Date` BETWEEN 5000 AND" not in disabled
+
+
+def test_plan_watermark_sync_switches_between_incremental_and_full() -> None:
+    now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    now_ms = int(now.timestamp() * 1000)
+    window_start_ms = int((now - timedelta(days=400)).timestamp() * 1000)
+    watermark = HelixSourceWatermark(
+        last_modified_ms=now_ms - 3_600_000,
+        last_full_sync_at=(now - timedelta(hours=10)).isoformat(),
+        full_window_start_ms=window_start_ms,
+    )
+
+    def plan(wm: HelixSourceWatermark | None, **overrides: object) -> tuple[int | None, str]:
+        kwargs: dict = {
+            "has_cached_items": True,
+            "window_start_ms": window_start_ms,
+            "now_ms": now_ms,
+            "skew_minutes": 15,
+            "full_reconcile_hours": 168,
+        }
+        kwargs.update(overrides)
+        return _plan_watermark_sync(wm, **kwargs)
+
+    since_ms, rule = plan(watermark)
+    assert since_ms == now_ms - 3_600_000 - 15 * 60 * 1000
+    assert rule.startswith("sync=incremental")
+
+    assert plan(None)[0] is None
+    assert plan(watermark, has_cached_items=False)[0] is None
+    assert plan(watermark, enabled=False)[0] is None
+    assert "widened" in plan(watermark, window_start_ms=window_start_ms - 1)[1]
+    assert "scheduled" in plan(watermark, full_reconcile_hours=6)[1]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -8,6 +10,7 @@ import pytest
 import requests
 
 from bug_resolution_radar.ingest import helix_ingest as helix_mod
+from bug_resolution_radar.ingest.connection_context import IngestConnectionContext
 
 
 class _FakeResponse:
@@ -216,19 +219,280 @@ def test_ingest_helix_rewinds_window_for_non_final_cache_and_adds_outside_pendin
 
     assert ok is True
     assert "ingesta Helix OK" in msg
-    assert captured_sql
-    sql = captured_sql[0]
+    assert len(captured_sql) == 2
+    sql, refresh_sql = captured_sql
 
     expected_start_sec = int(
         (datetime(2025, 10, 15, 8, 0, 0, tzinfo=timezone.utc) - timedelta(days=7)).timestamp()
     )
     assert f"BETWEEN {expected_start_sec} AND " in sql
-    assert "'INC-OLD-PENDING'" in sql
-    assert "'INC-IN-WINDOW'" not in sql
+    assert "'INC-OLD-PENDING'" not in sql
+    # Pending IDs outside the window are revalidated by a dedicated ID-only query.
+    assert "`Incident Number` IN ('INC-OLD-PENDING')" in refresh_sql
+    assert "BETWEEN" not in refresh_sql
+    assert "'INC-IN-WINDOW'" not in refresh_sql
+    assert "Pendientes revalidadas por ID: 1" in msg
+    assert "sin respuesta 1" in msg
     assert doc is not None
     assert "pending_ids=1" in str(doc.query)
 
 
+def test_pending_id_batches_respect_count_and_sql_length() -> None:
+    ids = [f"INC{idx:012d}" for idx in range(7)]
+
+    assert helix_mod._pending_id_batches(ids, max_ids=3) == [ids[0:3], ids[3:6], ids[6:]]
+    # Each quoted ID plus separator takes 19 chars, so a 64-char budget fits three.
+    by_chars = helix_mod._pending_id_batches(ids, max_ids=50, max_chars=64)
+    assert [len(batch) for batch in by_chars] == [3, 3, 1]
+    assert helix_mod._pending_id_batches([], max_ids=3) == []
+
+
+def test_ingest_helix_refreshes_pending_ids_in_concurrent_batches(monkeypatch: Any) -> None:
+    columns = list(helix_mod._ARSQL_SELECT_ALIASES)
+    statuses = {"INC-A": "Open", "INC-B": "Closed", "INC-C": "In Progress"}
+    lock = threading.Lock()
+    inflight = {"now": 0, "max": 0}
+    refresh_sql: list[str] = []
+
+    def _row(incident_id: str, status: str) -> list[Any]:
+        row: list[Any] = [None] * len(columns)
+        row[0], row[1], row[2], row[3] = incident_id, "Low", f"Resumen {incident_id}", status
+        row[5] = "Incidencia"
+        row[8], row[9], row[10] = "BBVA México", "ENTERPRISE WEB", "ENTERPRISE WEB"
+        return row
+
+    def fake_request(*args: Any, **kwargs: Any) -> _FakeResponse:
+        sql = str((kwargs.get("json") or {}).get("sql") or "")
+        if "`Incident Number` IN (" not in sql:
+            return _FakeResponse(200, payload={"columns": columns, "rows": []})
+        with lock:
+            refresh_sql.append(sql)
+            inflight["now"] += 1
+            inflight["max"] = max(inflight["max"], inflight["now"])
+        time.sleep(0.02)
+        with lock:
+            inflight["now"] -= 1
+        rows = [_row(iid, status) for iid, status in statuses.items() if f"'{iid}'" in sql]
+        offset = int(re.search(r"OFFSET (\d+)", sql).group(1))
+        return _FakeResponse(200, payload={"columns": columns, "rows": rows[offset:]})
+
+    def fake_get(self: requests.Session, url: str, timeout: Any) -> _FakeResponse:
+        return _FakeResponse(200, text="ok", payload={"ok": True}, url=url)
+
+    base_start_ms = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    base_end_ms = int(datetime(2026, 2, 28, tzinfo=timezone.utc).timestamp() * 1000)
+    monkeypatch.setenv("HELIX_ARSQL_ID_BATCH_SIZE", "2")
+    monkeypatch.setenv("HELIX_ID_REFRESH_CONCURRENCY", "2")
+    monkeypatch.setattr(helix_mod, "_request", fake_request)
+    monkeypatch.setattr(
+        helix_mod,
+        "_resolve_create_date_range_ms",
+        lambda **_: (base_start_ms, base_end_ms, "fixed_window"),
+    )
+    monkeypatch.setattr(
+        helix_mod,
+        "get_helix_session_cookie",
+        lambda browser, host: "JSESSIONID=abc; XSRF-TOKEN=xyz; loginId=test-user",
+    )
+    monkeypatch.setattr(requests.Session, "get", fake_get, raising=True)
+
+    source_id = "helix:mexico:web"
+    cached = [
+        helix_mod.HelixWorkItem(id=iid, status="Open", source_id=source_id)
+        for iid in ("INC-A", "INC-B", "INC-C", "INC-D", "INC-E")
+    ]
+
+    def _run(items: list[Any]) -> tuple[str, Any]:
+        ok, msg, doc = helix_mod.ingest_helix(
+            browser="chrome",
+            country="México",
+            source_alias="WEB",
+            source_id=source_id,
+            dry_run=False,
+            cache_doc=helix_mod.HelixDocument(items=items),
+        )
+        assert ok is True
+        return msg, doc
+
+    msg, doc = _run(cached)
+
+    # The partially answered batch (INC-C, INC-D) reads one more, empty, page.
+    assert len(refresh_sql) == 4
+    assert inflight["max"] <= 2
+    assert "Pendientes revalidadas por ID: 5" in msg
+    assert "(actualizadas 2, sin cambios 0, cerradas 1, sin respuesta 2, fallidas 0)" in msg
+    assert {item.id for item in doc.items} == {"INC-A", "INC-B", "INC-C"}
+
+    # Re-running against the refreshed copies reports them as unchanged.
+    msg, _ = _run([item for item in doc.items if item.id != "INC-B"] + cached[3:])
+
+    assert "(actualizadas 0, sin cambios 2, cerradas 0, sin respuesta 2, fallidas 0)" in msg
+
+
+def test_ingest_helix_pages_pending_id_batches_on_clamped_tenants(monkeypatch: Any) -> None:
+    columns = list(helix_mod._ARSQL_SELECT_ALIASES)
+    pending_ids = [f"INC-{idx}" for idx in range(5)]
+    refresh_sql: list[str] = []
+
+    def _row(incident_id: str) -> list[Any]:
+        row: list[Any] = [None] * len(columns)
+        row[0], row[1], row[2], row[3] = incident_id, "Low", f"Resumen {incident_id}", "Open"
+        row[5] = "Incidencia"
+        row[8], row[9], row[10] = "BBVA México", "ENTERPRISE WEB", "ENTERPRISE WEB"
+        return row
+
+    def fake_request(*args: Any, **kwargs: Any) -> _FakeResponse:
+        sql = str((kwargs.get("json") or {}).get("sql") or "")
+        if "`Incident Number` IN (" not in sql:
+            return _FakeResponse(200, payload={"columns": columns, "rows": []})
+        refresh_sql.append(sql)
+        # The tenant serves at most two rows per page whatever LIMIT asks for.
+        offset = int(re.search(r"OFFSET (\d+)", sql).group(1))
+        matched = [_row(iid) for iid in pending_ids if f"'{iid}'" in sql]
+        return _FakeResponse(
+            200, payload={"columns": columns, "rows": matched[offset : offset + 2]}
+        )
+
+    def fake_get(self: requests.Session, url: str, timeout: Any) -> _FakeResponse:
+        return _FakeResponse(200, text="ok", payload={"ok": True}, url=url)
+
+    base_start_ms = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    base_end_ms = int(datetime(2026, 2, 28, tzinfo=timezone.utc).timestamp() * 1000)
+    monkeypatch.delenv("HELIX_ARSQL_ID_BATCH_SIZE", raising=False)
+    monkeypatch.setattr(helix_mod, "_request", fake_request)
+    monkeypatch.setattr(
+        helix_mod,
+        "_resolve_create_date_range_ms",
+        lambda **_: (base_start_ms, base_end_ms, "fixed_window"),
+    )
+    monkeypatch.setattr(
+        helix_mod,
+        "get_helix_session_cookie",
+        lambda browser, host: "JSESSIONID=abc; XSRF-TOKEN=xyz; loginId=test-user",
+    )
+    monkeypatch.setattr(requests.Session, "get", fake_get, raising=True)
+
+    source_id = "helix:mexico:web"
+    ok, msg, doc = helix_mod.ingest_helix(
+        browser="chrome",
+        country="México",
+        source_alias="WEB",
+        source_id=source_id,
+        dry_run=False,
+        cache_doc=helix_mod.HelixDocument(
+            items=[
+                helix_mod.HelixWorkItem(id=iid, status="Open", source_id=source_id)
+                for iid in pending_ids
+            ]
+        ),
+    )
+
+    assert ok is True
+    # One IN (...) batch read over three clamped pages (2 + 2 + 1 rows).
+    assert [int(re.search(r"OFFSET (\d+)", sql).group(1)) for sql in refresh_sql] == [0, 2, 4]
+    assert "Pendientes revalidadas por ID: 5" in msg
+    assert "sin respuesta 0" in msg
+    assert {item.id for item in doc.items} == set(pending_ids)
+
+
+def test_ingest_helix_uses_last_modified_watermark_between_reconciliations(
+    monkeypatch: Any,
+) -> None:
+    captured_sql: list[str] = []
+    modified_ms = int(datetime.now(timezone.utc).timestamp() * 1000) - 60_000
+
+    def fake_request(*args: Any, **kwargs: Any) -> _FakeResponse:
+        body = kwargs.get("json") or {}
+        captured_sql.append(str(body.get("sql") or ""))
+        return _FakeResponse(
+            200,
+            payload={
+                "total": 1,
+                "columns": list(helix_mod._ARSQL_SELECT_ALIASES),
+                "rows": [
+                    [
+                        "INC0009",
+                        "Low",
+                        "Cambio reciente",
+                        "Open",
+                        "Ana",
+                        "Incidencia",
+                        "Service A",
+                        "Impact A",
+                        "BBVA México",
+                        "ENTERPRISE WEB",
+                        "ENTERPRISE WEB",
+                        modified_ms,
+                        None,
+                        modified_ms,
+                        modified_ms,
+                        "IDG0009",
+                    ]
+                ],
+            },
+        )
+
+    def fake_get(self: requests.Session, url: str, timeout: Any) -> _FakeResponse:
+        return _FakeResponse(200, text="ok", payload={"ok": True}, url=url)
+
+    base_start_ms = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    base_end_ms = int((datetime.now(timezone.utc) + timedelta(days=7)).timestamp() * 1000)
+    monkeypatch.setattr(helix_mod, "_request", fake_request)
+    monkeypatch.setattr(
+        helix_mod,
+        "_resolve_create_date_range_ms",
+        lambda **_: (base_start_ms, base_end_ms, "fixed_window"),
+    )
+    monkeypatch.setattr(
+        helix_mod,
+        "get_helix_session_cookie",
+        lambda browser, host: "JSESSIONID=abc; XSRF-TOKEN=xyz; loginId=test-user",
+    )
+    monkeypatch.setattr(requests.Session, "get", fake_get, raising=True)
+
+    source_id = "helix:mexico:web"
+    watermark_ms = modified_ms - 3_600_000
+    last_full = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+    cache_doc = helix_mod.HelixDocument(
+        items=[
+            helix_mod.HelixWorkItem(
+                id="INC-OLD-PENDING",
+                status="Open",
+                source_id=source_id,
+                target_date="2025-02-10T00:00:00+00:00",
+            )
+        ],
+        source_watermarks={
+            source_id: helix_mod.HelixSourceWatermark(
+                last_modified_ms=watermark_ms,
+                last_full_sync_at=last_full,
+                full_window_start_ms=base_start_ms,
+            )
+        },
+    )
+
+    ok, msg, doc = helix_mod.ingest_helix(
+        browser="chrome",
+        country="México",
+        source_alias="WEB",
+        source_id=source_id,
+        dry_run=False,
+        cache_doc=cache_doc,
+    )
+
+    assert ok is True
+    assert "Modo: incremental" in msg
+    since_ms = watermark_ms - 15 * 60 * 1000
+    assert f"`Last Modified Date` BETWEEN {since_ms} AND" in captured_sql[0]
+    # The full business window is kept; the modified-since bound does the narrowing.
+    assert f"`Submit Date` BETWEEN {base_start_ms // 1000} AND" in captured_sql[0]
+    assert doc is not None
+    assert "sync=incremental" in doc.query
+    watermark = doc.source_watermarks[source_id]
+    assert watermark.last_modified_ms == modified_ms
+    assert watermark.last_full_sync_at == last_full
+
+
 def test_ingest_helix_paginates_when_batch_is_smaller_than_requested_chunk(
     monkeypatch: Any,
 ) -> None:
@@ -885,3 +1149,52 @@ def test_ingest_helix_forces_interactive_bootstrap_on_preflight_sso_redirect(
     assert ok is True
     assert "ingesta Helix OK" in msg
     assert opened_urls
+
+
+def test_ingest_helix_reuses_cookie_and_discovered_uid_across_sources(monkeypatch: Any) -> None:
+    cookie_reads: list[str] = []
+    discoveries: list[str] = []
+    endpoints: list[str] = []
+
+    def fake_request(*args: Any, **kwargs: Any) -> _FakeResponse:
+        endpoints.append(str(args[2]))
+        return _FakeResponse(
+            200, payload={"columns": list(helix_mod._ARSQL_SELECT_ALIASES), "rows": []}
+        )
+
+    def fake_get(self: requests.Session, url: str, timeout: Any) -> _FakeResponse:
+        return _FakeResponse(200, text="ok", payload={"ok": True}, url=url)
+
+    def fake_cookie(browser: str, host: str) -> str:
+        cookie_reads.append(host)
+        return "JSESSIONID=abc; XSRF-TOKEN=xyz; loginId=test-user"
+
+    def fake_discover(session: Any, *, scheme: str, host: str, timeout: Any) -> str:
+        discoveries.append(host)
+        return "DISCOVERED"
+
+    monkeypatch.delenv("HELIX_ARSQL_DATASOURCE_UID", raising=False)
+    monkeypatch.setattr(helix_mod, "_request", fake_request)
+    monkeypatch.setattr(helix_mod, "get_helix_session_cookie", fake_cookie)
+    monkeypatch.setattr(helix_mod, "_discover_arsql_datasource_uid", fake_discover)
+    monkeypatch.setattr(requests.Session, "get", fake_get, raising=True)
+
+    connections = IngestConnectionContext()
+    for alias in ("WEB", "APP"):
+        ok, _, _ = helix_mod.ingest_helix(
+            browser="chrome",
+            country="México",
+            source_alias=alias,
+            dry_run=False,
+            create_date_year=2026,
+            connections=connections,
+        )
+        assert ok is True
+
+    assert discoveries == ["itsmhelixbbva-ir1.onbmc.com"]
+    # Discovery itself reads the cookie for the candidate host once; the second
+    # source takes both cookie and datasource from the run context.
+    assert cookie_reads == ["itsmhelixbbva-ir1.onbmc.com", "itsmhelixbbva-ir1.onbmc.com"]
+    assert endpoints and all("/uid/DISCOVERED/" in url for url in endpoints)
+    assert connections.stats()["datasource_reused"] == 1
+    assert connections.stats()["sessions_reused"] == 1
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pandas as pd
 
-from bug_resolution_radar.models.schema_helix import HelixWorkItem
+from bug_resolution_radar.models.schema_helix import HelixDocument, HelixWorkItem
+from bug_resolution_radar.repositories.helix_repo import HelixRepo
 from bug_resolution_radar.services.helix_raw_export import (
     build_helix_raw_export_frame,
+    open_helix_raw_export,
 )
 
 
@@ -151,3 +155,50 @@ def test_build_helix_raw_export_frame_keeps_row_when_raw_fields_are_empty() -> N
     assert isinstance(out, pd.DataFrame)
     assert len(out) == 1
     assert out.loc[0, "ID de la Incidencia"] == "INC-2"
+
+
+def test_open_helix_raw_export_joins_sidecar_rows_in_batches(tmp_path: Path) -> None:
+    path = tmp_path / "helix_dump.json"
+    items = [
+        HelixWorkItem(
+            id=f"INC-{idx}",
+            source_id="helix:mx:web",
+            url=f"https://smartit/inc-{idx}",
+            priority="High",
+            raw_fields={"Status": f"S{idx}", f"Only {idx}": "x"},
+        )
+        for idx in range(5)
+    ]
+    HelixRepo(path).save(HelixDocument(items=items))
+    df = pd.DataFrame(
+        [
+            {"key": f"INC-{idx}", "source_type": "helix", "source_id": "helix:mx:web"}
+            for idx in (3, 0, 4, 9)
+        ]
+    )
+
+    export = open_helix_raw_export(df, helix_path=str(path), batch_rows=2)
+
+    assert export is not None
+    assert len(export) == 3
+    assert [len(batch) for batch in export.batches()] == [2, 1]
+    out = export.to_frame()
+    legacy = build_helix_raw_export_frame(
+        df, helix_items_by_merge_key={f"helix:mx:web::{item.id}": item for item in items}
+    )
+    pd.testing.assert_frame_equal(out, legacy)
+    assert out["ID de la Incidencia"].tolist() == ["INC-3", "INC-0", "INC-4"]
+    assert out["Status"].tolist() == ["S3", "S0", "S4"]
+    # Raw columns without a value in the scope are projected away.
+    assert "Only 1" not in out.columns
+    assert {"Only 0", "Only 3", "Only 4"} <= set(out.columns)
+
+    export.write_xlsx(tmp_path / "raw.xlsx")
+    sheet = pd.read_excel(tmp_path / "raw.xlsx", sheet_name="Helix Raw")
+    assert sheet["ID de la Incidencia"].tolist() == ["INC-3", "INC-0", "INC-4"]
+    assert "__item_url__" not in sheet.columns
+
+    export.write_csv(tmp_path / "raw.csv")
+    assert (tmp_path / "raw.csv").read_bytes().startswith(b"\xef\xbb\xbf")
+    csv = pd.read_csv(tmp_path / "raw.csv", encoding="utf-8-sig")
+    assert csv["__item_url__"].tolist() == [f"https://smartit/inc-{idx}" for idx in (3, 0, 4)]
@@ -47,3 +47,31 @@ def test_helix_repo_save_creates_export_sidecars(tmp_path: Path) -> None:
     assert meta["items_count"] == 1
     assert meta["helix_source_count"] == 1
     assert meta["query"] == "'HPD:Help Desk'"
+
+
+def test_helix_repo_save_patches_export_for_changed_keys(tmp_path: Path) -> None:
+    path = tmp_path / "helix_dump.json"
+
+    def _item(item_id: str, status: str) -> HelixWorkItem:
+        return HelixWorkItem(
+            id=item_id, source_id="helix:espana:core", raw_fields={"Status": status}
+        )
+
+    doc = HelixDocument(items=[_item("INC1", "Open"), _item("INC2", "Open")])
+    repo = HelixRepo(path)
+    repo.save(doc)
+
+    doc.items[0] = _item("INC1", "Closed")
+    doc.items.append(_item("INC3", "Open"))
+    repo.save(doc, changed_keys={"helix:espana:core::INC1", "helix:espana:core::INC3"})
+
+    export_df = load_helix_export_df(str(path))
+    assert export_df["ID de la Incidencia"].tolist() == ["INC1", "INC2", "INC3"]
+    assert export_df["Status"].tolist() == ["Closed", "Open", "Open"]
+    assert load_helix_meta(str(path))["items_count"] == 3
+
+    parquet_path = path.with_suffix(".raw.parquet")
+    before = parquet_path.read_bytes()
+    repo.save(doc, changed_keys=set())
+    assert parquet_path.read_bytes() == before
+    assert len(load_helix_export_df(str(path))) == 3
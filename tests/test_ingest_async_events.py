@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+import time
+from collections import deque
+
+ingest_async = importlib.import_module("bug_resolution_radar.services.ingest_async")
+
+
+def _reset_state() -> None:
+    with ingest_async._LOCK:
+        ingest_async._PROGRESS.clear()
+        ingest_async._RUNNING_WORKERS.clear()
+
+
+def _run_one_source(connector: str) -> int:
+    run_id, _ = ingest_async._start_progress(connector, total_sources=1, max_run_seconds=600)
+    ingest_async._mark_source_started(
+        connector, run_id=run_id, source_label="Core", source_index=1, total_sources=1
+    )
+    ingest_async._append_progress(
+        connector, run_id=run_id, ok=True, message="Core OK", completed_sources=1, total_sources=1
+    )
+    ingest_async._finish_progress(
+        connector,
+        run_id=run_id,
+        result={"state": "success", "summary": "ok", "success_count": 1, "total_sources": 1},
+    )
+    return run_id
+
+
+def test_ingest_events_are_numbered_and_resumable() -> None:
+    _reset_state()
+
+    first = ingest_async.ingest_events_since("jira")
+    assert first["snapshot"]["state"] == "idle"
+    assert first["events"] == []
+
+    run_id = _run_one_source("jira")
+
+    batch = ingest_async.ingest_events_since("jira", first["lastSeq"])
+    assert batch["snapshot"] is None
+    assert [event["type"] for event in batch["events"]] == [
+        "run_started",
+        "source_started",
+        "source_finished",
+        "run_finished",
+    ]
+    assert [event["seq"] for event in batch["events"]] == [1, 2, 3, 4]
+    assert {event["runId"] for event in batch["events"]} == {run_id}
+    assert batch["events"][2]["successCount"] == 1
+    assert batch["events"][3]["state"] == "success"
+
+    resumed = ingest_async.ingest_events_since("jira", 2)
+    assert [event["seq"] for event in resumed["events"]] == [3, 4]
+    assert ingest_async.ingest_events_since("jira", 4)["events"] == []
+
+
+def test_ingest_events_fall_back_to_snapshot_when_resume_is_impossible() -> None:
+    _reset_state()
+    with ingest_async._LOCK:
+        ingest_async._entry("helix").events = deque(maxlen=2)
+
+    _run_one_source("helix")
+
+    evicted = ingest_async.ingest_events_since("helix", 1)
+    assert evicted["events"] == []
+    assert evicted["snapshot"]["state"] == "success"
+    assert evicted["snapshot"]["lastSeq"] == evicted["lastSeq"] == 4
+
+    from_other_process = ingest_async.ingest_events_since("helix", 99)
+    assert from_other_process["snapshot"] is not None
+
+
+def test_profiler_pages_are_streamed_as_progress_events() -> None:
+    _reset_state()
+    run_id, _ = ingest_async._start_progress("helix", total_sources=1, max_run_seconds=600)
+    with ingest_async._LOCK:
+        profiler = ingest_async._entry("helix").profiler
+        ingest_async._RUNNING_WORKERS["helix"] = (run_id, threading.current_thread())
+    assert profiler is not None
+
+    profiler.record_page(source_id="helix:mx", page=1, status=200, elapsed_ms=40.0, rows=25)
+    profiler.record_page(source_id="helix:mx", page=2, status=200, elapsed_ms=60.0, rows=5)
+    profiler.record_event("chunk_cut", source_id="helix:mx", chunk_size=50)
+
+    events = ingest_async.ingest_events_since("helix", 1)["events"]
+    assert [event["type"] for event in events] == ["page", "page", "adaptation"]
+    assert events[1]["page"] == 2
+    assert events[1]["totals"]["pages"] == 2
+    assert events[1]["totals"]["rows"] == 30
+    assert events[2]["kind"] == "chunk_cut"
+    assert events[2]["chunk_size"] == 50
+
+    ingest_async._fail_progress("helix", run_id=run_id, detail="boom")
+    profiler.record_page(source_id="helix:mx", page=3, status=200, elapsed_ms=10.0)
+    tail = ingest_async.ingest_events_since("helix", events[-1]["seq"])["events"]
+    assert [event["type"] for event in tail] == ["error", "run_finished"]
+
+
+def test_event_waiter_is_woken_from_ingest_threads() -> None:
+    _reset_state()
+
+    async def _wait() -> bool:
+        with ingest_async.IngestEventWaiter("jira") as waiter:
+            threading.Timer(
+                0.05,
+                lambda: ingest_async._start_progress("jira", total_sources=1, max_run_seconds=600),
+            ).start()
+            return await waiter.wait(5.0)
+
+    started = time.monotonic()
+    assert asyncio.run(_wait()) is True
+    assert time.monotonic() - started < 2.0
+    assert ingest_async._WAITERS["jira"] == set()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib
+import json
 import time
 from pathlib import Path
 from typing import Any
@@ -78,3 +79,38 @@ def test_start_ingest_job_recovers_stale_running_state_and_restarts(
             break
         time.sleep(0.02)
     assert latest["state"] == "success"
+
+
+def test_ingest_job_exposes_live_telemetry_and_persists_profile(
+    monkeypatch: Any,
+    tmp_path: Path,
+) -> None:
+    _reset_state()
+    settings = _settings(tmp_path)
+    profile_path = tmp_path / "profiles.jsonl"
+    monkeypatch.setenv("INGEST_PROFILE_JSONL_PATH", str(profile_path))
+
+    def _fake_run(*args: Any, profiler: Any, **kwargs: Any) -> dict[str, Any]:
+        profiler.record_page(source_id="jira:es:core", page=1, status=200, elapsed_ms=42.0, rows=7)
+        return {"state": "success", "summary": "ok", "success_count": 1, "total_sources": 1}
+
+    monkeypatch.setattr(ingest_async, "run_jira_ingest", _fake_run)
+
+    started = ingest_async.start_ingest_job(
+        "jira",
+        settings=settings,
+        selected_sources=[{"source_id": "jira:es:core", "country": "España", "alias": "Core"}],
+    )
+    assert started["telemetry"]["pages"] == 0
+
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline and not profile_path.exists():
+        time.sleep(0.02)
+
+    latest = ingest_async.get_ingest_progress("jira")
+    assert latest["state"] == "success"
+    assert latest["telemetry"]["pages"] == 1
+    assert latest["telemetry"]["rows"] == 7
+    record = json.loads(profile_path.read_text(encoding="utf-8").strip().splitlines()[-1])
+    assert record["run_id"] == latest["runId"]
+    assert record["page_stats"]["jira:es:core"]["rows_total"] == 7
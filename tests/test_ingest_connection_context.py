@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any
+
+from bug_resolution_radar.ingest import connection_context as ctx_mod
+from bug_resolution_radar.ingest.connection_context import (
+    IngestConnectionContext,
+    pooled_session,
+)
+
+
+def test_pooled_session_mounts_adapter_with_configured_pool_size(monkeypatch: Any) -> None:
+    monkeypatch.setenv("INGEST_HTTP_POOL_MAXSIZE", "24")
+    session = pooled_session()
+
+    adapter = session.get_adapter("https://helix.example.com/api")
+    assert adapter._pool_maxsize == 24  # type: ignore[attr-defined]
+    assert session.get_adapter("http://helix.example.com") is adapter
+
+
+def test_connection_context_reuses_sessions_per_connector_and_host() -> None:
+    connections = IngestConnectionContext()
+
+    first = connections.session("helix", "Helix.Example.com")
+    assert connections.session("helix", "helix.example.com") is first
+    assert connections.session("jira", "helix.example.com") is not first
+    assert connections.stats()["sessions_created"] == 2
+    assert connections.stats()["sessions_reused"] == 1
+
+    connections.close()
+    assert connections.session("helix", "helix.example.com") is not first
+
+
+def test_connection_context_expires_cookies_after_ttl(monkeypatch: Any) -> None:
+    clock = {"now": 100.0}
+    monkeypatch.setattr(ctx_mod.time, "monotonic", lambda: clock["now"])
+    connections = IngestConnectionContext(cookie_ttl_seconds=60)
+
+    connections.remember_cookie("jira.example.com", "JSESSIONID=abc")
+    assert connections.cached_cookie("JIRA.example.com") == "JSESSIONID=abc"
+    clock["now"] += 61
+    assert connections.cached_cookie("jira.example.com") is None
+
+    connections.remember_cookie("jira.example.com", "JSESSIONID=def")
+    connections.forget_cookie("jira.example.com")
+    assert connections.cached_cookie("jira.example.com") is None
+    assert connections.stats()["cookie_hits"] == 1
+    assert connections.stats()["cookie_misses"] == 2
+
+
+def test_connection_context_remembers_discovered_endpoints() -> None:
+    connections = IngestConnectionContext()
+    assert connections.arsql_datasource("helix-ir1.example.com") is None
+
+    connections.remember_arsql_datasource(
+        "helix-ir1.example.com", uid="ZFPV", root="https://helix-ir1.example.com"
+    )
+    connections.remember_jira_api_base("jira.example.com", "https://jira.example.com/rest/api/2")
+
+    assert connections.arsql_datasource("helix-ir1.example.com") == (
+        "ZFPV",
+        "https://helix-ir1.example.com",
+    )
+    assert connections.jira_api_base("jira.example.com") == "https://jira.example.com/rest/api/2"
+    assert connections.stats()["datasource_reused"] == 1
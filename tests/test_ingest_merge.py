@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from bug_resolution_radar.models.schema import NormalizedIssue
+from bug_resolution_radar.services.ingest_merge import (
+    MergeChangeSet,
+    MergeIndex,
+    issue_merge_key,
+)
+
+
+def _issue(key: str, *, status: str = "Open", source_id: str = "jira:mx:a") -> NormalizedIssue:
+    return NormalizedIssue(
+        key=key, summary=key, status=status, type="Bug", priority="High", source_id=source_id
+    )
+
+
+def test_merge_index_collapses_duplicates_like_a_dict() -> None:
+    rows = [_issue("A-1"), _issue("A-2"), _issue("A-1", status="Closed")]
+
+    index = MergeIndex(rows, issue_merge_key)
+
+    assert [issue.key for issue in index.rows] == ["A-1", "A-2"]
+    assert index.get("jira:mx:a::A-1").status == "Closed"  # type: ignore[union-attr]
+    assert "jira:mx:a::A-2" in index
+    assert len(index) == 2
+
+
+def test_merge_index_upsert_reports_inserted_updated_and_unchanged_keys() -> None:
+    index = MergeIndex([_issue("A-1"), _issue("A-2")], issue_merge_key)
+    rows = index.rows
+
+    delta = index.upsert([_issue("A-1"), _issue("A-2", status="Closed"), _issue("A-3")])
+
+    assert delta.inserted == {"jira:mx:a::A-3"}
+    assert delta.updated == {"jira:mx:a::A-2"}
+    assert delta.unchanged == {"jira:mx:a::A-1"}
+    assert index.rows is rows
+    assert [issue.status for issue in rows] == ["Open", "Closed", "Open"]
+
+
+def test_merge_index_run_changes_keep_first_outcome_per_key() -> None:
+    index = MergeIndex([_issue("A-1")], issue_merge_key)
+
+    index.upsert([_issue("A-1"), _issue("A-9")])
+    index.upsert([_issue("A-1", status="Closed"), _issue("A-9", status="Closed")])
+    index.upsert([_issue("A-1", status="Closed")])
+
+    assert index.changes.counts() == {"inserted": 1, "updated": 1, "unchanged": 0}
+    assert index.changes.changed == {"jira:mx:a::A-1", "jira:mx:a::A-9"}
+    assert MergeChangeSet().is_empty
@@ -70,3 +70,44 @@ def test_ingest_profiler_noops_when_disabled(tmp_path: Path) -> None:
 
     assert int(record["sample_count"]) == 0
     assert output_path.exists() is False
+
+
+def test_ingest_profiler_summarises_pages_per_tenant_and_live_snapshot(tmp_path: Path) -> None:
+    profiler = IngestRunProfiler(
+        connector="helix",
+        run_id=3,
+        enabled=True,
+        output_path=str(tmp_path / "profiles.jsonl"),
+    )
+    for page, latency in enumerate([120.0, 80.0, 400.0], start=1):
+        profiler.record_page(
+            source_id="helix:mx:core",
+            source_label="MX Core",
+            page=page,
+            status=200,
+            elapsed_ms=latency,
+            bytes_received=2048,
+            rows=75,
+            map_ms=3.0,
+            chunk_size=75,
+            read_timeout_s=30.0,
+        )
+    profiler.record_page(source_id="helix:es:core", page=1, status=500, elapsed_ms=10.0)
+    profiler.record_event("chunk_size_reduced", source_id="helix:mx:core", previous=75, current=37)
+
+    live = profiler.live_snapshot()
+    assert live["pages"] == 4
+    assert live["rows"] == 225
+    assert live["lastPage"]["status"] == 500
+    assert live["adaptations"] == {"chunk_size_reduced": 1}
+    assert live["recentEvents"][0]["current"] == 37
+
+    record = profiler.build_record(state="partial", summary="", total_sources=2, success_count=1)
+    mx = record["page_stats"]["helix:mx:core"]
+    assert mx["source_label"] == "MX Core"
+    assert mx["pages"] == 3
+    assert mx["bytes_total"] == 3 * 2048
+    assert float(mx["latency_ms"]["p50"]) == 120.0
+    assert float(mx["latency_ms"]["p95"]) > 300.0
+    assert record["page_stats"]["helix:es:core"]["errors"] == 1
+    assert record["adaptation_counts"] == {"chunk_size_reduced": 1}
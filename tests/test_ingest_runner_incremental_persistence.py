@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import importlib
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 from bug_resolution_radar.config import Settings
 from bug_resolution_radar.models.schema import IssuesDocument, NormalizedIssue
-from bug_resolution_radar.models.schema_helix import HelixDocument, HelixWorkItem
+from bug_resolution_radar.models.schema_helix import (
+    HelixDocument,
+    HelixSourceWatermark,
+    HelixWorkItem,
+)
+from bug_resolution_radar.repositories.issue_changelog import issue_state_at
 
 ingest_runner = importlib.import_module("bug_resolution_radar.services.ingest_runner")
 
@@ -29,7 +37,7 @@ def test_run_jira_ingest_persists_checkpoint_after_each_source(
         del path
         return IssuesDocument.empty()
 
-    def _fake_save_issues_doc(path: str, doc: IssuesDocument) -> None:
+    def _fake_save_issues_doc(path: str, doc: IssuesDocument, **_: Any) -> None:
         del path
         issue_snapshots.append(doc.model_copy(deep=True))
 
@@ -67,6 +75,37 @@ def test_run_jira_ingest_persists_checkpoint_after_each_source(
     assert result["success_count"] == 2
     assert len(issue_snapshots) == 2
     assert [len(snapshot.issues) for snapshot in issue_snapshots] == [1, 2]
+    state = issue_state_at(settings.DATA_PATH, datetime.now(timezone.utc))
+    assert state["status"].to_dict() == {"jira:mx:a::J-1": "Open", "jira:mx:b::J-2": "Open"}
+
+
+def test_run_jira_ingest_closes_owned_connections_when_a_source_raises(
+    monkeypatch: Any,
+    tmp_path: Path,
+) -> None:
+    closed: list[bool] = []
+
+    class _TrackingConnections:
+        def stats(self) -> dict[str, int]:
+            return {}
+
+        def close(self) -> None:
+            closed.append(True)
+
+    def _failing_ingest_jira(**_: Any) -> Any:
+        raise RuntimeError("socket reset")
+
+    monkeypatch.setattr(ingest_runner, "IngestConnectionContext", _TrackingConnections)
+    monkeypatch.setattr(ingest_runner, "load_issues_doc", lambda path: IssuesDocument.empty())
+    monkeypatch.setattr(ingest_runner, "ingest_jira", _failing_ingest_jira)
+
+    with pytest.raises(RuntimeError, match="socket reset"):
+        ingest_runner.run_jira_ingest(
+            _settings(tmp_path),
+            selected_sources=[{"source_id": "jira:mx:a", "country": "México", "alias": "A"}],
+        )
+
+    assert closed == [True]
 
 
 def test_run_helix_ingest_persists_partial_and_success_checkpoints_per_source(
@@ -84,14 +123,14 @@ def test_run_helix_ingest_persists_partial_and_success_checkpoints_per_source(
         def load(self) -> HelixDocument:
             return HelixDocument.empty()
 
-        def save(self, doc: HelixDocument) -> None:
+        def save(self, doc: HelixDocument, **_: Any) -> None:
             helix_snapshots.append(doc.model_copy(deep=True))
 
     def _fake_load_issues_doc(path: str) -> IssuesDocument:
         del path
         return IssuesDocument.empty()
 
-    def _fake_save_issues_doc(path: str, doc: IssuesDocument) -> None:
+    def _fake_save_issues_doc(path: str, doc: IssuesDocument, **_: Any) -> None:
         del path
         issue_snapshots.append(doc.model_copy(deep=True))
 
@@ -113,6 +152,7 @@ def test_run_helix_ingest_persists_partial_and_success_checkpoints_per_source(
         doc.items = [item]
         if source_id.endswith(":a"):
             return False, f"{source_id}: parcial", doc
+        doc.source_watermarks[source_id] = HelixSourceWatermark(last_modified_ms=1234)
         return True, f"{source_id}: ok", doc
 
     monkeypatch.setattr(ingest_runner, "HelixRepo", _FakeHelixRepo)
@@ -132,5 +172,58 @@ def test_run_helix_ingest_persists_partial_and_success_checkpoints_per_source(
     assert result["success_count"] == 1
     assert len(helix_snapshots) == 2
     assert [len(snapshot.items) for snapshot in helix_snapshots] == [1, 2]
+    assert set(helix_snapshots[-1].source_watermarks) == {"helix:mx:b"}
     assert len(issue_snapshots) == 2
     assert [len(snapshot.issues) for snapshot in issue_snapshots] == [1, 2]
+
+
+def test_run_helix_ingest_reports_change_set_and_skips_remapping_unchanged_items(
+    monkeypatch: Any,
+    tmp_path: Path,
+) -> None:
+    settings = _settings(tmp_path)
+    existing = HelixWorkItem(id="INC-1", summary="Igual", status="Open", source_id="helix:mx:a")
+    stored_issues = IssuesDocument.empty()
+    stored_issues.issues = [ingest_runner._helix_item_to_issue(existing)]
+    mapped: list[str] = []
+    original_mapper = ingest_runner._helix_item_to_issue
+
+    class _FakeHelixRepo:
+        def __init__(self, _: Path) -> None:
+            pass
+
+        def load(self) -> HelixDocument:
+            doc = HelixDocument.empty()
+            doc.items = [existing.model_copy()]
+            return doc
+
+        def save(self, doc: HelixDocument, **_: Any) -> None:
+            del doc
+
+    def _fake_ingest_helix(**kwargs: Any):
+        doc = HelixDocument.empty()
+        doc.items = [
+            existing.model_copy(),
+            HelixWorkItem(id="INC-2", summary="Nueva", status="Open", source_id="helix:mx:a"),
+        ]
+        return True, "ok", doc
+
+    def _tracking_mapper(item: HelixWorkItem) -> NormalizedIssue:
+        mapped.append(str(item.id))
+        return original_mapper(item)
+
+    monkeypatch.setattr(ingest_runner, "HelixRepo", _FakeHelixRepo)
+    monkeypatch.setattr(ingest_runner, "load_issues_doc", lambda path: stored_issues)
+    monkeypatch.setattr(ingest_runner, "save_issues_doc", lambda path, doc, **_: None)
+    monkeypatch.setattr(ingest_runner, "ingest_helix", _fake_ingest_helix)
+    monkeypatch.setattr(ingest_runner, "_helix_item_to_issue", _tracking_mapper)
+
+    result = ingest_runner.run_helix_ingest(
+        settings,
+        selected_sources=[{"source_id": "helix:mx:a", "country": "México", "alias": "A"}],
+    )
+
+    assert mapped == ["INC-2"]
+    assert result["changes"]["helix"] == {"inserted": 1, "updated": 0, "unchanged": 1}
+    assert result["changes"]["issues"] == {"inserted": 1, "updated": 0, "unchanged": 0}
+    assert [issue.key for issue in stored_issues.issues] == ["INC-1", "INC-2"]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+from bug_resolution_radar.models.schema import NormalizedIssue
+from bug_resolution_radar.repositories import issue_changelog
+from bug_resolution_radar.repositories.issue_changelog import (
+    append_issue_changes,
+    changelog_dir,
+    clear_issue_changes,
+    drop_source_changes,
+    field_transitions,
+    issue_state_at,
+)
+from bug_resolution_radar.services.ingest_merge import MergeIndex, issue_merge_key
+
+
+def _issue(key: str, status: str, *, priority: str = "High") -> NormalizedIssue:
+    return NormalizedIssue(
+        key=key,
+        summary=f"Issue {key}",
+        status=status,
+        type="Bug",
+        priority=priority,
+        source_id="jira:es",
+    )
+
+
+def _at(day: int) -> datetime:
+    return datetime(2025, 3, day, 9, 0, tzinfo=timezone.utc)
+
+
+def test_changelog_reconstructs_state_at_any_timestamp(tmp_path: Path) -> None:
+    data_path = tmp_path / "issues.json"
+    index = MergeIndex([_issue("A-1", "New"), _issue("A-2", "New")], issue_merge_key)
+    baseline = list(index.rows)
+
+    index.upsert([_issue("A-1", "In Progress"), _issue("A-3", "New", priority="Low")])
+    written = append_issue_changes(
+        data_path, index.drain_changed(), index.get, all_rows=baseline, observed_at=_at(2)
+    )
+    assert written > 0
+    assert changelog_dir(data_path).is_dir()
+
+    index.upsert([_issue("A-1", "Closed", priority="Low"), _issue("A-2", "New")])
+    append_issue_changes(
+        data_path, index.drain_changed(), index.get, all_rows=baseline, observed_at=_at(5)
+    )
+
+    before = issue_state_at(data_path, _at(1))
+    assert before.empty
+
+    start = issue_state_at(data_path, datetime(2025, 3, 2, 8, 59, 59, 999999, timezone.utc))
+    assert start.loc["jira:es::A-1", "status"] == "New"
+    assert "jira:es::A-3" not in start.index
+
+    mid = issue_state_at(data_path, _at(3))
+    assert mid.loc["jira:es::A-1", "status"] == "In Progress"
+    assert mid.loc["jira:es::A-2", "status"] == "New"
+    assert mid.loc["jira:es::A-3", "priority"] == "Low"
+
+    end = issue_state_at(data_path, _at(6), fields=["status", "priority"])
+    assert list(end.columns) == ["status", "priority"]
+    assert end.loc["jira:es::A-1", "status"] == "Closed"
+    assert end.loc["jira:es::A-1", "priority"] == "Low"
+
+    moves = field_transitions(data_path, field="status", since=_at(2))
+    a1 = moves.loc[moves["merge_key"] == "jira:es::A-1", ["old", "new"]]
+    assert a1.values.tolist() == [["New", "In Progress"], ["In Progress", "Closed"]]
+
+
+def test_only_changed_fields_are_logged_and_baseline_is_written_once(tmp_path: Path) -> None:
+    data_path = tmp_path / "issues.json"
+    index = MergeIndex([_issue("A-1", "New")], issue_merge_key)
+    baseline = list(index.rows)
+
+    index.upsert([_issue("A-1", "Blocked")])
+    pending: Dict[str, Optional[NormalizedIssue]] = index.drain_changed()
+    assert pending["jira:es::A-1"] is baseline[0]
+    append_issue_changes(data_path, pending, index.get, all_rows=baseline, observed_at=_at(2))
+
+    index.upsert([_issue("A-1", "Closed")])
+    append_issue_changes(
+        data_path, index.drain_changed(), index.get, all_rows=baseline, observed_at=_at(3)
+    )
+
+    rows = issue_changelog.load_issue_changes(data_path)
+    later = rows.loc[rows["observed_at"] > _at(2)]
+    assert later["field"].tolist() == ["status"]
+    assert (rows["old"].isna() & (rows["field"] == "status")).sum() == 1
+
+
+def test_changelog_can_be_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BUG_RESOLUTION_RADAR_ISSUE_CHANGELOG", "false")
+    data_path = tmp_path / "issues.json"
+    index = MergeIndex([], issue_merge_key)
+    index.upsert([_issue("A-1", "New")])
+    assert append_issue_changes(data_path, index.drain_changed(), index.get) == 0
+    assert not changelog_dir(data_path).exists()
+
+
+def test_segments_are_compacted(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(issue_changelog, "_COMPACT_AFTER_SEGMENTS", 3)
+    data_path = tmp_path / "issues.json"
+    index = MergeIndex([], issue_merge_key)
+    statuses = ["New", "Open", "Blocked", "In Progress", "Closed"]
+    for day, status in enumerate(statuses, start=1):
+        index.upsert([_issue("A-1", status)])
+        append_issue_changes(data_path, index.drain_changed(), index.get, observed_at=_at(day))
+
+    assert len(list(changelog_dir(data_path).glob("*.parquet"))) <= 3
+    moves = field_transitions(data_path)
+    assert moves["new"].tolist() == statuses
+    assert issue_state_at(data_path, _at(3)).loc["jira:es::A-1", "status"] == "Blocked"
+
+
+def test_source_purge_and_reset_remove_logged_issues(tmp_path: Path) -> None:
+    data_path = tmp_path / "issues.json"
+    other = _issue("B-1", "New").model_copy(update={"source_id": "jira:mx"})
+    index = MergeIndex([], issue_merge_key)
+    index.upsert([_issue("A-1", "New"), other])
+    append_issue_changes(data_path, index.drain_changed(), index.get, observed_at=_at(1))
+    index.upsert([_issue("A-1", "Closed")])
+    append_issue_changes(data_path, index.drain_changed(), index.get, observed_at=_at(2))
+
+    assert drop_source_changes(data_path, "JIRA:ES") > 0
+    state = issue_state_at(data_path, _at(3))
+    assert list(state.index) == ["jira:mx::B-1"]
+    assert (
+        not issue_changelog.load_issue_changes(data_path)["merge_key"]
+        .str.startswith("jira:es::")
+        .any()
+    )
+
+    assert clear_issue_changes(data_path) >= 1
+    assert not changelog_dir(data_path).exists()
+    assert issue_state_at(data_path, _at(3)).empty
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from bug_resolution_radar.analytics.filtering import FilterState, apply_filters
+from bug_resolution_radar.analytics.kpis import build_open_age_priority_payload, compute_kpis
+from bug_resolution_radar.config import Settings
+from bug_resolution_radar.models.schema import IssuesDocument, NormalizedIssue
+from bug_resolution_radar.repositories import issues_sql
+from bug_resolution_radar.repositories.issues_sql import IssuesSqlScope, issues_sql_engine
+from bug_resolution_radar.repositories.issues_store import save_issues_doc
+from bug_resolution_radar.services import dashboard_snapshot
+from bug_resolution_radar.services.dashboard_snapshot import (
+    DashboardQuery,
+    build_report_scope_query,
+    load_workspace_dataframe,
+)
+from bug_resolution_radar.services.workspace import WorkspaceSelection
+
+pytest.importorskip("duckdb")
+
+_STATUSES = ("New", "In Progress", "Ready_To-Deploy", "Closed", "", "Blocked", "Accepted")
+_PRIORITIES = ("High", " Low ", "", "Highest", "Medium")
+_ASSIGNEES = ("Ana", "", "Luis", "Marta", "Ana")
+_SOURCES = (
+    ("México", "jira:mexico:core"),
+    ("México", "helix:mexico:ops"),
+    ("España", "jira:espana:core"),
+)
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat()
+
+
+def _write_issues(path: Path, *, now: datetime, count: int = 160) -> None:
+    issues = []
+    for idx in range(count):
+        country, source_id = _SOURCES[idx % len(_SOURCES)]
+        created = now - timedelta(days=(idx * 37) % 260, hours=idx % 23)
+        resolved = created + timedelta(days=idx % 11) if idx % 4 == 0 else None
+        issues.append(
+            NormalizedIssue(
+                key=f"RAD-{idx}",
+                summary=f"Resumen {idx % 9}",
+                status=_STATUSES[idx % len(_STATUSES)],
+                type="Bug",
+                priority=_PRIORITIES[idx % len(_PRIORITIES)],
+                created=None if idx % 29 == 0 else _iso(created),
+                updated=_iso(created),
+                resolved=_iso(resolved) if resolved is not None and resolved < now else None,
+                assignee=_ASSIGNEES[(idx // 3) % len(_ASSIGNEES)],
+                labels=["web"] if idx % 2 else [],
+                country=country,
+                source_id=source_id,
+                source_type=source_id.split(":", 1)[0],
+            )
+        )
+    save_issues_doc(str(path), IssuesDocument(issues=issues))
+
+
+@pytest.fixture()
+def settings(tmp_path: Path) -> Settings:
+    data_path = tmp_path / "issues.json"
+    _write_issues(data_path, now=datetime.now(timezone.utc))
+    return Settings(DATA_PATH=str(data_path), ANALYSIS_LOOKBACK_MONTHS=4)
+
+
+def _query(**workspace: Any) -> DashboardQuery:
+    return DashboardQuery(
+        workspace=WorkspaceSelection(**workspace),
+        filters=FilterState(status=[], priority=[], assignee=[]),
+    )
+
+
+def _frames(settings: Settings, query: DashboardQuery, monkeypatch: Any) -> tuple[Any, Any]:
+    monkeypatch.delenv(issues_sql.QUERY_ENGINE_ENV, raising=False)
+    expected = load_workspace_dataframe(settings, query=query)
+    monkeypatch.setenv(issues_sql.QUERY_ENGINE_ENV, "duckdb")
+    return expected, load_workspace_dataframe(settings, query=query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        _query(country="México", scope_mode="country"),
+        _query(country="México", source_id="helix:mexico:ops", scope_mode="source"),
+        _query(),
+        build_report_scope_query(
+            country="México", source_ids=["jira:mexico:core", "helix:mexico:ops"]
+        ),
+    ],
+)
+def test_sql_workspace_frame_matches_pandas_scope(
+    settings: Settings, query: DashboardQuery, monkeypatch: Any
+) -> None:
+    expected, actual = _frames(settings, query, monkeypatch)
+
+    assert issues_sql_engine(settings.DATA_PATH) is not None
+    assert not expected.empty
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_sql_aggregates_match_pandas_aggregates(settings: Settings, monkeypatch: Any) -> None:
+    query = _query(country="México", scope_mode="country")
+    scoped, _ = _frames(settings, query, monkeypatch)
+    engine = issues_sql_engine(settings.DATA_PATH)
+    assert engine is not None
+    cutoff = pd.to_datetime(scoped["created"]).min()
+    base = IssuesSqlScope(country="México", require_created=True)
+    assert engine.scope_frame(base).shape[0] > len(scoped)
+    scope = IssuesSqlScope(
+        country="México",
+        require_created=True,
+        created_since=cutoff,
+        priority=("High", "(sin priority)", " Low "),
+    )
+    dff = apply_filters(scoped, FilterState(status=[], priority=list(scope.priority), assignee=[]))
+    now = pd.Timestamp.now("UTC")
+
+    kpis = compute_kpis(dff, settings=settings, include_timeseries_chart=True)
+    assert engine.status_counts(scope) == dff["status"].value_counts().to_dict()
+    assert engine.open_priority_counts(scope) == kpis["open_now_by_priority"]
+    pd.testing.assert_frame_equal(engine.timeseries_daily(scope), kpis["timeseries_daily"])
+    pd.testing.assert_frame_equal(
+        engine.open_age_priority(scope, reference_now=now),
+        build_open_age_priority_payload(dff, reference_now=now)["grouped"],
+    )
+    people = dashboard_snapshot._build_people_payload(dff)["cards"]
+    assert engine.top_open_assignees(scope, limit=12) == [
+        (card["assignee"], card["openCount"]) for card in people
+    ]
+
+
+def _without_age_days(payload: Any) -> Any:
+    # Ages are measured against the wall clock at build time.
+    if isinstance(payload, dict):
+        return {k: _without_age_days(v) for k, v in payload.items() if k != "ageDays"}
+    if isinstance(payload, list):
+        return [_without_age_days(v) for v in payload]
+    return payload
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        FilterState(status=[], priority=[], assignee=[]),
+        FilterState(status=[], priority=["High", "(sin priority)"], assignee=["Ana", ""]),
+    ],
+)
+def test_dashboard_payloads_answer_from_sql_aggregates(
+    settings: Settings, filters: FilterState, monkeypatch: Any
+) -> None:
+    query = replace(_query(country="México", scope_mode="country"), filters=filters)
+    calls: list[str] = []
+    for name in (
+        "status_counts",
+        "open_priority_counts",
+        "timeseries_daily",
+        "open_age_priority",
+        "top_open_assignees",
+    ):
+        method = getattr(issues_sql.IssuesSqlEngine, name)
+        monkeypatch.setattr(
+            issues_sql.IssuesSqlEngine,
+            name,
+            lambda self, *a, _m=method, _n=name, **kw: calls.append(_n) or _m(self, *a, **kw),
+        )
+
+    def _payloads() -> tuple[dict[str, Any], dict[str, Any]]:
+        dashboard_snapshot._scope_context_cache.clear()
+        return (
+            dashboard_snapshot.build_dashboard_snapshot(settings, query=query),
+            dashboard_snapshot.build_intelligence_snapshot(settings, query=query),
+        )
+
+    monkeypatch.delenv(issues_sql.QUERY_ENGINE_ENV, raising=False)
+    expected = _payloads()
+    assert calls == []
+    monkeypatch.setenv(issues_sql.QUERY_ENGINE_ENV, "duckdb")
+    actual = _payloads()
+
+    assert set(calls) == {
+        "status_counts",
+        "open_priority_counts",
+        "timeseries_daily",
+        "open_age_priority",
+        "top_open_assignees",
+    }
+    assert actual[0] == expected[0]
+    assert _without_age_days(actual[1]["people"]) == _without_age_days(expected[1]["people"])
+
+
+def test_sql_engine_is_opt_in_and_skips_stale_sidecars(
+    settings: Settings, monkeypatch: Any
+) -> None:
+    monkeypatch.delenv(issues_sql.QUERY_ENGINE_ENV, raising=False)
+    assert issues_sql_engine(settings.DATA_PATH) is None
+
+    monkeypatch.setenv(issues_sql.QUERY_ENGINE_ENV, "duckdb")
+    assert issues_sql_engine(settings.DATA_PATH) is not None
+
+    data_path = Path(settings.DATA_PATH)
+    parquet_mtime = data_path.with_suffix(".parquet").stat().st_mtime_ns
+    os.utime(data_path, ns=(parquet_mtime + 10**9, parquet_mtime + 10**9))
+    assert issues_sql_engine(settings.DATA_PATH) is None
@@ -3,8 +3,14 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from pathlib import Path
 
+import pandas as pd
+import pytest
+
+from bug_resolution_radar.analytics.daily_cube import build_daily_cube
 from bug_resolution_radar.models.schema import IssuesDocument, NormalizedIssue
+from bug_resolution_radar.repositories import issues_store
 from bug_resolution_radar.repositories.issues_store import (
+    load_issues_cube,
     load_issues_df,
     load_issues_workspace_index,
     save_issues_doc,
@@ -52,3 +58,72 @@ def test_save_issues_doc_refreshes_workspace_index_and_parquet(tmp_path: Path) -
     assert index_payload["rowCount"] == 1
     assert index_payload["countries"] == [{"country": "España", "sourceCount": 1}]
     assert index_payload["sourcesByCountry"]["España"][0]["source_id"] == source_id
+
+
+def _issue(
+    key: str, *, source_id: str = "jira:espana:core", status: str = "Open"
+) -> NormalizedIssue:
+    now = "2026-04-16T10:00:00+00:00"
+    return NormalizedIssue(
+        key=key,
+        summary=f"Resumen {key}",
+        status=status,
+        type="Bug",
+        priority="High",
+        created=now,
+        updated=now,
+        labels=["web"],
+        country="España",
+        source_alias=source_id.rsplit(":", 1)[-1].title(),
+        source_id=source_id,
+        source_type="jira",
+    )
+
+
+def test_save_issues_doc_patches_sidecars_for_changed_keys_only(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data_path = tmp_path / "issues.json"
+    doc = IssuesDocument(issues=[_issue("RAD-1"), _issue("RAD-2"), _issue("RAD-3")])
+    save_issues_doc(str(data_path), doc)
+    # Saves do not build the cube; its first reader does, and later saves patch it.
+    cube_path = data_path.with_suffix(".cube.parquet")
+    assert not cube_path.exists()
+    load_issues_cube(str(data_path))
+    assert cube_path.exists()
+
+    built: list[int] = []
+    original = issues_store._issues_to_dataframe
+
+    def _tracking(doc_in: IssuesDocument) -> pd.DataFrame:
+        built.append(len(doc_in.issues))
+        return original(doc_in)
+
+    monkeypatch.setattr(issues_store, "_issues_to_dataframe", _tracking)
+
+    doc.issues[1] = _issue("RAD-2", status="Closed")
+    doc.issues.append(_issue("OPS-1", source_id="jira:espana:ops"))
+    save_issues_doc(
+        str(data_path),
+        doc,
+        changed_keys={"jira:espana:core::RAD-2", "jira:espana:ops::OPS-1"},
+    )
+
+    assert built == [2]
+    df = load_issues_df(str(data_path))
+    assert df["key"].tolist() == ["RAD-1", "RAD-2", "RAD-3", "OPS-1"]
+    assert df["status"].tolist() == ["Open", "Closed", "Open", "Open"]
+    pd.testing.assert_frame_equal(
+        df.drop(columns=["labels", "components"]),
+        original(doc).drop(columns=["labels", "components"]),
+    )
+    assert cube_path.stat().st_mtime_ns >= data_path.stat().st_mtime_ns
+    pd.testing.assert_frame_equal(load_issues_cube(str(data_path)), build_daily_cube(original(doc)))
+    index_payload = load_issues_workspace_index(str(data_path))
+    assert index_payload["rowCount"] == 4
+    assert index_payload["countries"] == [{"country": "España", "sourceCount": 2}]
+
+    save_issues_doc(str(data_path), doc, changed_keys=set())
+
+    assert built == [2]
+    assert load_issues_df(str(data_path))["key"].tolist() == ["RAD-1", "RAD-2", "RAD-3", "OPS-1"]
@@ -4,6 +4,8 @@ from typing import Any, Optional
 
 from bug_resolution_radar.config import Settings
 from bug_resolution_radar.ingest import jira_ingest as jira_mod
+from bug_resolution_radar.ingest.connection_context import IngestConnectionContext
+from bug_resolution_radar.services.ingest_profiler import IngestRunProfiler
 
 
 class _FakeResponse:
@@ -479,3 +481,77 @@ def test_request_does_not_retry_non_transient_status() -> None:
 
     assert r.status_code == 404
     assert session.calls == 1
+
+
+def test_jira_ingest_records_page_telemetry_in_profiler(monkeypatch: Any) -> None:
+    payload = {"issues": [{"key": "MX-1", "fields": {}}, {"key": "MX-2", "fields": {}}], "total": 2}
+
+    def fake_request(*args: Any, **kwargs: Any) -> _FakeResponse:
+        return _FakeResponse(200, payload=payload, text="{}")
+
+    monkeypatch.setattr(jira_mod, "_request", fake_request)
+    monkeypatch.setattr(
+        jira_mod,
+        "get_jira_session_cookie",
+        lambda browser, host: "JSESSIONID=abc; atlassian.xsrf.token=xyz",
+    )
+    monkeypatch.setattr(jira_mod, "_is_target_page_open_in_configured_browser", lambda u, b: True)
+
+    profiler = IngestRunProfiler(connector="jira", run_id=1, enabled=True)
+    ok, _, doc = jira_mod.ingest_jira(
+        settings=Settings(JIRA_BASE_URL="https://jira.example.com", JIRA_BROWSER="chrome"),
+        dry_run=False,
+        source=_source(),
+        profiler=profiler,
+    )
+
+    assert ok is True
+    assert doc is not None
+    record = profiler.build_record(state="success", summary="", total_sources=1, success_count=1)
+    assert {"auth_bootstrap", "source_merge"} <= set(record["phase_stats"])
+    tenant = record["page_stats"]["jira:mexico:mx-core"]
+    assert tenant["pages"] == 1
+    assert tenant["rows_total"] == 2
+    live = profiler.live_snapshot()
+    assert live["pages"] == 1
+    assert live["lastPage"]["status"] == 200
+
+
+def test_jira_sources_share_cookie_session_and_api_base_within_a_run(monkeypatch: Any) -> None:
+    requested_urls: list[str] = []
+    cookie_reads: list[str] = []
+    sessions: list[Any] = []
+
+    def fake_request(session: Any, method: str, url: str, **kwargs: Any) -> _FakeResponse:
+        requested_urls.append(url)
+        sessions.append(session)
+        if url.endswith("/rest/api/latest/search"):
+            return _FakeResponse(200, payload={"issues": [], "total": 0})
+        return _FakeResponse(404, text="not found")
+
+    def fake_cookie(browser: str, host: str) -> str:
+        cookie_reads.append(host)
+        return "JSESSIONID=abc; atlassian.xsrf.token=xyz"
+
+    monkeypatch.setattr(jira_mod, "_request", fake_request)
+    monkeypatch.setattr(jira_mod, "get_jira_session_cookie", fake_cookie)
+    monkeypatch.setattr(jira_mod, "_is_target_page_open_in_configured_browser", lambda u, b: True)
+
+    settings = Settings(JIRA_BASE_URL="https://jira.example.com", JIRA_BROWSER="chrome")
+    connections = IngestConnectionContext()
+    for alias in ("MX Core", "MX Web"):
+        source = dict(_source(), alias=alias, source_id=f"jira:mexico:{alias.lower()}")
+        ok, _, _ = jira_mod.ingest_jira(
+            settings=settings, dry_run=False, source=source, connections=connections
+        )
+        assert ok is True
+
+    assert cookie_reads == ["jira.example.com"]
+    assert len({id(session) for session in sessions}) == 1
+    # The second source goes straight to the API base detected by the first one.
+    first_latest = requested_urls.index("https://jira.example.com/rest/api/latest/search")
+    assert requested_urls[first_latest + 1 :] == ["https://jira.example.com/rest/api/latest/search"]
+    stats = connections.stats()
+    assert stats["cookie_hits"] == 1
+    assert stats["sessions_reused"] == 1
+    assert stats["api_base_reused"] == 1
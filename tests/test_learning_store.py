@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from bug_resolution_radar.config import Settings
+from bug_resolution_radar.services import state_db
 from bug_resolution_radar.ui.insights.learning_store import (
     InsightsLearningStore,
     default_learning_path,
@@ -52,33 +54,63 @@ def test_learning_scope_key_and_default_path() -> None:
     assert default_learning_path(settings) == Path("data/custom_learning.json")
 
 
-def test_learning_store_remove_source() -> None:
-    store = InsightsLearningStore(Path("/tmp/unused-learning.json"))
-    store._raw = {
-        "version": 1,
-        "scopes": {
-            "México::jira:mexico:core": {
-                "state": {"a": 1},
-                "interactions": 2,
-                "source_id": "jira:mexico:core",
-            },
-            "España::jira:espana:retail": {
-                "state": {"b": 1},
-                "interactions": 3,
-                "source_id": "jira:espana:retail",
-            },
-            "Peru::jira:mexico:core": {
-                "state": {"c": 1},
-                "interactions": 4,
-                # Fallback de versiones antiguas sin source_id explícito.
-                "source_id": "",
-            },
-        },
-    }
+def test_learning_store_remove_source(tmp_path: Path) -> None:
+    store = InsightsLearningStore(tmp_path / "insights_learning.json")
+    store.load()
+    for scope, source_id, interactions in (
+        ("México::jira:mexico:core", "jira:mexico:core", 2),
+        ("España::jira:espana:retail", "jira:espana:retail", 3),
+        # Fallback de versiones antiguas sin source_id explícito.
+        ("Peru::jira:mexico:core", "", 4),
+    ):
+        store.set_scope(
+            scope,
+            state={"a": 1},
+            interactions=interactions,
+            country=scope.split("::", 1)[0],
+            source_id=source_id,
+        )
 
+    assert store.count_source_scopes("jira:mexico:core") == 2
     removed = store.remove_source("jira:mexico:core")
     assert removed == 2
-    scopes = store._raw.get("scopes", {})
-    assert "México::jira:mexico:core" not in scopes
-    assert "Peru::jira:mexico:core" not in scopes
-    assert "España::jira:espana:retail" in scopes
+    assert store.get_scope("México::jira:mexico:core") == ({}, 0)
+    assert store.get_scope("Peru::jira:mexico:core") == ({}, 0)
+    assert store.get_scope("España::jira:espana:retail") == ({"a": 1}, 3)
+    assert store.count_all_scopes() == 1
+
+
+def test_learning_store_migrates_legacy_json_once(tmp_path: Path) -> None:
+    path = tmp_path / "insights_learning.json"
+    path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "scopes": {
+                    "México::jira:mexico:core": {
+                        "state": {"shown_counts": {"a": 2}},
+                        "interactions": 7,
+                        "country": "México",
+                        "source_id": "jira:mexico:core",
+                        "last_snapshot": {"open_total": 101},
+                    }
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    store = InsightsLearningStore(path)
+    store.load()
+    assert store.get_scope_bundle("México::jira:mexico:core") == (
+        {"shown_counts": {"a": 2}},
+        7,
+        {"open_total": 101},
+    )
+
+    store.clear_all()
+    state_db._ready_paths.clear()  # simulate a fresh process
+    reloaded = InsightsLearningStore(path)
+    reloaded.load()
+    assert reloaded.count_all_scopes() == 0
+    assert path.exists()
@@ -116,6 +116,95 @@ def test_generate_country_period_followup_ppt_with_minimal_template(tmp_path: Pa
     assert bg_fill.fore_color.rgb == RGBColor(247, 248, 248)
 
 
+def test_generate_country_period_followup_ppt_reuses_persisted_result(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    template = tmp_path / "template.pptx"
+    _build_minimal_template(template)
+    now = pd.Timestamp("2026-03-15T00:00:00+00:00")
+    dff = pd.DataFrame(
+        [
+            {
+                "key": "A-1",
+                "summary": "Issue A",
+                "status": "New",
+                "priority": "High",
+                "created": (now - pd.Timedelta(days=2)).isoformat(),
+                "updated": now.isoformat(),
+                "resolved": None,
+                "country": "México",
+                "source_id": "jira:mexico:senda",
+                "source_type": "jira",
+            },
+            {
+                "key": "B-1",
+                "summary": "Issue B",
+                "status": "New",
+                "priority": "Medium",
+                "created": (now - pd.Timedelta(days=10)).isoformat(),
+                "updated": now.isoformat(),
+                "resolved": None,
+                "country": "México",
+                "source_id": "jira:mexico:gema",
+                "source_type": "jira",
+            },
+        ]
+    )
+    settings = Settings(PERIOD_PPT_TEMPLATE_PATH=str(template))
+    calls = {"normalize": 0}
+    original_normalize = period_ppt_mod._normalize_period_template
+
+    def _counting_normalize(prs: Any) -> None:
+        calls["normalize"] += 1
+        original_normalize(prs)
+
+    monkeypatch.setattr(period_ppt_mod, "_normalize_period_template", _counting_normalize)
+
+    kwargs: dict[str, Any] = {
+        "country": "México",
+        "source_ids": ["jira:mexico:senda", "jira:mexico:gema"],
+        "dff_override": dff,
+    }
+    first = generate_country_period_followup_ppt(settings, **kwargs)
+    second = generate_country_period_followup_ppt(settings, **kwargs)
+
+    assert calls["normalize"] == 1
+    assert second == first
+    assert second.source_ids == ("jira:mexico:senda", "jira:mexico:gema")
+
+
+def test_prepared_templates_are_normalised_once_per_revision(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    template = tmp_path / "template.pptx"
+    _build_minimal_template(template)
+    calls = {"value": 0}
+    original_normalize = period_ppt_mod._normalize_period_template
+
+    def _counting_normalize(prs: Any) -> None:
+        calls["value"] += 1
+        original_normalize(prs)
+
+    monkeypatch.setattr(period_ppt_mod, "_normalize_period_template", _counting_normalize)
+    period_ppt_mod._prepared_template_bytes.cache_clear()
+
+    first = period_ppt_mod._load_prepared_template(template, kind="period")
+    second = period_ppt_mod._load_prepared_template(template, kind="period")
+    assert calls["value"] == 1
+    assert len(first.slides) == len(second.slides) == 8
+    first.slides[0].shapes[0].text_frame.text = "Editada"
+    assert second.slides[0].shapes[0].text_frame.text == "Periodo dd/mm - dd/mm 2026"
+
+    _build_compact_template(template)
+    period_ppt_mod._load_prepared_template(template, kind="period")
+    assert calls["value"] == 2
+
+    prototypes = period_ppt_mod._load_prepared_template(
+        period_ppt_mod._resolve_functionality_template_path(), kind="functionality"
+    )
+    assert len(prototypes.slides) == 3
+
+
 def test_generate_country_period_followup_ppt_with_compact_template(tmp_path: Path) -> None:
     template = tmp_path / "compact-template.pptx"
     _build_compact_template(template)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+from PIL import Image
+
+from bug_resolution_radar.reports import plotly_png
+from bug_resolution_radar.reports.plotly_png import render_plotly_figure_png
+
+
+def _pixels(payload: bytes) -> np.ndarray:
+    return np.asarray(Image.open(BytesIO(payload)).convert("RGBA"))
+
+
+def _mixed_figure() -> go.Figure:
+    fig = go.Figure(
+        data=[
+            go.Bar(x=["A", "B", "C"], y=[3, 0, 5], text=["3", "", "5"], name="Altas"),
+            go.Bar(x=["A", "B", "C"], y=[1, 2, None], name="Bajas"),
+            go.Scatter(x=["A", "B", "C"], y=[4, 2, 6], mode="lines+markers+text", text=["x"]),
+        ]
+    )
+    fig.update_layout(barmode="stack")
+    return fig
+
+
+def test_array_coercion_matches_scalar_helpers() -> None:
+    numeric = [1, "2.5", " 3 ", None, "", "x", float("nan"), True]
+    expected = [plotly_png._to_float(value) for value in numeric]
+    got = plotly_png._to_float_array(numeric)
+    assert [None if np.isnan(value) else value for value in got.tolist()] == expected
+
+    dates = ["2025-01-05", "05/02/2025 10:00", "nope", None]
+    expected_dt = [plotly_png._to_datetime_float(value) for value in dates]
+    got_dt = plotly_png._to_datetime_array(dates)
+    assert [None if np.isnan(value) else value for value in got_dt.tolist()] == expected_dt
+
+    stamps = list(pd.date_range("2025-01-01", periods=3, freq="D").to_numpy())
+    assert plotly_png._to_datetime_array(stamps).tolist() == [
+        plotly_png._to_datetime_float(value) for value in stamps
+    ]
+
+
+def test_load_font_and_text_metrics_are_cached() -> None:
+    assert plotly_png._load_font(18, bold=True) is plotly_png._load_font(18, bold=True)
+
+    draw = plotly_png.ImageDraw.Draw(Image.new("RGBA", (8, 8)))
+    font = plotly_png._load_font(16)
+    first = plotly_png._text_bbox(draw, "Backlog abierto", font)
+    assert plotly_png._text_bbox(draw, "Backlog abierto", font) == first
+    assert (font, "RGBA", "Backlog abierto") in plotly_png._TEXT_SIZE_CACHE
+
+
+def test_render_plotly_figure_png_compress_level_keeps_pixels(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fig = _mixed_figure()
+    fast = render_plotly_figure_png(
+        fig, scale=1.0, export_width=640, export_height=420, compress_level=1
+    )
+    small = render_plotly_figure_png(
+        fig, scale=1.0, export_width=640, export_height=420, compress_level=9
+    )
+    assert np.array_equal(_pixels(fast), _pixels(small))
+    assert len(small) <= len(fast)
+
+    monkeypatch.setenv("BUG_RESOLUTION_RADAR_PPT_PNG_COMPRESS_LEVEL", "1")
+    from_env = render_plotly_figure_png(fig, scale=1.0, export_width=640, export_height=420)
+    assert from_env == fast
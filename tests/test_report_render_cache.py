@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bug_resolution_radar.reports.render_cache import (
+    PersistentBlobCache,
+    pack_report_blob,
+    unpack_report_blob,
+)
+
+
+def test_persistent_blob_cache_roundtrip_survives_new_instance(tmp_path: Path) -> None:
+    cache = PersistentBlobCache("unit")
+    cache.put("abc123", b"payload")
+
+    restarted = PersistentBlobCache("unit")
+    assert restarted.get("abc123") == b"payload"
+    assert restarted.get("missing") is None
+
+    stats = restarted.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(0.5)
+    assert not list((tmp_path / "render-cache" / "unit").glob("*/*.tmp"))
+
+
+def test_persistent_blob_cache_evicts_least_recently_used(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("BUG_RESOLUTION_RADAR_PPT_DISK_CACHE_MAX_MB", "1")
+    chunk = b"x" * (400 * 1024)
+    cache = PersistentBlobCache("lru")
+    cache.put("aa01", chunk)
+    cache.put("bb02", chunk)
+    assert cache.get("aa01") == chunk  # refresh recency of the first entry
+    cache.put("cc03", chunk)
+
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") == chunk
+    assert cache.get("cc03") == chunk
+    assert cache.stats()["evictions"] == 1
+    assert not (tmp_path / "render-cache" / "lru" / "bb" / "bb02.bin").exists()
+
+
+def test_persistent_blob_cache_disabled_by_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BUG_RESOLUTION_RADAR_PPT_DISK_CACHE", "0")
+    cache = PersistentBlobCache("off")
+    cache.put("abc", b"payload")
+    assert cache.get("abc") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_report_blob_roundtrip_and_corrupt_payload() -> None:
+    blob = pack_report_blob({"file_name": "deck.pptx", "slide_count": 3}, b"PPT\0BYTES")
+    unpacked = unpack_report_blob(blob)
+    assert unpacked is not None
+    metadata, content = unpacked
+    assert metadata == {"file_name": "deck.pptx", "slide_count": 3}
+    assert content == b"PPT\0BYTES"
+    assert unpack_report_blob(b"not-json\0data") is None
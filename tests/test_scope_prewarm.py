@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from bug_resolution_radar.analytics.filtering import FilterState
+from bug_resolution_radar.config import Settings
+from bug_resolution_radar.services import scope_prewarm
+from bug_resolution_radar.services.dashboard_snapshot import DashboardQuery
+from bug_resolution_radar.services.workspace import WorkspaceSelection
+
+
+def _query(source_id: str, *, like: str = "") -> DashboardQuery:
+    return DashboardQuery(
+        workspace=WorkspaceSelection(country="México", source_id=source_id),
+        filters=FilterState(status=["New"], priority=[], assignee=[]),
+        issue_like_query=like,
+        chart_ids=("timeseries",),
+    )
+
+
+def test_usage_tracker_ranks_recent_scopes_and_persists(tmp_path: Path) -> None:
+    path = tmp_path / "scope_usage.json"
+    tracker = scope_prewarm.ScopeUsageTracker(path)
+    now = 1_800_000_000.0
+    for offset in range(3):
+        tracker.record(_query("jira:mexico:core"), now=now + offset)
+    tracker.record(_query("helix:mexico:pagos"), now=now + 10)
+    tracker.record(_query("jira:mexico:core", like="login"), now=now + 11)
+    tracker.record(_query("jira:mexico:old"), now=now - 30 * 86400)
+    tracker.flush()
+
+    reloaded = scope_prewarm.ScopeUsageTracker(path)
+    top = reloaded.top(5, now=now + 20)
+
+    assert [q.workspace.source_id for q in top] == ["jira:mexico:core", "helix:mexico:pagos"]
+    assert top[0] == _query("jira:mexico:core")
+
+
+def test_prewarm_scopes_serves_dashboard_payload_until_data_changes(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    data_path = tmp_path / "issues.json"
+    data_path.write_text("{}", encoding="utf-8")
+    settings = Settings(DATA_PATH=str(data_path))
+    query = _query("jira:mexico:core")
+    scope_prewarm.record_scope_usage(settings, query)
+
+    contexts: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        scope_prewarm,
+        "load_scope_context",
+        lambda settings, *, query, **kwargs: contexts.append(kwargs),
+    )
+    monkeypatch.setattr(
+        scope_prewarm,
+        "build_dashboard_snapshot",
+        lambda settings, *, query: {"row_count": 7, "charts": list(query.chart_ids)},
+    )
+
+    stats = scope_prewarm.prewarm_scopes(settings, limit=3, is_idle=lambda: True)
+
+    assert stats["warmed"] == 1 and stats["failed"] == 0
+    assert contexts[0]["ttl_seconds"] >= 60
+    served = scope_prewarm.prewarmed_dashboard_snapshot(settings, query)
+    assert served == {"row_count": 7, "charts": ["timeseries"]}
+    served["workspace"] = {}
+    assert "workspace" not in scope_prewarm.prewarmed_dashboard_snapshot(settings, query)
+    assert scope_prewarm.prewarmed_dashboard_snapshot(settings, _query("jira:mexico:x")) is None
+
+    data_path.write_text('{"issues": []}', encoding="utf-8")
+    assert scope_prewarm.prewarmed_dashboard_snapshot(settings, query) is None
+
+
+def test_schedule_prewarm_can_be_disabled(monkeypatch: Any, tmp_path: Path) -> None:
+    monkeypatch.setenv("BUG_RESOLUTION_RADAR_PREWARM_SCOPES", "0")
+
+    assert scope_prewarm.schedule_prewarm(Settings(DATA_PATH=str(tmp_path / "i.json"))) is False
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from bug_resolution_radar.analytics.filtering import apply_text_like_filter
+from bug_resolution_radar.analytics.search_index import IssueSearchIndex
+
+
+def _issues() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "key": ["PAY-1", "PAY-12", "LOG-3", "LOG-4", None],
+            "summary": [
+                "Error en pagos SPEI",
+                "Timeout al pagar con tarjeta",
+                "Login bloqueado tras pago",
+                "Logs duplicados",
+                "Sin resumen",
+            ],
+            "description": ["", None, "El usuario no puede entrar", "pago-spei", "x"],
+            "assignee": ["Alice", "Bob", None, "alice", "Carol"],
+            "labels": [["pagos", "spei"], [], ["login"], None, ["ops"]],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+
+
+@pytest.mark.parametrize("column", ["key", "summary", "description", "assignee"])
+@pytest.mark.parametrize("query", ["pag", "PAY-1", "o", "n pa", "-", "spei", "zzz", "tras pago"])
+def test_like_filter_from_index_matches_literal_scan(column: str, query: str) -> None:
+    df = _issues()
+    index = IssueSearchIndex(df)
+    scoped = df.loc[[10, 12, 13, 14]]
+
+    expected = apply_text_like_filter(scoped, column=column, query=query)
+    actual = apply_text_like_filter(scoped, column=column, query=query, search_index=index)
+
+    assert actual.index.tolist() == expected.index.tolist()
+
+
+def test_search_ranks_exact_key_then_word_prefix_hits() -> None:
+    df = _issues()
+    index = IssueSearchIndex(df)
+
+    results = index.search("pay-1")
+    assert results.total == 2
+    assert [hit.label for hit in results.hits] == [10, 11]
+    assert results.hits[0].fields == ("key",)
+
+    pago = index.search("pag")
+    assert pago.total == 4
+    assert pago.hits[0].label == 10
+    assert set(pago.hits[0].fields) == {"summary", "labels"}
+
+    scoped = index.search("pag", within=pd.Index([11, 13]), limit=1)
+    assert scoped.total == 2
+    assert [hit.label for hit in scoped.hits] == [11]
+
+
+def test_covers_rows_rejects_frames_from_another_revision() -> None:
+    df = _issues()
+    index = IssueSearchIndex(df)
+
+    assert index.covers_rows(df.loc[[11, 13]])
+    assert not index.covers_rows(df.reset_index(drop=True))
+    changed = df.copy()
+    changed.loc[12, "key"] = "LOG-30"
+    assert not index.covers_rows(changed)
+    assert not index.supports_like("labels")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Mapping
+
+import pytest
+
+from bug_resolution_radar.reports.section_plan import SectionTask, run_section_plan
+
+
+def _plan(log: list[str], lock: threading.Lock) -> list[SectionTask]:
+    def _task(name: str, value: int, delay: float = 0.0) -> Any:
+        def _build(deps: Mapping[str, Any]) -> int:
+            time.sleep(delay)
+            with lock:
+                log.append(name)
+            return value + sum(deps.values())
+
+        return _build
+
+    return [
+        SectionTask("total", _task("total", 0), ("left", "right")),
+        SectionTask("root", _task("root", 1)),
+        SectionTask("left", _task("left", 10, 0.3), ("root",)),
+        SectionTask("right", _task("right", 100, 0.3), ("root",)),
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_sections_run_after_their_dependencies(workers: int) -> None:
+    log: list[str] = []
+    started = time.perf_counter()
+    results = run_section_plan(_plan(log, threading.Lock()), max_workers=workers)
+    elapsed = time.perf_counter() - started
+
+    assert results == {"root": 1, "left": 11, "right": 101, "total": 112}
+    assert log[0] == "root"
+    assert log[-1] == "total"
+    if workers > 1:
+        assert elapsed < 0.55
+
+
+def test_failures_and_bad_plans_raise() -> None:
+    def _boom(_deps: Mapping[str, Any]) -> None:
+        raise RuntimeError("render failed")
+
+    with pytest.raises(RuntimeError, match="render failed"):
+        run_section_plan(
+            [SectionTask("a", lambda _deps: 1), SectionTask("b", _boom, ("a",))], max_workers=2
+        )
+    with pytest.raises(ValueError):
+        run_section_plan([SectionTask("a", lambda _deps: 1, ("missing",))], max_workers=2)
+    with pytest.raises(ValueError):
+        run_section_plan(
+            [SectionTask("a", lambda _deps: 1, ("b",)), SectionTask("b", lambda _deps: 1, ("a",))],
+            max_workers=2,
+        )
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timezone
 from pathlib import Path
 
 from bug_resolution_radar.config import Settings
 from bug_resolution_radar.models.schema import IssuesDocument, NormalizedIssue
 from bug_resolution_radar.models.schema_helix import HelixDocument, HelixWorkItem
 from bug_resolution_radar.repositories.helix_repo import HelixRepo
+from bug_resolution_radar.repositories.issue_changelog import (
+    append_issue_changes,
+    changelog_dir,
+    issue_state_at,
+)
+from bug_resolution_radar.services.ingest_merge import issue_merge_key
 from bug_resolution_radar.services.source_maintenance import (
     cache_inventory,
     purge_source_cache,
@@ -15,7 +22,7 @@ from bug_resolution_radar.services.source_maintenance import (
     reset_cache_store,
     source_cache_impact,
 )
-from bug_resolution_radar.ui.common import save_issues_doc
+from bug_resolution_radar.ui.common import load_issues_doc, save_issues_doc
 from bug_resolution_radar.ui.insights.learning_store import InsightsLearningStore
 
 
@@ -89,6 +96,8 @@ def test_purge_source_cache_removes_issues_helix_and_learning(tmp_path: Path) ->
         ],
     )
     save_issues_doc(str(issues_path), issues_doc)
+    by_key = {issue_merge_key(issue): issue for issue in issues_doc.issues}
+    append_issue_changes(issues_path, dict.fromkeys(by_key), by_key.get)
 
     helix_repo = HelixRepo(helix_path)
     helix_repo.save(
@@ -146,16 +155,17 @@ def test_purge_source_cache_removes_issues_helix_and_learning(tmp_path: Path) ->
     reloaded_issues = json.loads(issues_path.read_text(encoding="utf-8"))
     reloaded_issue_sids = [str(x.get("source_id") or "") for x in reloaded_issues.get("issues", [])]
     assert "helix:espana:es-smartit" not in reloaded_issue_sids
+    state = issue_state_at(issues_path, datetime.now(timezone.utc))
+    assert list(state.index) == ["jira:mexico:core-mx::J-1"]
 
     reloaded_helix = helix_repo.load()
     assert reloaded_helix is not None
     reloaded_helix_sids = [str(x.source_id or "") for x in reloaded_helix.items]
     assert "helix:espana:es-smartit" not in reloaded_helix_sids
 
-    learning_raw = json.loads(learning_path.read_text(encoding="utf-8"))
-    scopes = learning_raw.get("scopes", {})
-    assert "España::helix:espana:es-smartit" not in scopes
-    assert "México::jira:mexico:core-mx" in scopes
+    reloaded_learning = InsightsLearningStore(learning_path)
+    assert reloaded_learning.get_scope("España::helix:espana:es-smartit") == ({}, 0)
+    assert reloaded_learning.get_scope("México::jira:mexico:core-mx") == ({"seen": {"b": 2}}, 5)
 
 
 def test_source_cache_impact_preview_counts_records(tmp_path: Path) -> None:
@@ -280,6 +290,10 @@ def test_cache_inventory_and_reset_store(tmp_path: Path) -> None:
     assert inv["helix"]["records"] == 1
     assert inv["learning"]["records"] == 1
 
+    stored = {issue_merge_key(i): i for i in load_issues_doc(str(issues_path)).issues}
+    append_issue_changes(issues_path, dict.fromkeys(stored), stored.get)
+    assert changelog_dir(issues_path).is_dir()
+
     issue_reset = reset_cache_store(settings, "issues")
     helix_reset = reset_cache_store(settings, "helix")
     learning_reset = reset_cache_store(settings, "learning")
@@ -290,6 +304,7 @@ def test_cache_inventory_and_reset_store(tmp_path: Path) -> None:
     assert helix_reset["after"] == 0
     assert learning_reset["before"] == 1
     assert learning_reset["after"] == 0
+    assert not changelog_dir(issues_path).exists()
 
     inv_after = {str(row["cache_id"]): row for row in cache_inventory(settings)}
     assert inv_after["issues"]["records"] == 0
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from PIL import Image, ImageDraw
+
+from bug_resolution_radar.reports import period_followup_ppt, plotly_png
+from bug_resolution_radar.reports.text_layout import (
+    fit_lines,
+    font_metrics,
+    load_font,
+    text_width,
+    truncate_to_width,
+    wrap_to_width,
+)
+
+_TEXT = "El usuario no puede completar el pago SPEI desde la app móvil tras actualizar la versión"
+
+
+def _ink_width(font: object, text: str) -> int:
+    draw = ImageDraw.Draw(Image.new("RGB", (8, 8)))
+    left, _, right, _ = draw.textbbox((0, 0), text, font=font)
+    return int(right - left)
+
+
+def test_fonts_and_metrics_are_shared_between_report_modules() -> None:
+    table_font = period_followup_ppt._load_report_font(size_px=22, bold=False)
+    assert table_font is load_font([period_followup_ppt._REPORT_FONT_BOOK_PATH], 22)
+    assert plotly_png._load_font(22) is table_font
+    assert font_metrics(table_font) is font_metrics(table_font)
+    assert abs(text_width(table_font, _TEXT) - _ink_width(table_font, _TEXT)) <= 2
+
+
+def test_truncate_and_wrap_respect_the_width() -> None:
+    font = load_font([period_followup_ppt._REPORT_FONT_BOOK_PATH], 20)
+    short = truncate_to_width(font, _TEXT, max_width=160)
+    assert short.endswith("...")
+    assert _TEXT.startswith(short[:-3])
+    assert text_width(font, short) <= 160
+    longer = _TEXT[: len(short) - 3 + 1].rstrip() + "..."
+    assert text_width(font, longer) > 160
+    assert truncate_to_width(font, "corto", max_width=500) == "corto"
+    assert truncate_to_width(font, _TEXT, max_width=1) == "..."
+
+    lines = wrap_to_width(font, _TEXT, max_width=200)
+    assert " ".join(lines) == _TEXT
+    assert all(text_width(font, line) <= 200 for line in lines if " " in line)
+    for line, following in zip(lines, lines[1:]):
+        assert text_width(font, f"{line} {following.split()[0]}") > 200
+
+
+def test_fit_lines_truncates_the_last_line_that_fits() -> None:
+    font = load_font([period_followup_ppt._REPORT_FONT_BOOK_PATH], 20)
+    wrapped = wrap_to_width(font, _TEXT, max_width=200)
+    lines = fit_lines(font, _TEXT, max_width=200, max_height=50, line_spacing=2)
+    assert 1 <= len(lines) < len(wrapped)
+    assert lines[:-1] == wrapped[: len(lines) - 1]
+    assert lines[-1].endswith("...")